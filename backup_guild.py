@@ -0,0 +1,65 @@
+"""Back up or restore one guild's election data from the command line.
+
+    python backup_guild.py dump GUILD_ID guild.archive.gz
+    python backup_guild.py restore guild.archive.gz [--guild GUILD_ID]
+
+Uses the bot's database credentials unless --uri points at another MongoDB
+server, e.g. a local one being loaded with an archive as a test fixture.
+Restart the bot (or run restore_guild from Discord) after restoring into a
+database it is using, so it drops what it has cached for the guild.
+"""
+
+import argparse
+import time
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+from cogs.guild_archive import ArchiveError, dump_guild, read_header, restore_guild
+
+load_dotenv()
+
+def get_database(uri: str, name: str):
+    if uri:
+        return MongoClient(uri)[name]
+    # Importing the db cog connects with the bot's credentials
+    from cogs.db import client
+    return client[name]
+
+def main():
+    parser = argparse.ArgumentParser(description="Back up or restore one guild's election data")
+    parser.add_argument("--uri", help="MongoDB connection string (defaults to the bot's database)")
+    parser.add_argument("--database", default="election_bot", help="Database name (default: election_bot)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dump = commands.add_parser("dump", help="Write a guild's documents to an archive")
+    dump.add_argument("guild_id", type=int)
+    dump.add_argument("path")
+
+    restore = commands.add_parser("restore", help="Replace a guild's documents with an archive's")
+    restore.add_argument("path")
+    restore.add_argument("--guild", type=int, help="Guild to restore into (defaults to the archived guild)")
+
+    args = parser.parse_args()
+    database = get_database(args.uri, args.database)
+    started = time.perf_counter()
+
+    try:
+        if args.command == "dump":
+            with open(args.path, "wb") as archive:
+                counts = dump_guild(database, args.guild_id, archive)
+            action = f"Archived guild {args.guild_id} to {args.path}"
+        else:
+            with open(args.path, "rb") as archive:
+                header = read_header(archive)
+                counts = restore_guild(database, archive, args.guild)
+            action = f"Restored guild {header['guild_id']} into guild {args.guild or header['guild_id']}"
+    except ArchiveError as e:
+        parser.exit(1, f"❌ {e}\n")
+
+    for name, count in sorted(counts.items()):
+        print(f"  {name}: {count}")
+    print(f"✅ {action}: {sum(counts.values())} documents in {time.perf_counter() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+"""Time command handlers and phase changes on a generated guild, offline.
+
+Loads every cog against an in-memory mongomock database, fills one guild
+with a generated election (by default 500 House candidates, 8 presidential
+candidates and 30 days of momentum history), then calls each benchmarked
+command with a fake interaction and runs the phase-change pipeline the time
+manager runs. Commands that write start every repetition from a fresh copy
+of the guild; read-only ones start with the cogs' caches dropped and then
+repeat back to back, like on a running bot, so the first repetition is the
+cold one. Requires mongomock.
+
+    python benchmark_commands.py
+    python benchmark_commands.py --output before.json
+    python benchmark_commands.py --output after.json --compare before.json
+
+Results are saved as JSON so runs from two commits can be compared; the
+database call counts are deterministic for a given seed and sizes, so a
+change in them is a real change in the handler, not noise.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import discord
+import mongomock
+import pymongo.mongo_client
+from discord import app_commands
+from discord.ext import commands, tasks
+
+# cogs.db creates its client at import time, so point it at mongomock first
+pymongo.mongo_client.MongoClient = lambda *args, **kwargs: mongomock.MongoClient()
+
+# Background loops would write to the guild between timings
+tasks.Loop.start = lambda self, *args, **kwargs: None
+
+from cogs.geography import STATES
+from cogs.guild_archive import dump_guild, restore_guild
+from cogs.startup import CORE_EXTENSIONS, DATABASE_EXTENSION, DEFERRED_EXTENSIONS
+
+# Guild holding the generated election
+GUILD_ID = 1
+
+# User running the commands: the first generated candidate
+USER_ID = 1000
+
+# Parties of generated candidates, and the party names used by momentum
+PARTIES = ("Democratic Party", "Republican Party", "Independent")
+MOMENTUM_PARTIES = ("Democrat", "Republican", "Independent")
+
+# Candidates sign up in SIGNUP_YEAR; the general campaign is in ELECTION_YEAR
+SIGNUP_YEAR = 1999
+ELECTION_YEAR = 2000
+
+# Candidates per party in every Senate and governor race
+STATEWIDE_CANDIDATES_PER_PARTY = 1
+
+# Reasons given to generated momentum events
+MOMENTUM_REASONS = ("Campaign speech", "Canvassing", "Campaign ad", "Poster", "Debate")
+
+# A speech reply within the 700-3000 character limit, and a canvassing message within 100-300
+SPEECH_TEXT = ("My fellow citizens, this campaign is about the future of our state. " * 12).strip()
+CANVASSING_TEXT = ("Hi! I'm knocking on doors for a candidate who will fight for this neighbourhood. " * 2).strip()
+
+# (command, arguments, writes) for every benchmarked command, keyed by case name
+COMMAND_CASES = {
+    "poll state": ("poll state", {"state": "CALIFORNIA"}, False),
+    "poll candidate": ("poll candidate", {}, False),
+    "poll media_seat": ("poll media_seat", {"seat_id": "REP-CA-1"}, False),
+    "pres_poll": ("pres_poll", {"candidate_name": "Pres 0"}, False),
+    "signup_view": ("signup_view", {"year": SIGNUP_YEAR}, False),
+    "admin_signup_leaderboard": ("admin_signup_leaderboard", {"year": SIGNUP_YEAR}, False),
+    "view_general_campaign": ("view_general_campaign", {}, False),
+    "admin_view_all_campaign_points": ("admin_view_all_campaign_points", {}, False),
+    "admin_demo overview presidential": (
+        "admin_demo overview", {"scope": app_commands.Choice(name="Presidential", value="presidential")}, False
+    ),
+    "admin_demo overview general": (
+        "admin_demo overview", {"scope": app_commands.Choice(name="General", value="general")}, False
+    ),
+    "demographic_status": ("demographic_status", {}, False),
+    "momentum status": ("momentum status", {"state": "CALIFORNIA"}, False),
+    "momentum overview": ("momentum overview", {}, False),
+    "speech": ("speech", {"state": "CALIFORNIA", "ideology": "Moderate", "target": f"Cand {USER_ID}"}, True),
+    "canvassing": (
+        "canvassing", {"state": "CALIFORNIA", "canvassing_message": CANVASSING_TEXT, "target": f"Cand {USER_ID}"}, True
+    ),
+}
+
+# Phase changes of one election cycle, as (old phase, new phase, year)
+PHASE_CHANGES = (
+    ("Signups", "Primary Campaign", SIGNUP_YEAR),
+    ("Primary Campaign", "Primary Election", ELECTION_YEAR),
+    ("Primary Election", "General Campaign", ELECTION_YEAR),
+    ("General Campaign", "General Election", ELECTION_YEAR),
+    ("General Election", "Signups", ELECTION_YEAR + 1)
+)
+
+# Cogs notified of a phase change, in the order the time manager notifies them
+PHASE_CHANGE_COGS = ("Elections", "AllWinners", "PresidentialWinners")
+
+class Obj:
+    pass
+
+def sent_text(content, kwargs) -> str:
+    """What a user would read first in a message: its text, or its embed's title"""
+    embed = kwargs.get("embed") or next(iter(kwargs.get("embeds") or []), None)
+    return content or (embed.title if embed is not None else None) or ""
+
+class FakeMessage:
+    """The message a handler gets from `original_response()`"""
+    id = 777
+
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def edit(self, **kwargs):
+        self.interaction.sent.append(sent_text(kwargs.get("content"), kwargs))
+
+    async def add_reaction(self, *args):
+        pass
+
+class FakeReply:
+    """A user's reply to a handler's prompt, e.g. the text of a speech"""
+
+    def __init__(self, user_id: int, content: str, reply_to: int, sent: list):
+        self.author = Obj()
+        self.author.id = user_id
+        self.content = content
+        self.reference = Obj()
+        self.reference.message_id = reply_to
+        self.sent = sent
+
+    async def reply(self, content=None, **kwargs):
+        self.sent.append(sent_text(content, kwargs))
+
+class FakeResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def send_message(self, content=None, **kwargs):
+        self._done = True
+        self.interaction.sent.append(sent_text(content, kwargs))
+
+    async def defer(self, **kwargs):
+        self._done = True
+
+    async def edit_message(self, **kwargs):
+        self._done = True
+        self.interaction.sent.append(sent_text(kwargs.get("content"), kwargs))
+
+    async def send_modal(self, modal):
+        self._done = True
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        self.interaction.sent.append(sent_text(content, kwargs))
+
+class FakeInteraction:
+    """Enough of `discord.Interaction` for the benchmarked handlers; keeps the text they send"""
+
+    # The interaction created last, whose handler any reply answers
+    latest = None
+    _ids = itertools.count(1)
+
+    def __init__(self, bot, guild_id: int = GUILD_ID, user_id: int = USER_ID):
+        self.id = next(FakeInteraction._ids)
+        self.client = bot
+        self.sent = []
+        self.guild_id = guild_id
+        self.guild = Obj()
+        self.guild.id = guild_id
+        self.guild.name = "Benchmark"
+        self.guild.get_member = lambda member_id: None
+        self.guild.get_channel = lambda channel_id: None
+        self.guild.get_role = lambda role_id: None
+        self.guild.channels = self.guild.text_channels = self.guild.roles = []
+        self.user = Obj()
+        self.user.id = user_id
+        self.user.name = self.user.display_name = f"Cand {user_id}"
+        self.user.mention = f"<@{user_id}>"
+        self.user.roles = []
+        self.user.guild_permissions = discord.Permissions(administrator=True)
+        self.user.display_avatar = Obj()
+        self.user.display_avatar.url = "https://example.com/avatar.png"
+        self.channel = Obj()
+        self.channel.id = 5
+        self.channel.send = self.followup_send
+        self.command = None
+        self.response = FakeResponse(self)
+        self.followup = FakeFollowup(self)
+        self._message = FakeMessage(self)
+        FakeInteraction.latest = self
+
+    async def followup_send(self, content=None, **kwargs):
+        self.sent.append(sent_text(content, kwargs))
+
+    async def original_response(self):
+        return self._message
+
+    async def edit_original_response(self, **kwargs):
+        self.sent.append(sent_text(kwargs.get("content"), kwargs))
+        return self._message
+
+    async def delete_original_response(self):
+        pass
+
+class CountingRun:
+    """Wraps `AsyncDatabase.run` to count the database calls a handler makes"""
+
+    def __init__(self, run):
+        self._run = run
+        self.calls = 0
+
+    async def __call__(self, func, *args, **kwargs):
+        self.calls += 1
+        return await self._run(func, *args, **kwargs)
+
+def quiet():
+    """Swallow the handlers' debug prints while they are timed"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+def generate_guild(database, rng: random.Random, seats: list, house: int, presidential: int,
+                   momentum_days: int, events_per_day: int) -> dict:
+    """Insert a generated election for GUILD_ID into a synchronous database; returns documents per collection"""
+    now = datetime.utcnow()
+    database["time_configs"].insert_one({
+        "guild_id": GUILD_ID, "minutes_per_rp_day": 28, "current_rp_date": datetime(ELECTION_YEAR, 5, 1),
+        "current_phase": "General Campaign", "cycle_year": SIGNUP_YEAR, "last_real_update": now,
+        "last_stamina_regen": now, "voice_channel_id": None, "update_voice_channels": False,
+        "time_paused": True,
+        "phases": [
+            {"name": "Signups", "start_month": 2, "end_month": 8},
+            {"name": "Primary Campaign", "start_month": 9, "end_month": 12},
+            {"name": "Primary Election", "start_month": 1, "end_month": 2},
+            {"name": "General Campaign", "start_month": 3, "end_month": 10},
+            {"name": "General Election", "start_month": 11, "end_month": 12}
+        ]
+    })
+
+    seats = [dict(seat, up_for_election=True, current_holder=None) for seat in seats]
+    database["elections_config"].insert_one({"guild_id": GUILD_ID, "seats": seats})
+
+    # House candidates are spread evenly over the House seats, statewide races get one per party
+    house_seats = [seat for seat in seats if seat["seat_id"].startswith("REP-")]
+    statewide_seats = [seat for seat in seats if seat["state"] != "National" and seat not in house_seats]
+    field_sizes = [(seat, len(PARTIES) * STATEWIDE_CANDIDATES_PER_PARTY) for seat in statewide_seats]
+    field_sizes += [
+        (seat, house // len(house_seats) + (1 if index < house % len(house_seats) else 0))
+        for index, seat in enumerate(house_seats)
+    ]
+
+    candidates, winners = [], []
+    user_id = USER_ID
+    for seat, field_size in field_sizes:
+        for position in range(field_size):
+            party = PARTIES[position % len(PARTIES)]
+            name = f"Cand {user_id}"
+            candidates.append({
+                "user_id": user_id, "name": name, "party": party, "region": seat["state"],
+                "seat_id": seat["seat_id"], "office": seat["office"], "year": SIGNUP_YEAR,
+                "signup_date": now, "points": round(rng.uniform(0, 40), 2), "stamina": 100,
+                "corruption": rng.randint(0, 20), "phase": "Primary Campaign"
+            })
+            # The first candidate of each party won its primary
+            if position < len(PARTIES):
+                winners.append({
+                    "year": ELECTION_YEAR, "user_id": user_id, "office": seat["office"], "state": seat["state"],
+                    "seat_id": seat["seat_id"], "candidate": name, "party": party,
+                    "points": round(rng.uniform(0, 30), 2), "baseline_percentage": 50.0, "votes": 0,
+                    "corruption": rng.randint(0, 20), "final_score": 0, "stamina": 100, "winner": False,
+                    "phase": "Primary Winner", "primary_winner": True, "general_winner": False,
+                    "created_date": now
+                })
+            user_id += 1
+    database["signups"].insert_one({"guild_id": GUILD_ID, "candidates": candidates})
+    database["winners"].insert_one({"guild_id": GUILD_ID, "winners": winners})
+
+    presidential_candidates = []
+    for index in range(presidential):
+        presidential_candidates.append({
+            "user_id": 5000 + index, "name": f"Pres {index}", "party": PARTIES[index % len(PARTIES)],
+            "state": rng.choice(STATES), "office": "President", "seat_id": "US-PRES", "region": "National",
+            "year": SIGNUP_YEAR, "ideology": "Moderate", "economic": "Centrist", "social": "Moderate",
+            "government": "Moderate", "axis": "center", "vp_candidate": None, "vp_candidate_id": None,
+            "signup_date": now, "points": round(rng.uniform(0, 20), 2), "stamina": 300, "corruption": 0,
+            "phase": "Primary Campaign", "state_points": {state: round(rng.uniform(0, 5), 2) for state in STATES},
+            "total_points": 10.0
+        })
+    database["presidential_signups"].insert_one({
+        "guild_id": GUILD_ID, "candidates": presidential_candidates, "pending_vp_requests": []
+    })
+    database["presidential_winners"].insert_one({
+        "guild_id": GUILD_ID, "election_year": ELECTION_YEAR,
+        "winners": {party: f"Pres {index}" for index, party in enumerate(PARTIES[:2]) if index < presidential}
+    })
+
+    # Momentum history: individual events plus the daily rollups the momentum cog keeps beside them
+    events, rollups = [], {}
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    for days_ago in range(momentum_days):
+        day = today - timedelta(days=days_ago)
+        for _ in range(events_per_day):
+            event = {
+                "guild_id": GUILD_ID, "timestamp": day + timedelta(seconds=rng.randrange(86400)),
+                "state": rng.choice(STATES), "party": rng.choice(MOMENTUM_PARTIES),
+                "change": round(rng.uniform(-3, 5), 2), "reason": rng.choice(MOMENTUM_REASONS),
+                "user_id": rng.randrange(USER_ID, user_id)
+            }
+            events.append(event)
+            rollup = rollups.setdefault((event["state"], event["party"], day), {"change": 0.0, "events": 0})
+            rollup["change"] += event["change"]
+            rollup["events"] += 1
+    if events:
+        database["momentum_events"].insert_many(events)
+        database["momentum_event_rollups"].insert_many([
+            {"guild_id": GUILD_ID, "state": state, "party": party, "day": day, **totals}
+            for (state, party, day), totals in rollups.items()
+        ])
+
+    return {
+        "signups": len(candidates), "winners": len(winners), "presidential_signups": len(presidential_candidates),
+        "momentum_events": len(events), "momentum_event_rollups": len(rollups)
+    }
+
+async def load_bot():
+    """A bot with every cog loaded on a mongomock database, its calls counted"""
+    bot = commands.Bot(command_prefix=None, intents=discord.Intents.default(), help_command=None)
+    with quiet():
+        await bot.load_extension(DATABASE_EXTENSION)
+        # Collections capture `run` when first used, so count before any cog touches one
+        bot.db.run = CountingRun(bot.db.run)
+        for name in CORE_EXTENSIONS + DEFERRED_EXTENSIONS:
+            await bot.load_extension(name)
+    bot.get_guild = lambda guild_id: None
+
+    async def wait_for(event, check=None, timeout=None):
+        # Handlers waiting for a reply get a speech-length one right away
+        reply = FakeReply(USER_ID, SPEECH_TEXT, FakeMessage.id, FakeInteraction.latest.sent)
+        if check is not None and not check(reply):
+            raise asyncio.TimeoutError()
+        return reply
+
+    bot.wait_for = wait_for
+    return bot
+
+async def seed_guild(bot, args) -> dict:
+    """Generate the benchmark guild and migrate it to the layout the bot runs on"""
+    from cogs.elections import Elections
+
+    rng = random.Random(args.seed)
+    seats = Elections._initialize_seats(None)
+    sizes = generate_guild(bot.db.sync, rng, seats, args.house, args.presidential,
+                           args.momentum_days, args.momentum_events)
+
+    # No ensure_indexes: with a TTL index, mongomock scans the whole collection on every insert
+    with quiet():
+        await bot.db.migrate_candidate_documents()
+        # The momentum cog builds the state leans; give every state some momentum on top
+        momentum = bot.get_cog("Momentum")
+        await momentum._get_momentum_config(GUILD_ID)
+    await bot.db["momentum_config"].update_one({"guild_id": GUILD_ID}, {"$set": {
+        f"state_momentum.{state}.{party}": round(rng.uniform(0, 60), 2)
+        for state in STATES for party in MOMENTUM_PARTIES
+    }})
+    return sizes
+
+def snapshot_guild(bot) -> bytes:
+    archive = io.BytesIO()
+    dump_guild(bot.db.sync, GUILD_ID, archive)
+    return archive.getvalue()
+
+async def forget_guild(bot):
+    """Drop everything the cogs cache about the guild"""
+    # Imported here: loading an extension re-executes its module, so these must come from the loaded copy
+    from cogs.candidates import get_candidate_registry
+    from cogs.cooldowns import get_cooldowns
+    from cogs.ideology import get_ideology_store
+    from cogs.time_manager import get_rp_clock
+
+    await bot.db.run(bot.db.guild_replaced, GUILD_ID)
+    get_rp_clock(bot).invalidate(GUILD_ID)
+    get_candidate_registry(bot).invalidate(GUILD_ID)
+    get_cooldowns(bot).invalidate(GUILD_ID)
+    get_ideology_store(bot).invalidate(GUILD_ID)
+    with quiet():
+        await bot.db.migrate_candidate_documents()
+
+async def reset_guild(bot, snapshot: bytes):
+    """Put the guild back as generated, with nothing cached about it"""
+    await bot.db.run(restore_guild, bot.db.sync, io.BytesIO(snapshot), GUILD_ID)
+    await forget_guild(bot)
+
+def command_case(bot, command_name: str, arguments: dict):
+    command = next(
+        (command for command in bot.tree.walk_commands()
+         if isinstance(command, app_commands.Command) and command.qualified_name == command_name),
+        None
+    )
+    if command is None:
+        raise LookupError(f"no command named /{command_name}")
+
+    async def run():
+        interaction = FakeInteraction(bot)
+        await command.callback(command.binding, interaction, **arguments)
+        return interaction.sent
+
+    return run
+
+def phase_change_case(bot, changes):
+    """The work `TimeManager._advance_guild` does for each of `changes`"""
+    from cogs.time_manager import get_rp_clock
+
+    async def prepare():
+        # The guild sits in the phase being left, as it would when the clock crosses into the next one
+        await bot.db["time_configs"].update_one({"guild_id": GUILD_ID}, {"$set": {"current_phase": changes[0][0]}})
+        get_rp_clock(bot).invalidate(GUILD_ID)
+
+    async def run():
+        time_manager = bot.get_cog("TimeManager")
+        for old_phase, new_phase, year in changes:
+            await time_manager.clock.update(GUILD_ID, {"current_phase": new_phase})
+            if new_phase == "General Campaign":
+                await time_manager._reset_stamina_for_general_campaign(GUILD_ID, year)
+            for cog_name in PHASE_CHANGE_COGS:
+                await bot.get_cog(cog_name).on_phase_change(GUILD_ID, old_phase, new_phase, year)
+        return []
+
+    return prepare, run
+
+def benchmark_cases(bot, only=None) -> list:
+    """(name, prepare, run, writes) for every case, or for the named ones"""
+    cases = []
+    for name, (command_name, arguments, writes) in COMMAND_CASES.items():
+        cases.append((name, None, command_case(bot, command_name, arguments), writes))
+    for change in PHASE_CHANGES:
+        cases.append((f"phase {change[0]} -> {change[1]}", *phase_change_case(bot, [change]), True))
+    cases.append(("phase full cycle", *phase_change_case(bot, list(PHASE_CHANGES)), True))
+    if only:
+        unknown = set(only) - {case[0] for case in cases}
+        if unknown:
+            raise LookupError(f"no benchmark cases named {', '.join(sorted(unknown))}")
+        cases = [case for case in cases if case[0] in only]
+    return cases
+
+async def time_case(bot, snapshot: bytes, prepare, run, writes: bool, pristine: bool,
+                    repeat: int, seed: int) -> dict:
+    """Time `repeat` runs of a case; `pristine` if the guild is unchanged since it was generated"""
+    timings, db_calls, rejected, error = [], [], None, None
+    for repetition in range(repeat):
+        if writes or repetition == 0:
+            # Restoring takes seconds on mongomock, so only do it when something was written
+            if writes or not pristine:
+                await reset_guild(bot, snapshot)
+            else:
+                await forget_guild(bot)
+            if prepare is not None:
+                await prepare()
+        random.seed(seed)
+        bot.db.run.calls = 0
+        started = time.perf_counter()
+        try:
+            with quiet():
+                sent = await run()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            break
+        timings.append(time.perf_counter() - started)
+        db_calls.append(bot.db.run.calls)
+        # A handler that answered with an error message was not benchmarked doing its real work
+        rejected = rejected or next(
+            (message.splitlines()[0] for message in sent if isinstance(message, str) and message.startswith("❌")), None
+        )
+
+    result = {"error": error, "rejected": rejected}
+    if timings:
+        result.update({
+            "first_ms": round(timings[0] * 1000, 3),
+            "min_ms": round(min(timings) * 1000, 3),
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "mean_ms": round(statistics.mean(timings) * 1000, 3),
+            "max_ms": round(max(timings) * 1000, 3),
+            "db_calls": int(statistics.median(db_calls))
+        })
+    return result
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_results(results: dict):
+    print(f"{'case':<40}{'median ms':>11}{'min ms':>10}{'first ms':>10}{'db calls':>10}")
+    for name, result in results.items():
+        if result["error"]:
+            print(f"{name:<40}  ❌ {result['error']}")
+            continue
+        print(f"{name:<40}{result['median_ms']:>11.2f}{result['min_ms']:>10.2f}"
+              f"{result['first_ms']:>10.2f}{result['db_calls']:>10}")
+        if result["rejected"]:
+            print(f"{'':<40}  ⚠️ {result['rejected']}")
+
+def print_comparison(old: dict, new: dict):
+    print(f"\nCompared with {old['meta'].get('commit') or 'the earlier run'}:")
+    print(f"{'case':<40}{'old ms':>10}{'new ms':>10}{'change':>9}{'db calls':>14}")
+    for name, result in new["results"].items():
+        before = old["results"].get(name)
+        if not before or before.get("median_ms") is None or result.get("median_ms") is None:
+            continue
+        change = (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100 if before["median_ms"] else 0.0
+        calls = f"{before['db_calls']} -> {result['db_calls']}" if before["db_calls"] != result["db_calls"] else ""
+        print(f"{name:<40}{before['median_ms']:>10.2f}{result['median_ms']:>10.2f}{change:>+8.1f}%{calls:>14}")
+    if old["meta"].get("sizes") != new["meta"].get("sizes"):
+        print("⚠️ The runs generated different guilds; compare runs made with the same sizes and seed")
+
+async def run_benchmark(args) -> dict:
+    bot = await load_bot()
+    sizes = await seed_guild(bot, args)
+    snapshot = snapshot_guild(bot)
+
+    results = {}
+    pristine = True
+    for name, prepare, run, writes in benchmark_cases(bot, args.only):
+        results[name] = await time_case(bot, snapshot, prepare, run, writes, pristine, args.repeat, args.seed)
+        pristine = not writes
+    bot.db.close()
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "discord.py": discord.__version__,
+            "mongomock": mongomock.__version__,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "sizes": sizes
+        },
+        "results": results
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark command handlers against a generated guild in mongomock")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare with results saved earlier by --output")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions of each case (default: 5)")
+    parser.add_argument("--house", type=int, default=500, help="House candidates (default: 500)")
+    parser.add_argument("--presidential", type=int, default=8, help="Presidential candidates (default: 8)")
+    parser.add_argument("--momentum-days", type=int, default=30, help="Days of momentum history (default: 30)")
+    parser.add_argument("--momentum-events", type=int, default=200, help="Momentum events per day (default: 200)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated guild and the handlers")
+    parser.add_argument("--only", nargs="+", metavar="CASE", help="Run only these cases")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    try:
+        report = asyncio.run(run_benchmark(args))
+    except LookupError as e:
+        parser.exit(1, f"❌ {e}\n")
+    print_results(report["results"])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+        print(f"✅ Results written to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous:
+            print_comparison(json.load(previous), report)
+
+    if any(result["error"] for result in report["results"].values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
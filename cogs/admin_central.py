@@ -3,6 +3,24 @@ import discord
 from discord import app_commands
 from datetime import datetime, timedelta
 import inspect
+import io
+import tempfile
+from cogs.candidates import get_candidate_registry
+from cogs.cooldowns import get_cooldowns
+from cogs.exports import DEFAULT_ATTACHMENT_LIMIT, EXPORT_SPOOL_BYTES
+from cogs.guild_archive import ArchiveError, dump_guild, read_header, restore_guild
+from cogs.ideology import get_ideology_store
+from cogs.indexes import register_index
+from cogs.time_manager import get_rp_clock
+
+# Admin command logs are deleted automatically once they are this old
+ADMIN_LOG_RETENTION_DAYS = 90
+
+# Query shapes this cog runs, created at startup by the db cog
+register_index("admin_command_logs", [("guild_id", 1), ("timestamp", -1)], owner=__name__)
+register_index("admin_command_logs", [("guild_id", 1), ("user_id", 1), ("timestamp", -1)], owner=__name__)
+register_index("admin_command_logs", [("timestamp", 1)], owner=__name__,
+               expireAfterSeconds=ADMIN_LOG_RETENTION_DAYS * 24 * 60 * 60)
 
 class AdminCentral(commands.Cog):
     """Centralized admin commands with role-based access control"""
@@ -132,7 +150,7 @@ class AdminCentral(commands.Cog):
             "channel_id": interaction.channel.id if interaction.channel else None
         }
 
-        admin_logs_col.insert_one(log_entry)
+        await admin_logs_col.insert_one(log_entry)
 
     # SYSTEM COMMANDS
     @admin_system_group.command(
@@ -152,12 +170,7 @@ class AdminCentral(commands.Cog):
         collection_name: str = "action_cooldowns"
     ):
         target_user = user if user else interaction.user
-        cooldowns_col = self.bot.db[collection_name]
-
-        result = cooldowns_col.delete_many({
-            "guild_id": interaction.guild.id,
-            "user_id": target_user.id
-        })
+        records_removed = await get_cooldowns(self.bot).reset(collection_name, interaction.guild.id, target_user.id)
 
         # Log the command
         await self._log_admin_command(
@@ -167,13 +180,13 @@ class AdminCentral(commands.Cog):
                 "target_user_id": target_user.id,
                 "target_username": target_user.display_name,
                 "collection_name": collection_name,
-                "records_removed": result.deleted_count
+                "records_removed": records_removed
             }
         )
 
         await interaction.response.send_message(
             f"✅ Reset campaign cooldowns for {target_user.mention} in collection '{collection_name}'. "
-            f"Removed {result.deleted_count} cooldown record(s).",
+            f"Removed {records_removed} cooldown record(s).",
             ephemeral=True
         )
 
@@ -183,6 +196,175 @@ class AdminCentral(commands.Cog):
         return [app_commands.Choice(name=col, value=col)
                 for col in collections if current.lower() in col.lower()][:25]
 
+    @admin_system_group.command(
+        name="migrate_candidates",
+        description="Move embedded candidate lists into per-candidate documents (one-time)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_migrate_candidates(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
+        report = await self.bot.db.migrate_candidate_documents()
+
+        await self._log_admin_command(interaction, "migrate_candidates", {
+            name: result["candidates"] for name, result in report.items()
+        })
+
+        embed = discord.Embed(
+            title="🗃️ Candidate Migration Complete",
+            description="Embedded candidate lists have been split into one document per candidate.",
+            color=discord.Color.green(),
+            timestamp=datetime.utcnow()
+        )
+
+        for name, result in report.items():
+            embed.add_field(
+                name=name,
+                value=f"**Guilds:** {result['guilds']}\n**Candidates:** {result['candidates']}",
+                inline=True
+            )
+
+        if not any(result["guilds"] for result in report.values()):
+            embed.set_footer(text="Nothing left to migrate - all guilds already use candidate documents")
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @admin_system_group.command(
+        name="index_report",
+        description="Show missing, unused and undeclared database indexes"
+    )
+    @app_commands.describe(create_missing="Create any registered index that is missing before reporting")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_index_report(self, interaction: discord.Interaction, create_missing: bool = False):
+        await interaction.response.defer(ephemeral=True)
+
+        created = []
+        if create_missing:
+            created = await self.bot.db.ensure_indexes(force=True)
+        report = await self.bot.db.index_report()
+
+        await self._log_admin_command(interaction, "index_report", {"create_missing": create_missing})
+
+        embed = discord.Embed(
+            title="🗂️ Database Index Report",
+            description="Registered indexes compared with the indexes on the server.",
+            color=discord.Color.orange() if report else discord.Color.green(),
+            timestamp=datetime.utcnow()
+        )
+
+        for collection_name, result in list(report.items())[:24]:
+            lines = []
+            if result["missing"]:
+                lines.append(f"❌ **Missing:** {', '.join(result['missing'])}")
+            if result["unused"]:
+                lines.append(f"💤 **Unused:** {', '.join(result['unused'])}")
+            if result["undeclared"]:
+                lines.append(f"❔ **Undeclared:** {', '.join(result['undeclared'])}")
+            embed.add_field(name=collection_name, value="\n".join(lines)[:1024], inline=False)
+
+        if not report:
+            embed.add_field(name="✅ All Good", value="Every registered index exists and is in use.", inline=False)
+        if len(report) > 24:
+            embed.add_field(name="...", value=f"{len(report) - 24} more collections not shown", inline=False)
+
+        footer = []
+        if created:
+            footer.append(f"Ensured {len(created)} indexes")
+        if report and not any(result["usage_known"] for result in report.values()):
+            footer.append("Index usage is not available on this server")
+        if footer:
+            embed.set_footer(text=" • ".join(footer))
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @admin_system_group.command(
+        name="backup_guild",
+        description="Download an archive of all of this server's election data"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_backup_guild(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+
+        archive = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+        counts = await self.bot.db.run(dump_guild, self.bot.db.sync, interaction.guild.id, archive)
+        size = archive.tell()
+        archive.seek(0)
+
+        await self._log_admin_command(interaction, "backup_guild", {"documents": sum(counts.values())})
+
+        limit = getattr(interaction.guild, "filesize_limit", None) or DEFAULT_ATTACHMENT_LIMIT
+        if size > limit:
+            archive.close()
+            await interaction.followup.send(
+                f"❌ The archive is {size / (1024 * 1024):.1f} MB, over this server's attachment limit. "
+                f"Use `backup_guild.py dump {interaction.guild.id}` on the bot host instead.",
+                ephemeral=True
+            )
+            return
+
+        filename = f"guild_{interaction.guild.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.archive.gz"
+        await interaction.followup.send(
+            f"🗄️ Archived {sum(counts.values())} documents from {len(counts)} collections. "
+            f"Restore it with `/admincentral system restore_guild`.",
+            file=discord.File(archive, filename=filename),
+            ephemeral=True
+        )
+
+    @admin_system_group.command(
+        name="restore_guild",
+        description="Replace all of this server's election data with an archive"
+    )
+    @app_commands.describe(
+        archive="An archive downloaded with backup_guild",
+        confirm="Set to True to confirm replacing every election setting, candidate and result"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_restore_guild(
+        self,
+        interaction: discord.Interaction,
+        archive: discord.Attachment,
+        confirm: bool = False
+    ):
+        if not confirm:
+            await interaction.response.send_message(
+                "⚠️ **Warning:** This will delete all of this server's election data and replace it with "
+                "the archive's.\nTo confirm, run the command again with `confirm:True`",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        data = io.BytesIO(await archive.read())
+        try:
+            header = read_header(data)
+            counts = await self.bot.db.run(restore_guild, self.bot.db.sync, data, interaction.guild.id)
+        except ArchiveError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+
+        # The restore wrote around the cached views of this guild's data
+        await self.bot.db.run(self.bot.db.guild_replaced, interaction.guild.id)
+        get_rp_clock(self.bot).invalidate(interaction.guild.id)
+        get_candidate_registry(self.bot).invalidate(interaction.guild.id)
+        get_cooldowns(self.bot).invalidate(interaction.guild.id)
+        get_ideology_store(self.bot).invalidate(interaction.guild.id)
+
+        await self._log_admin_command(interaction, "restore_guild", {
+            "source_guild_id": header["guild_id"],
+            "documents": sum(counts.values())
+        })
+
+        await interaction.followup.send(
+            f"✅ Restored {sum(counts.values())} documents in {len(counts)} collections "
+            f"from an archive taken {header['created_at'].strftime('%Y-%m-%d %H:%M')} UTC.",
+            ephemeral=True
+        )
+
     # ELECTION COMMANDS
     @admin_election_group.command(
         name="set_seats",
@@ -204,7 +386,7 @@ class AdminCentral(commands.Cog):
     ):
         elections_col = self.bot.db["elections_config"]
 
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$push": {"seats": {"state": state, "office": office, "seats": seats}}},
             upsert=True
@@ -238,7 +420,7 @@ class AdminCentral(commands.Cog):
             return
 
         elections_col = self.bot.db["elections_config"]
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": []}},
             upsert=True
@@ -268,7 +450,7 @@ class AdminCentral(commands.Cog):
     ):
         winners_col = self.bot.db["winners"]
 
-        winners_col.update_one(
+        await winners_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$push": {"winners": {
                 "user_id": user.id,
@@ -311,7 +493,7 @@ class AdminCentral(commands.Cog):
                     state, office, seats_str = parts
                     try:
                         seats = int(seats_str.strip())
-                        elections_col.update_one(
+                        await elections_col.update_one(
                             {"guild_id": interaction.guild.id},
                             {"$push": {"seats": {
                                 "state": state.strip(),
@@ -358,7 +540,7 @@ class AdminCentral(commands.Cog):
 
         parties_col = self.bot.db["parties_config"]
 
-        parties_col.update_one(
+        await parties_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$push": {"parties": {
                 "name": name,
@@ -391,7 +573,7 @@ class AdminCentral(commands.Cog):
     ):
         parties_col = self.bot.db["parties_config"]
 
-        result = parties_col.update_one(
+        result = await parties_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$pull": {"parties": {"name": name}}}
         )
@@ -441,7 +623,7 @@ class AdminCentral(commands.Cog):
             }
         ]
 
-        parties_col.update_one(
+        await parties_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": default_parties}},
             upsert=True
@@ -476,12 +658,8 @@ class AdminCentral(commands.Cog):
             await interaction.response.send_message("❌ Invalid date provided", ephemeral=True)
             return
 
-        time_col = self.bot.db["time_configs"]
-        time_col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"current_rp_date": new_date}},
-            upsert=True
-        )
+        # Moves the RP clock's anchor; the time loop picks up any phase change
+        await get_rp_clock(self.bot).update(interaction.guild.id, {"current_rp_date": new_date})
 
         await self._log_admin_command(interaction, "set_current_time", {"year": year, "month": month, "day": day})
 
@@ -506,12 +684,7 @@ class AdminCentral(commands.Cog):
             await interaction.response.send_message("❌ Minutes must be positive", ephemeral=True)
             return
 
-        time_col = self.bot.db["time_configs"]
-        time_col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"time_scale_minutes": minutes}},
-            upsert=True
-        )
+        await get_rp_clock(self.bot).update(interaction.guild.id, {"minutes_per_rp_day": minutes})
 
         await self._log_admin_command(interaction, "set_time_scale", {"minutes": minutes})
 
@@ -541,7 +714,7 @@ class AdminCentral(commands.Cog):
     ):
         momentum_col = self.bot.db["momentum"]
 
-        momentum_col.update_one(
+        await momentum_col.update_one(
             {"guild_id": interaction.guild.id, "state": state, "party": party},
             {"$inc": {"momentum": amount}},
             upsert=True
@@ -581,7 +754,7 @@ class AdminCentral(commands.Cog):
             return
 
         states_col = self.bot.db["state_data"]
-        states_col.update_one(
+        await states_col.update_one(
             {"guild_id": interaction.guild.id, "state": state},
             {"$set": {"lean": lean, "lean_strength": strength}},
             upsert=True
@@ -619,7 +792,7 @@ class AdminCentral(commands.Cog):
                 candidate, votes_str = line.split(':', 1)
                 try:
                     votes = int(votes_str.strip())
-                    polling_col.update_one(
+                    await polling_col.update_one(
                         {"guild_id": interaction.guild.id, "candidate": candidate.strip()},
                         {"$set": {"votes": votes}},
                         upsert=True
@@ -658,7 +831,7 @@ class AdminCentral(commands.Cog):
         polling_col = self.bot.db["polling"]
 
         # Set winner votes
-        polling_col.update_one(
+        await polling_col.update_one(
             {"guild_id": interaction.guild.id, "candidate": winner},
             {"$set": {"votes": winner_votes, "is_winner": True}},
             upsert=True
@@ -668,7 +841,7 @@ class AdminCentral(commands.Cog):
 
         # Set runner-up votes if provided
         if runner_up and runner_up_votes is not None:
-            polling_col.update_one(
+            await polling_col.update_one(
                 {"guild_id": interaction.guild.id, "candidate": runner_up},
                 {"$set": {"votes": runner_up_votes, "is_winner": False}},
                 upsert=True
@@ -781,13 +954,13 @@ class AdminCentral(commands.Cog):
             return
 
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": interaction.guild.id})
+        config = await col.find_one({"guild_id": interaction.guild.id})
         if not config:
             config = {"guild_id": interaction.guild.id, "winners": {}}
-            col.insert_one(config)
+            await col.insert_one(config)
 
         config["winners"][party] = winner_name
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"winners": config["winners"]}}
         )
@@ -815,8 +988,7 @@ class AdminCentral(commands.Cog):
         signup_year: int = None,
         confirm: bool = False
     ):
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -856,16 +1028,16 @@ class AdminCentral(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_toggle_delegate_system(self, interaction: discord.Interaction):
         delegates_col = self.bot.db["delegates_config"]
-        config = delegates_col.find_one({"guild_id": interaction.guild.id})
+        config = await delegates_col.find_one({"guild_id": interaction.guild.id})
 
         if not config:
             config = {"guild_id": interaction.guild.id, "enabled": True}
-            delegates_col.insert_one(config)
+            await delegates_col.insert_one(config)
 
         current_status = config.get("enabled", True)
         new_status = not current_status
 
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"enabled": new_status}}
         )
@@ -886,16 +1058,16 @@ class AdminCentral(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_pause_delegate_system(self, interaction: discord.Interaction):
         delegates_col = self.bot.db["delegates_config"]
-        config = delegates_col.find_one({"guild_id": interaction.guild.id})
+        config = await delegates_col.find_one({"guild_id": interaction.guild.id})
 
         if not config:
             config = {"guild_id": interaction.guild.id, "paused": False}
-            delegates_col.insert_one(config)
+            await delegates_col.insert_one(config)
 
         current_status = config.get("paused", False)
         new_status = not current_status
 
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"paused": new_status}}
         )
@@ -928,7 +1100,7 @@ class AdminCentral(commands.Cog):
     ):
         delegates_col = self.bot.db["delegates"]
 
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id, "candidate": winner},
             {"$inc": {"delegates": delegate_count}},
             upsert=True
@@ -936,7 +1108,7 @@ class AdminCentral(commands.Cog):
 
         # Log the state call
         state_calls_col = self.bot.db["state_calls"]
-        state_calls_col.insert_one({
+        await state_calls_col.insert_one({
             "guild_id": interaction.guild.id,
             "state": state,
             "winner": winner,
@@ -970,7 +1142,7 @@ class AdminCentral(commands.Cog):
         position: str
     ):
         endorsements_col = self.bot.db["endorsements_config"]
-        endorsements_col.update_one(
+        await endorsements_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {f"roles.{position}": role.id}},
             upsert=True
@@ -1000,7 +1172,7 @@ class AdminCentral(commands.Cog):
         candidate: str
     ):
         endorsements_col = self.bot.db["endorsements"]
-        endorsements_col.update_one(
+        await endorsements_col.update_one(
             {"guild_id": interaction.guild.id, "position": position},
             {"$set": {
                 "endorsed_candidate": candidate,
@@ -1070,7 +1242,7 @@ class AdminCentral(commands.Cog):
         if state:
             filter_dict["state"] = state
 
-        winners_col.update_one(
+        await winners_col.update_one(
             filter_dict,
             {"$set": {"votes": votes, "updated_at": datetime.utcnow()}},
             upsert=True
@@ -1108,7 +1280,7 @@ class AdminCentral(commands.Cog):
             return
 
         campaign_col = self.bot.db["campaign_actions"]
-        campaign_col.insert_one({
+        await campaign_col.insert_one({
             "guild_id": interaction.guild.id,
             "candidate": candidate,
             "action": "rally",
@@ -1144,7 +1316,7 @@ class AdminCentral(commands.Cog):
         ad_type: str = "general"
     ):
         campaign_col = self.bot.db["campaign_actions"]
-        campaign_col.insert_one({
+        await campaign_col.insert_one({
             "guild_id": interaction.guild.id,
             "candidate": candidate,
             "action": "advertisement",
@@ -1185,7 +1357,7 @@ class AdminCentral(commands.Cog):
             return
 
         demographics_col = self.bot.db["demographics"]
-        demographics_col.update_one(
+        await demographics_col.update_one(
             {"guild_id": interaction.guild.id, "candidate": candidate, "demographic": demographic},
             {"$set": {"strength": strength}},
             upsert=True
@@ -1223,7 +1395,7 @@ class AdminCentral(commands.Cog):
             return
 
         demographics_col = self.bot.db["demographics"]
-        result = demographics_col.delete_many({
+        result = await demographics_col.delete_many({
             "guild_id": interaction.guild.id,
             "candidate": candidate
         })
@@ -1259,7 +1431,7 @@ class AdminCentral(commands.Cog):
             return
 
         ideology_col = self.bot.db["user_ideologies"]
-        ideology_col.update_one(
+        await ideology_col.update_one(
             {"guild_id": interaction.guild.id, "user_id": user.id},
             {"$set": {
                 "ideology": ideology,
@@ -1290,7 +1462,7 @@ class AdminCentral(commands.Cog):
         user: discord.Member
     ):
         ideology_col = self.bot.db["user_ideologies"]
-        result = ideology_col.delete_one({
+        result = await ideology_col.delete_one({
             "guild_id": interaction.guild.id,
             "user_id": user.id
         })
@@ -1344,7 +1516,7 @@ class AdminCentral(commands.Cog):
         if party:
             signup_data["party"] = party
 
-        signups_col.insert_one(signup_data)
+        await signups_col.insert_one(signup_data)
 
         location_text = f" in {state}" if state else ""
         party_text = f" ({party})" if party else ""
@@ -1385,7 +1557,7 @@ class AdminCentral(commands.Cog):
         if state:
             filter_dict["state"] = state
 
-        result = signups_col.delete_one(filter_dict)
+        result = await signups_col.delete_one(filter_dict)
 
         if result.deleted_count > 0:
             location_text = f" in {state}" if state else ""
@@ -1419,7 +1591,7 @@ class AdminCentral(commands.Cog):
         reason: str = "Administrative action"
     ):
         elections_col = self.bot.db["elections_config"]
-        config = elections_col.find_one({"guild_id": interaction.guild.id})
+        config = await elections_col.find_one({"guild_id": interaction.guild.id})
 
         if not config:
             await interaction.response.send_message("❌ Elections system not configured.", ephemeral=True)
@@ -1448,7 +1620,7 @@ class AdminCentral(commands.Cog):
             "vacancy_date": datetime.utcnow()
         })
 
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1514,7 +1686,7 @@ class AdminCentral(commands.Cog):
         term_start_year: int = None
     ):
         elections_col = self.bot.db["elections_config"]
-        config = elections_col.find_one({"guild_id": interaction.guild.id})
+        config = await elections_col.find_one({"guild_id": interaction.guild.id})
 
         if not config:
             await interaction.response.send_message("❌ Elections system not configured.", ephemeral=True)
@@ -1536,8 +1708,7 @@ class AdminCentral(commands.Cog):
         # Calculate term dates
         if term_start_year is None:
             # Get current RP year from time manager
-            time_col = self.bot.db["time_configs"]
-            time_config = time_col.find_one({"guild_id": interaction.guild.id})
+            time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
             if time_config:
                 term_start_year = time_config["current_rp_date"].year
             else:
@@ -1557,7 +1728,7 @@ class AdminCentral(commands.Cog):
             "vacancy_date": None
         })
 
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1597,7 +1768,7 @@ class AdminCentral(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_list_vacant_seats(self, interaction: discord.Interaction):
         elections_col = self.bot.db["elections_config"]
-        config = elections_col.find_one({"guild_id": interaction.guild.id})
+        config = await elections_col.find_one({"guild_id": interaction.guild.id})
 
         if not config:
             await interaction.response.send_message("❌ Elections system not configured.", ephemeral=True)
@@ -1733,7 +1904,7 @@ class AdminCentral(commands.Cog):
         if user:
             filter_dict["user_id"] = user.id
 
-        logs = list(admin_logs_col.find(filter_dict).sort("timestamp", -1).limit(limit))
+        logs = await admin_logs_col.find(filter_dict).sort("timestamp", -1).limit(limit).to_list(None)
 
         if not logs:
             await interaction.response.send_message("📝 No admin command logs found.", ephemeral=True)
@@ -1827,7 +1998,7 @@ class AdminCentral(commands.Cog):
         if command_name:
             filter_dict["command"] = {"$regex": command_name, "$options": "i"}
 
-        logs = list(admin_logs_col.find(filter_dict).sort("timestamp", -1).limit(25))
+        logs = await admin_logs_col.find(filter_dict).sort("timestamp", -1).limit(25).to_list(None)
 
         if not logs:
             await interaction.response.send_message("📝 No matching admin command logs found.", ephemeral=True)
@@ -1905,10 +2076,10 @@ class AdminCentral(commands.Cog):
         cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
         # Get all logs in the timeframe
-        logs = list(admin_logs_col.find({
+        logs = await admin_logs_col.find({
             "guild_id": interaction.guild.id,
             "timestamp": {"$gte": cutoff_date}
-        }))
+        }).to_list(None)
 
         if not logs:
             await interaction.response.send_message(
@@ -2001,7 +2172,7 @@ class AdminCentral(commands.Cog):
         cutoff_date = datetime.utcnow() - timedelta(days=days_old)
 
         # Count logs that would be deleted
-        count_to_delete = admin_logs_col.count_documents({
+        count_to_delete = await admin_logs_col.count_documents({
             "guild_id": interaction.guild.id,
             "timestamp": {"$lt": cutoff_date}
         })
@@ -2016,7 +2187,7 @@ class AdminCentral(commands.Cog):
             return
 
         # Delete old logs
-        result = admin_logs_col.delete_many({
+        result = await admin_logs_col.delete_many({
             "guild_id": interaction.guild.id,
             "timestamp": {"$lt": cutoff_date}
         })
@@ -3,15 +3,29 @@ import discord
 from discord import app_commands
 from typing import List, Optional
 from datetime import datetime
+from cogs.candidates import get_candidate_registry
+from cogs.exports import build_export, send_export
+from cogs.time_manager import get_rp_clock
+
+# Candidates listed per page of the campaign points view
+CANDIDATES_PER_PAGE = 10
+
+# Columns of the signup CSV and JSON Lines exports
+SIGNUP_EXPORT_COLUMNS = ["name", "party", "seat_id", "office", "region", "stamina", "points",
+                         "corruption", "phase", "winner"]
 
 class CampaignPointsPaginationView(discord.ui.View):
-    def __init__(self, interaction, sort_by, filter_region, filter_party, year, total_pages, current_page=1):
+    """Pages over the filtered, sorted candidates captured when the view was created"""
+
+    def __init__(self, interaction, sort_by, filter_region, filter_party, year, candidates, current_page=1):
         super().__init__(timeout=300)
         self.interaction = interaction
         self.sort_by = sort_by
         self.filter_region = filter_region
         self.filter_party = filter_party
         self.year = year
+        self.candidates = tuple(candidates)
+        total_pages = max(1, (len(self.candidates) + CANDIDATES_PER_PAGE - 1) // CANDIDATES_PER_PAGE)
         self.total_pages = total_pages
         self.current_page = current_page
 
@@ -47,56 +61,13 @@ class PageSelectDropdown(discord.ui.Select):
 
             selected_page = int(self.values[0])
 
-            # Get the main cog to access the command logic
-            signups_cog = interaction.client.get_cog('AllSignups')
-            if not signups_cog:
-                await interaction.followup.send("❌ Error: AllSignups cog not found.", ephemeral=True)
-                return
-
-            # Get time configuration
-            time_col, time_config = signups_cog._get_time_config(interaction.guild.id)
-            if not time_config:
-                await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-                return
-
-            current_phase = time_config.get("current_phase", "")
             target_year = self.view.year
 
-            # Get signups configuration
-            signups_col, signups_config = signups_cog._get_signups_config(interaction.guild.id)
-
-            # Filter candidates by year
-            candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
-
-            if not candidates:
-                await interaction.followup.send(f"❌ No candidates found for {target_year}.", ephemeral=True)
-                return
-
-            # Apply filters and sorting (same logic as in main command)
-            filtered_candidates = candidates
-            if self.view.filter_region:
-                filtered_candidates = [c for c in filtered_candidates if c["region"].lower() == self.view.filter_region.lower()]
-            if self.view.filter_party:
-                filtered_candidates = [c for c in filtered_candidates if self.view.filter_party.lower() in c["party"].lower()]
-
-            if not filtered_candidates:
-                await interaction.followup.send("❌ No candidates found with those filters.", ephemeral=True)
-                return
-
-            # Sort candidates
-            if self.view.sort_by.lower() == "points":
-                filtered_candidates.sort(key=lambda x: x["points"], reverse=True)
-            elif self.view.sort_by.lower() == "corruption":
-                filtered_candidates.sort(key=lambda x: x["corruption"], reverse=True)
-            elif self.view.sort_by.lower() == "stamina":
-                filtered_candidates.sort(key=lambda x: x["stamina"], reverse=True)
-            elif self.view.sort_by.lower() == "seat":
-                filtered_candidates.sort(key=lambda x: x["seat_id"])
-            else:
-                filtered_candidates.sort(key=lambda x: x["name"].lower())
+            # Page over the snapshot the view was created with instead of re-reading the signups
+            filtered_candidates = self.view.candidates
 
             # Pagination
-            candidates_per_page = 10
+            candidates_per_page = CANDIDATES_PER_PAGE
             total_candidates = len(filtered_candidates)
             total_pages = max(1, (total_candidates + candidates_per_page - 1) // candidates_per_page)
             page = max(1, min(selected_page, total_pages))
@@ -214,7 +185,7 @@ class PageSelectDropdown(discord.ui.Select):
                 self.view.filter_region,
                 self.view.filter_party,
                 self.view.year,
-                total_pages,
+                filtered_candidates,
                 page  # Pass the selected page as current_page
             )
 
@@ -241,28 +212,28 @@ class AllSignups(commands.Cog):
         self.bot = bot
         print("All Signups cog loaded successfully")
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_elections_config(self, guild_id: int):
+    async def _get_elections_config(self, guild_id: int):
         """Get elections configuration"""
         col = self.bot.db["elections_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_signups_config(self, guild_id: int):
+    async def _get_signups_config(self, guild_id: int):
         """Get or create signups configuration"""
         col = self.bot.db["signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "candidates": []
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
     async def party_autocomplete(
@@ -273,7 +244,7 @@ class AllSignups(commands.Cog):
         """Autocomplete for party names from database"""
         # Get parties from database
         parties_col = self.bot.db["parties_config"]
-        parties_config = parties_col.find_one({"guild_id": interaction.guild.id})
+        parties_config = await parties_col.find_one({"guild_id": interaction.guild.id})
 
         if not parties_config:
             # Return default parties if no config exists
@@ -293,15 +264,15 @@ class AllSignups(commands.Cog):
             for party in filtered_parties[:25]
         ]
 
-    def _get_available_seats_in_region(self, guild_id: int, region: str) -> List[dict]:
+    async def _get_available_seats_in_region(self, guild_id: int, region: str) -> List[dict]:
         """Get all seats that are up for election in the specified region"""
-        elections_col, elections_config = self._get_elections_config(guild_id)
+        elections_col, elections_config = await self._get_elections_config(guild_id)
 
         if not elections_config or not elections_config.get("seats"):
             return []
 
         # Get current RP year for election cycle checking
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         available_seats = []
@@ -333,9 +304,9 @@ class AllSignups(commands.Cog):
 
         return available_seats
 
-    def _get_regions_from_elections(self, guild_id: int) -> List[str]:
+    async def _get_regions_from_elections(self, guild_id: int) -> List[str]:
         """Get available regions from elections config"""
-        elections_col, elections_config = self._get_elections_config(guild_id)
+        elections_col, elections_config = await self._get_elections_config(guild_id)
 
         if not elections_config or not elections_config.get("seats"):
             return []
@@ -384,9 +355,9 @@ class AllSignups(commands.Cog):
 
         return False
 
-    def _get_regions_from_elections(self, guild_id: int) -> List[str]:
+    async def _get_regions_from_elections(self, guild_id: int) -> List[str]:
         """Get available regions from elections config"""
-        elections_col, elections_config = self._get_elections_config(guild_id)
+        elections_col, elections_config = await self._get_elections_config(guild_id)
 
         if not elections_config or not elections_config.get("seats"):
             return []
@@ -404,7 +375,7 @@ class AllSignups(commands.Cog):
         current: str,
     ) -> List[app_commands.Choice[str]]:
         """Autocomplete for region selection"""
-        regions = self._get_regions_from_elections(interaction.guild.id)
+        regions = await self._get_regions_from_elections(interaction.guild.id)
 
         # Filter regions based on current input
         filtered_regions = [
@@ -437,7 +408,7 @@ class AllSignups(commands.Cog):
         region: str
     ):
         # Check if we're in signup phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -455,7 +426,7 @@ class AllSignups(commands.Cog):
             return
 
         # Validate region
-        available_regions = self._get_regions_from_elections(interaction.guild.id)
+        available_regions = await self._get_regions_from_elections(interaction.guild.id)
         if region not in available_regions:
             regions_text = ", ".join(available_regions) if available_regions else "None available"
             await interaction.response.send_message(
@@ -465,7 +436,7 @@ class AllSignups(commands.Cog):
             return
 
         # Get available seats in the region
-        available_seats = self._get_available_seats_in_region(interaction.guild.id, region)
+        available_seats = await self._get_available_seats_in_region(interaction.guild.id, region)
 
         if not available_seats:
             await interaction.response.send_message(
@@ -475,15 +446,13 @@ class AllSignups(commands.Cog):
             return
 
         # Check if user already has a signup for this election cycle
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year
 
-        existing_signup = None
-        for candidate in signups_config["candidates"]:
-            if (candidate["user_id"] == interaction.user.id and
-                candidate["year"] == current_year):
-                existing_signup = candidate
-                break
+        registry = get_candidate_registry(self.bot)
+        _, existing_signup = await registry.resolve(
+            interaction.guild.id, time_config, user_id=interaction.user.id, sources=("signups",)
+        )
 
         if existing_signup:
             await interaction.response.send_message(
@@ -493,17 +462,19 @@ class AllSignups(commands.Cog):
             return
 
         # Check if user has a presidential signup
+        _, pres_candidate = await registry.resolve(
+            interaction.guild.id, time_config, user_id=interaction.user.id, sources=("presidential_signups",)
+        )
+        if pres_candidate:
+            await interaction.response.send_message(
+                f"❌ You are already signed up for the presidential race as **{pres_candidate['name']}** ({pres_candidate['office']}) in {current_year}. You cannot sign up for both presidential and regular elections.",
+                ephemeral=True
+            )
+            return
+
         pres_col = self.bot.db["presidential_signups"]
-        pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+        pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
         if pres_config:
-            for candidate in pres_config.get("candidates", []):
-                if (candidate["user_id"] == interaction.user.id and
-                    candidate["year"] == current_year):
-                    await interaction.response.send_message(
-                        f"❌ You are already signed up for the presidential race as **{candidate['name']}** ({candidate['office']}) in {current_year}. You cannot sign up for both presidential and regular elections.",
-                        ephemeral=True
-                    )
-                    return
 
             # Check if user has pending VP requests
             for vp_request in pres_config.get("pending_vp_requests", []):
@@ -519,7 +490,7 @@ class AllSignups(commands.Cog):
         # Validate party role if configured
         party_cog = self.bot.get_cog("PartyManagement")
         if party_cog:
-            is_valid, error_msg = party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
+            is_valid, error_msg = await party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
             if not is_valid:
                 await interaction.response.send_message(f"❌ {error_msg}", ephemeral=True)
                 return
@@ -628,7 +599,7 @@ class AllSignups(commands.Cog):
 
                 signups_config["candidates"].append(new_candidate)
 
-                signups_col.update_one(
+                await signups_col.update_one(
                     {"guild_id": interaction.guild.id},
                     {"$set": {"candidates": signups_config["candidates"]}}
                 )
@@ -702,7 +673,7 @@ class AllSignups(commands.Cog):
     )
     @app_commands.autocomplete(region=region_autocomplete)
     async def view_signups(self, interaction: discord.Interaction, year: int = None, region: str = None):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -713,7 +684,7 @@ class AllSignups(commands.Cog):
 
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Filter candidates for target year
         current_candidates = [
@@ -899,7 +870,7 @@ class AllSignups(commands.Cog):
         description="Withdraw your candidacy from the current election"
     )
     async def withdraw_signup(self, interaction: discord.Interaction):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -910,17 +881,12 @@ class AllSignups(commands.Cog):
 
         current_year = time_config["current_rp_date"].year
         current_phase = time_config.get("current_phase", "")
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col = self.bot.db["signups"]
 
         # Find user's signup
-        user_signup = None
-        signup_index = None
-        for i, candidate in enumerate(signups_config["candidates"]):
-            if (candidate["user_id"] == interaction.user.id and
-                candidate["year"] == current_year):
-                user_signup = candidate
-                signup_index = i
-                break
+        _, user_signup = await get_candidate_registry(self.bot).resolve(
+            interaction.guild.id, time_config, user_id=interaction.user.id, sources=("signups",)
+        )
 
         if not user_signup:
             await interaction.response.send_message(
@@ -930,10 +896,9 @@ class AllSignups(commands.Cog):
             return
 
         # Remove the signup
-        signups_config["candidates"].pop(signup_index)
-        signups_col.update_one(
+        await signups_col.update_one(
             {"guild_id": interaction.guild.id},
-            {"$set": {"candidates": signups_config["candidates"]}}
+            {"$pull": {"candidates": {"user_id": interaction.user.id, "year": current_year}}}
         )
 
         await interaction.response.send_message(
@@ -946,7 +911,7 @@ class AllSignups(commands.Cog):
         description="View your current signup details"
     )
     async def my_signup(self, interaction: discord.Interaction):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -957,71 +922,62 @@ class AllSignups(commands.Cog):
 
         current_year = time_config["current_rp_date"].year
         current_phase = time_config.get("current_phase", "")
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        registry = get_candidate_registry(self.bot)
 
         # If we're in the General Campaign phase, check winners collection first
         if current_phase == "General Campaign":
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if winners_config and winners_config.get("winners"):
-                user_winner = None
-                for w in winners_config["winners"]:
-                    if w.get("user_id") == interaction.user.id and w.get("year") == current_year:
-                        user_winner = w
-                        break
+            _, user_winner = await registry.resolve(
+                interaction.guild.id, time_config, user_id=interaction.user.id, sources=("winners",)
+            )
 
-                if user_winner:
-                    embed = discord.Embed(
-                        title="📋 Your General Campaign Details",
-                        color=discord.Color.green(),
-                        timestamp=datetime.utcnow()
-                    )
+            if user_winner:
+                embed = discord.Embed(
+                    title="📋 Your General Campaign Details",
+                    color=discord.Color.green(),
+                    timestamp=datetime.utcnow()
+                )
 
-                    embed.add_field(
-                        name="👤 Candidate Info",
-                        value=f"**Name:** {user_winner.get('candidate', 'Unknown')}\n"
-                              f"**Party:** {user_winner.get('party', 'Unknown')}\n"
-                              f"**Region:** {user_winner.get('state', 'Unknown')}",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="👤 Candidate Info",
+                    value=f"**Name:** {user_winner.get('candidate', 'Unknown')}\n"
+                          f"**Party:** {user_winner.get('party', 'Unknown')}\n"
+                          f"**Region:** {user_winner.get('state', 'Unknown')}",
+                    inline=True
+                )
 
-                    embed.add_field(
-                        name="🏛️ Running For",
-                        value=f"**Seat:** {user_winner.get('seat_id', 'Unknown')}\n"
-                              f"**Office:** {user_winner.get('office', 'Unknown')}\n"
-                              f"**Year:** {user_winner.get('year', current_year)}",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="🏛️ Running For",
+                    value=f"**Seat:** {user_winner.get('seat_id', 'Unknown')}\n"
+                          f"**Office:** {user_winner.get('office', 'Unknown')}\n"
+                          f"**Year:** {user_winner.get('year', current_year)}",
+                    inline=True
+                )
 
-                    embed.add_field(
-                        name="📊 Campaign Stats",
-                        value=f"**Stamina:** {user_winner.get('stamina', 0)}\n"
-                              f"**Points:** {float(user_winner.get('points', 0.0)):.2f}\n"
-                              f"**Corruption:** {user_winner.get('corruption', 0)}\n"
-                              f"**Baseline %:** {float(user_winner.get('baseline_percentage', 0.0)):.1f}\n"
-                              f"**Votes:** {user_winner.get('votes', 0)}",
-                        inline=True
-                    )
+                embed.add_field(
+                    name="📊 Campaign Stats",
+                    value=f"**Stamina:** {user_winner.get('stamina', 0)}\n"
+                          f"**Points:** {float(user_winner.get('points', 0.0)):.2f}\n"
+                          f"**Corruption:** {user_winner.get('corruption', 0)}\n"
+                          f"**Baseline %:** {float(user_winner.get('baseline_percentage', 0.0)):.1f}\n"
+                          f"**Votes:** {user_winner.get('votes', 0)}",
+                    inline=True
+                )
 
-                    embed.add_field(
-                        name="📅 Status",
-                        value=f"**Phase:** {user_winner.get('phase', 'General Campaign')}\n"
-                              f"**Primary Winner:** {'Yes' if user_winner.get('primary_winner', False) else 'No'}\n"
-                              f"**General Winner:** {'Yes' if user_winner.get('general_winner', False) else 'TBD'}",
-                        inline=False
-                    )
+                embed.add_field(
+                    name="📅 Status",
+                    value=f"**Phase:** {user_winner.get('phase', 'General Campaign')}\n"
+                          f"**Primary Winner:** {'Yes' if user_winner.get('primary_winner', False) else 'No'}\n"
+                          f"**General Winner:** {'Yes' if user_winner.get('general_winner', False) else 'TBD'}",
+                    inline=False
+                )
 
-                    await interaction.response.send_message(embed=embed, ephemeral=True)
-                    return
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
 
         # Find user's signup
-        user_signup = None
-        for candidate in signups_config["candidates"]:
-            if (candidate["user_id"] == interaction.user.id and
-                candidate["year"] == current_year):
-                user_signup = candidate
-                break
+        _, user_signup = await registry.resolve(
+            interaction.guild.id, time_config, user_id=interaction.user.id, sources=("signups",)
+        )
 
         if not user_signup:
             await interaction.response.send_message(
@@ -1081,7 +1037,7 @@ class AllSignups(commands.Cog):
         year: int = None
     ):
         """Remove a candidate by name"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1093,28 +1049,23 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col = self.bot.db["signups"]
 
         # Find candidate
-        candidate_found = None
-        for i, candidate in enumerate(signups_config["candidates"]):
-            if (candidate["name"].lower() == candidate_name.lower() and
-                candidate["year"] == target_year):
-                candidate_found = i
-                break
+        _, removed_candidate = await get_candidate_registry(self.bot).resolve(
+            interaction.guild.id, time_config, name=candidate_name, sources=("signups",), year=target_year
+        )
 
-        if candidate_found is None:
+        if removed_candidate is None:
             await interaction.response.send_message(
                 f"❌ Candidate '{candidate_name}' not found for {target_year}.",
                 ephemeral=True
             )
             return
 
-        removed_candidate = signups_config["candidates"].pop(candidate_found)
-
-        signups_col.update_one(
+        await signups_col.update_one(
             {"guild_id": interaction.guild.id},
-            {"$set": {"candidates": signups_config["candidates"]}}
+            {"$pull": {"candidates": {"name": removed_candidate["name"], "year": target_year}}}
         )
 
         await interaction.response.send_message(
@@ -1135,7 +1086,7 @@ class AllSignups(commands.Cog):
         confirm: bool = False
     ):
         """Clear all signups for a specific year"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1147,7 +1098,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Count signups for target year
         year_signups = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -1172,7 +1123,7 @@ class AllSignups(commands.Cog):
             c for c in signups_config["candidates"] if c["year"] != target_year
         ]
 
-        signups_col.update_one(
+        await signups_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"candidates": signups_config["candidates"]}}
         )
@@ -1196,7 +1147,7 @@ class AllSignups(commands.Cog):
         year: int = None
     ):
         """Modify candidate fields like party, stamina, points, corruption"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1208,15 +1159,12 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col = self.bot.db["signups"]
 
         # Find candidate
-        candidate_found = None
-        for i, candidate in enumerate(signups_config["candidates"]):
-            if (candidate["name"].lower() == candidate_name.lower() and
-                candidate["year"] == target_year):
-                candidate_found = i
-                break
+        _, candidate_found = await get_candidate_registry(self.bot).resolve(
+            interaction.guild.id, time_config, name=candidate_name, sources=("signups",), year=target_year
+        )
 
         if candidate_found is None:
             await interaction.response.send_message(
@@ -1235,7 +1183,7 @@ class AllSignups(commands.Cog):
             )
             return
 
-        old_value = signups_config["candidates"][candidate_found].get(field.lower(), "None")
+        old_value = candidate_found.get(field.lower(), "None")
 
         try:
             if field.lower() in ["stamina", "points", "corruption"]:
@@ -1247,11 +1195,10 @@ class AllSignups(commands.Cog):
             elif field.lower() == "winner":
                 new_value = new_value.lower() in ["true", "yes", "1"]
 
-            signups_config["candidates"][candidate_found][field.lower()] = new_value
-
-            signups_col.update_one(
-                {"guild_id": interaction.guild.id},
-                {"$set": {"candidates": signups_config["candidates"]}}
+            await signups_col.update_one(
+                {"guild_id": interaction.guild.id,
+                 "candidates": {"$elemMatch": {"name": candidate_found["name"], "year": target_year}}},
+                {"$set": {f"candidates.$.{field.lower()}": new_value}}
             )
 
             await interaction.response.send_message(
@@ -1277,7 +1224,7 @@ class AllSignups(commands.Cog):
         year: int = None
     ):
         """Bulk update multiple candidates at once"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1289,7 +1236,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Validate field
         valid_fields = ["stamina", "points", "corruption", "phase"]
@@ -1324,7 +1271,7 @@ class AllSignups(commands.Cog):
                     updated_candidates.append(candidate["name"])
 
             if updated_candidates:
-                signups_col.update_one(
+                await signups_col.update_one(
                     {"guild_id": interaction.guild.id},
                     {"$set": {"candidates": signups_config["candidates"]}}
                 )
@@ -1347,17 +1294,18 @@ class AllSignups(commands.Cog):
 
     @app_commands.command(
         name="admin_signup_export",
-        description="Export candidate signups as text (Admin only)"
+        description="Export candidate signups as a CSV, JSON Lines or text file (Admin only)"
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_export_signups(
         self,
         interaction: discord.Interaction,
         year: int = None,
-        format_type: str = "csv"
+        format_type: str = "csv",
+        compress: bool = False
     ):
         """Export signup data"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1369,60 +1317,41 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        # Reading the roster may take a while for a large guild
+        await interaction.response.defer(ephemeral=True)
 
-        # Filter by year
-        candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
+        candidates = self.bot.db["signups"].iter_candidates(
+            {"guild_id": interaction.guild.id, "year": target_year}
+        )
+        export = await build_export(
+            candidates, f"signups_{target_year}", format_type, SIGNUP_EXPORT_COLUMNS,
+            row=lambda candidate: [
+                candidate.get("name"), candidate.get("party"), candidate.get("seat_id"),
+                candidate.get("office"), candidate.get("region"), candidate.get("stamina"),
+                float(candidate.get("points", 0)), candidate.get("corruption"),
+                candidate.get("phase", "Primary Campaign"), candidate.get("winner", False)
+            ],
+            line=lambda candidate: (
+                f"{candidate['name']} ({candidate['party']}) - {candidate['seat_id']} "
+                f"({candidate['office']}, {candidate['region']}) | "
+                f"S:{candidate['stamina']} P:{candidate['points']:.2f} C:{candidate['corruption']} "
+                f"Phase:{candidate.get('phase', 'Primary Campaign')} Winner:{candidate.get('winner', False)}"
+            ),
+            compress=compress
+        )
 
-        if not candidates:
-            await interaction.response.send_message(
+        if not export.rows:
+            export.discard()
+            await interaction.followup.send(
                 f"❌ No signups found for {target_year}.",
                 ephemeral=True
             )
             return
 
-        if format_type.lower() == "csv":
-            lines = ["name,party,seat_id,office,region,stamina,points,corruption,phase,winner"]
-            for candidate in candidates:
-                lines.append(
-                    f"{candidate['name']},{candidate['party']},{candidate['seat_id']},"
-                    f"{candidate['office']},{candidate['region']},{candidate['stamina']},"
-                    f"{candidate['points']:.2f},{candidate['corruption']},{candidate.get('phase', 'Primary Campaign')},"
-                    f"{candidate.get('winner', False)}"
-                )
-            export_text = "\n".join(lines)
-        else:
-            # Text format
-            export_lines = []
-            for candidate in candidates:
-                export_lines.append(
-                    f"{candidate['name']} ({candidate['party']}) - {candidate['seat_id']} "
-                    f"({candidate['office']}, {candidate['region']}) | "
-                    f"S:{candidate['stamina']} P:{candidate['points']:.2f} C:{candidate['corruption']} "
-                    f"Phase:{candidate.get('phase', 'Primary Campaign')} Winner:{candidate.get('winner', False)}"
-                )
-            export_text = "\n".join(export_lines)
-
-        # Handle long responses
-        if len(export_text) > 1900:
-            chunk_size = 1900
-            chunks = [export_text[i:i+chunk_size] for i in range(0, len(export_text), chunk_size)]
-
-            await interaction.response.send_message(
-                f"📊 {target_year} Signups Export ({format_type.upper()}) - Part 1/{len(chunks)}:\n```\n{chunks[0]}\n```",
-                ephemeral=True
-            )
-
-            for i, chunk in enumerate(chunks[1:], 2):
-                await interaction.followup.send(
-                    f"📊 Part {i}/{len(chunks)}:\n```\n{chunk}\n```",
-                    ephemeral=True
-                )
-        else:
-            await interaction.response.send_message(
-                f"📊 {target_year} Signups Export ({format_type.upper()}):\n```\n{export_text}\n```",
-                ephemeral=True
-            )
+        await send_export(
+            interaction, export,
+            f"📊 {target_year} Signups Export ({format_type.upper()}) - {export.rows} candidates"
+        )
 
     @app_commands.command(
         name="admin_signup_view_points",
@@ -1438,7 +1367,7 @@ class AllSignups(commands.Cog):
         year: int = None
     ):
         """View candidate points with sorting and filtering options"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -1450,7 +1379,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Filter by year
         candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -1653,7 +1582,7 @@ class AllSignups(commands.Cog):
         # Defer immediately to prevent timeout
         await interaction.response.defer(ephemeral=True)
 
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
@@ -1662,7 +1591,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Filter by year
         candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -1697,7 +1626,7 @@ class AllSignups(commands.Cog):
             filtered_candidates.sort(key=lambda x: x["name"].lower())
 
         # Pagination settings - reduced to handle field length limits better
-        candidates_per_page = 10
+        candidates_per_page = CANDIDATES_PER_PAGE
         total_candidates = len(filtered_candidates)
         total_pages = max(1, (total_candidates + candidates_per_page - 1) // candidates_per_page)
 
@@ -1817,19 +1746,19 @@ class AllSignups(commands.Cog):
 
         # Create dropdown for quick navigation if many pages
         if total_pages > 1:
-            view = CampaignPointsPaginationView(interaction, sort_by, filter_region, filter_party, year, total_pages, page)
+            view = CampaignPointsPaginationView(interaction, sort_by, filter_region, filter_party, target_year, filtered_candidates, page)
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
         else:
             await interaction.followup.send(embed=embed, ephemeral=True)
 
     @admin_view_points.autocomplete("filter_region")
     async def filter_region_autocomplete(self, interaction: discord.Interaction, current: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         regions = set()
         for candidate in signups_config["candidates"]:
@@ -1841,12 +1770,12 @@ class AllSignups(commands.Cog):
 
     @admin_view_points.autocomplete("filter_party")
     async def filter_party_autocomplete(self, interaction: discord.Interaction, current: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         parties = set()
         for candidate in signups_config["candidates"]:
@@ -1864,12 +1793,12 @@ class AllSignups(commands.Cog):
 
     @admin_view_campaign_points.autocomplete("filter_region")
     async def campaign_filter_region_autocomplete(self, interaction: discord.Interaction, current: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         regions = set()
         for candidate in signups_config["candidates"]:
@@ -1881,12 +1810,12 @@ class AllSignups(commands.Cog):
 
     @admin_view_campaign_points.autocomplete("filter_party")
     async def campaign_filter_party_autocomplete(self, interaction: discord.Interaction, current: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         parties = set()
         for candidate in signups_config["candidates"]:
@@ -1908,7 +1837,7 @@ class AllSignups(commands.Cog):
         seat_id: str,
         year: int = None
     ):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -1917,7 +1846,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Find candidates for this seat
         seat_candidates = [
@@ -2006,7 +1935,7 @@ class AllSignups(commands.Cog):
         confirm: bool = False
     ):
         """Process signups and move winners to all_winners.py"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -2015,7 +1944,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Count candidates for target year
         candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -2063,7 +1992,7 @@ class AllSignups(commands.Cog):
         year: int = None
     ):
         """Show overall leaderboard of top candidates"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -2075,7 +2004,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Filter by year and sort by points (descending)
         candidates = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -2158,7 +2087,7 @@ class AllSignups(commands.Cog):
         name: str = None
     ):
         """Admin command to sign up any user for any race, bypassing normal restrictions"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -2171,7 +2100,7 @@ class AllSignups(commands.Cog):
         candidate_name = name if name else user.display_name
 
         # Validate region
-        available_regions = self._get_regions_from_elections(interaction.guild.id)
+        available_regions = await self._get_regions_from_elections(interaction.guild.id)
         if region not in available_regions:
             regions_text = ", ".join(available_regions) if available_regions else "None available"
             await interaction.response.send_message(
@@ -2181,7 +2110,7 @@ class AllSignups(commands.Cog):
             return
 
         # Get available seats in the region
-        available_seats = self._get_available_seats_in_region(interaction.guild.id, region)
+        available_seats = await self._get_available_seats_in_region(interaction.guild.id, region)
 
         # Find the specific seat
         selected_seat = None
@@ -2212,13 +2141,13 @@ class AllSignups(commands.Cog):
         if current_phase == "General Campaign":
             # Get all_winners configuration
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if not winners_config:
                 winners_config = {
                     "guild_id": interaction.guild.id,
                     "winners": []
                 }
-                winners_col.insert_one(winners_config)
+                await winners_col.insert_one(winners_config)
 
             # Check if user already has a winner entry for this year
             for winner in winners_config.get("winners", []):
@@ -2263,7 +2192,7 @@ class AllSignups(commands.Cog):
 
             winners_config["winners"].append(winner_entry)
 
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"winners": winners_config["winners"]}}
             )
@@ -2276,15 +2205,12 @@ class AllSignups(commands.Cog):
         else:
             # During primary phases, add to signups as normal
             # Get signups configuration
-            signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
             # Check if user already has a signup for this election cycle
-            existing_signup = None
-            for candidate in signups_config["candidates"]:
-                if (candidate["user_id"] == user.id and
-                    candidate["year"] == current_year):
-                    existing_signup = candidate
-                    break
+            _, existing_signup = await get_candidate_registry(self.bot).resolve(
+                interaction.guild.id, time_config, user_id=user.id, sources=("signups",)
+            )
 
             if existing_signup:
                 await interaction.response.send_message(
@@ -2311,7 +2237,7 @@ class AllSignups(commands.Cog):
 
             signups_config["candidates"].append(new_candidate)
 
-            signups_col.update_one(
+            await signups_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"candidates": signups_config["candidates"]}}
             )
@@ -2376,7 +2302,7 @@ class AllSignups(commands.Cog):
         confirm: bool = False
     ):
         """Reset primary election by clearing all signups"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -2385,7 +2311,7 @@ class AllSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
 
         # Count signups for target year
         year_signups = [c for c in signups_config["candidates"] if c["year"] == target_year]
@@ -2413,7 +2339,7 @@ class AllSignups(commands.Cog):
             c for c in signups_config["candidates"] if c["year"] != target_year
         ]
 
-        signups_col.update_one(
+        await signups_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"candidates": signups_config["candidates"]}}
         )
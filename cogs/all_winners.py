@@ -3,15 +3,24 @@ import discord
 from discord import app_commands
 from typing import List, Optional
 from datetime import datetime
+from cogs.polling_engine import baseline_redistribution, party_baselines
+from cogs.time_manager import get_rp_clock
+
+# Candidates listed per page of the campaign points view
+CANDIDATES_PER_PAGE = 8
 
 class CampaignPointsView(discord.ui.View):
-    def __init__(self, interaction: discord.Interaction, sort_by: str, filter_state: str, filter_party: str, year: int, total_pages: int, current_page: int):
+    """Pages over the filtered, sorted candidates captured when the view was created"""
+
+    def __init__(self, interaction: discord.Interaction, sort_by: str, filter_state: str, filter_party: str, year: int, candidates, current_page: int):
         super().__init__(timeout=300)
         self.interaction = interaction
         self.sort_by = sort_by
         self.filter_state = filter_state
         self.filter_party = filter_party
         self.year = year
+        self.candidates = tuple(candidates)
+        total_pages = max(1, (len(self.candidates) + CANDIDATES_PER_PAGE - 1) // CANDIDATES_PER_PAGE)
         self.total_pages = total_pages
         self.current_page = current_page
 
@@ -70,66 +79,12 @@ class PageSelector(discord.ui.Select):
         selected_page = int(self.values[0])
         await interaction.response.defer()
 
-        # Get the cog and regenerate the page content
-        cog = interaction.client.get_cog('AllWinners')
-        if not cog:
-            await interaction.followup.send("❌ Error: Cog not found", ephemeral=True)
-            return
-
-        # Get time and winners config
-        time_col, time_config = cog._get_time_config(interaction.guild.id)
-        if not time_config:
-            await interaction.followup.send("❌ Election system not configured.", ephemeral=True)
-            return
-
-        current_year = time_config["current_rp_date"].year
-        current_phase = time_config.get("current_phase", "")
-        target_year = self.view.year if self.view.year else current_year
-
-        winners_col, winners_config = cog._get_winners_config(interaction.guild.id)
-
-        # Get primary winners (candidates in general election)
-        candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["year"] == target_year and w.get("primary_winner", False)
-        ]
-
-        # Apply filters
-        if self.view.filter_state:
-            candidates = [c for c in candidates if self.view.filter_state.lower() == c.get("state", "").lower()]
-        if self.view.filter_party:
-            candidates = [c for c in candidates if self.view.filter_party.lower() in c.get("party", "").lower()]
-
-        # Sort candidates
-        if self.view.sort_by.lower() == "points":
-            candidates.sort(key=lambda x: x.get("total_points", x.get("points", 0)), reverse=True)
-        elif self.view.sort_by == "corruption":
-            candidates.sort(key=lambda x: x.get("corruption", 0), reverse=True)
-        elif self.view.sort_by == "seat":
-            candidates.sort(key=lambda x: x.get("seat_id", ""))
-        elif self.view.sort_by == "name":
-            candidates.sort(key=lambda x: x.get("candidate", ""))
-
-        # Calculate percentages for all candidates first
-        unique_seats = list(set(c.get("seat_id") for c in candidates if c.get("seat_id")))
-        seat_percentages_cache = {}
-        for seat_id in unique_seats:
-            if seat_id and seat_id != "N/A":
-                try:
-                    seat_percentages_cache[seat_id] = cog._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
-                except Exception as e:
-                    seat_percentages_cache[seat_id] = {}
-
-        for candidate in candidates:
-            seat_id = candidate.get('seat_id')
-            candidate_name = candidate.get('candidate', '')
-            if seat_id in seat_percentages_cache:
-                candidate['calculated_percentage'] = seat_percentages_cache[seat_id].get(candidate_name, 50.0)
-            else:
-                candidate['calculated_percentage'] = 50.0
+        # Page over the snapshot the view was created with, percentages included, instead of re-reading the winners
+        target_year = self.view.year
+        candidates = self.view.candidates
 
         # Pagination
-        candidates_per_page = 8
+        candidates_per_page = CANDIDATES_PER_PAGE
         total_pages = max(1, (len(candidates) + candidates_per_page - 1) // candidates_per_page)
         start_idx = (selected_page - 1) * candidates_per_page
         end_idx = start_idx + candidates_per_page
@@ -208,7 +163,7 @@ class PageSelector(discord.ui.Select):
             self.view.filter_state,
             self.view.filter_party,
             self.view.year,
-            total_pages,
+            candidates,
             selected_page
         )
 
@@ -385,34 +340,34 @@ class AllWinners(commands.Cog):
         self.bot = bot
         print("All Winners cog loaded successfully")
 
-    def _get_winners_config(self, guild_id: int):
+    async def _get_winners_config(self, guild_id: int):
         """Get or create winners configuration"""
         col = self.bot.db["winners"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "winners": []
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _get_signups_config(self, guild_id: int):
+    async def _get_signups_config(self, guild_id: int):
         """Get signups configuration"""
         col = self.bot.db["signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_elections_config(self, guild_id: int):
+    async def _get_elections_config(self, guild_id: int):
         """Get elections configuration"""
         col = self.bot.db["elections_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
     @app_commands.command(
@@ -438,7 +393,7 @@ class AllWinners(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
         
         try:
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             if not time_config:
                 await interaction.edit_original_response(content="❌ Election system not configured.")
                 return
@@ -448,7 +403,7 @@ class AllWinners(commands.Cog):
 
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_winners_config(interaction.guild.id)
 
         # Get primary winners (candidates in general election)
         candidates = [
@@ -473,15 +428,13 @@ class AllWinners(commands.Cog):
         # Pre-calculate percentages for all candidates
         current_phase = time_config.get("current_phase", "")
         unique_seats = list(set(c.get("seat_id") for c in candidates if c.get("seat_id")))
-        seat_percentages_cache = {}
-
-        for seat_id in unique_seats:
-            if seat_id and seat_id != "N/A":
-                try:
-                    seat_percentages_cache[seat_id] = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
-                except Exception as e:
-                    print(f"Error calculating percentages for seat {seat_id}: {e}")
-                    seat_percentages_cache[seat_id] = {}
+        try:
+            seat_percentages_cache = await self._calculate_all_zero_sum_percentages(
+                interaction.guild.id, [seat_id for seat_id in unique_seats if seat_id != "N/A"]
+            )
+        except Exception as e:
+            print(f"Error calculating seat percentages: {e}")
+            seat_percentages_cache = {}
 
         # Apply calculated percentages to candidates
         for candidate in candidates:
@@ -510,7 +463,7 @@ class AllWinners(commands.Cog):
         )
 
         # Pagination - 8 candidates per page
-        candidates_per_page = 8
+        candidates_per_page = CANDIDATES_PER_PAGE
         total_pages = max(1, (len(candidates) + candidates_per_page - 1) // candidates_per_page)
         current_page = min(page, total_pages)
         start_idx = (current_page - 1) * candidates_per_page
@@ -558,7 +511,7 @@ class AllWinners(commands.Cog):
         # Create view with pagination if multiple pages
         view = None
         if total_pages > 1:
-            view = CampaignPointsView(interaction, sort_by, filter_state, filter_party, target_year, total_pages, current_page)
+            view = CampaignPointsView(interaction, sort_by, filter_state, filter_party, target_year, candidates, current_page)
 
         try:
             await interaction.edit_original_response(content=None, embed=embed, view=view)
@@ -570,12 +523,12 @@ class AllWinners(commands.Cog):
     @admin_view_all_campaign_points.autocomplete("filter_state")
     async def campaign_filter_state_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for state filter"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_winners_config(interaction.guild.id)
         if not winners_config:
             return []
 
@@ -590,12 +543,12 @@ class AllWinners(commands.Cog):
     @admin_view_all_campaign_points.autocomplete("filter_party")
     async def campaign_filter_party_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for party filter"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_winners_config(interaction.guild.id)
         if not winners_config:
             return []
 
@@ -627,14 +580,14 @@ class AllWinners(commands.Cog):
         )
         await interaction.response.send_message(embed=embed)
         
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.edit_original_response(content="❌ Election system not configured.")
             return
 
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
-        winners_col, winners_config = self._get_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_winners_config(interaction.guild.id)
 
         # Get primary winners (candidates in general campaign)
         general_candidates = [
@@ -735,235 +688,51 @@ class AllWinners(commands.Cog):
             # For other offices (President, VP, etc.), default baseline
             return 25.0
 
-    def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
-        """Calculate final percentages for candidates in a seat with zero-sum redistribution"""
-        winners_col, winners_config = self._get_winners_config(guild_id)
-        time_col, time_config = self._get_time_config(guild_id)
-        current_year = time_config["current_rp_date"].year
-
-        # Find all primary winners for this seat for the current year
-        seat_candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["seat_id"] == seat_id and w["year"] == current_year and w.get("primary_winner", False)
-        ]
-
-        if not seat_candidates:
-            return {}
-
-        # Count parties and determine baseline percentages
-        parties = {}
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            if party not in parties:
-                parties[party] = []
-            parties[party].append(candidate)
-
-        num_parties = len(parties)
-        major_parties = ["Republican Party", "Democratic Party"]
-
-        # Determine baseline percentages based on party composition
-        baseline_percentages = {}
-        major_parties_present = sum(1 for p in parties.keys() if p in major_parties)
-        
-        if num_parties == 2:
-            # 50-50 split (Democrat + Republican)
-            for party in parties.keys():
-                baseline_percentages[party] = 50.0
-        elif num_parties == 3:
-            # 40-40-20 split (Democrat + Republican + Independent)
-            if major_parties_present == 2:
-                for party in parties.keys():
-                    if party in major_parties:
-                        baseline_percentages[party] = 40.0
-                    else:
-                        baseline_percentages[party] = 20.0
-            else:
-                # If not standard Dem-Rep-Ind, split evenly
-                for party in parties.keys():
-                    baseline_percentages[party] = 100.0 / 3
-        else:
-            # For other numbers of parties, split evenly
-            for party in parties.keys():
-                baseline_percentages[party] = 100.0 / num_parties
-
-        # Calculate each candidate's raw change
-        raw_changes = {}
-        B = 100.0  # Total baseline percentage
+    async def _calculate_all_zero_sum_percentages(self, guild_id: int, seat_ids: list) -> dict:
+        """Zero-sum percentages of several seats at once, as {seat_id: {candidate: percentage}}.
 
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-            candidate_points = candidate.get("total_points", candidate.get("points", 0.0))
-            points_change = float(candidate_points)
-            corruption_penalty = candidate.get("corruption", 0) * 0.1
-            raw_change = points_change - corruption_penalty
-            raw_changes[candidate_name] = raw_change
-
-        # Calculate net change across all candidates
-        net_change_s = sum(raw_changes.values())
-
-        # Apply zero-sum redistribution formula
-        final_percentages = {}
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-            baseline_bi = baseline_percentages[party]
-            raw_change_ai = raw_changes[candidate_name]
-            redistribution = (baseline_bi / B) * net_change_s
-            final_percentage = baseline_bi + raw_change_ai - redistribution
-            final_percentage = max(0.1, final_percentage)
-            final_percentages[candidate_name] = final_percentage
-
-        # Normalize to 100%
-        total_percentage = sum(final_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in final_percentages:
-                final_percentages[candidate_name] = (final_percentages[candidate_name] / total_percentage) * 100.0
-
-        return final_percentages
-
-    def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
-        """Calculate final percentages for candidates in a seat with zero-sum redistribution"""
-        winners_col, winners_config = self._get_winners_config(guild_id)
-
-        time_col, time_config = self._get_time_config(guild_id)
+        Final_i = b_i + a_i - (b_i / B) * s, where b_i is the baseline of the
+        candidate's party, a_i their points less a corruption penalty and s
+        the net change of the seat, normalized to 100%.
+        """
+        time_col, time_config = await self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year
 
-        # Find all primary winners for this seat for the current year
-        seat_candidates = [
-            w for w in winners_config.get("winners", [])
-            if w["seat_id"] == seat_id and w["year"] == current_year and w.get("primary_winner", False)
-        ]
+        # Find all primary winners of these seats for the current year
+        winners_col = self.bot.db["winners"]
+        year_winners = await winners_col.find_candidates(
+            {"guild_id": guild_id, "year": current_year, "primary_winner": True, "seat_id": {"$in": list(seat_ids)}}
+        )
+        seats = {}
+        for winner in year_winners:
+            seats.setdefault(winner["seat_id"], []).append(winner)
 
-        if not seat_candidates:
-            print(f"DEBUG: No seat candidates found for {seat_id}")
+        if not seats:
             return {}
 
-        print(f"DEBUG: Found {len(seat_candidates)} candidates for seat {seat_id}")
-        for c in seat_candidates:
-            print(f"  - {c.get('candidate', 'Unknown')} ({c.get('party', 'Unknown')})")
-
-        # Count parties and determine baseline percentages
-        parties = {}
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            if party not in parties:
-                parties[party] = []
-            parties[party].append(candidate)
-
-        num_parties = len(parties)
-        major_parties = ["Republican Party", "Democratic Party"]
-
-        # Determine baseline percentages based on party composition
-        baseline_percentages = {}
-        major_parties_present = sum(1 for p in parties.keys() if p in major_parties)
-        
-        # Check if we have the standard 3-party setup: Republican + Democratic + Independent
-        has_republican = any("Republican" in party for party in parties.keys())
-        has_democratic = any("Democratic" in party for party in parties.keys())
-        has_independent = any("Independent" in party for party in parties.keys())
-        is_standard_three_way = has_republican and has_democratic and has_independent and num_parties == 3
-
-        if num_parties == 2:
-            # 50-50 split (Democrat + Republican)
-            for party in parties.keys():
-                baseline_percentages[party] = 50.0
-        elif num_parties == 3:
-            # 40-40-20 split (Democrat + Republican + Independent)
-            if major_parties_present == 2 or is_standard_three_way:
-                for party in parties.keys():
-                    if party in major_parties or "Republican" in party or "Democratic" in party:
-                        baseline_percentages[party] = 40.0
-                    else:
-                        baseline_percentages[party] = 20.0
-            else:
-                # If not standard Dem-Rep-Ind, split evenly
-                for party in parties.keys():
-                    baseline_percentages[party] = 100.0 / 3
-        elif num_parties == 4:
-            # 40-40-10-10 split (Democrat + Republican + Independent + Independent)
-            if major_parties_present == 2:
-                for party in parties.keys():
-                    if party in major_parties:
-                        baseline_percentages[party] = 40.0
-                    else:
-                        baseline_percentages[party] = 10.0
-            else:
-                # If not standard setup, split evenly
-                for party in parties.keys():
-                    baseline_percentages[party] = 25.0
-        else:
-            # For other numbers of parties, split evenly
-            for party in parties.keys():
-                baseline_percentages[party] = 100.0 / num_parties
-
-        # Step 1: Calculate each candidate's raw change (a_i)
-        raw_changes = {}
-        B = 100.0  # Total baseline percentage
-
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-
+        def raw_change(candidate):
             # Use general campaign points when available; fall back to primary points
-            candidate_points = candidate.get("total_points", candidate.get("points", 0.0))
-
-            # Treat points as direct percentage movement (no extreme downscaling)
-            # and apply a small corruption penalty
-            points_change = float(candidate_points)
+            points_change = float(candidate.get("total_points", candidate.get("points", 0.0)))
             corruption_penalty = candidate.get("corruption", 0) * 0.1
-            raw_change = points_change - corruption_penalty
-
-            raw_changes[candidate_name] = raw_change
-
-        # Step 2: Calculate net change across all candidates (s)
-        net_change_s = sum(raw_changes.values())
+            return points_change - corruption_penalty
 
-        # Step 3: Apply zero-sum redistribution formula
-        final_percentages = {}
-
-        for candidate in seat_candidates:
-            party = candidate["party"]
-            candidate_name = candidate["candidate"]
-
-            # Final_i = b_i + a_i - (b_i / B) * s
-            baseline_bi = baseline_percentages[party]
-            raw_change_ai = raw_changes[candidate_name]
-            redistribution = (baseline_bi / B) * net_change_s
-
-            final_percentage = baseline_bi + raw_change_ai - redistribution
-
-            # Ensure minimum percentage (optional guardrail)
-            final_percentage = max(0.1, final_percentage)
-            final_percentages[candidate_name] = final_percentage
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(final_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in final_percentages:
-                final_percentages[candidate_name] = (final_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(final_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage
-            largest_candidate = max(final_percentages.keys(), key=lambda x: final_percentages[x])
-            adjustment = 100.0 - final_total
-            final_percentages[largest_candidate] += adjustment
-
-        print(f"DEBUG: Final percentages for {seat_id}: {final_percentages}")
-        return final_percentages
+        percentages = baseline_redistribution(
+            list(seats.values()), party_baselines,
+            name=lambda candidate: candidate["candidate"],
+            raw_change=raw_change
+        )
+        return dict(zip(seats, percentages))
 
-    def _calculate_baseline_percentage(self, guild_id: int, seat_id: str, candidate_party: str):
+    async def _calculate_baseline_percentage(self, guild_id: int, seat_id: str, candidate_party: str):
         """Calculate baseline starting percentage for general election based on party distribution"""
         # Get all primary winners for this seat
-        winners_col, winners_config = self._get_winners_config(guild_id)
+        winners_col, winners_config = await self._get_winners_config(guild_id)
 
         if not winners_config:
             return 50.0
 
         # Get current year
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # Find all primary winners for this seat
@@ -1028,8 +797,8 @@ class AllWinners(commands.Cog):
             else:  # Even year
                 election_year = signup_year
 
-        signups_col, signups_config = self._get_signups_config(guild_id)
-        winners_col, winners_config = self._get_winners_config(guild_id)
+        signups_col, signups_config = await self._get_signups_config(guild_id)
+        winners_col, winners_config = await self._get_winners_config(guild_id)
 
         if not signups_config:
             return
@@ -1050,16 +819,6 @@ class AllWinners(commands.Cog):
 
         primary_winners = []
 
-        # Import ideology data for seat-based points
-        try:
-            from cogs.ideology import STATE_DATA, calculate_region_medians, STATE_TO_SEAT
-        except ImportError:
-            print("Could not import ideology data. Ideology-based points will not be calculated.")
-            STATE_DATA, calculate_region_medians, STATE_TO_SEAT = {}, lambda: {}, {}
-
-        # Get region medians for senate/governor seats
-        region_medians = calculate_region_medians()
-
         # Determine winner for each party in each seat
         for key, party_candidates in seat_party_groups.items():
             if len(party_candidates) == 1:
@@ -1070,7 +829,7 @@ class AllWinners(commands.Cog):
                 winner = max(party_candidates, key=lambda x: x.get("points", 0))
 
             # Calculate baseline percentage for general election
-            baseline_percentage = self._calculate_baseline_percentage(guild_id, winner["seat_id"], winner["party"])
+            baseline_percentage = await self._calculate_baseline_percentage(guild_id, winner["seat_id"], winner["party"])
 
             # Create winner entry
             winner_entry = {
@@ -1101,7 +860,7 @@ class AllWinners(commands.Cog):
             if "winners" not in winners_config:
                 winners_config["winners"] = []
             winners_config["winners"].extend(primary_winners)
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"winners": winners_config["winners"]}}
             )
@@ -1119,7 +878,7 @@ class AllWinners(commands.Cog):
         
         # Get announcement channel - only use the specific channel ID
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
+        setup_config = await setup_col.find_one({"guild_id": guild.id})
         
         channel = None
         
@@ -1199,7 +958,7 @@ class AllWinners(commands.Cog):
 
     async def _ensure_general_campaign_candidates(self, guild_id: int, current_year: int):
         """Ensure primary winners are properly transitioned to general campaign"""
-        winners_col, winners_config = self._get_winners_config(guild_id)
+        winners_col, winners_config = await self._get_winners_config(guild_id)
 
         # For general campaign phase, we need to look for primary winners
         # If current_year is even (2000), we look for primary winners from the same year
@@ -1226,7 +985,7 @@ class AllWinners(commands.Cog):
                 updated_count += 1
 
         if updated_count > 0:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"winners": winners_config["winners"]}}
             )
@@ -1239,14 +998,14 @@ class AllWinners(commands.Cog):
         """Ensure presidential primary winners are transitioned to general campaign"""
         # Get presidential signups and check for primary winners
         pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
+        pres_signups_config = await pres_signups_col.find_one({"guild_id": guild_id})
 
         if not pres_signups_config:
             return
 
         # Get presidential winners from the presidential_winners collection
         pres_winners_col = self.bot.db["presidential_winners"]
-        pres_winners_config = pres_winners_col.find_one({"guild_id": guild_id})
+        pres_winners_config = await pres_winners_col.find_one({"guild_id": guild_id})
 
         if not pres_winners_config or not pres_winners_config.get("winners"):
             return
@@ -1279,7 +1038,7 @@ class AllWinners(commands.Cog):
                     candidates_updated.append(candidate_name)
 
         if candidates_updated:
-            pres_signups_col.update_one(
+            await pres_signups_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"candidates": pres_signups_config["candidates"]}}
             )
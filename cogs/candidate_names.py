@@ -0,0 +1,185 @@
+"""Candidate names offered by the campaign `target` autocompletes.
+
+Autocomplete runs on every keystroke, so the names a guild can target in a
+given phase and year are collected once into a `CandidateNameIndex` and
+answered from memory. The index keeps every lowercased suffix of every name
+in one sorted list, so "names containing what was typed" is a binary search
+for the typed text as a prefix.
+
+An index is rebuilt only when its guild's roster changes: the candidate
+collections bump a roster version on signups, withdrawals, primary
+processing and any other add, remove or rename, and `presidential_winners`
+writes are picked up through a collection listener. Writes made outside this
+process are not seen until `invalidate`.
+"""
+
+import asyncio
+import bisect
+import threading
+
+from cogs.candidates import INDEXED_SOURCES, PRESIDENTIAL_OFFICES, primary_year
+
+# Targets of the general campaign and demographic actions
+CAMPAIGN_TARGETS = "campaign"
+
+# Targets of the presidential campaign actions
+PRESIDENTIAL_TARGETS = "presidential"
+
+# Most choices Discord shows for an autocomplete
+MAX_CHOICES = 25
+
+# Candidate fields the names are collected from
+NAME_PROJECTION = {"name": 1, "candidate": 1, "year": 1, "primary_winner": 1, "office": 1}
+
+class CandidateNameIndex:
+    """Sorted candidate names, searchable by any part of the name"""
+
+    def __init__(self, names):
+        self.names = sorted({name for name in names if isinstance(name, str) and name})
+        self._suffixes = sorted(
+            (lowered[start:], position)
+            for position, lowered in enumerate(name.lower() for name in self.names)
+            for start in range(len(lowered))
+        )
+
+    def matches(self, current: str, limit: int = MAX_CHOICES) -> list:
+        """Names containing `current`, case-insensitively, in sorted order"""
+        if not current:
+            return self.names[:limit]
+        key = current.lower()
+        found = set()
+        for index in range(bisect.bisect_left(self._suffixes, (key,)), len(self._suffixes)):
+            suffix, position = self._suffixes[index]
+            if not suffix.startswith(key):
+                break
+            found.add(position)
+        return [self.names[position] for position in sorted(found)[:limit]]
+
+class CandidateNames:
+    """Per-guild name indexes for each kind of target, phase and year"""
+
+    def __init__(self, db):
+        self.db = db
+        self._indexes = {}  # (guild_id, kind, phase, year) -> (versions, CandidateNameIndex)
+        # Stamps of presidential_winners writes, which have no roster version of their own
+        self._winner_epoch = 0
+        self._winner_versions = {}
+        self._lock = threading.Lock()
+        self._build_lock = asyncio.Lock()
+        db["presidential_winners"].add_listener(self._on_presidential_winners_change)
+
+    def close(self):
+        """Stop listening to the database"""
+        self.db["presidential_winners"].remove_listener(self._on_presidential_winners_change)
+
+    async def matches(self, guild_id: int, kind: str, phase: str, year: int, current: str,
+                      limit: int = MAX_CHOICES) -> list:
+        """Names of `kind` targets in `phase` of `year` that contain `current`"""
+        index = await self._index(guild_id, kind, phase, year)
+        return index.matches(current, limit)
+
+    def invalidate(self, guild_id: int = None):
+        """Drop cached indexes so they are rebuilt on next use"""
+        with self._lock:
+            if guild_id is None:
+                self._indexes.clear()
+            else:
+                for key in [key for key in self._indexes if key[0] == guild_id]:
+                    del self._indexes[key]
+
+    def _versions(self, guild_id: int) -> tuple:
+        rosters = tuple(self.db[source].roster_version(guild_id) for source in INDEXED_SOURCES)
+        return rosters + (self._winner_epoch, self._winner_versions.get(guild_id, 0))
+
+    async def _index(self, guild_id: int, kind: str, phase: str, year: int) -> CandidateNameIndex:
+        key = (guild_id, kind, phase, year)
+        cached = self._indexes.get(key)
+        if cached is not None and cached[0] == self._versions(guild_id):
+            return cached[1]
+
+        async with self._build_lock:
+            versions = self._versions(guild_id)
+            cached = self._indexes.get(key)
+            if cached is not None and cached[0] == versions:
+                return cached[1]
+            if kind == PRESIDENTIAL_TARGETS:
+                names = await self._presidential_names(guild_id, phase, year)
+            else:
+                names = await self._campaign_names(guild_id, phase, year)
+            index = CandidateNameIndex(names)
+            with self._lock:
+                self._indexes[key] = (versions, index)
+            return index
+
+    async def _signup_names(self, guild_id: int, source: str, year: int, offices=None) -> list:
+        return [
+            candidate.get("name")
+            for candidate in await self.db[source].find_candidates({"guild_id": guild_id}, NAME_PROJECTION)
+            if candidate.get("year") == year and (offices is None or candidate.get("office") in offices)
+        ]
+
+    async def _campaign_names(self, guild_id: int, phase: str, year: int) -> list:
+        if phase == "Primary Campaign":
+            return (await self._signup_names(guild_id, "signups", year)
+                    + await self._signup_names(guild_id, "all_signups", year))
+
+        if phase not in ("General Campaign", "Primary Election"):
+            return (await self._signup_names(guild_id, "signups", year)
+                    + await self._signup_names(guild_id, "all_signups", year)
+                    + await self._signup_names(guild_id, "presidential_signups", year))
+
+        names = [
+            winner.get("candidate")
+            for winner in await self.db["winners"].find_candidates({"guild_id": guild_id}, NAME_PROJECTION)
+            if winner.get("year") == year and winner.get("primary_winner", False)
+        ]
+        pres_winners_config = await self.db["presidential_winners"].find_one({"guild_id": guild_id})
+        if pres_winners_config and pres_winners_config.get("election_year", year) == year:
+            winners_data = pres_winners_config.get("winners", {})
+            if isinstance(winners_data, dict):
+                names.extend(name for name in winners_data.values() if isinstance(name, str))
+        return names
+
+    async def _presidential_names(self, guild_id: int, phase: str, year: int) -> list:
+        if phase != "General Campaign":
+            return await self._signup_names(guild_id, "presidential_signups", year, PRESIDENTIAL_OFFICES)
+
+        names = []
+        pres_winners_config = await self.db["presidential_winners"].find_one({"guild_id": guild_id})
+        winners_data = pres_winners_config.get("winners") if pres_winners_config else None
+        if isinstance(winners_data, dict):
+            # Old format: {party: candidate_name}
+            names.extend(name for name in winners_data.values() if isinstance(name, str))
+        elif isinstance(winners_data, list):
+            names.extend(
+                winner.get("name") for winner in winners_data
+                if isinstance(winner, dict) and winner.get("name") and winner.get("primary_winner", False)
+                and winner.get("year") == primary_year(year) and winner.get("office") in PRESIDENTIAL_OFFICES
+            )
+
+        # Fall back to the presidential primary winners kept with the other winners
+        if not names:
+            names = [
+                winner.get("candidate")
+                for winner in await self.db["winners"].find_candidates({"guild_id": guild_id}, NAME_PROJECTION)
+                if winner.get("office") in PRESIDENTIAL_OFFICES and winner.get("primary_winner", False)
+                and winner.get("year") == primary_year(year)
+            ]
+        return names
+
+    def _on_presidential_winners_change(self, guild_id, seat_ids, fields):
+        with self._lock:
+            if guild_id is None:
+                self._winner_epoch += 1
+            else:
+                self._winner_versions[guild_id] = self._winner_versions.get(guild_id, 0) + 1
+
+def get_candidate_names(bot) -> CandidateNames:
+    """The bot's candidate name indexes, created on first use"""
+    names = getattr(bot, "candidate_names", None)
+    if names is None or names.db is not bot.db:
+        if names is not None:
+            names.close()
+        names = CandidateNames(bot.db)
+        bot.candidate_names = names
+    return names
@@ -0,0 +1,214 @@
+"""Candidate registry shared by every cog.
+
+Candidates can live in four per-candidate collections (`signups`,
+`all_signups`, `presidential_signups`, `winners`) plus the per-guild
+`presidential_winners` document. `CandidateRegistry` keeps, per guild, hash
+indexes of the candidates' identifying fields by user_id and by lowercased
+name, and resolves a user or a name with one precedence order instead of
+every cog scanning the collections in its own order.
+
+The candidate collections bump a roster version whenever a guild's
+candidates are added, removed or change one of `CANDIDATE_KEY_FIELDS`
+(signups, withdrawals, primary processing, ...), so an index is rebuilt only
+after such a change, never after a points or stamina update. This module has
+no database dependency so cogs can import it without connecting.
+"""
+
+import asyncio
+
+from cogs.indexes import register_index
+
+# Fields that decide which lookups a candidate answers; changing one rebuilds its guild's index
+CANDIDATE_KEY_FIELDS = ("user_id", "name_lower", "year", "office", "primary_winner", "phase")
+
+# Collections holding one document per candidate, as served by the db cog
+INDEXED_SOURCES = ("signups", "all_signups", "presidential_signups", "winners")
+
+# Order candidates are resolved in during the General Campaign: general-election records come first
+GENERAL_CAMPAIGN_PRECEDENCE = ("winners", "presidential_winners", "presidential_signups", "signups", "all_signups")
+
+# Order candidates are resolved in during every other phase: the current cycle's signups come first
+PRIMARY_PRECEDENCE = ("signups", "all_signups", "presidential_signups", "winners", "presidential_winners")
+
+ALL_SOURCES = PRIMARY_PRECEDENCE
+
+PRESIDENTIAL_OFFICES = ("President", "Vice President")
+
+register_index("presidential_winners", [("guild_id", 1)], owner=__name__)
+
+def primary_year(year: int) -> int:
+    """Signup year of the presidential primary that feeds the election in `year`"""
+    return year - 1 if year % 2 == 0 else year
+
+class GuildCandidateIndex:
+    """Key fields of one guild's candidates, hashed by user_id and by name"""
+
+    def __init__(self, versions: tuple):
+        self.versions = versions
+        self.by_user = {source: {} for source in INDEXED_SOURCES}
+        self.by_name = {source: {} for source in INDEXED_SOURCES}
+
+    def add(self, source: str, ref: dict):
+        if ref.get("user_id") is not None:
+            self.by_user[source].setdefault(ref["user_id"], []).append(ref)
+        if ref.get("name_lower"):
+            self.by_name[source].setdefault(ref["name_lower"], []).append(ref)
+
+    def lookup(self, source: str, user_id=None, name_lower=None) -> list:
+        if user_id is not None:
+            return self.by_user[source].get(user_id, [])
+        return self.by_name[source].get(name_lower, [])
+
+class CandidateRegistry:
+    """Resolves candidates by user_id or name across every candidate collection.
+
+    `resolve` returns `(collection, candidate)` for the first match in phase
+    precedence order among the requested `sources`, or `(None, None)`;
+    `resolve_all` returns every match in that order. What counts as a match
+    is the same for every cog:
+
+    - signups / all_signups / presidential_signups: a signup for the current year
+    - winners: a primary winner of the current election year
+    - presidential_winners: a primary winner of the primary feeding this election;
+      with the old `{party: name}` format the winner's presidential signup is
+      returned, marked as a primary winner
+    - during the General Campaign, when a lookup includes a winners source,
+      signups only answer for candidates added straight to the general
+      campaign (`phase` "General Campaign"), so primary losers are not resolved
+
+    Writes made outside this process are not seen until `invalidate`.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._indexes = {}  # guild_id -> GuildCandidateIndex
+        self._lock = asyncio.Lock()
+
+    def _versions(self, guild_id: int) -> tuple:
+        return tuple(self.db[source].roster_version(guild_id) for source in INDEXED_SOURCES)
+
+    async def _index(self, guild_id: int) -> GuildCandidateIndex:
+        index = self._indexes.get(guild_id)
+        if index is not None and index.versions == self._versions(guild_id):
+            return index
+
+        async with self._lock:
+            versions = self._versions(guild_id)
+            index = self._indexes.get(guild_id)
+            if index is not None and index.versions == versions:
+                return index
+
+            index = GuildCandidateIndex(versions)
+            projection = {field: 1 for field in CANDIDATE_KEY_FIELDS}
+            for source in INDEXED_SOURCES:
+                for ref in await self.db[source].find_candidates({"guild_id": guild_id}, projection):
+                    index.add(source, ref)
+            self._indexes[guild_id] = index
+            return index
+
+    def invalidate(self, guild_id: int = None):
+        """Drop cached indexes so they are rebuilt on next use"""
+        if guild_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(guild_id, None)
+
+    async def resolve(self, guild_id: int, time_config, *, user_id: int = None, name: str = None,
+                      sources=ALL_SOURCES, year: int = None):
+        """First candidate matching `user_id` or `name`, as `(collection, candidate)`"""
+        matches = await self._resolve(guild_id, time_config, user_id, name, sources, year, first_only=True)
+        return matches[0] if matches else (None, None)
+
+    async def resolve_all(self, guild_id: int, time_config, *, user_id: int = None, name: str = None,
+                          sources=ALL_SOURCES, year: int = None) -> list:
+        """Every candidate matching `user_id` or `name`, as `(collection, candidate)` pairs"""
+        return await self._resolve(guild_id, time_config, user_id, name, sources, year, first_only=False)
+
+    async def _resolve(self, guild_id, time_config, user_id, name, sources, year, first_only: bool) -> list:
+        if user_id is None and not name:
+            return []
+        name_lower = name.lower() if user_id is None else None
+        phase = time_config.get("current_phase", "") if time_config else ""
+        if year is None:
+            year = time_config["current_rp_date"].year if time_config else 2024
+
+        precedence = GENERAL_CAMPAIGN_PRECEDENCE if phase == "General Campaign" else PRIMARY_PRECEDENCE
+        general_only = phase == "General Campaign" and any(
+            source in sources for source in ("winners", "presidential_winners")
+        )
+
+        index = await self._index(guild_id)
+        matches = []
+        seen = set()
+        for source in precedence:
+            if source not in sources:
+                continue
+            if source == "presidential_winners":
+                found = await self._presidential_winners(guild_id, index, user_id, name_lower, year)
+            else:
+                found = []
+                for ref in index.lookup(source, user_id, name_lower):
+                    if ref["_id"] not in seen and self._answers(source, ref, year, general_only):
+                        candidate = await self.db[source].find_candidate({"_id": ref["_id"]})
+                        if candidate is not None:
+                            seen.add(ref["_id"])
+                            found.append((self.db[source], candidate))
+            matches.extend(found)
+            if first_only and matches:
+                return matches[:1]
+        return matches
+
+    @staticmethod
+    def _answers(source: str, ref: dict, year: int, general_only: bool) -> bool:
+        if source == "winners":
+            return ref.get("year") == year and bool(ref.get("primary_winner"))
+        if ref.get("year") != year:
+            return False
+        if source == "presidential_signups" and ref.get("office") not in PRESIDENTIAL_OFFICES:
+            return False
+        return not general_only or ref.get("phase") == "General Campaign"
+
+    async def _presidential_winners(self, guild_id, index, user_id, name_lower, year) -> list:
+        pres_winners_col = self.db["presidential_winners"]
+        pres_winners_config = await pres_winners_col.find_one({"guild_id": guild_id})
+        if not pres_winners_config:
+            return []
+
+        winners_data = pres_winners_config.get("winners", [])
+        if isinstance(winners_data, list):
+            return [
+                (pres_winners_col, winner) for winner in winners_data
+                if isinstance(winner, dict)
+                and (winner.get("user_id") == user_id if user_id is not None
+                     else str(winner.get("name", "")).lower() == name_lower)
+                and winner.get("primary_winner", False)
+                and winner.get("year") == primary_year(year)
+                and winner.get("office") in PRESIDENTIAL_OFFICES
+            ]
+
+        if not isinstance(winners_data, dict):
+            return []
+
+        # Old {party: name} format: the winner's details live in their presidential signup
+        winner_names = {winner_name.lower() for winner_name in winners_data.values() if isinstance(winner_name, str)}
+        election_year = pres_winners_config.get("election_year", year)
+        signups_col = self.db["presidential_signups"]
+        for ref in index.lookup("presidential_signups", user_id, name_lower):
+            if (ref.get("name_lower") in winner_names and ref.get("office") in PRESIDENTIAL_OFFICES
+                    and ref.get("year") in (election_year - 1, election_year)):
+                candidate = await signups_col.find_candidate({"_id": ref["_id"]})
+                if candidate is not None:
+                    general_candidate = candidate.copy()
+                    general_candidate["primary_winner"] = True
+                    general_candidate["total_points"] = general_candidate.get("points", 0.0)
+                    general_candidate["state_points"] = general_candidate.get("state_points", {})
+                    return [(signups_col, general_candidate)]
+        return []
+
+def get_candidate_registry(bot) -> CandidateRegistry:
+    """The bot's candidate registry, created on first use"""
+    registry = getattr(bot, "candidate_registry", None)
+    if registry is None or registry.db is not bot.db:
+        registry = CandidateRegistry(bot.db)
+        bot.candidate_registry = registry
+    return registry
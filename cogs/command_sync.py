@@ -0,0 +1,77 @@
+"""Slash command sync that only calls Discord when the command tree changed.
+
+The fingerprint of a tree is a SHA-256 of its commands serialized exactly
+as `CommandTree.sync` sends them, sorted by type and name. After every
+successful sync the fingerprint is written to SYNC_STATE_PATH, keyed by
+application and target (global or a guild), so restarts and reconnects
+with an unchanged tree make no sync calls. A forced sync always calls
+Discord; use it when commands were changed from elsewhere, e.g. removed
+with another tool, since the local record cannot see that.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime
+
+import discord
+
+# Fingerprints of the last successful syncs, next to the bot
+SYNC_STATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".command_sync.json")
+
+def tree_payload(tree: discord.app_commands.CommandTree, guild=None) -> list:
+    """Commands of a sync target as Discord receives them, in a stable order"""
+    payload = [command.to_dict(tree) for command in tree.get_commands(guild=guild)]
+    return sorted(payload, key=lambda command: (command.get("type", 1), command["name"]))
+
+def tree_fingerprint(tree: discord.app_commands.CommandTree, guild=None) -> str:
+    """SHA-256 of a sync target's serialized commands"""
+    serialized = json.dumps(tree_payload(tree, guild), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+def _target_key(tree: discord.app_commands.CommandTree, guild=None) -> str:
+    target = f"guild:{guild.id}" if guild is not None else "global"
+    return f"{tree.client.application_id}/{target}"
+
+def load_sync_state(path: str = SYNC_STATE_PATH) -> dict:
+    """Recorded syncs, or an empty record if the file is missing or unreadable"""
+    try:
+        with open(path, encoding="utf-8") as state_file:
+            state = json.load(state_file)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_sync_state(state: dict, path: str):
+    # Written to a temporary file first so a crash never leaves a half-written record
+    directory = os.path.dirname(path) or "."
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, delete=False, suffix=".tmp") as state_file:
+        json.dump(state, state_file, indent=2, sort_keys=True)
+    os.replace(state_file.name, path)
+
+async def sync_commands(tree: discord.app_commands.CommandTree, guild=None, force: bool = False,
+                        path: str = SYNC_STATE_PATH):
+    """Sync a target's commands if they changed since the last successful sync.
+
+    Returns the synced commands, or None when the tree was unchanged and no
+    call was made. Errors from Discord (e.g. `discord.Forbidden`) propagate
+    and leave the record untouched, so the next attempt syncs again.
+    """
+    fingerprint = tree_fingerprint(tree, guild)
+    key = _target_key(tree, guild)
+    state = load_sync_state(path)
+    if not force and state.get(key, {}).get("fingerprint") == fingerprint:
+        return None
+
+    synced = await tree.sync(guild=guild)
+    state[key] = {
+        "fingerprint": fingerprint,
+        "commands": len(synced),
+        "synced_at": datetime.utcnow().isoformat(timespec="seconds")
+    }
+    try:
+        _save_sync_state(state, path)
+    except OSError as e:
+        print(f"Could not record command sync in {path}: {e}")
+    return synced
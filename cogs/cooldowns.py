@@ -0,0 +1,164 @@
+"""Action cooldowns shared by the campaign cogs.
+
+General, presidential and demographic actions each keep their cooldowns in
+their own row shape (`CooldownTable`). `CooldownService` reads a guild's
+cooldowns once, answers every later check from memory and writes each use
+through to the database, where the TTL indexes below drop rows once they are
+older than any cooldown. `check_and_claim` tests and records a use in one
+step, so two concurrent uses of the same action cannot both go through.
+This module has no database dependency so cogs can import it without
+connecting.
+"""
+
+import asyncio
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+from cogs.indexes import COOLDOWN_TTL_SECONDS, register_index
+
+# Where a family of cooldowns lives: its collection, the field naming the action and the field holding the last use
+CooldownTable = namedtuple("CooldownTable", ["collection", "action_field", "time_field"])
+
+# General campaign actions (speech, donor, poster, ad, canvassing)
+GENERAL_COOLDOWNS = CooldownTable("action_cooldowns", "action_type", "last_used")
+
+# Presidential campaign actions, kept next to the general ones under their own action field
+PRESIDENTIAL_COOLDOWNS = CooldownTable("action_cooldowns", "action", "last_used")
+
+# Demographic speeches, posters and ads
+DEMOGRAPHIC_COOLDOWNS = CooldownTable("demographic_cooldowns", "action_type", "last_action")
+
+COOLDOWN_TABLES = (GENERAL_COOLDOWNS, PRESIDENTIAL_COOLDOWNS, DEMOGRAPHIC_COOLDOWNS)
+
+for _table in COOLDOWN_TABLES:
+    register_index(_table.collection, [("guild_id", 1), ("user_id", 1), (_table.action_field, 1)], owner=__name__)
+    register_index(_table.collection, [(_table.time_field, 1)], owner=__name__,
+                   expireAfterSeconds=COOLDOWN_TTL_SECONDS)
+
+class CooldownService:
+    """When each user last used each action, per guild and collection.
+
+    Remaining times are `timedelta(0)` when the action is available. Writes
+    made outside this service are not seen until `invalidate`.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._cooldowns = {}  # (collection, guild_id) -> {(action_field, user_id, action): last use}
+        # Bumped by every invalidation, so a load that raced a reset is not kept
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    async def remaining(self, table: CooldownTable, guild_id: int, user_id: int, action: str,
+                        hours: float) -> timedelta:
+        """Time left before `user_id` may use `action` again"""
+        cooldowns = await self._guild(table.collection, guild_id)
+        return self._remaining(cooldowns, table, user_id, action, hours, datetime.utcnow())
+
+    async def check_and_claim(self, table: CooldownTable, guild_id: int, user_id: int, action: str,
+                              hours: float, batch=None) -> timedelta:
+        """Record a use of `action` unless it is on cooldown.
+
+        Returns `timedelta(0)` when the use was recorded, otherwise the time
+        left. The write is queued on `batch` when given; the use counts in
+        memory straight away, so call `release` if the batch is never
+        committed.
+        """
+        cooldowns = await self._guild(table.collection, guild_id)
+        now = datetime.utcnow()
+        remaining = self._remaining(cooldowns, table, user_id, action, hours, now)
+        if remaining:
+            return remaining
+        await self._record(cooldowns, table, guild_id, user_id, action, now, batch)
+        return timedelta(0)
+
+    async def start(self, table: CooldownTable, guild_id: int, user_id: int, action: str, batch=None):
+        """Record a use of `action` without checking its cooldown"""
+        cooldowns = await self._guild(table.collection, guild_id)
+        await self._record(cooldowns, table, guild_id, user_id, action, datetime.utcnow(), batch)
+
+    def release(self, table: CooldownTable, guild_id: int, user_id: int, action: str):
+        """Forget a claimed use of `action` whose queued write was never committed.
+
+        Only for claims made with a batch that was then abandoned: the claim
+        was the user's latest use, so dropping it leaves them as if the action
+        had not been tried.
+        """
+        cooldowns = self._cooldowns.get((table.collection, guild_id))
+        if cooldowns is not None:
+            cooldowns.pop((table.action_field, user_id, action), None)
+
+    async def reset(self, collection: str, guild_id: int, user_id: int = None) -> int:
+        """Delete a guild's cooldowns in `collection`, or only one user's; returns the rows removed"""
+        query = {"guild_id": guild_id}
+        if user_id is not None:
+            query["user_id"] = user_id
+        result = await self.db[collection].delete_many(query)
+        self.invalidate(guild_id)
+        return result.deleted_count
+
+    def invalidate(self, guild_id: int = None):
+        """Drop cached cooldowns so they are read again on next use"""
+        self._generation += 1
+        if guild_id is None:
+            self._cooldowns.clear()
+        else:
+            for key in [key for key in self._cooldowns if key[1] == guild_id]:
+                del self._cooldowns[key]
+
+    async def _guild(self, collection: str, guild_id: int) -> dict:
+        cooldowns = self._cooldowns.get((collection, guild_id))
+        if cooldowns is not None:
+            return cooldowns
+
+        async with self._lock:
+            cooldowns = self._cooldowns.get((collection, guild_id))
+            if cooldowns is not None:
+                return cooldowns
+            generation = self._generation
+            documents = await self.db[collection].find({"guild_id": guild_id}).to_list(None)
+            cooldowns = {}
+            for document in documents:
+                for table in COOLDOWN_TABLES:
+                    action = document.get(table.action_field)
+                    last_used = document.get(table.time_field)
+                    if table.collection == collection and action is not None and isinstance(last_used, datetime):
+                        cooldowns[(table.action_field, document.get("user_id"), action)] = last_used
+            if generation == self._generation:
+                self._cooldowns[(collection, guild_id)] = cooldowns
+            return cooldowns
+
+    @staticmethod
+    def _remaining(cooldowns: dict, table: CooldownTable, user_id: int, action: str, hours: float,
+                   now: datetime) -> timedelta:
+        last_used = cooldowns.get((table.action_field, user_id, action))
+        if last_used is None:
+            return timedelta(0)
+        return max(timedelta(0), last_used + timedelta(hours=hours) - now)
+
+    async def _record(self, cooldowns: dict, table: CooldownTable, guild_id: int, user_id: int, action: str,
+                      now: datetime, batch=None):
+        # Memory first and without awaiting, so a concurrent check_and_claim already sees this use
+        cooldowns[(table.action_field, user_id, action)] = now
+        expired = now - timedelta(seconds=COOLDOWN_TTL_SECONDS)
+        for key in [key for key, last_used in cooldowns.items() if last_used < expired]:
+            del cooldowns[key]
+
+        collection = self.db[table.collection]
+        filter = {"guild_id": guild_id, "user_id": user_id, table.action_field: action}
+        update = {"$set": {table.time_field: now}}
+        try:
+            if batch is not None:
+                batch.update_one(collection, filter, update, upsert=True)
+            else:
+                await collection.update_one(filter, update, upsert=True)
+        except Exception as e:
+            print(f"Error saving {action} cooldown: {e}")
+
+def get_cooldowns(bot) -> CooldownService:
+    """The bot's cooldown service, created on first use"""
+    service = getattr(bot, "cooldown_service", None)
+    if service is None or service.db is not bot.db:
+        service = CooldownService(bot.db)
+        bot.cooldown_service = service
+    return service
@@ -4,10 +4,26 @@ from discord import app_commands
 from datetime import datetime, timedelta
 import asyncio
 from typing import Dict, List, Optional
+from cogs.indexes import register_index
+from cogs.time_manager import GuildTimers, RPClock, RP_TIMER_MARGIN, get_rp_clock
+
+# Query shapes this cog runs, created at startup by the db cog
+register_index("delegates", [("guild_id", 1), ("candidate", 1)], owner=__name__)
+register_index("state_calls", [("guild_id", 1), ("state", 1)], owner=__name__)
+
+# Parties with a delegate primary calendar
+PRIMARY_PARTIES = ("Democrats", "Republican")
+
+# Delay before retrying a guild whose delegate check failed
+DELEGATE_CHECK_RETRY = timedelta(minutes=5)
 
 class Delegates(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.timers = GuildTimers()
+        self._timers_loaded = False
+        self._cursors = {}  # (guild_id, party, year) -> calendar index of the first state that may be uncalled
+        get_rp_clock(bot).add_listener(self._on_clock_change)
         self.delegate_check_loop.start()
         print("Delegates cog loaded successfully")
 
@@ -130,13 +146,21 @@ class Delegates(commands.Cog):
             {"order": 56, "month": 11, "day": 8, "state": "South Dakota", "party": "Republican", "delegates": 29}
         ]
 
+        # Each party's schedule in date order, walked by per-guild cursors
+        self._calendars = {
+            party: sorted(schedule, key=lambda state: (state["month"], state["day"], state["order"]))
+            for party, schedule in zip(PRIMARY_PARTIES, (self.dnc_schedule, self.gop_schedule))
+        }
+
     def cog_unload(self):
         self.delegate_check_loop.cancel()
+        self.timers.clear()
+        get_rp_clock(self.bot).remove_listener(self._on_clock_change)
 
-    def _get_delegates_config(self, guild_id: int):
+    async def _get_delegates_config(self, guild_id: int):
         """Get or create delegates configuration for a guild"""
         col = self.bot.db["delegates_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
@@ -146,13 +170,13 @@ class Delegates(commands.Cog):
                 "paused": False, # Added paused state
                 "last_check": datetime.utcnow()
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
     def _calculate_current_rp_time(self, time_config):
@@ -167,41 +191,34 @@ class Delegates(commands.Cog):
         current_rp_date = time_config["current_rp_date"] + timedelta(days=rp_days_elapsed)
         return current_rp_date
 
-    def _get_presidential_candidates(self, guild_id: int, party: str, year: int):
+    async def _get_presidential_candidates(self, guild_id: int, party: str, year: int):
         """Get presidential candidates for a specific party and year"""
         candidates = []
         
         print(f"Searching for candidates: party='{party}', year={year}, guild_id={guild_id}")
         
-        # First check presidential_signups collection
+        # Indexed lookup of this year's presidential signups, then match the party loosely
         pres_col = self.bot.db["presidential_signups"]
-        pres_config = pres_col.find_one({"guild_id": guild_id})
-        
-        if pres_config:
-            print(f"Found presidential_signups config with {len(pres_config.get('candidates', []))} total candidates")
-            for candidate in pres_config.get("candidates", []):
-                candidate_party = candidate.get("party", "").lower()
-                candidate_year = candidate.get("year", 0)
-                candidate_office = candidate.get("office", "")
-                
-                print(f"  Checking candidate: {candidate.get('name')}, party='{candidate_party}', year={candidate_year}, office='{candidate_office}'")
-                
-                # More flexible party matching
-                party_match = False
-                if party.lower() == "democrats" or party.lower() == "democratic":
-                    party_match = "democrat" in candidate_party
-                elif party.lower() == "republicans" or party.lower() == "republican":
-                    party_match = "republican" in candidate_party
-                else:
-                    party_match = candidate_party == party.lower()
-                
-                if (party_match and 
-                    candidate_year == year and
-                    candidate_office == "President"):
-                    print(f"    -> MATCH! Adding {candidate.get('name')}")
-                    candidates.append(candidate)
-        else:
-            print("No presidential_signups config found")
+        year_candidates = await pres_col.find_candidates({"guild_id": guild_id, "year": year, "office": "President"})
+        print(f"Found {len(year_candidates)} presidential candidates for {year}")
+
+        for candidate in year_candidates:
+            candidate_party = candidate.get("party", "").lower()
+            
+            print(f"  Checking candidate: {candidate.get('name')}, party='{candidate_party}'")
+            
+            # More flexible party matching
+            party_match = False
+            if party.lower() == "democrats" or party.lower() == "democratic":
+                party_match = "democrat" in candidate_party
+            elif party.lower() == "republicans" or party.lower() == "republican":
+                party_match = "republican" in candidate_party
+            else:
+                party_match = candidate_party == party.lower()
+            
+            if party_match:
+                print(f"    -> MATCH! Adding {candidate.get('name')}")
+                candidates.append(candidate)
         
         print(f"Final result: Found {len(candidates)} presidential candidates")
         return candidates
@@ -241,68 +258,123 @@ class Delegates(commands.Cog):
 
         return allocation
 
-    @tasks.loop(minutes=5)
+    @tasks.loop(seconds=0)
     async def delegate_check_loop(self):
-        """Check for states to call every 5 minutes"""
+        """Sleep until a guild's next primary is due in RP time, then call its due states"""
         try:
-            # Get all guild configurations
-            time_col = self.bot.db["time_configs"]
-            time_configs = time_col.find({})
+            if not self._timers_loaded:
+                self._timers_loaded = True
+                for time_config in await get_rp_clock(self.bot).get_all_configs():
+                    self.timers.set(time_config["guild_id"], datetime.utcnow())
 
-            for time_config in time_configs:
-                guild_id = time_config["guild_id"]
-                guild = self.bot.get_guild(guild_id)
+            for guild_id in await self.timers.wait_due():
+                await self._check_guild(guild_id)
+        except Exception as e:
+            print(f"Error in delegate check loop: {e}")
 
-                if not guild:
-                    continue
+    async def _check_guild(self, guild_id: int):
+        """Call a guild's due states and arm its timer for the next primary"""
+        try:
+            guild = self.bot.get_guild(guild_id)
+            time_config = await get_rp_clock(self.bot).get_config(guild_id)
+            if not guild or not time_config:
+                return
 
-                # Calculate current RP time
-                current_rp_date = self._calculate_current_rp_time(time_config)
-                current_phase = time_config.get("current_phase", "")
-                current_year = current_rp_date.year
-
-                # Auto-enable delegate system during presidential election years (odd years) and Primary Campaign phase
-                delegates_col, delegates_config = self._get_delegates_config(guild_id)
-
-                # Check if this is a presidential primary year (odd years) and Primary Campaign phase
-                if current_year % 2 == 1 and current_phase == "Primary Campaign":
-                    # Auto-enable delegate system if not already enabled
-                    if not delegates_config.get("enabled", True):
-                        delegates_col.update_one(
-                            {"guild_id": guild_id},
-                            {"$set": {"enabled": True}}
-                        )
-                        delegates_config["enabled"] = True
-                        print(f"Auto-enabled delegate system for guild {guild_id} (Presidential primary year {current_year})")
-
-                # Only check during Primary Campaign phase, if enabled, and not paused
-                if (current_phase != "Primary Campaign" or 
-                    not delegates_config.get("enabled", True) or
-                    delegates_config.get("paused", False)):
-                    continue
+            # Calculate current RP time
+            current_rp_date = self._calculate_current_rp_time(time_config)
+            current_phase = time_config.get("current_phase", "")
+            current_year = current_rp_date.year
+
+            # Auto-enable delegate system during presidential election years (odd years) and Primary Campaign phase
+            delegates_col, delegates_config = await self._get_delegates_config(guild_id)
+
+            # Check if this is a presidential primary year (odd years) and Primary Campaign phase
+            if current_year % 2 == 1 and current_phase == "Primary Campaign":
+                # Auto-enable delegate system if not already enabled
+                if not delegates_config.get("enabled", True):
+                    await delegates_col.update_one(
+                        {"guild_id": guild_id},
+                        {"$set": {"enabled": True}}
+                    )
+                    delegates_config["enabled"] = True
+                    print(f"Auto-enabled delegate system for guild {guild_id} (Presidential primary year {current_year})")
 
-                # Only process delegates during presidential election years (odd years)
-                if current_year % 2 != 1:
-                    continue
+            # Only check during Primary Campaign phase, if enabled, and not paused
+            if (current_phase != "Primary Campaign" or 
+                not delegates_config.get("enabled", True) or
+                delegates_config.get("paused", False)):
+                return
 
-                # Check both Democratic and Republican schedules
-                # Only process if primary not already won
-                primary_winners = delegates_config.get("primary_winners", {})
+            # Only process delegates during presidential election years (odd years)
+            if current_year % 2 != 1:
+                return
 
-                if f"Democrats_{current_year}" not in primary_winners:
-                    await self._check_and_call_states(
-                        guild, guild_id, current_rp_date, current_year, 
-                        self.dnc_schedule, "Democrats", delegates_config, delegates_col
-                    )
+            # Check both Democratic and Republican schedules
+            # Only process if primary not already won
+            primary_winners = delegates_config.get("primary_winners", {})
 
-                if f"Republican_{current_year}" not in primary_winners:
-                    await self._check_and_call_states(
-                        guild, guild_id, current_rp_date, current_year, 
-                        self.gop_schedule, "Republican", delegates_config, delegates_col
-                    )
+            if f"Democrats_{current_year}" not in primary_winners:
+                await self._check_and_call_states(
+                    guild, guild_id, current_rp_date, current_year, 
+                    self.dnc_schedule, "Democrats", delegates_config, delegates_col
+                )
 
+            if f"Republican_{current_year}" not in primary_winners:
+                await self._check_and_call_states(
+                    guild, guild_id, current_rp_date, current_year, 
+                    self.gop_schedule, "Republican", delegates_config, delegates_col
+                )
+
+            self.timers.set(guild_id, self._next_due(time_config, delegates_config))
         except Exception as e:
-            print(f"Error in delegate check loop: {e}")
+            print(f"Error checking delegates for guild {guild_id}: {e}")
+            self.timers.set(guild_id, datetime.utcnow() + DELEGATE_CHECK_RETRY)
+
+    def _next_due(self, time_config, delegates_config):
+        """Real moment the next uncalled primary of a guild is due, or None if no primary is pending"""
+        current_rp_date = self._calculate_current_rp_time(time_config)
+        current_year = current_rp_date.year
+        called = set(delegates_config.get("called_states", []))
+        primary_winners = delegates_config.get("primary_winners", {})
+
+        next_dates = []
+        for party in PRIMARY_PARTIES:
+            if f"{party}_{current_year}" in primary_winners:
+                continue
+            state_data = self._next_uncalled_state(time_config["guild_id"], party, current_year, called)
+            if state_data:
+                next_dates.append(datetime(current_year, state_data["month"], state_data["day"]))
+        if not next_dates:
+            return None
+
+        due = RPClock.real_time_at(time_config, min(next_dates))
+        return max(datetime.utcnow(), due + RP_TIMER_MARGIN) if due else None
+
+    def _next_uncalled_state(self, guild_id: int, party: str, year: int, called: set):
+        """First uncalled state of a party's calendar, moving the guild's cursor past called ones"""
+        calendar = self._calendars[party]
+        cursor = self._cursors.get((guild_id, party, year), 0)
+        while cursor < len(calendar) and f"{calendar[cursor]['state']}_{party}_{year}" in called:
+            cursor += 1
+        self._cursors[(guild_id, party, year)] = cursor
+        return calendar[cursor] if cursor < len(calendar) else None
+
+    def _reschedule(self, guild_id: int, reset_cursors: bool = False):
+        """Re-check a guild now, e.g. after an admin changed its delegate state"""
+        if reset_cursors:
+            self._cursors = {key: cursor for key, cursor in self._cursors.items() if key[0] != guild_id}
+        self.timers.set(guild_id, datetime.utcnow())
+
+    def _on_clock_change(self, guild_id):
+        if guild_id is None:
+            self._timers_loaded = False
+            self.timers.clear()
+        else:
+            self.timers.set(guild_id, datetime.utcnow())
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild):
+        self.timers.set(guild.id, datetime.utcnow())
 
     def _calculate_current_rp_time(self, time_config):
         """Calculate current RP time based on time manager configuration"""
@@ -318,38 +390,26 @@ class Delegates(commands.Cog):
 
     async def _check_and_call_states(self, guild, guild_id: int, current_rp_date, current_year: int, 
                                    schedule: List[dict], party: str, delegates_config: dict, delegates_col):
-        """Check if any states should be called and call them"""
-        for state_data in schedule:
-            state_key = f"{state_data['state']}_{party}_{current_year}"
-
-            # Skip if already called
-            if state_key in delegates_config.get("called_states", []):
-                continue
-
-            # Create proper date objects for comparison
-            try:
-                state_date = datetime(current_year, state_data["month"], state_data["day"])
-                current_date = datetime(current_rp_date.year, current_rp_date.month, current_rp_date.day)
-
-                # Debug logging
-                print(f"Checking {state_data['state']} ({party}): state_date={state_date.strftime('%Y-%m-%d')}, current_date={current_date.strftime('%Y-%m-%d')}")
-
-                # Check if the state date has passed or is today
-                if current_date >= state_date:
-                    print(f"  -> Should call! {current_date} >= {state_date}")
-                else:
-                    print(f"  -> Not yet. {current_date} < {state_date}")
-                    continue
-            except ValueError as e:
-                print(f"Date error for {state_data['state']} ({party}): {e}")
-                continue
+        """Call every uncalled state whose primary date has been reached"""
+        called = set(delegates_config.get("called_states", []))
+        if not self._next_uncalled_state(guild_id, party, current_year, called):
+            return
 
-            # Check if the state date has passed or is today
-            if current_date >= state_date:
-                await self._call_state(
-                    guild, guild_id, state_data, party, current_year, 
-                    delegates_config, delegates_col
-                )
+        # The calendar is sorted by date, so due states are those from the cursor up to today
+        today = (current_rp_date.month, current_rp_date.day)
+        due_states = []
+        for state_data in self._calendars[party][self._cursors[(guild_id, party, current_year)]:]:
+            if (state_data["month"], state_data["day"]) > today:
+                break
+            if f"{state_data['state']}_{party}_{current_year}" not in called:
+                due_states.append(state_data)
+
+        for state_data in due_states:
+            print(f"Calling {state_data['state']} ({party}) for {current_year}")
+            await self._call_state(
+                guild, guild_id, state_data, party, current_year, 
+                delegates_config, delegates_col
+            )
 
     async def _call_state(self, guild, guild_id: int, state_data: dict, party: str, 
                          year: int, delegates_config: dict, delegates_col):
@@ -359,16 +419,16 @@ class Delegates(commands.Cog):
         state_key = f"{state_name}_{party}_{year}"
 
         # Get presidential candidates for this party
-        candidates = self._get_presidential_candidates(guild_id, party, year)
+        candidates = await self._get_presidential_candidates(guild_id, party, year)
         print(f"Found {len(candidates)} candidates for {party} in {year}")
 
         if not candidates:
             # No candidates, skip this state
             print(f"No candidates found for {party} in {year}, skipping state announcement")
             delegates_config["called_states"].append(state_key)
-            delegates_col.update_one(
+            await delegates_col.update_one(
                 {"guild_id": guild_id},
-                {"$set": {"called_states": delegates_config["called_states"]}}
+                {"$addToSet": {"called_states": state_key}}
             )
             return
 
@@ -389,13 +449,11 @@ class Delegates(commands.Cog):
         delegates_config["called_states"].append(state_key)
 
         # Update database
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": guild_id},
             {
-                "$set": {
-                    "called_states": delegates_config["called_states"],
-                    "delegate_totals": delegates_config["delegate_totals"]
-                }
+                "$addToSet": {"called_states": state_key},
+                "$set": {"delegate_totals": delegates_config["delegate_totals"]}
             }
         )
 
@@ -424,7 +482,7 @@ class Delegates(commands.Cog):
         print(f"Checking primary winners for {party} {year}: threshold = {delegate_threshold}")
 
         # Find candidates for this party
-        candidates = self._get_presidential_candidates(guild_id, party, year)
+        candidates = await self._get_presidential_candidates(guild_id, party, year)
         party_candidates = []
         for c in candidates:
             candidate_party = c.get("party", "").lower()
@@ -465,7 +523,7 @@ class Delegates(commands.Cog):
 
                 # Update database
                 delegates_col = self.bot.db["delegates_config"]
-                delegates_col.update_one(
+                await delegates_col.update_one(
                     {"guild_id": guild_id},
                     {"$set": {"primary_winners": delegates_config["primary_winners"]}}
                 )
@@ -476,7 +534,7 @@ class Delegates(commands.Cog):
         """Declare a primary winner and update presidential_winners"""
         # Get presidential winners config
         winners_col = self.bot.db["presidential_winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
+        winners_config = await winners_col.find_one({"guild_id": guild_id})
 
         if not winners_config:
             winners_config = {
@@ -492,7 +550,7 @@ class Delegates(commands.Cog):
 
         # Handle Independents separately - they automatically win
         signups_col = self.bot.db["presidential_signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
+        signups_config = await signups_col.find_one({"guild_id": guild_id})
 
         if signups_config:
             independent_candidates = [
@@ -512,7 +570,7 @@ class Delegates(commands.Cog):
                     winners_config["winners"]["Others"] = best_independent["name"]
 
         # Update database
-        winners_col.replace_one(
+        await winners_col.replace_one(
             {"guild_id": guild_id},
             winners_config,
             upsert=True
@@ -527,7 +585,7 @@ class Delegates(commands.Cog):
     async def _update_voice_channel_time(self, guild):
         """Update voice channel with current RP time if configured"""
         try:
-            time_col, time_config = self._get_time_config(guild.id)
+            time_col, time_config = await self._get_time_config(guild.id)
             if not time_config:
                 return
 
@@ -566,7 +624,7 @@ class Delegates(commands.Cog):
 
         # First check guild_configs (from setup.py)
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
+        setup_config = await setup_col.find_one({"guild_id": guild.id})
 
         if setup_config:
             # Check announcement_channel_id first
@@ -615,7 +673,7 @@ class Delegates(commands.Cog):
         )
 
         # Get current delegate count
-        delegates_col, delegates_config = self._get_delegates_config(guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(guild.id)
         delegate_totals = delegates_config.get("delegate_totals", {})
         winner_delegates = delegate_totals.get(winner["name"], 0)
 
@@ -660,7 +718,7 @@ class Delegates(commands.Cog):
 
         # First check guild_configs (from setup.py)
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild.id})
+        setup_config = await setup_col.find_one({"guild_id": guild.id})
 
         if setup_config:
             # Check announcement_channel_id first
@@ -738,15 +796,16 @@ class Delegates(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     @app_commands.checks.has_permissions(administrator=True)
     async def toggle_delegate_system(self, interaction: discord.Interaction):
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
 
         current_status = delegates_config.get("enabled", True)
         new_status = not current_status
 
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"enabled": new_status}}
         )
+        self._reschedule(interaction.guild.id)
 
         status_text = "enabled" if new_status else "disabled"
         await interaction.response.send_message(
@@ -761,15 +820,16 @@ class Delegates(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def pause_delegate_system(self, interaction: discord.Interaction):
         """Pause or resume the automatic delegate checking system"""
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
 
         current_paused = delegates_config.get("paused", False)
         new_paused = not current_paused
 
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"paused": new_paused}}
         )
+        self._reschedule(interaction.guild.id)
 
         status = "paused" if new_paused else "resumed"
         embed = discord.Embed(
@@ -788,7 +848,7 @@ class Delegates(commands.Cog):
         else:
             embed.add_field(
                 name="ℹ️ Note", 
-                value="Delegate system will now check for states to call every 5 minutes.",
+                value="Delegate system will now call states as their primaries come due.",
                 inline=False
             )
 
@@ -806,14 +866,14 @@ class Delegates(commands.Cog):
     ):
         """Set the announcement channel for delegate results and primary winners"""
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": interaction.guild.id})
+        setup_config = await setup_col.find_one({"guild_id": interaction.guild.id})
 
         if not setup_config:
             setup_config = {"guild_id": interaction.guild.id}
 
         setup_config["announcement_channel_id"] = channel.id
 
-        setup_col.replace_one(
+        await setup_col.replace_one(
             {"guild_id": interaction.guild.id},
             setup_config,
             upsert=True
@@ -851,7 +911,7 @@ class Delegates(commands.Cog):
             )
             return
 
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
             return
@@ -859,7 +919,7 @@ class Delegates(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
 
         if not confirm:
             # Show warning and current delegate counts
@@ -876,7 +936,7 @@ class Delegates(commands.Cog):
             else:
                 # Find candidates for specific party
                 signups_col = self.bot.db["presidential_signups"]
-                signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+                signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
                 party_candidates = []
                 if signups_config:
@@ -935,7 +995,7 @@ class Delegates(commands.Cog):
         else:
             # Reset specific party
             signups_col = self.bot.db["presidential_signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+            signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
             party_candidates = []
             if signups_config:
@@ -972,7 +1032,7 @@ class Delegates(commands.Cog):
                 del delegates_config["primary_winners"][primary_key]
 
         # Update database
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {
                 "$set": {
@@ -982,12 +1042,13 @@ class Delegates(commands.Cog):
                 }
             }
         )
+        self._reschedule(interaction.guild.id, reset_cursors=True)
 
         # Also reset presidential winners if primary winners were reset
         primary_winners_dict = delegates_config.get("primary_winners", {})
         if party == "All" or any(key.endswith(f"_{target_year}") for key in primary_winners_dict.keys()):
             winners_col = self.bot.db["presidential_winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
             if winners_config:
                 if party == "All":
@@ -998,7 +1059,7 @@ class Delegates(commands.Cog):
                     if party in winners_config.get("winners", {}):
                         del winners_config["winners"][party]
 
-                winners_col.update_one(
+                await winners_col.update_one(
                     {"guild_id": interaction.guild.id},
                     {"$set": {"winners": winners_config["winners"]}}
                 )
@@ -1050,7 +1111,7 @@ class Delegates(commands.Cog):
         year: int = None
     ):
         """Manually declare independent candidates as primary winners"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
@@ -1061,7 +1122,7 @@ class Delegates(commands.Cog):
 
         # Get presidential signups
         signups_col = self.bot.db["presidential_signups"]
-        signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+        signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
         if not signups_config:
             await interaction.response.send_message("❌ No presidential signups found.", ephemeral=True)
@@ -1079,7 +1140,7 @@ class Delegates(commands.Cog):
 
         # Update presidential_winners
         winners_col = self.bot.db["presidential_winners"]
-        winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+        winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
         if not winners_config:
             winners_config = {
@@ -1098,7 +1159,7 @@ class Delegates(commands.Cog):
             winners_config["winners"]["Others"] = best_independent["name"]
 
         # Update database
-        winners_col.replace_one(
+        await winners_col.replace_one(
             {"guild_id": interaction.guild.id},
             winners_config,
             upsert=True
@@ -1116,8 +1177,8 @@ class Delegates(commands.Cog):
     )
     async def delegate_totals(self, interaction: discord.Interaction):
         """View current delegate totals for all candidates"""
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
@@ -1132,7 +1193,7 @@ class Delegates(commands.Cog):
 
         # Get candidate info to group by party
         signups_col = self.bot.db["presidential_signups"]
-        signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+        signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
         candidates_by_party = {"Democrats": [], "Republican": [], "Others": []}
 
@@ -1199,7 +1260,7 @@ class Delegates(commands.Cog):
     )
     async def upcoming_primaries(self, interaction: discord.Interaction):
         """Show upcoming primaries in the next month"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
@@ -1213,8 +1274,8 @@ class Delegates(commands.Cog):
             await interaction.response.send_message("📅 No presidential primaries scheduled this year.", ephemeral=True)
             return
 
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
-        called_states = delegates_config.get("called_states", [])
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
+        called_states = set(delegates_config.get("called_states", []))
 
         upcoming_events = []
 
@@ -1274,15 +1335,15 @@ class Delegates(commands.Cog):
     )
     async def primary_schedule(self, interaction: discord.Interaction, party: str = None):
         """Show the full primary schedule"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
             return
 
         current_year = time_config["current_rp_date"].year
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
-        called_states = delegates_config.get("called_states", [])
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
+        called_states = set(delegates_config.get("called_states", []))
 
         # Filter by party if specified
         schedules_to_show = []
@@ -1365,7 +1426,7 @@ class Delegates(commands.Cog):
             )
             return
 
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
             return
@@ -1389,7 +1450,7 @@ class Delegates(commands.Cog):
             )
             return
 
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
         guild = interaction.guild
 
         # Check if already called
@@ -1408,6 +1469,8 @@ class Delegates(commands.Cog):
             delegates_config, delegates_col
         )
 
+        self._reschedule(interaction.guild.id)
+
         await interaction.response.send_message(
             f"✅ Manually called **{state_data['state']}** ({party}) primary for {target_year}.\n"
             f"**Delegates allocated:** {state_data['delegates']}",
@@ -1469,7 +1532,7 @@ class Delegates(commands.Cog):
             )
             return
 
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.response.send_message("❌ Time system not configured.", ephemeral=True)
             return
@@ -1477,7 +1540,7 @@ class Delegates(commands.Cog):
         current_rp_date = self._calculate_current_rp_time(time_config)
         current_year = current_rp_date.year
 
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
         called_states = delegates_config.get("called_states", [])
 
         # Find missed primaries
@@ -1558,7 +1621,7 @@ class Delegates(commands.Cog):
                 # Update delegate count for winner
                 if winner_name:
                     delegates_col = self.bot.db["delegates"]
-                    delegates_col.update_one(
+                    await delegates_col.update_one(
                         {"guild_id": interaction.guild.id, "candidate": winner_name},
                         {"$inc": {"delegates": delegate_count}},
                         upsert=True
@@ -1566,7 +1629,7 @@ class Delegates(commands.Cog):
 
                     # Log the state call
                     state_calls_col = self.bot.db["state_calls"]
-                    state_calls_col.insert_one({
+                    await state_calls_col.insert_one({
                         "guild_id": interaction.guild.id,
                         "state": primary['state'],
                         "party": primary['party'],
@@ -1589,10 +1652,11 @@ class Delegates(commands.Cog):
                 error_count += 1
 
         # Update the called_states in delegates_config
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"called_states": called_states}}
         )
+        self._reschedule(interaction.guild.id)
 
         # Final result message
         result_message = f"✅ Processing complete!\n"
@@ -1607,14 +1671,13 @@ class Delegates(commands.Cog):
         """Determine the winner of a primary based on current standings"""
         # Check if there are any signups for this state/party
         signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
+        signups_config = await signups_col.find_one({"guild_id": guild_id})
 
         if not signups_config:
             return None
 
         # Get current year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": guild_id})
+        time_config = await get_rp_clock(self.bot).get_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # Find candidates for this party
@@ -1657,7 +1720,7 @@ class Delegates(commands.Cog):
             )
             return
 
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
         delegate_totals = delegates_config.get("delegate_totals", {})
 
         # Check if from_candidate exists and has enough delegates
@@ -1690,7 +1753,7 @@ class Delegates(commands.Cog):
             del delegate_totals[from_candidate]
 
         # Update database
-        delegates_col.update_one(
+        await delegates_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"delegate_totals": delegate_totals}}
         )
@@ -1726,7 +1789,7 @@ class Delegates(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
         # Check if this transfer affects any primary winners
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if time_config:
             current_year = time_config["current_rp_date"].year
 
@@ -1739,7 +1802,7 @@ class Delegates(commands.Cog):
     @transfer_delegates.autocomplete("from_candidate")
     async def from_candidate_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for from_candidate parameter"""
-        delegates_col, delegates_config = self._get_delegates_config(interaction.guild.id)
+        delegates_col, delegates_config = await self._get_delegates_config(interaction.guild.id)
         delegate_totals = delegates_config.get("delegate_totals", {})
 
         candidates = [name for name in delegate_totals.keys() if delegate_totals[name] > 0]
@@ -1749,7 +1812,7 @@ class Delegates(commands.Cog):
     @transfer_delegates.autocomplete("to_candidate")
     async def to_candidate_autocomplete(self, interaction: discord.Interaction, current: str):
         """Autocomplete for to_candidate parameter - show all presidential candidates"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
@@ -1757,7 +1820,7 @@ class Delegates(commands.Cog):
 
         # Get all presidential candidates for current year
         signups_col = self.bot.db["presidential_signups"]
-        signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+        signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
         candidates = []
         if signups_config:
@@ -0,0 +1,243 @@
+"""Demographic leaderboards used by the demographics cog.
+
+The leader of a demographic in a state is the general campaign candidate
+with the most points in it among those the state is relevant to (a
+representative's state, a senator's or governor's region, every state for
+presidential tickets), ties going to the candidate listed first. Each
+guild's board groups its candidates by their set of relevant states and
+keeps one max-heap per (demographic, state set), so finding a leader looks
+at the head of a handful of heaps and a score change is one heap push.
+
+Boards are rebuilt only when the candidate pool changes: the leaderboards
+listen to writes on `winners`, `signups` and `presidential_winners` and drop
+a guild's board when a write may add, remove or re-scope candidates.
+Demographic point writes leave the board in place; the demographics cog
+applies them to it right after writing.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+
+from cogs.candidates import primary_year
+
+# Collections the candidate pool is read from, in the order ties are broken
+POOL_SOURCES = ("winners", "presidential_winners", "signups")
+
+# Candidate fields that decide whether, where and in which order a candidate is on a board
+POOL_FIELDS = frozenset({
+    "user_id", "year", "primary_winner", "phase", "office", "seat_id", "candidate", "name", "party",
+})
+
+# Points a candidate must beat to lead, as in the original per-call scan
+NO_LEADER_POINTS = -1
+
+# Group of the candidates every state is relevant to
+ALL_STATES = None
+
+# Bookkeeping fields of candidate documents left out of board entries
+CANDIDATE_PROJECTION = {"guild_id": 0, "position": 0, "name_lower": 0}
+
+class _Entry:
+    __slots__ = ("order", "source", "candidate", "group")
+
+    def __init__(self, order, source, candidate, group):
+        self.order = order
+        self.source = source
+        self.candidate = candidate
+        self.group = group
+
+    def points(self, demographic: str) -> float:
+        points = self.candidate.get("demographic_points")
+        return points.get(demographic, 0) if isinstance(points, dict) else 0
+
+class GuildLeaderboard:
+    """Demographic leaders of one guild's candidate pool for one election year"""
+
+    def __init__(self, year: int):
+        self.year = year
+        self._entries = []
+        self._members = {}  # group -> entries
+        self._writable = {}  # (source, user_id) -> entry that user_id-keyed writes land on
+        self._groups_by_state = {}  # state -> groups relevant to it
+        self._heaps = {}  # (demographic, group) -> [(-points, order, stamp)], built on first use
+        self._stamps = {}  # (demographic, order) -> stamp of the live heap item
+        self._counter = itertools.count()
+
+    def add(self, source: str, candidate: dict, relevant_states, receives_writes: bool):
+        """Append a candidate; `relevant_states` is ALL_STATES or the states it counts in"""
+        group = ALL_STATES if relevant_states is ALL_STATES else frozenset(relevant_states)
+        entry = _Entry(len(self._entries), source, candidate, group)
+        self._entries.append(entry)
+        self._members.setdefault(group, []).append(entry)
+        if receives_writes and candidate.get("user_id") is not None:
+            self._writable.setdefault((source, candidate.get("user_id")), entry)
+        if group is not ALL_STATES:
+            for state in group:
+                groups = self._groups_by_state.setdefault(state, [])
+                if group not in groups:
+                    groups.append(group)
+
+    def _heap(self, demographic: str, group) -> list:
+        heap = self._heaps.get((demographic, group))
+        if heap is None:
+            heap = []
+            for entry in self._members.get(group, []):
+                stamp = next(self._counter)
+                self._stamps[(demographic, entry.order)] = stamp
+                heap.append((-entry.points(demographic), entry.order, stamp))
+            heapq.heapify(heap)
+            self._heaps[(demographic, group)] = heap
+        while heap and self._stamps.get((demographic, heap[0][1])) != heap[0][2]:
+            heapq.heappop(heap)
+        return heap
+
+    def _requeue(self, entry: _Entry, demographic: str):
+        heap = self._heaps.get((demographic, entry.group))
+        if heap is None:
+            return
+        stamp = next(self._counter)
+        self._stamps[(demographic, entry.order)] = stamp
+        heapq.heappush(heap, (-entry.points(demographic), entry.order, stamp))
+        # Rebuild once superseded items outnumber the live ones
+        if len(heap) > 2 * len(self._members[entry.group]) + 16:
+            heap[:] = [item for item in heap if self._stamps.get((demographic, item[1])) == item[2]]
+            heapq.heapify(heap)
+
+    def leader(self, demographic: str, state: str):
+        """`(candidate, points)` leading `demographic` in `state`, or `(None, -1)`"""
+        best = None
+        for group in [ALL_STATES] + self._groups_by_state.get(state.upper(), []):
+            heap = self._heap(demographic, group)
+            if heap and (best is None or heap[0][:2] < best[:2]):
+                best = heap[0]
+        if best is None or -best[0] <= NO_LEADER_POINTS:
+            return None, NO_LEADER_POINTS
+        return self._entries[best[1]].candidate, -best[0]
+
+    def leading_count(self, user_id: int, state: str, demographics) -> int:
+        """How many of `demographics` `user_id` leads in `state`"""
+        count = 0
+        for demographic in demographics:
+            candidate, _ = self.leader(demographic, state)
+            if (candidate.get("user_id") if candidate is not None else None) == user_id:
+                count += 1
+        return count
+
+    def set_points(self, source: str, user_id: int, points: dict, replace: bool = False):
+        """Record a demographic write keyed by user_id; `replace` swaps in the whole dict"""
+        entry = self._writable.get((source, user_id))
+        if entry is None:
+            return
+        current = entry.candidate.get("demographic_points")
+        current = dict(current) if isinstance(current, dict) and not replace else {}
+        changed = set(points) | (set(entry.candidate.get("demographic_points") or {}) if replace else set())
+        current.update(points)
+        entry.candidate["demographic_points"] = current
+        for demographic in changed:
+            self._requeue(entry, demographic)
+
+    def adjust_points(self, source: str, user_id: int, demographic: str, delta: float, minimum: float = 0):
+        """Record an `$inc` of one demographic followed by a `$max` with `minimum`"""
+        entry = self._writable.get((source, user_id))
+        if entry is not None:
+            self.set_points(source, user_id, {demographic: max(minimum, entry.points(demographic) + delta)})
+
+class DemographicLeaderboards:
+    """Per-guild leaderboards, built on first use and dropped when the candidate pool changes.
+
+    `relevant_states(candidate)` returns the states a candidate counts in,
+    or ALL_STATES. Writes made outside this process are not seen until
+    `invalidate`.
+    """
+
+    def __init__(self, db, relevant_states):
+        self.db = db
+        self.relevant_states = relevant_states
+        self._boards = {}  # guild_id -> GuildLeaderboard
+        # Bumped whenever a guild's board (or every board) is dropped, so a build that raced a write is not kept
+        self._generation = 0
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._build_lock = asyncio.Lock()
+        for source in POOL_SOURCES:
+            db[source].add_listener(self._on_candidates_change)
+
+    def close(self):
+        """Stop listening to the database"""
+        for source in POOL_SOURCES:
+            self.db[source].remove_listener(self._on_candidates_change)
+
+    async def board(self, guild_id: int, time_config) -> GuildLeaderboard:
+        """The guild's board for the current election year"""
+        year = time_config["current_rp_date"].year if time_config else 2024
+        board = self._boards.get(guild_id)
+        if board is not None and board.year == year:
+            return board
+
+        async with self._build_lock:
+            board = self._boards.get(guild_id)
+            if board is not None and board.year == year:
+                return board
+            generation = self._generation_of(guild_id)
+            board = await self._build(guild_id, year)
+            with self._lock:
+                if generation == self._generation_of(guild_id):
+                    self._boards[guild_id] = board
+            return board
+
+    def loaded(self, guild_id: int):
+        """The guild's board if one is built, without building it"""
+        return self._boards.get(guild_id)
+
+    def invalidate(self, guild_id: int = None):
+        """Drop boards so they are rebuilt on next use"""
+        with self._lock:
+            if guild_id is None:
+                self._generation += 1
+                self._boards.clear()
+            else:
+                self._generations[guild_id] = self._generations.get(guild_id, 0) + 1
+                self._boards.pop(guild_id, None)
+
+    def _generation_of(self, guild_id: int) -> tuple:
+        return self._generation, self._generations.get(guild_id, 0)
+
+    async def _build(self, guild_id: int, year: int) -> GuildLeaderboard:
+        board = GuildLeaderboard(year)
+
+        # User_id-keyed writes land on the first candidate of that user in each collection
+        winners = await self.db["winners"].find_candidates({"guild_id": guild_id}, CANDIDATE_PROJECTION)
+        pres_config = await self.db["presidential_winners"].find_one({"guild_id": guild_id})
+        signups = await self.db["signups"].find_candidates({"guild_id": guild_id}, CANDIDATE_PROJECTION)
+        pres_winners = pres_config.get("winners", []) if isinstance(pres_config, dict) else []
+        if not isinstance(pres_winners, list):
+            pres_winners = []
+
+        pools = (
+            ("winners", winners,
+             lambda c: c.get("primary_winner", False) and c.get("year") == year),
+            ("presidential_winners", pres_winners,
+             lambda c: (c.get("primary_winner", False) and c.get("year") == primary_year(year)
+                        and c.get("office") in ["President", "Vice President"])),
+            ("signups", signups,
+             lambda c: c.get("year") == year and c.get("phase") == "General Campaign"),
+        )
+        for source, candidates, in_pool in pools:
+            first_of_user = set()
+            for candidate in candidates:
+                if not isinstance(candidate, dict):
+                    continue
+                candidate.pop("_id", None)
+                user_id = candidate.get("user_id")
+                receives_writes = user_id not in first_of_user
+                first_of_user.add(user_id)
+                if in_pool(candidate):
+                    board.add(source, candidate, self.relevant_states(candidate), receives_writes)
+        return board
+
+    def _on_candidates_change(self, guild_id, seat_ids, fields):
+        if fields is not None and not POOL_FIELDS.intersection(fields):
+            return
+        self.invalidate(guild_id)
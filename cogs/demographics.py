@@ -6,6 +6,13 @@ import asyncio
 import random
 from typing import Optional, Dict, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from cogs.candidate_names import CAMPAIGN_TARGETS, get_candidate_names
+from cogs.candidates import get_candidate_registry
+from cogs.demographic_leaderboard import ALL_STATES, DemographicLeaderboards
+from cogs.geography import REGIONS, REGION_CODES, SEAT_TO_STATE, STATE_IDS, state_table
+from cogs.cooldowns import DEMOGRAPHIC_COOLDOWNS, get_cooldowns
+from cogs.polling_engine import invalidate_state_baselines
+from cogs.time_manager import get_rp_clock
 
 # Demographic voting bloc strength values (removed thresholds)
 DEMOGRAPHIC_STRENGTH = {
@@ -31,6 +38,13 @@ DEMOGRAPHIC_STRENGTH = {
     "Gun Rights Advocates": True
 }
 
+# Demographics by demographic ID, and each demographic's ID
+DEMOGRAPHICS = tuple(DEMOGRAPHIC_STRENGTH)
+DEMOGRAPHIC_IDS = {demographic: demographic_id for demographic_id, demographic in enumerate(DEMOGRAPHICS)}
+
+# Multiplier of a state and demographic missing from STATE_DEMOGRAPHICS
+DEFAULT_DEMOGRAPHIC_MULTIPLIER = 0.10
+
 # Backlash system - opposing voter blocks
 DEMOGRAPHIC_CONFLICTS = {
     "Urban Voters": ["Rural Voters", "Gun Rights Advocates"],
@@ -520,266 +534,78 @@ class Demographics(commands.Cog):
         }
     }
 
+    # STATE_DEMOGRAPHICS by state ID, one multiplier per demographic ID
+    DEMOGRAPHIC_MULTIPLIERS = state_table(
+        {state: tuple(strengths.get(demographic, DEFAULT_DEMOGRAPHIC_MULTIPLIER) for demographic in DEMOGRAPHICS)
+         for state, strengths in STATE_DEMOGRAPHICS.items()},
+        (DEFAULT_DEMOGRAPHIC_MULTIPLIER,) * len(DEMOGRAPHICS)
+    )
+
     def __init__(self, bot):
         self.bot = bot
+        self._leaderboards = None
         print("Demographics cog loaded successfully")
 
-    def _get_time_config(self, guild_id: int):
+    def cog_unload(self):
+        if self._leaderboards is not None:
+            self._leaderboards.close()
+
+    @property
+    def leaderboards(self) -> DemographicLeaderboards:
+        """Demographic leaderboards of the bot's database, created on first use"""
+        if self._leaderboards is None or self._leaderboards.db is not self.bot.db:
+            if self._leaderboards is not None:
+                self._leaderboards.close()
+            self._leaderboards = DemographicLeaderboards(self.bot.db, self._get_leaderboard_states)
+        return self._leaderboards
+
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_presidential_config(self, guild_id: int):
+    async def _get_presidential_config(self, guild_id: int):
         """Get presidential signups configuration"""
         col = self.bot.db["presidential_signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_presidential_winners_config(self, guild_id: int):
+    async def _get_presidential_winners_config(self, guild_id: int):
         """Get presidential winners configuration"""
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_user_candidate(self, guild_id: int, user_id: int):
+    async def _get_user_candidate(self, guild_id: int, user_id: int):
         """Get user's candidate information for any race type"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
-        if current_phase == "General Campaign":
-            # First check all_winners collection for general campaign primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
+        time_col, time_config = await self._get_time_config(guild_id)
+        return await get_candidate_registry(self.bot).resolve(guild_id, time_config, user_id=user_id)
 
-            if winners_config and isinstance(winners_config, dict):
-                for winner in winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("user_id") == user_id and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == current_year):
-                        return winners_col, winner
-
-            # Also check presidential winners collection for general campaign
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
-
-            if pres_winners_config and isinstance(pres_winners_config, dict):
-                # For general campaign, look for primary winners from the previous year if we're in an even year
-                # Or current year if odd year
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                for winner in pres_winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("user_id") == user_id and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == primary_year):
-                        return pres_winners_col, winner
-
-            # Check presidential signups collection for general campaign candidates
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-            if pres_signups_config and isinstance(pres_signups_config, dict):
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year and
-                        candidate.get("office") in ["President", "Vice President"]):
-                        return pres_signups_col, candidate
-
-            # Also check signups collection for admin-created general campaign candidates
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year and
-                        candidate.get("phase") == "General Campaign"):
-                        return signups_col, candidate
-
-            return None, None
-        else:
-            # For non-General Campaign phases, check signups collections
-            # Check regular signups collection
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year):
-                        return signups_col, candidate
-
-            # Check all_signups collection
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": guild_id})
-
-            if all_signups_config and isinstance(all_signups_config, dict):
-                for candidate in all_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year):
-                        return all_signups_col, candidate
-
-            # Check presidential signups collection
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-            if pres_signups_config and isinstance(pres_signups_config, dict):
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year):
-                        return pres_signups_col, candidate
-
-            return None, None
-
-    def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
+    async def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get candidate by name for any race type"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
-        if current_phase == "General Campaign":
-            # First check all_winners collection for general campaign primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config and isinstance(winners_config, dict):
-                for winner in winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("candidate", "").lower() == candidate_name.lower() and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == current_year):
-                        return winners_col, winner
-
-            # Also check presidential winners collection for general campaign
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
-
-            if pres_winners_config and isinstance(pres_winners_config, dict):
-                # For general campaign, look for primary winners from the previous year if we're in an even year
-                # Or current year if odd year
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                for winner in pres_winners_config.get("winners", []):
-                    if (isinstance(winner, dict) and 
-                        winner.get("name", "").lower() == candidate_name.lower() and 
-                        winner.get("primary_winner", False) and 
-                        winner.get("year") == primary_year):
-                        return pres_winners_col, winner
-
-            # Also check signups collection for admin-created general campaign candidates
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("name", "").lower() == candidate_name.lower() and 
-                        candidate.get("year") == current_year and
-                        candidate.get("phase") == "General Campaign"):
-                        return signups_col, candidate
-
-            return None, None
-        else:
-            # For non-General Campaign phases, check signups collections
-            # Check regular signups collection
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-
-            if signups_config and isinstance(signups_config, dict):
-                for candidate in signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("name", "").lower() == candidate_name.lower() and 
-                        candidate.get("year") == current_year):
-                        return signups_col, candidate
-
-            # Check all_signups collection
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": guild_id})
-
-            if all_signups_config and isinstance(all_signups_config, dict):
-                for candidate in all_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("name", "").lower() == candidate_name.lower() and 
-                        candidate.get("year") == current_year):
-                        return all_signups_col, candidate
-
-            # Check presidential signups collection
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-            if pres_signups_config and isinstance(pres_signups_config, dict):
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (isinstance(candidate, dict) and 
-                        candidate.get("name", "").lower() == candidate_name.lower() and 
-                        candidate.get("year") == current_year):
-                        return pres_signups_col, candidate
-
-            return None, None
-
-    def _check_cooldown(self, guild_id: int, user_id: int, action_type: str, cooldown_hours: int):
-        """Check if user is on cooldown for a specific action"""
-        cooldowns_col = self.bot.db["demographic_cooldowns"]
-        cooldown_record = cooldowns_col.find_one({
-            "guild_id": guild_id,
-            "user_id": user_id,
-            "action_type": action_type
-        })
-
-        if not cooldown_record:
-            return True  # No cooldown record, user can proceed
-
-        last_action = cooldown_record["last_action"]
-        cooldown_end = last_action + timedelta(hours=cooldown_hours)
-
-        return datetime.utcnow() >= cooldown_end
-
-    def _set_cooldown(self, guild_id: int, user_id: int, action_type: str):
-        """Set cooldown for a specific action"""
-        cooldowns_col = self.bot.db["demographic_cooldowns"]
-        cooldowns_col.update_one(
-            {"guild_id": guild_id, "user_id": user_id, "action_type": action_type},
-            {
-                "$set": {
-                    "guild_id": guild_id,
-                    "user_id": user_id,
-                    "action_type": action_type,
-                    "last_action": datetime.utcnow()
-                }
-            },
-            upsert=True
-        )
+        time_col, time_config = await self._get_time_config(guild_id)
+        return await get_candidate_registry(self.bot).resolve(guild_id, time_config, name=candidate_name)
 
-    def _get_cooldown_remaining(self, guild_id: int, user_id: int, action_type: str, cooldown_hours: int):
+    async def _get_cooldown_remaining(self, guild_id: int, user_id: int, action_type: str, cooldown_hours: int):
         """Get remaining cooldown time"""
-        cooldowns_col = self.bot.db["demographic_cooldowns"]
-        cooldown_record = cooldowns_col.find_one({
-            "guild_id": guild_id,
-            "user_id": user_id,
-            "action_type": action_type
-        })
-
-        if not cooldown_record:
-            return None
-
-        last_action = cooldown_record["last_action"]
-        cooldown_end = last_action + timedelta(hours=cooldown_hours)
-        remaining = cooldown_end - datetime.utcnow()
-
-        if remaining.total_seconds() <= 0:
-            return None
+        return await get_cooldowns(self.bot).remaining(DEMOGRAPHIC_COOLDOWNS, guild_id, user_id, action_type, cooldown_hours)
 
-        return remaining
+    async def _claim_cooldown(self, interaction: discord.Interaction, action_type: str, hours: int) -> bool:
+        """Start the user's cooldown for an action, telling them if another use of it got there first"""
+        remaining = await get_cooldowns(self.bot).check_and_claim(
+            DEMOGRAPHIC_COOLDOWNS, interaction.guild.id, interaction.user.id, action_type, hours
+        )
+        if not remaining:
+            return True
+        hours_left = int(remaining.total_seconds() // 3600)
+        minutes_left = int((remaining.total_seconds() % 3600) // 60)
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(f"❌ You must wait {hours_left}h {minutes_left}m before doing that again.", ephemeral=True)
+        return False
 
     def _get_relevant_states_for_candidate(self, candidate: dict, state: str):
         """Get relevant states for demographic calculations based on candidate's office"""
-        from .ideology import REGIONS, STATE_TO_SEAT
-
         office = candidate.get("office", "")
         seat_id = candidate.get("seat_id", "")
 
@@ -790,94 +616,46 @@ class Demographics(commands.Cog):
         # For governors, all states in their region are relevant
         elif office == "Governor":
             region_code = seat_id.split("-")[0] if "-" in seat_id else ""
-            region_mapping = {
-                "CO": "Columbia", "CA": "Cambridge", "AU": "Austin",
-                "SU": "Superior", "HL": "Heartland", "YS": "Yellowstone", "PH": "Phoenix"
-            }
-            region_name = region_mapping.get(region_code)
+            region_name = REGION_CODES.get(region_code)
             if region_name and region_name in REGIONS:
                 return REGIONS[region_name]
 
         # For senators, all states in their region are relevant
         elif office == "Senator":
             region_code = seat_id.split("-")[1] if "-" in seat_id else ""
-            region_mapping = {
-                "CO": "Columbia", "CA": "Cambridge", "AU": "Austin",
-                "SU": "Superior", "HL": "Heartland", "YS": "Yellowstone", "PH": "Phoenix"
-            }
-            region_name = region_mapping.get(region_code)
+            region_name = REGION_CODES.get(region_code)
             if region_name and region_name in REGIONS:
                 return REGIONS[region_name]
 
         # For representatives, only their specific state is relevant
         elif office == "Representative":
-            for state_name, rep_seat in STATE_TO_SEAT.items():
-                if rep_seat == seat_id:
-                    return [state_name]
+            if seat_id in SEAT_TO_STATE:
+                return [SEAT_TO_STATE[seat_id]]
 
         # Default fallback
         return [state.upper()]
 
-    def _get_demographic_leader(self, guild_id: int, demographic: str, state: str):
-        """Get the candidate leading in a specific demographic and state"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-        primary_year = current_year - 1 if current_year % 2 == 0 else current_year
+    def _get_leaderboard_states(self, candidate: dict):
+        """States a candidate's demographic points count in, or ALL_STATES"""
+        states = self._get_relevant_states_for_candidate(candidate, "")
+        return ALL_STATES if states == [""] else states
 
-        all_candidates = []
+    def _record_demographic_points(self, collection, guild_id: int, user_id: int, points: dict, replace: bool = False):
+        """Apply a demographic points write to the guild's leaderboard, if one is built"""
+        board = self.leaderboards.loaded(guild_id)
+        if board is not None:
+            board.set_points(str(collection.name), user_id, points, replace=replace)
 
-        # First check all_winners collection (primary source for General Campaign)
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-        
-        if winners_config and isinstance(winners_config, dict):
-            for winner in winners_config.get("winners", []):
-                if (isinstance(winner, dict) and 
-                    winner.get("primary_winner", False) and 
-                    winner.get("year") == current_year):
-                    all_candidates.append(winner)
-
-        # Get presidential winners (primary winners) as backup
-        pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
-        if pres_winners_config and isinstance(pres_winners_config, dict):
-            for winner in pres_winners_config.get("winners", []):
-                if (isinstance(winner, dict) and 
-                    winner.get("primary_winner", False) and 
-                    winner.get("year") == primary_year and
-                    winner.get("office") in ["President", "Vice President"]):
-                    all_candidates.append(winner)
-
-        # Get general campaign signups as additional backup
-        signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
-        if signups_config and isinstance(signups_config, dict):
-            for candidate in signups_config.get("candidates", []):
-                if (isinstance(candidate, dict) and 
-                    candidate.get("year") == current_year and
-                    candidate.get("phase") == "General Campaign"):
-                    all_candidates.append(candidate)
-
-        # Find the leader in this demographic
-        leader = None
-        highest_points = -1
-
-        for candidate in all_candidates:
-            # Check if this state is relevant for this candidate
-            relevant_states = self._get_relevant_states_for_candidate(candidate, state)
-            if state.upper() not in relevant_states:
-                continue
-
-            demo_points = candidate.get("demographic_points", {}).get(demographic, 0)
-            if demo_points > highest_points:
-                highest_points = demo_points
-                leader = candidate
-
-        return leader, highest_points
-
-    def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
+    async def _get_demographic_leader(self, guild_id: int, demographic: str, state: str):
+        """Get the candidate leading in a specific demographic and state"""
+        time_col, time_config = await self._get_time_config(guild_id)
+        board = await self.leaderboards.board(guild_id, time_config)
+        return board.leader(demographic, state)
+
+    async def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
         """Determines whether the user or the target candidate pays the stamina cost."""
         # Get the user's candidate data
-        _, user_candidate_data = self._get_user_candidate(guild_id, user_id)
+        _, user_candidate_data = await self._get_user_candidate(guild_id, user_id)
 
         # If the user is a candidate in the current election cycle and has enough stamina, they pay
         if (user_candidate_data and 
@@ -895,13 +673,13 @@ class Demographics(commands.Cog):
         # Fallback (should rarely happen)
         return user_id
 
-    def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float):
+    async def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float):
         """Deducts stamina from a user's candidate profile."""
         # Check all potential collections where the candidate might be stored
 
         # Check all_winners collection first (primary source for General Campaign)
         all_winners_col = self.bot.db["winners"]
-        all_winners_result = all_winners_col.update_one(
+        all_winners_result = await all_winners_col.update_one(
             {"guild_id": guild_id, "winners.user_id": user_id},
             {"$inc": {"winners.$.stamina": -cost}}
         )
@@ -909,20 +687,20 @@ class Demographics(commands.Cog):
             return
 
         # Check presidential winners collection (for General Campaign)
-        pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
+        pres_winners_col, pres_winners_config = await self._get_presidential_winners_config(guild_id)
         if pres_winners_config:
             for i, winner in enumerate(pres_winners_config.get("winners", [])):
                 if isinstance(winner, dict) and winner.get("user_id") == user_id:
-                    pres_winners_col.update_one(
+                    await pres_winners_col.update_one(
                         {"guild_id": guild_id},
                         {"$inc": {f"winners.{i}.stamina": -cost}}
                     )
                     return
 
         # Check presidential signups collection
-        pres_signups_col, pres_signups_config = self._get_presidential_config(guild_id)
+        pres_signups_col, pres_signups_config = await self._get_presidential_config(guild_id)
         if pres_signups_config:
-            pres_signups_result = pres_signups_col.update_one(
+            pres_signups_result = await pres_signups_col.update_one(
                 {"guild_id": guild_id, "candidates.user_id": user_id},
                 {"$inc": {"candidates.$.stamina": -cost}}
             )
@@ -931,19 +709,19 @@ class Demographics(commands.Cog):
 
         # Check regular signups collection
         signups_col = self.bot.db["signups"]
-        signups_col.update_one(
+        await signups_col.update_one(
             {"guild_id": guild_id, "candidates.user_id": user_id},
             {"$inc": {"candidates.$.stamina": -cost}}
         )
 
         # Check all_signups collection
         all_signups_col = self.bot.db["all_signups"]
-        all_signups_col.update_one(
+        await all_signups_col.update_one(
             {"guild_id": guild_id, "candidates.user_id": user_id},
             {"$inc": {"candidates.$.stamina": -cost}}
         )
 
-    def _update_demographic_points(self, collection, guild_id: int, user_id: int, demographic: str, points_gained: float, state: str, candidate: dict):
+    async def _update_demographic_points(self, collection, guild_id: int, user_id: int, demographic: str, points_gained: float, state: str, candidate: dict):
         """Update demographic points for a candidate and handle backlash"""
         # Determine if this is a winners collection or signups collection
         collection_name = str(collection.name)
@@ -952,14 +730,15 @@ class Demographics(commands.Cog):
 
         if is_winners_collection:
             # Initialize demographic_points if it doesn't exist
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "winners.user_id": user_id},
                 {"$set": {"winners.$.demographic_points": {}}},
                 upsert=False
             )
+            self._record_demographic_points(collection, guild_id, user_id, {}, replace=True)
 
             # Get current demographic points
-            config = collection.find_one({"guild_id": guild_id})
+            config = await collection.find_one({"guild_id": guild_id})
             current_candidate = None
             for winner in config.get("winners", []):
                 if winner.get("user_id") == user_id:
@@ -975,14 +754,15 @@ class Demographics(commands.Cog):
 
         elif is_signups_collection:
             # Initialize demographic_points if it doesn't exist for signups
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "candidates.user_id": user_id},
                 {"$set": {"candidates.$.demographic_points": {}}},
                 upsert=False
             )
+            self._record_demographic_points(collection, guild_id, user_id, {}, replace=True)
 
             # Get current demographic points
-            config = collection.find_one({"guild_id": guild_id})
+            config = await collection.find_one({"guild_id": guild_id})
             current_candidate = None
             for candidate_entry in config.get("candidates", []):
                 if candidate_entry.get("user_id") == user_id:
@@ -1010,17 +790,19 @@ class Demographics(commands.Cog):
         new_points = current_points + points_gained
 
         # Apply state multiplier
-        state_multiplier = self.STATE_DEMOGRAPHICS.get(state.upper(), {}).get(demographic, 0.10)
+        state_multiplier = self._get_state_demographic_multiplier(state, demographic)
         final_points_gained = points_gained * state_multiplier
 
         # Calculate backlash (simplified - no threshold dependency)
         backlash_updates = {}
+        recorded_points = {demographic: current_points + final_points_gained}
         if new_points > 5:  # Apply backlash when demographic points exceed 5
             backlash_loss = -0.5
             opposing_blocs = DEMOGRAPHIC_CONFLICTS.get(demographic, [])
             for opposing_bloc in opposing_blocs:
                 current_opposing = current_demographics.get(opposing_bloc, 0)
                 backlash_updates[f"{update_path_prefix}.{opposing_bloc}"] = max(0, current_opposing + backlash_loss)
+                recorded_points[opposing_bloc] = max(0, current_opposing + backlash_loss)
 
         # Update the demographic points
         update_doc = {
@@ -1028,16 +810,21 @@ class Demographics(commands.Cog):
         }
         update_doc.update(backlash_updates)
 
-        collection.update_one(
+        await collection.update_one(
             array_filter,
             {"$set": update_doc}
         )
+        self._record_demographic_points(collection, guild_id, user_id, recorded_points)
 
         return final_points_gained, backlash_updates
 
     def _get_state_demographic_multiplier(self, state: str, demographic: str) -> float:
         """Get the demographic multiplier for a given state and demographic."""
-        return self.STATE_DEMOGRAPHICS.get(state.upper(), {}).get(demographic, 0.10)
+        state_id = STATE_IDS.get(state.upper())
+        demographic_id = DEMOGRAPHIC_IDS.get(demographic)
+        if state_id is None or demographic_id is None:
+            return DEFAULT_DEMOGRAPHIC_MULTIPLIER
+        return self.DEMOGRAPHIC_MULTIPLIERS[state_id][demographic_id]
 
     def _get_party_demographic_multiplier(self, candidate: dict, state: str, demographic: str) -> float:
         """Get the party multiplier for a candidate's demographic in a state."""
@@ -1067,7 +854,7 @@ class Demographics(commands.Cog):
              return 0.0
 
 
-    def _update_candidate_demographic_points(self, collection, guild_id: int, user_id: int, demographic: str, points_to_add: float):
+    async def _update_candidate_demographic_points(self, collection, guild_id: int, user_id: int, demographic: str, points_to_add: float):
         """Helper to add points to a candidate's demographic and ensure it doesn't go below zero."""
         collection_name = str(collection.name)
         update_path = ""
@@ -1081,17 +868,21 @@ class Demographics(commands.Cog):
         else:
             return
 
-        collection.update_one(
+        await collection.update_one(
             array_filter,
             {"$inc": {update_path: points_to_add}}
         )
 
         # Ensure points don't go below zero after update
-        collection.update_one(
+        await collection.update_one(
             array_filter,
             {"$max": {update_path: 0}}
         )
 
+        board = self.leaderboards.loaded(guild_id)
+        if board is not None:
+            board.adjust_points(collection_name, user_id, demographic, points_to_add, minimum=0)
+
     @app_commands.command(
         name="demographic_speech",
         description="Give a targeted demographic speech in a U.S. state (General Campaign only)"
@@ -1103,7 +894,7 @@ class Demographics(commands.Cog):
     )
     async def demographic_speech(self, interaction: discord.Interaction, state: str, demographic: str, target: Optional[str] = None):
         # Allow usage regardless of campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         # Validate state
         state_upper = state.upper()
@@ -1123,7 +914,7 @@ class Demographics(commands.Cog):
             return
 
         # Check if user is a candidate
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Allow unregistered users to campaign for demographics
         # if not candidate:
@@ -1145,7 +936,7 @@ class Demographics(commands.Cog):
                 return
 
         # Get target candidate
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate:
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -1155,11 +946,11 @@ class Demographics(commands.Cog):
 
         # Determine who pays stamina cost
         stamina_cost = 6
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Get the stamina user's candidate data
         if stamina_user_id == interaction.user.id:
-            _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+            _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
         else:
             stamina_user_candidate = target_candidate
 
@@ -1176,7 +967,7 @@ class Demographics(commands.Cog):
         state_multiplier = self._get_state_demographic_multiplier(state_upper, demographic)
         party_multiplier = self._get_party_demographic_multiplier(target_candidate, state_upper, demographic)
         total_multiplier = state_multiplier + party_multiplier
-        leader, highest_points = self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
+        leader, highest_points = await self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
 
         # Get the creator's name (candidate name or user display name)
         creator_name = candidate.get('name', interaction.user.display_name) if candidate else interaction.user.display_name
@@ -1217,28 +1008,29 @@ class Demographics(commands.Cog):
                 await reply_message.reply(f"❌ Demographic speech must be 700-3000 characters. You wrote {char_count} characters.")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "demographic_speech")
+            # Start the cooldown after successful validation; speeches are not gated on it
+            await get_cooldowns(self.bot).start(DEMOGRAPHIC_COOLDOWNS, interaction.guild.id, interaction.user.id,
+                                                "demographic_speech")
 
             # Calculate demographic points
             base_points = (char_count / 200) * 1.0  # 1 point per 200 characters
             final_points = base_points * total_multiplier
 
             # Update demographic points
-            points_gained, backlash_updates = self._update_demographic_points(
+            points_gained, backlash_updates = await self._update_demographic_points(
                 target_signups_col, interaction.guild.id, target_candidate.get("user_id"), 
                 demographic, final_points, state_upper, target_candidate
             )
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
             # Get updated demographic status
-            updated_candidate = self._get_candidate_by_name(interaction.guild.id, target)[1]
+            updated_candidate = (await self._get_candidate_by_name(interaction.guild.id, target))[1]
             current_points = updated_candidate.get("demographic_points", {}).get(demographic, 0)
 
             # Check new leadership status
-            new_leader, new_highest_points = self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
+            new_leader, new_highest_points = await self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
             is_now_leader = new_leader and new_leader.get("user_id") == target_candidate.get("user_id")
 
             # Create response embed
@@ -1312,7 +1104,7 @@ class Demographics(commands.Cog):
         target: Optional[str] = None
     ):
         # Allow usage regardless of campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         # Validate state
         state_upper = state.upper()
@@ -1332,7 +1124,7 @@ class Demographics(commands.Cog):
             return
 
         # Check if user is a candidate
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Allow unregistered users to campaign for demographics
         # if not candidate:
@@ -1354,7 +1146,7 @@ class Demographics(commands.Cog):
                 return
 
         # Get target candidate
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate:
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -1364,11 +1156,11 @@ class Demographics(commands.Cog):
 
         # Check stamina
         stamina_cost = 4
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Get the stamina user's candidate data
         if stamina_user_id == interaction.user.id:
-            _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+            _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
         else:
             stamina_user_candidate = target_candidate
 
@@ -1382,8 +1174,8 @@ class Demographics(commands.Cog):
             return
 
         # Check cooldown (6 hours)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "demographic_poster", 6):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "demographic_poster", 6)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "demographic_poster", 6)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             await interaction.response.send_message(
@@ -1408,23 +1200,24 @@ class Demographics(commands.Cog):
             )
             return
 
+        # Start the cooldown before applying the poster, unless a concurrent use already did
+        if not await self._claim_cooldown(interaction, "demographic_poster", 6):
+            return
+
         # Random demographic points between 0.3 and 0.8
         base_points = random.uniform(0.3, 0.8)
 
         # Update demographic points and handle backlash
-        points_gained, backlash_updates = self._update_demographic_points(
+        points_gained, backlash_updates = await self._update_demographic_points(
             target_signups_col, interaction.guild.id, target_candidate.get("user_id"), 
             demographic, base_points, state_upper, target_candidate
         )
 
         # Deduct stamina from the determined user
-        self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
-
-        # Set cooldown
-        self._set_cooldown(interaction.guild.id, interaction.user.id, "demographic_poster")
+        await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
         # Get leadership status
-        leader, highest_points = self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
+        leader, highest_points = await self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
         current_points = target_candidate.get("demographic_points", {}).get(demographic, 0) + points_gained
         is_leader = leader and leader.get("user_id") == target_candidate.get("user_id")
 
@@ -1492,7 +1285,7 @@ class Demographics(commands.Cog):
     )
     async def demographic_ad(self, interaction: discord.Interaction, state: str, demographic: str, target: Optional[str] = None):
         # Allow usage regardless of campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         # Validate state
         state_upper = state.upper()
@@ -1512,7 +1305,7 @@ class Demographics(commands.Cog):
             return
 
         # Check if user is a candidate
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Allow unregistered users to campaign for demographics
         # if not candidate:
@@ -1534,7 +1327,7 @@ class Demographics(commands.Cog):
                 return
 
         # Get target candidate
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate:
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -1544,11 +1337,11 @@ class Demographics(commands.Cog):
 
         # Check stamina
         stamina_cost = 5
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Get the stamina user's candidate data
         if stamina_user_id == interaction.user.id:
-            _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+            _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
         else:
             stamina_user_candidate = target_candidate
 
@@ -1562,8 +1355,8 @@ class Demographics(commands.Cog):
             return
 
         # Check cooldown (10 hours)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "demographic_ad", 10):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "demographic_ad", 10)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "demographic_ad", 10)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             await interaction.response.send_message(
@@ -1614,23 +1407,24 @@ class Demographics(commands.Cog):
                 await reply_message.reply("❌ Video file too large! Maximum size is 25MB.")
                 return
 
+            # Start the cooldown before applying the ad, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "demographic_ad", 10):
+                return
+
             # Random demographic points between 0.8 and 1.5
             base_points = random.uniform(0.8, 1.5)
 
             # Update demographic points and handle backlash
-            points_gained, backlash_updates = self._update_demographic_points(
+            points_gained, backlash_updates = await self._update_demographic_points(
                 target_signups_col, interaction.guild.id, target_candidate.get("user_id"), 
                 demographic, base_points, state_upper, target_candidate
             )
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
-
-            # Set cooldown
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "demographic_ad")
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
             # Get leadership status
-            leader, highest_points = self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
+            leader, highest_points = await self._get_demographic_leader(interaction.guild.id, demographic, state_upper)
             current_points = target_candidate.get("demographic_points", {}).get(demographic, 0) + points_gained
             is_leader = leader and leader.get("user_id") == target_candidate.get("user_id")
 
@@ -1739,7 +1533,7 @@ class Demographics(commands.Cog):
 
         try:
             # Check if user is a candidate in General Campaign
-            signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+            signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
             if not candidate:
                 await interaction.followup.send(
@@ -1759,14 +1553,14 @@ class Demographics(commands.Cog):
             )
 
             # Get all primary winners from all_winners collection
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             current_year = time_config["current_rp_date"].year if time_config else 2024
 
             all_candidates = []
             
             # First check all_winners collection (primary source for General Campaign)
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             
             if winners_config and isinstance(winners_config, dict):
                 for winner in winners_config.get("winners", []):
@@ -1776,7 +1570,7 @@ class Demographics(commands.Cog):
                         all_candidates.append(winner)
 
             # Also check presidential winners collection as backup
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(interaction.guild.id)
+            pres_winners_col, pres_winners_config = await self._get_presidential_winners_config(interaction.guild.id)
             if pres_winners_config and isinstance(pres_winners_config, dict):
                 primary_year = current_year - 1 if current_year % 2 == 0 else current_year
                 winners_data = pres_winners_config.get("winners", [])
@@ -1789,7 +1583,7 @@ class Demographics(commands.Cog):
                             winner.get("office") in ["President", "Vice President"]):
                             all_candidates.append(winner)
                 elif isinstance(winners_data, dict):
-                    signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+                    signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
                     if signups_config:
                         election_year = pres_winners_config.get("election_year", current_year)
                         signup_year = election_year - 1 if election_year % 2 == 0 else election_year
@@ -1873,14 +1667,11 @@ class Demographics(commands.Cog):
             ]
 
             for action, hours in cooldowns:
-                if not self._check_cooldown(interaction.guild.id, interaction.user.id, action, hours):
-                    remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, action, hours)
-                    if remaining:
-                        hours_left = int(remaining.total_seconds() // 3600)
-                        minutes_left = int((remaining.total_seconds() % 3600) // 60)
-                        cooldown_info += f"🔒 **{action.replace('_', ' ').title()}:** {hours_left}h {minutes_left}m\n"
-                    else:
-                        cooldown_info += f"✅ **{action.replace('_', ' ').title()}:** Available\n"
+                remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, action, hours)
+                if remaining:
+                    hours_left = int(remaining.total_seconds() // 3600)
+                    minutes_left = int((remaining.total_seconds() % 3600) // 60)
+                    cooldown_info += f"🔒 **{action.replace('_', ' ').title()}:** {hours_left}h {minutes_left}m\n"
                 else:
                     cooldown_info += f"✅ **{action.replace('_', ' ').title()}:** Available\n"
 
@@ -1928,7 +1719,7 @@ class Demographics(commands.Cog):
             pass
 
         # Check if in General Campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") != "General Campaign":
             await interaction.followup.send(
                 "❌ Demographic overview is only available during the General Campaign phase.",
@@ -1948,7 +1739,7 @@ class Demographics(commands.Cog):
         embed_color = discord.Color.red()
 
         if selected_scope == "presidential":
-            winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
+            winners_col, winners_config = await self._get_presidential_winners_config(interaction.guild.id)
 
             if not winners_config or not winners_config.get("winners"):
                 await interaction.followup.send(
@@ -1968,7 +1759,7 @@ class Demographics(commands.Cog):
                         candidates_to_show.append(winner)
             elif isinstance(winners_data, dict):
                 # Old dict format: {party: candidate_name}
-                signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+                signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
                 if signups_config:
                     election_year = winners_config.get("election_year", current_year)
                     signup_year = election_year - 1 if election_year % 2 == 0 else election_year
@@ -1997,7 +1788,7 @@ class Demographics(commands.Cog):
 
             # First check all_winners collection: primary winners advancing to general election
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
             if winners_config and isinstance(winners_config, dict):
                 for winner in winners_config.get("winners", []):
@@ -2007,7 +1798,7 @@ class Demographics(commands.Cog):
                         candidates_to_show.append(winner)
 
             # Also check presidential winners collection as backup
-            pres_winners_col, pres_winners_config = self._get_presidential_winners_config(interaction.guild.id)
+            pres_winners_col, pres_winners_config = await self._get_presidential_winners_config(interaction.guild.id)
             if pres_winners_config and isinstance(pres_winners_config, dict):
                 primary_year = current_year - 1 if current_year % 2 == 0 else current_year
                 for winner in pres_winners_config.get("winners", []):
@@ -2020,7 +1811,7 @@ class Demographics(commands.Cog):
             # Fallback to signups if no winners were found
             if not candidates_to_show:
                 signups_col = self.bot.db["signups"]
-                signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+                signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
 
                 if signups_config and isinstance(signups_config, dict):
                     for candidate in signups_config.get("candidates", []):
@@ -2043,11 +1834,9 @@ class Demographics(commands.Cog):
             )
             return
 
-        # Compute leaders once per demographic to reduce DB calls
-        leaders_by_demographic = {}
-        for demographic in DEMOGRAPHIC_STRENGTH.keys():
-            leader, _ = self._get_demographic_leader(interaction.guild.id, demographic, "ALABAMA")
-            leaders_by_demographic[demographic] = leader.get("user_id") if leader else None
+        # Leaders come from the guild's leaderboard, built at most once
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
+        board = await self.leaderboards.board(interaction.guild.id, time_config)
 
         # Apply optional filters and sorting
         def _normalize_state(value: str) -> str:
@@ -2093,10 +1882,7 @@ class Demographics(commands.Cog):
             for candidate in pages[page_index]:
                 candidate_demographics = candidate.get("demographic_points", {})
 
-                leading_count = 0
-                for demographic in DEMOGRAPHIC_STRENGTH.keys():
-                    if leaders_by_demographic.get(demographic) == candidate.get("user_id"):
-                        leading_count += 1
+                leading_count = board.leading_count(candidate.get("user_id"), "ALABAMA", DEMOGRAPHIC_STRENGTH.keys())
 
                 total_points = sum(candidate_demographics.values()) if isinstance(candidate_demographics, dict) else 0
                 stamina = candidate.get("stamina", 0)
@@ -2143,12 +1929,12 @@ class Demographics(commands.Cog):
         await interaction.followup.send(embed=build_embed(0), view=view, ephemeral=True)
 
     async def candidate_autocomplete_reset(self, interaction: discord.Interaction, current: str):
-        winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_presidential_winners_config(interaction.guild.id)
 
         if not winners_config:
             return []
 
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
         primary_year = current_year - 1 if current_year % 2 == 0 else current_year
 
@@ -2178,7 +1964,7 @@ class Demographics(commands.Cog):
     @app_commands.autocomplete(candidate_name=candidate_autocomplete_reset)
     @app_commands.default_permissions(administrator=True)
     async def admin_demographic_reset(self, interaction: discord.Interaction, candidate_name: str):
-        winners_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, candidate_name)
+        winners_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, candidate_name)
 
         if not target_candidate:
             await interaction.response.send_message(
@@ -2190,15 +1976,16 @@ class Demographics(commands.Cog):
         # Reset all demographic points - check collection type
         collection_name = str(winners_col.name)
         if "winners" in collection_name:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": target_candidate.get("user_id")},
                 {"$set": {"winners.$.demographic_points": {}}}
             )
         elif "signups" in collection_name:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                 {"$set": {"candidates.$.demographic_points": {}}}
             )
+        self._record_demographic_points(winners_col, interaction.guild.id, target_candidate.get("user_id"), {}, replace=True)
 
         embed = discord.Embed(
             title="🔄 Demographic Reset Complete",
@@ -2236,7 +2023,7 @@ class Demographics(commands.Cog):
             )
             return
 
-        winners_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, candidate_name)
+        winners_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, candidate_name)
 
         if not target_candidate:
             await interaction.response.send_message(
@@ -2253,18 +2040,20 @@ class Demographics(commands.Cog):
         # Update the demographic points - check collection type
         collection_name = str(winners_col.name)
         if "winners" in collection_name:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": target_candidate.get("user_id")},
                 {"$set": {f"winners.$.demographic_points.{demographic}": new_points}}
             )
         elif "signups" in collection_name:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                 {"$set": {f"candidates.$.demographic_points.{demographic}": new_points}}
             )
+        self._record_demographic_points(winners_col, interaction.guild.id, target_candidate.get("user_id"),
+                                        {demographic: new_points})
 
         # Check new leadership status
-        leader, highest_points = self._get_demographic_leader(interaction.guild.id, demographic, "ALABAMA")
+        leader, highest_points = await self._get_demographic_leader(interaction.guild.id, demographic, "ALABAMA")
         is_now_leader = leader and leader.get("user_id") == target_candidate.get("user_id")
 
         embed = discord.Embed(
@@ -2293,12 +2082,7 @@ class Demographics(commands.Cog):
     @app_commands.describe(user="User whose cooldowns to clear")
     @app_commands.default_permissions(administrator=True)
     async def admin_demographic_clear_cooldowns(self, interaction: discord.Interaction, user: discord.Member):
-        cooldowns_col = self.bot.db["demographic_cooldowns"]
-
-        result = cooldowns_col.delete_many({
-            "guild_id": interaction.guild.id,
-            "user_id": user.id
-        })
+        cooldowns_removed = await get_cooldowns(self.bot).reset("demographic_cooldowns", interaction.guild.id, user.id)
 
         embed = discord.Embed(
             title="🕒 Cooldowns Cleared",
@@ -2310,7 +2094,7 @@ class Demographics(commands.Cog):
         embed.add_field(
             name="Action Details",
             value=f"**Target User:** {user.mention}\n"
-                  f"**Cooldowns Removed:** {result.deleted_count}\n"
+                  f"**Cooldowns Removed:** {cooldowns_removed}\n"
                   f"**Status:** All demographic actions now available",
             inline=False
         )
@@ -2334,30 +2118,29 @@ class Demographics(commands.Cog):
 
         # Reset demographics for all_winners collection
         all_winners_col = self.bot.db["winners"]
-        all_winners_result = all_winners_col.update_many(
+        all_winners_result = await all_winners_col.update_many(
             {"guild_id": interaction.guild.id},
             {"$unset": {"winners.$[].demographic_points": ""}}
         )
 
         # Reset demographics for presidential winners
         winners_col = self.bot.db["presidential_winners"]
-        winners_result = winners_col.update_many(
+        winners_result = await winners_col.update_many(
             {"guild_id": interaction.guild.id},
             {"$unset": {"winners.$[].demographic_points": ""}}
         )
 
         # Reset demographics for general signups
         signups_col = self.bot.db["signups"]
-        signups_result = signups_col.update_many(
+        signups_result = await signups_col.update_many(
             {"guild_id": interaction.guild.id},
             {"$unset": {"candidates.$[].demographic_points": ""}}
         )
 
+        self.leaderboards.invalidate(interaction.guild.id)
+
         # Clear all demographic cooldowns
-        cooldowns_col = self.bot.db["demographic_cooldowns"]
-        cooldowns_result = cooldowns_col.delete_many({
-            "guild_id": interaction.guild.id
-        })
+        cooldowns_removed = await get_cooldowns(self.bot).reset("demographic_cooldowns", interaction.guild.id)
 
         embed = discord.Embed(
             title="🔄 ALL Demographics Reset Complete",
@@ -2371,7 +2154,7 @@ class Demographics(commands.Cog):
             value=f"**All Winners:** {all_winners_result.modified_count} records reset\n"
                   f"**Presidential Winners:** {winners_result.modified_count} records reset\n"
                   f"**General Candidates:** {signups_result.modified_count} records reset\n"
-                  f"**Cooldowns Cleared:** {cooldowns_result.deleted_count} cooldowns removed\n"
+                  f"**Cooldowns Cleared:** {cooldowns_removed} cooldowns removed\n"
                   f"**Status:** Fresh start for all demographic campaigns",
             inline=False
         )
@@ -2509,7 +2292,7 @@ class Demographics(commands.Cog):
     async def admin_demographic_system_status(self, interaction: discord.Interaction):
         # Get system statistics
         cooldowns_col = self.bot.db["demographic_cooldowns"]
-        active_cooldowns = cooldowns_col.count_documents({"guild_id": interaction.guild.id})
+        active_cooldowns = await cooldowns_col.count_documents({"guild_id": interaction.guild.id})
 
         # Get demographic configuration
         embed = discord.Embed(
@@ -2646,6 +2429,7 @@ class Demographics(commands.Cog):
             PRESIDENTIAL_STATE_DATA[state_upper]["republican"] = round(republican, 1)
             PRESIDENTIAL_STATE_DATA[state_upper]["democrat"] = round(democrat, 1) 
             PRESIDENTIAL_STATE_DATA[state_upper]["other"] = round(other, 1)
+            invalidate_state_baselines()
 
             embed = discord.Embed(
                 title="📊 Base Party Percentages Updated",
@@ -2695,12 +2479,11 @@ class Demographics(commands.Cog):
 
     async def _get_candidate_choices_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice]:
         """Helper to get candidate choices for autocompletion"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         # Calculate current phase dynamically instead of relying on stored value
-        from cogs.time_manager import TimeManager
         time_manager = self.bot.get_cog('TimeManager')
         if time_manager:
             current_rp_date, current_phase = time_manager._calculate_current_rp_time(time_config)
@@ -2709,136 +2492,10 @@ class Demographics(commands.Cog):
             current_year = time_config["current_rp_date"].year if time_config else 2024
             current_phase = time_config.get("current_phase", "")
 
-        all_candidates = []
-
-        print(f"DEBUG: Demographics Autocomplete - Phase: {current_phase}, Year: {current_year}")
-
-        # Phase-specific logic: prioritize different collections based on current phase
-        if current_phase == "Primary Campaign":
-            # During Primary Campaign, prioritize signups collection (used by all_signups.py)
-            print("DEBUG: Primary Campaign phase - checking signups collection")
-            
-            # 1. Check signups collection (primary source for Primary Campaign - used by all_signups.py)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added signup candidate: {candidate_name}")
-
-            # 2. Check all_signups collection (backup)
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if all_signups_config and "candidates" in all_signups_config:
-                for candidate in all_signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added all_signups candidate: {candidate_name}")
-
-        elif current_phase in ["General Campaign", "Primary Election"]:
-            # During General Campaign or Primary Election, prioritize winners collection
-            print(f"DEBUG: {current_phase} phase - checking winners collection")
-            
-            # 1. Check winners collection for primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if winners_config and "winners" in winners_config:
-                # For General Campaign/Primary Election, look for primary winners from the current election year
-                # Primary winners are stored with the election year (even years), not the signup year
-                print(f"DEBUG: Checking winners for election year: {current_year}")
-                for winner in winners_config["winners"]:
-                    if (winner.get("year") == current_year and 
-                        winner.get("primary_winner", False)):
-                        candidate_name = winner.get("candidate")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added primary winner candidate: {candidate_name}")
-
-            # 2. Check presidential winners
-            pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if pres_winners_config:
-                election_year = pres_winners_config.get("election_year", current_year)
-                print(f"DEBUG: Presidential winners - election_year: {election_year}, current_year: {current_year}")
-                if election_year == current_year:
-                    winners_data = pres_winners_config.get("winners", {})
-                    if isinstance(winners_data, dict):
-                        for party, winner_name in winners_data.items():
-                            if isinstance(winner_name, str) and winner_name not in all_candidates:
-                                all_candidates.append(winner_name)
-                                print(f"DEBUG: Added presidential winner: {winner_name} ({party})")
-
-        else:
-            # For other phases or unknown phases, check all collections
-            print("DEBUG: Unknown phase - checking all collections")
-            
-            # Check signups collection first (primary source)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-
-            # Check all_signups collection (backup)
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if all_signups_config and "candidates" in all_signups_config:
-                for candidate in all_signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-
-            # Check presidential signups
-            pres_col = self.bot.db["presidential_signups"]
-            pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
-
-            if pres_config and "candidates" in pres_config:
-                for candidate in pres_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-
-        # Debug: Log candidates found
-        print(f"DEBUG: Found {len(all_candidates)} candidates for autocomplete: {all_candidates[:10]}...")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_candidates = []
-        for name in all_candidates:
-            if name and name not in seen:
-                seen.add(name)
-                unique_candidates.append(name)
-
-        # Filter candidates based on user input
-        if current:
-            filtered_candidates = [name for name in unique_candidates if current.lower() in name.lower()]
-        else:
-            filtered_candidates = unique_candidates
-
-        # Sort alphabetically for better UX
-        filtered_candidates.sort()
-
-        # Debug: Log filtered results
-        print(f"DEBUG: Filtered to {len(filtered_candidates)} candidates matching '{current}': {filtered_candidates[:5]}...")
-
-        # Return up to 25 choices
-        return [app_commands.Choice(name=name, value=name) for name in filtered_candidates[:25]]
+        names = await get_candidate_names(self.bot).matches(
+            interaction.guild.id, CAMPAIGN_TARGETS, current_phase, current_year, current
+        )
+        return [app_commands.Choice(name=name, value=name) for name in names]
 
 async def setup(bot):
     await bot.add_cog(Demographics(bot))
\ No newline at end of file
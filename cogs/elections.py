@@ -3,7 +3,24 @@ import discord
 from discord import app_commands
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from pymongo import UpdateOne
+import csv
+import io
 import math
+from cogs.exports import build_export, send_export
+from cogs.indexes import register_index
+from cogs.time_manager import get_rp_clock
+
+# Raw ballots are written in batches of this size during CSV imports
+VOTE_INSERT_BATCH_SIZE = 5000
+
+# Columns of the seat CSV and JSON Lines exports
+SEAT_EXPORT_COLUMNS = ["seat_id", "office", "state", "term_years", "current_holder", "term_end",
+                       "up_for_election"]
+
+# Query shapes this cog runs, created at startup by the db cog
+register_index("votes", [("guild_id", 1), ("seat_id", 1)], owner=__name__)
+register_index("vote_tallies", [("guild_id", 1), ("seat_id", 1), ("candidate", 1)], owner=__name__)
 
 class SeatsUpDropdown(discord.ui.Select):
     def __init__(self, office_groups, current_year):
@@ -195,41 +212,29 @@ class Elections(commands.Cog):
         vote_data: str
     ):
         """Set vote counts for candidates in format: candidate1:votes,candidate2:votes"""
-        votes_col = self.bot.db["votes"]
-
-        # Clear existing votes for this seat
-        votes_col.delete_many({
-            "guild_id": interaction.guild.id,
-            "seat_id": seat_id.upper()
-        })
-
-        # Parse vote data
-        vote_pairs = vote_data.split(",")
-        total_votes = 0
+        # Parse vote data before touching the database
+        tallies = {}
         added_candidates = []
 
-        for pair in vote_pairs:
+        for pair in vote_data.split(","):
             try:
                 candidate, vote_count_str = pair.strip().split(":")
                 vote_count = int(vote_count_str)
-
-                # Create fake votes for this candidate
-                for i in range(vote_count):
-                    vote_record = {
-                        "guild_id": interaction.guild.id,
-                        "user_id": f"fake_voter_{seat_id}_{candidate}_{i}",  # Fake user ID
-                        "seat_id": seat_id.upper(),
-                        "candidate": candidate.strip(),
-                        "timestamp": datetime.utcnow()
-                    }
-                    votes_col.insert_one(vote_record)
-
-                total_votes += vote_count
-                added_candidates.append(f"{candidate.strip()}: {vote_count}")
-
+                candidate = candidate.strip()
             except (ValueError, IndexError):
                 await interaction.response.send_message(f"❌ Invalid format in: {pair}", ephemeral=True)
                 return
+            if vote_count < 0:
+                await interaction.response.send_message(f"❌ Vote counts cannot be negative: {pair}", ephemeral=True)
+                return
+
+            tallies[candidate] = tallies.get(candidate, 0) + vote_count
+            added_candidates.append(f"{candidate}: {vote_count}")
+
+        total_votes = sum(tallies.values())
+
+        # Store one tally per candidate instead of one document per vote
+        await self._set_vote_tallies(interaction.guild.id, seat_id.upper(), tallies)
 
         embed = discord.Embed(
             title=f"✅ Votes Set for {seat_id}",
@@ -266,8 +271,7 @@ class Elections(commands.Cog):
     ):
         """Set election winner and vote counts for general elections"""
         # Check if we're in general election phase
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
 
         if time_config:
             current_phase = time_config.get("current_phase", "")
@@ -277,51 +281,37 @@ class Elections(commands.Cog):
                     ephemeral=True
                 )
 
-        # Set the votes using the bulk vote function
-        votes_col = self.bot.db["votes"]
-
-        # Clear existing votes for this seat
-        votes_col.delete_many({
-            "guild_id": interaction.guild.id,
-            "seat_id": seat_id.upper()
-        })
-
         # Parse vote data
-        vote_pairs = vote_data.split(",")
-        total_votes = 0
+        tallies = {}
         added_candidates = []
         winner_votes = 0
 
-        for pair in vote_pairs:
+        for pair in vote_data.split(","):
             try:
                 candidate, vote_count_str = pair.strip().split(":")
                 vote_count = int(vote_count_str)
                 candidate = candidate.strip()
+            except (ValueError, IndexError):
+                await interaction.response.send_message(f"❌ Invalid format in: {pair}", ephemeral=True)
+                return
+            if vote_count < 0:
+                await interaction.response.send_message(f"❌ Vote counts cannot be negative: {pair}", ephemeral=True)
+                return
 
-                # Track winner votes
-                if candidate.lower() == winner_candidate.lower():
-                    winner_votes = vote_count
+            # Track winner votes
+            if candidate.lower() == winner_candidate.lower():
+                winner_votes = vote_count
 
-                # Create fake votes for this candidate
-                for i in range(vote_count):
-                    vote_record = {
-                        "guild_id": interaction.guild.id,
-                        "user_id": f"fake_voter_{seat_id}_{candidate}_{i}",
-                        "seat_id": seat_id.upper(),
-                        "candidate": candidate,
-                        "timestamp": datetime.utcnow()
-                    }
-                    votes_col.insert_one(vote_record)
+            tallies[candidate] = tallies.get(candidate, 0) + vote_count
+            added_candidates.append(f"{candidate}: {vote_count}")
 
-                total_votes += vote_count
-                added_candidates.append(f"{candidate}: {vote_count}")
+        total_votes = sum(tallies.values())
 
-            except (ValueError, IndexError):
-                await interaction.response.send_message(f"❌ Invalid format in: {pair}", ephemeral=True)
-                return
+        # Set the votes using the same tally store as the bulk vote command
+        await self._set_vote_tallies(interaction.guild.id, seat_id.upper(), tallies)
 
         # Update the seat with the winner
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find and update the seat
         seat_found = None
@@ -344,7 +334,7 @@ class Elections(commands.Cog):
                 "up_for_election": False
             })
 
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -382,6 +372,172 @@ class Elections(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @election_group.command(
+        name="admin_import_votes",
+        description="Import ballots or vote counts from a CSV file (Admin only)"
+    )
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def admin_import_votes(
+        self,
+        interaction: discord.Interaction,
+        ballots: discord.Attachment,
+        replace_existing: bool = True
+    ):
+        """Import a CSV with columns seat_id,candidate and optional votes,voter_id"""
+        if not ballots.filename.lower().endswith(".csv"):
+            await interaction.response.send_message("❌ Please attach a `.csv` file.", ephemeral=True)
+            return
+
+        # Large imports can take a while, so acknowledge the interaction first
+        await interaction.response.defer(ephemeral=True)
+
+        data = await ballots.read()
+
+        try:
+            tallies, ballot_count, errors = await self._ingest_vote_csv(interaction.guild.id, data, replace_existing)
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {str(e)}", ephemeral=True)
+            return
+
+        seat_totals = {}
+        for (seat_id, candidate), votes in tallies.items():
+            seat_totals[seat_id] = seat_totals.get(seat_id, 0) + votes
+
+        embed = discord.Embed(
+            title="✅ Votes Imported",
+            color=discord.Color.green(),
+            timestamp=datetime.utcnow()
+        )
+
+        embed.add_field(name="Seats", value=str(len(seat_totals)), inline=True)
+        embed.add_field(name="Candidates", value=str(len(tallies)), inline=True)
+        embed.add_field(name="Total Votes", value=f"{sum(seat_totals.values()):,}", inline=True)
+        embed.add_field(name="Raw Ballots Stored", value=f"{ballot_count:,}", inline=True)
+
+        if seat_totals:
+            seat_lines = [f"**{seat_id}**: {votes:,}" for seat_id, votes in sorted(seat_totals.items())]
+            seat_text = "\n".join(seat_lines[:20])
+            if len(seat_lines) > 20:
+                seat_text += f"\n... and {len(seat_lines) - 20} more"
+            embed.add_field(name="📊 Votes by Seat", value=seat_text, inline=False)
+
+        if errors:
+            error_text = "\n".join(errors[:5])
+            if len(errors) > 5:
+                error_text += f"\n... and {len(errors) - 5} more"
+            embed.add_field(name=f"❌ Skipped Rows ({len(errors)})", value=error_text, inline=False)
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    async def _set_vote_tallies(self, guild_id: int, seat_id: str, tallies: Dict[str, int]):
+        """Replace all votes for a seat with one tally document per candidate"""
+        votes_col = self.bot.db["votes"]
+        tallies_col = self.bot.db["vote_tallies"]
+
+        # Raw ballots for this seat would no longer match the new tallies
+        await votes_col.delete_many({"guild_id": guild_id, "seat_id": seat_id})
+        await tallies_col.delete_many({"guild_id": guild_id, "seat_id": seat_id})
+
+        if tallies:
+            await tallies_col.insert_many([
+                {
+                    "guild_id": guild_id,
+                    "seat_id": seat_id,
+                    "candidate": candidate,
+                    "votes": votes,
+                    "updated_at": datetime.utcnow()
+                }
+                for candidate, votes in tallies.items()
+            ])
+
+    @staticmethod
+    def _parse_vote_csv(guild_id: int, data: bytes):
+        """Read a whole vote CSV into per-candidate tallies, ballot documents and row errors.
+
+        Rows with a votes column are treated as pre-counted totals, rows without one
+        are single ballots that are also kept in the votes collection. Raises
+        ValueError if the file as a whole cannot be read.
+        """
+        try:
+            text = data.decode("utf-8-sig")
+        except UnicodeDecodeError as e:
+            line_number = data[:e.start].count(b"\n") + 1
+            raise ValueError(f"CSV must be UTF-8 encoded (line {line_number} is not).")
+
+        reader = csv.DictReader(io.StringIO(text, newline=""))
+        columns = [(name or "").strip().lower() for name in (reader.fieldnames or [])]
+        if "seat_id" not in columns or "candidate" not in columns:
+            raise ValueError("CSV must have a header row with `seat_id` and `candidate` columns.")
+        reader.fieldnames = columns
+
+        tallies = {}
+        ballots = []
+        errors = []
+
+        for line_number, row in enumerate(reader, start=2):
+            seat_id = (row.get("seat_id") or "").strip().upper()
+            candidate = (row.get("candidate") or "").strip()
+            if not seat_id or not candidate:
+                errors.append(f"Line {line_number}: missing seat_id or candidate")
+                continue
+
+            vote_field = (row.get("votes") or "").strip()
+            try:
+                vote_count = int(vote_field) if vote_field else 1
+            except ValueError:
+                errors.append(f"Line {line_number}: invalid vote count `{vote_field}`")
+                continue
+            if vote_count < 0:
+                errors.append(f"Line {line_number}: negative vote count `{vote_field}`")
+                continue
+
+            if not vote_field:
+                ballots.append({
+                    "guild_id": guild_id,
+                    "user_id": (row.get("voter_id") or "").strip() or f"imported_voter_{seat_id}_{line_number}",
+                    "seat_id": seat_id,
+                    "candidate": candidate,
+                    "timestamp": datetime.utcnow()
+                })
+
+            tallies[(seat_id, candidate)] = tallies.get((seat_id, candidate), 0) + vote_count
+
+        return tallies, ballots, errors
+
+    async def _ingest_vote_csv(self, guild_id: int, data: bytes, replace_existing: bool):
+        """Import a vote CSV as batched ballot inserts and per-candidate tally upserts.
+
+        The file is decoded and parsed on a worker thread, and nothing is written
+        until all of it has been read, so a file that fails part-way leaves the
+        seats' existing votes untouched.
+        """
+        votes_col = self.bot.db["votes"]
+        tallies_col = self.bot.db["vote_tallies"]
+
+        tallies, ballots, errors = await self.bot.db.run(self._parse_vote_csv, guild_id, data)
+
+        if replace_existing:
+            for seat_id in sorted({seat_id for seat_id, candidate in tallies}):
+                await votes_col.delete_many({"guild_id": guild_id, "seat_id": seat_id})
+                await tallies_col.delete_many({"guild_id": guild_id, "seat_id": seat_id})
+
+        for start in range(0, len(ballots), VOTE_INSERT_BATCH_SIZE):
+            await votes_col.insert_many(ballots[start:start + VOTE_INSERT_BATCH_SIZE], ordered=False)
+        ballot_count = len(ballots)
+
+        if tallies:
+            await tallies_col.bulk_write([
+                UpdateOne(
+                    {"guild_id": guild_id, "seat_id": seat_id, "candidate": candidate},
+                    {"$inc": {"votes": votes}, "$set": {"updated_at": datetime.utcnow()}},
+                    upsert=True
+                )
+                for (seat_id, candidate), votes in tallies.items()
+            ], ordered=False)
+
+        return tallies, ballot_count, errors
+
     @commands.Cog.listener()
     async def on_phase_change(self, guild_id: int, old_phase: str, new_phase: str, current_year: int):
         """Automatically handle phase changes from time manager"""
@@ -399,7 +555,7 @@ class Elections(commands.Cog):
 
     async def _handle_automatic_phase_change(self, guild_id: int, old_phase: str, new_phase: str, current_year: int):
         """Handle automatic election management based on phase changes"""
-        col, config = self._get_elections_config(guild_id)
+        col, config = await self._get_elections_config(guild_id)
         guild = self.bot.get_guild(guild_id)
 
         if not guild:
@@ -411,7 +567,7 @@ class Elections(commands.Cog):
         
         # Get announcement channel - only use the specific channel ID
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": guild_id})
+        setup_config = await setup_col.find_one({"guild_id": guild_id})
         
         channel = None
         
@@ -472,7 +628,7 @@ class Elections(commands.Cog):
         current_time = datetime.utcnow()
         
         # Get the last announcement time from the database directly
-        elections_config = col.find_one({"guild_id": guild_id})
+        elections_config = await col.find_one({"guild_id": guild_id})
         if elections_config:
             last_announcement = elections_config.get(last_announcement_key)
             if last_announcement:
@@ -504,7 +660,7 @@ class Elections(commands.Cog):
                 seats_up.append(seat["seat_id"])
 
         # Update database
-        col.update_one(
+        await col.update_one(
             {"guild_id": guild_id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -545,7 +701,7 @@ class Elections(commands.Cog):
                 print(f"DEBUG: Signups announcement sent to channel {channel.name} (ID: {channel.id})")
                 
                 # Update the last announcement time
-                col.update_one(
+                await col.update_one(
                     {"guild_id": guild_id},
                     {"$set": {last_announcement_key: current_time}}
                 )
@@ -609,7 +765,7 @@ class Elections(commands.Cog):
         current_time = datetime.utcnow()
         
         # Get the last announcement time from the database directly
-        elections_config = col.find_one({"guild_id": guild_id})
+        elections_config = await col.find_one({"guild_id": guild_id})
         if elections_config:
             last_announcement = elections_config.get(last_announcement_key)
             if last_announcement:
@@ -639,7 +795,7 @@ class Elections(commands.Cog):
                 print(f"DEBUG: General campaign announcement sent to channel {channel.name} (ID: {channel.id})")
                 
                 # Update the last announcement time
-                col.update_one(
+                await col.update_one(
                     {"guild_id": guild_id},
                     {"$set": {last_announcement_key: current_time}}
                 )
@@ -676,7 +832,7 @@ class Elections(commands.Cog):
 
         # Update database if seats were modified
         if seats_updated > 0:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -730,7 +886,7 @@ class Elections(commands.Cog):
 
     async def _auto_advance_terms_after_election(self, guild_id: int, current_year: int):
         """Automatically advance term end dates for seats that were up for election"""
-        col, config = self._get_elections_config(guild_id)
+        col, config = await self._get_elections_config(guild_id)
 
         updated_seats = []
 
@@ -743,7 +899,7 @@ class Elections(commands.Cog):
                 updated_seats.append(f"{seat['seat_id']} -> {new_term_end_year}")
 
         if updated_seats:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -859,10 +1015,10 @@ class Elections(commands.Cog):
 
         return False
 
-    def _get_elections_config(self, guild_id: int):
+    async def _get_elections_config(self, guild_id: int):
         """Get or create elections configuration for a guild"""
         col = self.bot.db["elections_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             # Initialize seats in database
             seats_in_db = []
@@ -886,7 +1042,7 @@ class Elections(commands.Cog):
                 "candidates": [],  # List of candidate registrations
                 "elections": []    # List of past/current elections
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
     @election_info_group.command(
@@ -899,7 +1055,7 @@ class Elections(commands.Cog):
         state: str = None
     ):
         try:
-            col, config = self._get_elections_config(interaction.guild.id)
+            col, config = await self._get_elections_config(interaction.guild.id)
 
             seats = config["seats"]
 
@@ -967,7 +1123,7 @@ class Elections(commands.Cog):
         term_start_year: int = None
     ):
         """Admin command to fill a vacant seat"""
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # If no seat_id provided, show available vacant seats
         if not seat_id:
@@ -1056,8 +1212,7 @@ class Elections(commands.Cog):
         # Calculate term dates
         if term_start_year is None:
             # Get current RP year from time manager
-            time_col = self.bot.db["time_configs"]
-            time_config = time_col.find_one({"guild_id": interaction.guild.id})
+            time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
             if time_config:
                 term_start_year = time_config["current_rp_date"].year
             else:
@@ -1075,7 +1230,7 @@ class Elections(commands.Cog):
             "up_for_election": False
         })
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1119,7 +1274,7 @@ class Elections(commands.Cog):
         user: discord.Member,
         term_start_year: int = None
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find the seat
         seat_found = None
@@ -1137,8 +1292,7 @@ class Elections(commands.Cog):
         # Calculate term dates
         if term_start_year is None:
             # Get current RP year from time manager
-            time_col = self.bot.db["time_configs"]
-            time_config = time_col.find_one({"guild_id": interaction.guild.id})
+            time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
             if time_config:
                 term_start_year = time_config["current_rp_date"].year
             else:
@@ -1156,7 +1310,7 @@ class Elections(commands.Cog):
             "up_for_election": False
         })
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1172,11 +1326,10 @@ class Elections(commands.Cog):
         description="Show all seats that are up for election this cycle"
     )
     async def seats_up_for_election(self, interaction: discord.Interaction):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Get current RP year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         up_for_election = []
@@ -1258,7 +1411,7 @@ class Elections(commands.Cog):
         self, interaction: discord.Interaction,
         seat_id: str
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find the seat
         seat_found = None
@@ -1277,7 +1430,7 @@ class Elections(commands.Cog):
 
         config["seats"][seat_found]["up_for_election"] = new_status
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1298,7 +1451,7 @@ class Elections(commands.Cog):
         self, interaction: discord.Interaction,
         seat_id: str
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find the seat
         seat_found = None
@@ -1322,7 +1475,7 @@ class Elections(commands.Cog):
             "up_for_election": True
         })
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1343,7 +1496,7 @@ class Elections(commands.Cog):
         office_type: str = None,
         state: str = None
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         if not office_type and not state:
             await interaction.response.send_message("❌ Please specify either office_type or state.", ephemeral=True)
@@ -1375,7 +1528,7 @@ class Elections(commands.Cog):
             await interaction.response.send_message("❌ No seats found matching the criteria.", ephemeral=True)
             return
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1402,7 +1555,7 @@ class Elections(commands.Cog):
             await interaction.response.send_message("❌ Term length must be between 1 and 10 years.", ephemeral=True)
             return
 
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         updated_seats = []
 
@@ -1426,7 +1579,7 @@ class Elections(commands.Cog):
             await interaction.response.send_message(f"❌ No seats found for office type '{office_type}'.", ephemeral=True)
             return
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1442,11 +1595,10 @@ class Elections(commands.Cog):
         description="Show statistics about current elections and seats"
     )
     async def election_stats(self, interaction: discord.Interaction):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Get current RP year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         seats = config["seats"]
@@ -1535,7 +1687,7 @@ class Elections(commands.Cog):
         house_districts: int = 4,
         has_governor: bool = True
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Validate inputs
         state_code = state_code.upper()
@@ -1604,7 +1756,7 @@ class Elections(commands.Cog):
         # Add all new seats to config
         config["seats"].extend(new_seats)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1633,7 +1785,7 @@ class Elections(commands.Cog):
         state_name: str,
         additional_districts: int
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         if additional_districts < 1 or additional_districts > 10:
             await interaction.response.send_message("❌ Additional districts must be between 1 and 10", ephemeral=True)
@@ -1686,7 +1838,7 @@ class Elections(commands.Cog):
 
         config["seats"].extend(new_seats)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1710,7 +1862,7 @@ class Elections(commands.Cog):
         state_name: str,
         additional_seats: int
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         if additional_seats < 1 or additional_seats > 5:
             await interaction.response.send_message("❌ Additional senate seats must be between 1 and 5", ephemeral=True)
@@ -1763,7 +1915,7 @@ class Elections(commands.Cog):
 
         config["seats"].extend(new_seats)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1784,7 +1936,7 @@ class Elections(commands.Cog):
         self, interaction: discord.Interaction,
         seat_id: str
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find the seat
         seat_found = None
@@ -1800,7 +1952,7 @@ class Elections(commands.Cog):
         removed_seat = config["seats"][seat_found]
         config["seats"].pop(seat_found)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1820,7 +1972,7 @@ class Elections(commands.Cog):
         state_name: str,
         confirm: bool = False
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find seats in this state
         state_seats = [seat for seat in config["seats"] if seat["state"] == state_name]
@@ -1849,7 +2001,7 @@ class Elections(commands.Cog):
         # Remove all seats from this state
         config["seats"] = [seat for seat in config["seats"] if seat["state"] != state_name]
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1870,7 +2022,7 @@ class Elections(commands.Cog):
         seat_id: str,
         term_end_year: int
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Find the seat
         seat_found = None
@@ -1893,7 +2045,7 @@ class Elections(commands.Cog):
             "up_for_election": term_end_year == datetime.now().year  # Up for election if term ends this year
         })
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": config["seats"]}}
         )
@@ -1912,7 +2064,7 @@ class Elections(commands.Cog):
         interaction: discord.Interaction,
         seat_year_pairs: str
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Parse the input format: "SEN-CO-1:1986,SEN-CO-2:1988,..."
         pairs = seat_year_pairs.split(",")
@@ -1945,7 +2097,7 @@ class Elections(commands.Cog):
                 errors.append(f"Invalid format: {pair}")
 
         if updated_seats:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -1968,8 +2120,7 @@ class Elections(commands.Cog):
     async def advance_all_terms(self, interaction: discord.Interaction):
         """Manually advance terms for seats that were up for election"""
         # Get current RP year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         updated_seats = await self._auto_advance_terms_after_election(interaction.guild.id, current_year)
@@ -1991,11 +2142,10 @@ class Elections(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def announce_seats_up(self, interaction: discord.Interaction):
         """Announce seats up for election in the configured announcement channel"""
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Get current RP year
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # DEBUG: Only allow the specific channel ID
@@ -2004,7 +2154,7 @@ class Elections(commands.Cog):
         
         # Get announcement channel - only use the specific channel ID
         setup_col = self.bot.db["guild_configs"]
-        setup_config = setup_col.find_one({"guild_id": interaction.guild.id})
+        setup_config = await setup_col.find_one({"guild_id": interaction.guild.id})
         
         channel = None
         
@@ -2140,7 +2290,7 @@ class Elections(commands.Cog):
         state: str = None,
         office_type: str = None
     ):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         seats = config["seats"]
 
@@ -2213,7 +2363,7 @@ class Elections(commands.Cog):
         description="List all states/regions and their seat counts"
     )
     async def list_states(self, interaction: discord.Interaction):
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Group seats by state
         state_info = {}
@@ -2283,11 +2433,10 @@ class Elections(commands.Cog):
             )
             return
 
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Get current RP year for comparison
-        time_col = self.bot.db["time_configs"]
-        time_config = time_col.find_one({"guild_id": interaction.guild.id})
+        time_config = await get_rp_clock(self.bot).get_config(interaction.guild.id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # Parse the input
@@ -2321,7 +2470,7 @@ class Elections(commands.Cog):
                 errors.append(f"Invalid format: {pair}")
 
         if updated_seats:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -2356,7 +2505,7 @@ class Elections(commands.Cog):
             )
             return
 
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
         updated_seats = []
 
         for i, seat in enumerate(config["seats"]):
@@ -2367,7 +2516,7 @@ class Elections(commands.Cog):
                 updated_seats.append(f"{seat['seat_id']}: {old_year} → {new_year}")
 
         if updated_seats:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -2401,7 +2550,7 @@ class Elections(commands.Cog):
             )
             return
 
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         # Reset to initial state
         seats_in_db = []
@@ -2422,7 +2571,7 @@ class Elections(commands.Cog):
             "elections": []
         }
 
-        col.replace_one(
+        await col.replace_one(
             {"guild_id": interaction.guild.id},
             new_config
         )
@@ -2456,7 +2605,7 @@ class Elections(commands.Cog):
             )
             return
 
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
         cleared_seats = []
 
         for i, seat in enumerate(config["seats"]):
@@ -2484,7 +2633,7 @@ class Elections(commands.Cog):
                 cleared_seats.append(seat["seat_id"])
 
         if cleared_seats:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"seats": config["seats"]}}
             )
@@ -2509,7 +2658,7 @@ class Elections(commands.Cog):
         value: str
     ):
         """Modify various election settings"""
-        col, config = self._get_elections_config(interaction.guild.id)
+        col, config = await self._get_elections_config(interaction.guild.id)
 
         valid_settings = ["default_senate_term", "default_governor_term", "default_house_term", "default_national_term"]
 
@@ -2541,7 +2690,7 @@ class Elections(commands.Cog):
                     config["defaults"] = {}
                 config["defaults"][setting] = term_years
 
-                col.update_one(
+                await col.update_one(
                     {"guild_id": interaction.guild.id},
                     {"$set": {"defaults": config["defaults"]}}
                 )
@@ -2556,64 +2705,44 @@ class Elections(commands.Cog):
 
     @election_group.command(
         name="admin_export_seats",
-        description="Export seat configuration as text (Admin only)"
+        description="Export seat configuration as a CSV, JSON Lines or text file (Admin only)"
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_export_seats(
         self,
         interaction: discord.Interaction,
-        format_type: str = "csv"
+        format_type: str = "csv",
+        compress: bool = False
     ):
         """Export seat data in various formats"""
-        col, config = self._get_elections_config(interaction.guild.id)
-
-        if format_type.lower() == "csv":
-            lines = ["seat_id,office,state,term_years,current_holder,term_end,up_for_election"]
-            for seat in config["seats"]:
-                holder = seat.get("current_holder", "")
-                term_end = seat.get("term_end", "").strftime("%Y-%m-%d") if seat.get("term_end") else ""
-                up_for_election = "yes" if seat.get("up_for_election") else "no"
-                lines.append(f"{seat['seat_id']},{seat['office']},{seat['state']},{seat['term_years']},{holder},{term_end},{up_for_election}")
-
-            export_text = "\n".join(lines)
-        else:
-            # JSON-like format
-            export_lines = []
-            for seat in config["seats"]:
-                holder = seat.get("current_holder", "None")
-                term_end = seat.get("term_end", "None")
-                if term_end != "None":
-                    term_end = f"'{term_end.strftime('%Y-%m-%d')}'"
-                up_for_election = seat.get("up_for_election", False)
-
-                export_lines.append(
-                    f"'{seat['seat_id']}': {seat['office']}, {seat['state']}, "
-                    f"{seat['term_years']}yr, Holder: {holder}, Term End: {term_end}, "
-                    f"Up: {up_for_election}"
-                )
-
-            export_text = "\n".join(export_lines)
-
-        # Split into chunks if too long
-        if len(export_text) > 1900:
-            chunk_size = 1900
-            chunks = [export_text[i:i+chunk_size] for i in range(0, len(export_text), chunk_size)]
-
-            await interaction.response.send_message(
-                f"📊 Seat Export ({format_type.upper()}) - Part 1/{len(chunks)}:\n```\n{chunks[0]}\n```",
-                ephemeral=True
+        col, config = await self._get_elections_config(interaction.guild.id)
+
+        def seat_line(seat):
+            holder = seat.get("current_holder", "None")
+            term_end = seat.get("term_end", "None")
+            if term_end != "None":
+                term_end = f"'{term_end.strftime('%Y-%m-%d')}'"
+            return (
+                f"'{seat['seat_id']}': {seat['office']}, {seat['state']}, "
+                f"{seat['term_years']}yr, Holder: {holder}, Term End: {term_end}, "
+                f"Up: {seat.get('up_for_election', False)}"
             )
 
-            for i, chunk in enumerate(chunks[1:], 2):
-                await interaction.followup.send(
-                    f"📊 Part {i}/{len(chunks)}:\n```\n{chunk}\n```",
-                    ephemeral=True
-                )
-        else:
-            await interaction.response.send_message(
-                f"📊 Seat Export ({format_type.upper()}):\n```\n{export_text}\n```",
-                ephemeral=True
-            )
+        export = await build_export(
+            config["seats"], "seats", format_type, SEAT_EXPORT_COLUMNS,
+            row=lambda seat: [
+                seat["seat_id"], seat["office"], seat["state"], seat["term_years"],
+                seat.get("current_holder", ""),
+                seat["term_end"].strftime("%Y-%m-%d") if seat.get("term_end") else "",
+                "yes" if seat.get("up_for_election") else "no"
+            ],
+            line=seat_line,
+            compress=compress
+        )
+        await send_export(
+            interaction, export,
+            f"📊 Seat Export ({format_type.upper()}) - {export.rows} seats"
+        )
 
 async def setup(bot):
     await bot.add_cog(Elections(bot))
\ No newline at end of file
@@ -3,22 +3,32 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime, timedelta
 from typing import Optional
+from cogs.candidates import get_candidate_registry
+from cogs.time_manager import get_rp_clock
+
+# Collection a candidate was found in -> how its endorsement points are stored
+ENDORSEMENT_SYSTEMS = {
+    "signups": "general_signups",
+    "winners": "general_winners",
+    "presidential_signups": "presidential_signups",
+    "presidential_winners": "presidential_winners",
+}
 
 class Endorsements(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         print("Endorsements cog loaded successfully")
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_endorsement_config(self, guild_id: int):
+    async def _get_endorsement_config(self, guild_id: int):
         """Get or create endorsement configuration"""
         col = self.bot.db["endorsement_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
@@ -33,24 +43,24 @@ class Endorsements(commands.Cog):
                     "Other": None
                 }
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _get_endorsement_history(self, guild_id: int):
+    async def _get_endorsement_history(self, guild_id: int):
         """Get or create endorsement history"""
         col = self.bot.db["endorsement_history"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "endorsements": []
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _check_duplicate_endorsement(self, guild_id: int, user_id: int, candidate_name: str):
+    async def _check_duplicate_endorsement(self, guild_id: int, user_id: int, candidate_name: str):
         """Check if user has already endorsed this specific candidate"""
-        history_col, history_config = self._get_endorsement_history(guild_id)
+        history_col, history_config = await self._get_endorsement_history(guild_id)
 
         # Check if user has already endorsed this specific candidate
         for endorsement in history_config.get("endorsements", []):
@@ -60,9 +70,9 @@ class Endorsements(commands.Cog):
 
         return False  # Not yet endorsed
 
-    def _get_user_endorsement_value(self, guild_id: int, user: discord.Member):
+    async def _get_user_endorsement_value(self, guild_id: int, user: discord.Member):
         """Get endorsement value based on user's Discord roles"""
-        config_col, config = self._get_endorsement_config(guild_id)
+        config_col, config = await self._get_endorsement_config(guild_id)
         role_mappings = config.get("role_mappings", {})
         
         # Check roles in order of priority (highest value first)
@@ -86,70 +96,20 @@ class Endorsements(commands.Cog):
         
         return 0.0, None, None
 
-    def _find_candidate_in_all_systems(self, guild_id: int, candidate_name: str):
+    async def _find_candidate_in_all_systems(self, guild_id: int, candidate_name: str):
         """Find candidate in all possible systems (signups, winners, presidential)"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        
-        candidates_found = []
-        
-        # Check general signups
-        signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
-        if signups_config:
-            for candidate in signups_config.get("candidates", []):
-                if (candidate["name"].lower() == candidate_name.lower() and 
-                    candidate["year"] == current_year):
-                    candidates_found.append({
-                        "collection": signups_col,
-                        "candidate": candidate,
-                        "system": "general_signups"
-                    })
-        
-        # Check general winners
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-        if winners_config:
-            # For general campaign, look for primary winners
-            primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-            for winner in winners_config.get("winners", []):
-                if (winner["name"].lower() == candidate_name.lower() and 
-                    winner.get("year", primary_year) == primary_year):
-                    candidates_found.append({
-                        "collection": winners_col,
-                        "candidate": winner,
-                        "system": "general_winners"
-                    })
-
-        # Check presidential signups
-        pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-        if pres_signups_config and "Presidential" in current_phase:
-            for candidate in pres_signups_config.get("candidates", []):
-                if (candidate["name"].lower() == candidate_name.lower() and 
-                    candidate["year"] == current_year):
-                    candidates_found.append({
-                        "collection": pres_signups_col,
-                        "candidate": candidate,
-                        "system": "presidential_signups"
-                    })
-
-        # Check presidential winners
-        pres_winners_col = self.bot.db["presidential_winners"]
-        pres_winners_config = pres_winners_col.find_one({"guild_id": guild_id})
-        if pres_winners_config and "General" in current_phase:
-            for party, winner_name in pres_winners_config.get("winners", {}).items():
-                if winner_name and winner_name.lower() == candidate_name.lower():
-                    candidates_found.append({
-                        "collection": pres_winners_col,
-                        "candidate": {"name": winner_name, "party": party},
-                        "system": "presidential_winners"
-                    })
-
-        return candidates_found
-
-    def _update_candidate_with_endorsement(self, candidate_data, endorsement_value: float):
+        time_col, time_config = await self._get_time_config(guild_id)
+        matches = await get_candidate_registry(self.bot).resolve_all(
+            guild_id, time_config, name=candidate_name,
+            sources=("signups", "winners", "presidential_signups", "presidential_winners")
+        )
+
+        return [
+            {"collection": collection, "candidate": candidate, "system": ENDORSEMENT_SYSTEMS[collection.name]}
+            for collection, candidate in matches
+        ]
+
+    async def _update_candidate_with_endorsement(self, candidate_data, endorsement_value: float):
         """Update candidate with endorsement points"""
         collection = candidate_data["collection"]
         candidate = candidate_data["candidate"]
@@ -157,37 +117,37 @@ class Endorsements(commands.Cog):
         
         if system == "general_signups":
             # Update in signups collection
-            collection.update_one(
-                {"guild_id": candidate["guild_id"] if "guild_id" in candidate else collection.find_one({"candidates.user_id": candidate["user_id"]})["guild_id"], 
+            await collection.update_one(
+                {"guild_id": candidate["guild_id"] if "guild_id" in candidate else (await collection.find_one({"candidates.user_id": candidate["user_id"]}))["guild_id"], 
                  "candidates.user_id": candidate["user_id"]},
                 {"$inc": {"candidates.$.points": endorsement_value}}
             )
         elif system == "general_winners":
             # Update in winners collection
-            collection.update_one(
-                {"guild_id": candidate.get("guild_id", collection.find_one({"winners.user_id": candidate["user_id"]})["guild_id"]),
+            await collection.update_one(
+                {"guild_id": candidate.get("guild_id", (await collection.find_one({"winners.user_id": candidate["user_id"]}))["guild_id"]),
                  "winners.user_id": candidate["user_id"]},
                 {"$inc": {"winners.$.points": endorsement_value}}
             )
         elif system == "presidential_signups":
             # Update in presidential signups
-            collection.update_one(
-                {"guild_id": candidate.get("guild_id", collection.find_one({"candidates.user_id": candidate["user_id"]})["guild_id"]),
+            await collection.update_one(
+                {"guild_id": candidate.get("guild_id", (await collection.find_one({"candidates.user_id": candidate["user_id"]}))["guild_id"]),
                  "candidates.user_id": candidate["user_id"]},
                 {"$inc": {"candidates.$.points": endorsement_value}}
             )
         elif system == "presidential_winners":
             # Update in presidential winners
-            collection.update_one(
-                {"guild_id": candidate.get("guild_id", collection.find_one({"winners.user_id": candidate["user_id"]})["guild_id"]),
+            await collection.update_one(
+                {"guild_id": candidate.get("guild_id", (await collection.find_one({"winners.user_id": candidate["user_id"]}))["guild_id"]),
                  "winners.user_id": candidate["user_id"]},
                 {"$inc": {"winners.$.total_points": endorsement_value}}
             )
 
-    def _record_endorsement(self, guild_id: int, endorser_id: int, candidate_name: str, 
+    async def _record_endorsement(self, guild_id: int, endorser_id: int, candidate_name: str, 
                            endorsement_value: float, role_type: str, role_name: str):
         """Record endorsement in history"""
-        history_col, history_config = self._get_endorsement_history(guild_id)
+        history_col, history_config = await self._get_endorsement_history(guild_id)
 
         # Add new endorsement (no duplicates should reach here due to check)
         new_endorsement = {
@@ -201,7 +161,7 @@ class Endorsements(commands.Cog):
 
         history_config["endorsements"].append(new_endorsement)
 
-        history_col.update_one(
+        await history_col.update_one(
             {"guild_id": guild_id},
             {"$set": {"endorsements": history_config["endorsements"]}}
         )
@@ -213,7 +173,7 @@ class Endorsements(commands.Cog):
     @app_commands.describe(candidate_name="Name of the candidate you want to endorse")
     async def endorse(self, interaction: discord.Interaction, candidate_name: str):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.response.send_message(
                 "❌ Election system not configured.",
@@ -230,7 +190,7 @@ class Endorsements(commands.Cog):
             return
         
         # Check if user has already endorsed this specific candidate
-        already_endorsed = self._check_duplicate_endorsement(interaction.guild.id, interaction.user.id, candidate_name)
+        already_endorsed = await self._check_duplicate_endorsement(interaction.guild.id, interaction.user.id, candidate_name)
         if already_endorsed:
             await interaction.response.send_message(
                 f"❌ You have already endorsed **{candidate_name}**. You can't endorse the same candidate multiple times.",
@@ -239,7 +199,7 @@ class Endorsements(commands.Cog):
             return
         
         # Get user's endorsement value based on Discord roles
-        endorsement_value, role_type, role_name = self._get_user_endorsement_value(interaction.guild.id, interaction.user)
+        endorsement_value, role_type, role_name = await self._get_user_endorsement_value(interaction.guild.id, interaction.user)
         
         if endorsement_value == 0.0:
             await interaction.response.send_message(
@@ -249,7 +209,7 @@ class Endorsements(commands.Cog):
             return
         
         # Find candidate in all systems
-        candidates_found = self._find_candidate_in_all_systems(interaction.guild.id, candidate_name)
+        candidates_found = await self._find_candidate_in_all_systems(interaction.guild.id, candidate_name)
         
         if not candidates_found:
             await interaction.response.send_message(
@@ -280,10 +240,10 @@ class Endorsements(commands.Cog):
         candidate = candidate_data["candidate"]
         
         # Update candidate with endorsement points
-        self._update_candidate_with_endorsement(candidate_data, endorsement_value)
+        await self._update_candidate_with_endorsement(candidate_data, endorsement_value)
         
         # Record endorsement
-        self._record_endorsement(
+        await self._record_endorsement(
             interaction.guild.id, 
             interaction.user.id, 
             candidate_name, 
@@ -352,11 +312,11 @@ class Endorsements(commands.Cog):
             )
             return
         
-        config_col, config = self._get_endorsement_config(interaction.guild.id)
+        config_col, config = await self._get_endorsement_config(interaction.guild.id)
         
         config["role_mappings"][position] = role.id
         
-        config_col.update_one(
+        await config_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"role_mappings": config["role_mappings"]}}
         )
@@ -395,7 +355,7 @@ class Endorsements(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     @app_commands.checks.has_permissions(administrator=True)
     async def view_endorsement_roles(self, interaction: discord.Interaction):
-        config_col, config = self._get_endorsement_config(interaction.guild.id)
+        config_col, config = await self._get_endorsement_config(interaction.guild.id)
         role_mappings = config.get("role_mappings", {})
         
         embed = discord.Embed(
@@ -436,7 +396,7 @@ class Endorsements(commands.Cog):
         description="View all endorsements made in current cycle"
     )
     async def view_endorsements(self, interaction: discord.Interaction):
-        history_col, history_config = self._get_endorsement_history(interaction.guild.id)
+        history_col, history_config = await self._get_endorsement_history(interaction.guild.id)
         endorsements = history_config.get("endorsements", [])
         
         if not endorsements:
@@ -483,10 +443,10 @@ class Endorsements(commands.Cog):
     )
     async def my_endorsements(self, interaction: discord.Interaction):
         # Check endorsement value
-        endorsement_value, role_type, role_name = self._get_user_endorsement_value(interaction.guild.id, interaction.user)
+        endorsement_value, role_type, role_name = await self._get_user_endorsement_value(interaction.guild.id, interaction.user)
 
         # Find all current endorsements
-        history_col, history_config = self._get_endorsement_history(interaction.guild.id)
+        history_col, history_config = await self._get_endorsement_history(interaction.guild.id)
         user_endorsements = [
             e for e in history_config.get("endorsements", []) 
             if e["endorser_id"] == interaction.user.id
@@ -0,0 +1,133 @@
+"""File exports of guild data for the admin export commands.
+
+Rows are streamed one at a time into a spooled temporary file (kept in
+memory while small, moved to disk once it grows past EXPORT_SPOOL_BYTES),
+optionally through gzip, and sent back as a single `discord.File`
+attachment, so an export costs one message however many rows it has.
+`documents` may be a plain iterable or an async one such as a cursor.
+"""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+
+import discord
+
+# Exports larger than this are written to disk instead of kept in memory
+EXPORT_SPOOL_BYTES = 1024 * 1024
+
+# Attachment size allowed when the guild's own limit is unknown
+DEFAULT_ATTACHMENT_LIMIT = 8 * 1024 * 1024
+
+# Format names accepted for JSON Lines exports
+JSONL_FORMATS = ("jsonl", "json")
+
+class ExportWriter:
+    """One export file being written, row by row"""
+
+    def __init__(self, name: str, format_type: str, columns, compress: bool = False):
+        self.format_type = format_type.lower()
+        self.columns = list(columns)
+        self.rows = 0
+        if self.format_type == "csv":
+            extension = "csv"
+        elif self.format_type in JSONL_FORMATS:
+            extension = "jsonl"
+        else:
+            extension = "txt"
+        self.filename = f"{name}.{extension}" + (".gz" if compress else "")
+
+        self._spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+        self._gzip = gzip.GzipFile(fileobj=self._spool, mode="wb", mtime=0) if compress else None
+        self._text = io.TextIOWrapper(self._gzip or self._spool, encoding="utf-8", newline="")
+        self._csv = None
+        if self.format_type == "csv":
+            self._csv = csv.writer(self._text)
+            self._csv.writerow(self.columns)
+
+    @property
+    def tabular(self) -> bool:
+        """Whether rows are written from `columns` rather than as free-form lines"""
+        return self.format_type == "csv" or self.format_type in JSONL_FORMATS
+
+    def write_row(self, values):
+        """Write one row of values in `columns` order"""
+        if self._csv is not None:
+            self._csv.writerow([f"{value:.2f}" if isinstance(value, float) else value for value in values])
+        else:
+            self._text.write(json.dumps(dict(zip(self.columns, values)), default=str) + "\n")
+        self.rows += 1
+
+    def write_line(self, line: str, separator: str = "\n"):
+        """Write one free-form line, `separator` going between lines"""
+        self._text.write((separator if self.rows else "") + line)
+        self.rows += 1
+
+    def size(self) -> int:
+        """Bytes written so far"""
+        self._text.flush()
+        return self._spool.tell()
+
+    def file(self) -> discord.File:
+        """Finish the export and return it as an attachment"""
+        self._text.flush()
+        self._text.detach()
+        if self._gzip is not None:
+            self._gzip.close()
+        self._spool.seek(0)
+        return discord.File(self._spool, filename=self.filename)
+
+    def discard(self):
+        """Drop an export that will not be sent"""
+        self._spool.close()
+
+async def build_export(documents, name: str, format_type: str, columns, row, line,
+                       separator: str = "\n", compress: bool = False) -> ExportWriter:
+    """Stream `documents` into an export.
+
+    CSV and JSON Lines exports write `row(document)`, a list of values in
+    `columns` order; any other format writes `line(document)` as text.
+    Documents for which the callback returns None are skipped.
+    """
+    writer = ExportWriter(name, format_type, columns, compress)
+    async for document in _iterate(documents):
+        if writer.tabular:
+            values = row(document)
+            if values is not None:
+                writer.write_row(values)
+        else:
+            text = line(document)
+            if text is not None:
+                writer.write_line(text, separator)
+    return writer
+
+async def _iterate(documents):
+    if hasattr(documents, "__aiter__"):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+async def send_export(interaction: discord.Interaction, writer: ExportWriter, message: str):
+    """Send a finished export as one ephemeral attachment, or explain why it cannot be sent"""
+    limit = getattr(interaction.guild, "filesize_limit", None) or DEFAULT_ATTACHMENT_LIMIT
+    size = writer.size()
+    if size > limit:
+        writer.discard()
+        content = (f"❌ The export is {size / (1024 * 1024):.1f} MB, over this server's "
+                   f"{limit / (1024 * 1024):.0f} MB attachment limit. Try again with `compress` enabled.")
+        file = None
+    else:
+        content = message
+        file = writer.file()
+
+    kwargs = {"ephemeral": True}
+    if file is not None:
+        kwargs["file"] = file
+    if interaction.response.is_done():
+        await interaction.followup.send(content, **kwargs)
+    else:
+        await interaction.response.send_message(content, **kwargs)
@@ -6,15 +6,25 @@ import random
 import asyncio
 from typing import Optional, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
-from cogs.ideology import STATE_DATA
-
+from cogs.ideology import STATE_DATA, get_ideology_store
+from cogs.candidate_names import CAMPAIGN_TARGETS, get_candidate_names
+from cogs.candidates import get_candidate_registry
+from cogs.cooldowns import GENERAL_COOLDOWNS, get_cooldowns
+from cogs.polling_engine import campaign_baselines, floor_redistribution
+from cogs.time_manager import get_rp_clock
 
 
 class GeneralCampaignActions(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # Interaction ID -> (guild ID, user ID, action) of cooldowns claimed on a batch not yet committed
+        self._uncommitted_cooldowns = {}
         print("General Campaign Actions cog loaded successfully")
 
+    async def cog_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        # An action that failed before any of its writes never happened, so it must not lock the user out
+        self._release_uncommitted_cooldown(interaction)
+
     def _normalize_party_key(self, raw_party: str) -> str:
         """Normalize various party string formats to standard keys used by momentum.
 
@@ -64,147 +74,87 @@ class GeneralCampaignActions(commands.Cog):
         except Exception:
             return "Independent"
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         try:
             col = self.bot.db["time_configs"]
-            config = col.find_one({"guild_id": guild_id})
+            config = await get_rp_clock(self.bot).get_config(guild_id)
             return col, config
         except Exception as e:
             print(f"Error in _get_time_config: {e}")
             return self.bot.db["time_configs"], None
 
-    def _get_signups_config(self, guild_id: int):
+    async def _get_signups_config(self, guild_id: int):
         """Get or create signups configuration"""
         try:
             col = self.bot.db["all_signups"]
-            config = col.find_one({"guild_id": guild_id})
+            config = await col.find_one({"guild_id": guild_id})
             if not config:
                 config = {
                     "guild_id": guild_id,
                     "candidates": []
                 }
-                col.insert_one(config)
+                await col.insert_one(config)
             return col, config
         except Exception as e:
             print(f"Error in _get_signups_config: {e}")
             return self.bot.db["all_signups"], {"guild_id": guild_id, "candidates": []}
 
-    def _get_user_candidate(self, guild_id: int, user_id: int):
+    async def _get_user_candidate(self, guild_id: int, user_id: int):
         """Get user's candidate information from signups"""
         try:
-            time_col, time_config = self._get_time_config(guild_id)
-            current_year = time_config["current_rp_date"].year if time_config else 2024
-
-            # Check signups collection first (primary source)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
+            time_col, time_config = await self._get_time_config(guild_id)
 
-            if signups_config:
-                for candidate in signups_config.get("candidates", []):
-                    if (candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year):
-                        return signups_col, candidate
-
-            # Check all_signups collection as backup
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": guild_id})
-
-            if all_signups_config:
-                for candidate in all_signups_config.get("candidates", []):
-                    if (candidate.get("user_id") == user_id and 
-                        candidate.get("year") == current_year):
-                        return all_signups_col, candidate
-
-            return signups_col, None
+            # Check signups collection first (primary source), then all_signups as backup
+            col, candidate = await get_candidate_registry(self.bot).resolve(
+                guild_id, time_config, user_id=user_id, sources=("signups", "all_signups")
+            )
+            return col or self.bot.db["signups"], candidate
         except Exception as e:
             print(f"Error in _get_user_candidate: {e}")
             return self.bot.db["signups"], None
 
-    def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
+    async def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get candidate by name from signups, winners, or presidential signups"""
         try:
             if not candidate_name or not isinstance(candidate_name, str):
                 return None, None
                 
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             if not time_config:
                 return None, None
 
-            # Calculate current phase dynamically instead of relying on stored value
-            from cogs.time_manager import TimeManager
-            time_manager = self.bot.get_cog('TimeManager')
-            if time_manager:
-                current_rp_date, current_phase = time_manager._calculate_current_rp_time(time_config)
-                current_year = current_rp_date.year
-            else:
-                current_year = time_config["current_rp_date"].year
-                current_phase = time_config.get("current_phase", "")
-
-            # Check both signups collections (prioritize based on phase)
-
-            # 1. Check signups collection (used by all_signups.py - primary source for Primary Campaign)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if (candidate.get("name", "").lower() == candidate_name.lower() and
-                        candidate.get("year") == current_year):
-                        return signups_col, candidate
-
-            # 2. Check all_signups collection (backup)
-            all_signups_col, all_signups_config = self._get_signups_config(guild_id)
-            if all_signups_config and "candidates" in all_signups_config:
-                for candidate in all_signups_config["candidates"]:
-                    if (candidate.get("name", "").lower() == candidate_name.lower() and
-                        candidate.get("year") == current_year):
-                        return all_signups_col, candidate
-
-            # 3. Check presidential signups
-            pres_col = self.bot.db["presidential_signups"]
-            pres_config = pres_col.find_one({"guild_id": guild_id})
-            if pres_config and "candidates" in pres_config:
-                for candidate in pres_config.get("candidates", []):
-                    if (candidate.get("name", "").lower() == candidate_name.lower() and
-                        candidate.get("year") == current_year):
-                        return pres_col, candidate
-
-            # 4. Check winners if in general campaign or primary election
-            if current_phase in ["General Campaign", "Primary Election"]:
-                winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": guild_id})
-                if winners_config and "winners" in winners_config:
-                    # For General Campaign/Primary Election, look for primary winners from the current election year
-                    # Primary winners are stored with the election year (even years), not the signup year
-                    for winner in winners_config["winners"]:
-                        if (winner.get("candidate", "").lower() == candidate_name.lower() and
-                            winner.get("year") == current_year and
-                            winner.get("primary_winner", False)):
-                            return winners_col, winner
-
-            print(f"DEBUG: Could not find candidate '{candidate_name}' in any collection for year {current_year}")
+            # Primary winners take over from signups once the General Campaign starts
+            col, candidate = await get_candidate_registry(self.bot).resolve(
+                guild_id, time_config, name=candidate_name,
+                sources=("signups", "all_signups", "presidential_signups", "winners")
+            )
+            if candidate:
+                return col, candidate
+
+            print(f"DEBUG: Could not find candidate '{candidate_name}' in any collection for year {time_config['current_rp_date'].year}")
             return None, None
         except Exception as e:
             print(f"Error in _get_candidate_by_name: {e}")
             return None, None
 
 
-    def _get_buffs_debuffs_config(self, guild_id: int):
+    async def _get_buffs_debuffs_config(self, guild_id: int):
         """Get or create campaign buffs/debuffs configuration"""
         col = self.bot.db["campaign_buffs_debuffs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "active_effects": {}  # effect_id -> {effect_type, target_user_id, effect_name, multiplier, expires_at}
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _apply_buff_debuff_multiplier_enhanced(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
+    async def _apply_buff_debuff_multiplier_enhanced(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
         """Apply any active buffs or debuffs to the points gained with announcements"""
         try:
-            buffs_col, buffs_config = self._get_buffs_debuffs_config(guild_id)
+            buffs_col, buffs_config = await self._get_buffs_debuffs_config(guild_id)
 
             active_effects = buffs_config.get("active_effects", {})
             multiplier = 1.0
@@ -218,7 +168,7 @@ class GeneralCampaignActions(commands.Cog):
 
             if expired_effects:
                 for effect_id in expired_effects:
-                    buffs_col.update_one(
+                    await buffs_col.update_one(
                         {"guild_id": guild_id},
                         {"$unset": {f"active_effects.{effect_id}": ""}}
                     )
@@ -270,10 +220,12 @@ class GeneralCampaignActions(commands.Cog):
             )
             return
 
-        state_data = STATE_DATA[state_key]
+        # This guild's state data, with its election shifts
+        guild_ideology = await get_ideology_store(self.bot).guild(interaction.guild.id)
+        state_data = guild_ideology[state_key]
 
         # Check if user has a registered candidate (optional)
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Use candidate name if registered, otherwise use display name
         candidate_name = candidate["name"] if candidate else interaction.user.display_name
@@ -290,7 +242,7 @@ class GeneralCampaignActions(commands.Cog):
                 return
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -299,16 +251,15 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "speech", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "speech", 1)
-            if remaining:
-                hours = int(remaining.total_seconds() // 3600)
-                minutes = int((remaining.total_seconds() % 3600) // 60)
-                await interaction.response.send_message(
-                    f"❌ You must wait {hours}h {minutes}m before giving another speech.",
-                    ephemeral=True
-                )
-                return
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "speech", 1)
+        if remaining:
+            hours = int(remaining.total_seconds() // 3600)
+            minutes = int((remaining.total_seconds() % 3600) // 60)
+            await interaction.response.send_message(
+                f"❌ You must wait {hours}h {minutes}m before giving another speech.",
+                ephemeral=True
+            )
+            return
 
         # Send initial message asking for speech
         await interaction.response.send_message(
@@ -345,13 +296,13 @@ class GeneralCampaignActions(commands.Cog):
 
             # Determine who pays stamina cost
             stamina_cost = 6.0
-            stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+            stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
             # Check if stamina user has enough stamina
             stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else None
             if not stamina_user_candidate and stamina_user_id != target_candidate.get("user_id"):
                 # Get stamina user's candidate data
-                _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+                _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
 
             stamina_amount = stamina_user_candidate.get("stamina", 0) if stamina_user_candidate else 0
             if stamina_amount < stamina_cost:
@@ -359,11 +310,15 @@ class GeneralCampaignActions(commands.Cog):
                 await reply_message.reply(f"❌ {stamina_user_name} doesn't have enough stamina for this speech! They need at least {stamina_cost} stamina (current: {stamina_amount}).")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "speech")
+            # Collect the action's writes and apply them together once its effects are known
+            batch = self.bot.db.batch()
+
+            # Start the cooldown after successful validation, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "speech", 1, batch=batch):
+                return
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost, batch=batch)
 
             # Check for ideology match
             ideology_match = False
@@ -376,13 +331,13 @@ class GeneralCampaignActions(commands.Cog):
             total_bonus = base_bonus + ideology_bonus
 
             # Get current phase
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             # Update candidate stats based on phase
             if current_phase == "General Campaign" and target_candidate:
                 # Update points in winners collection for General Campaign
-                self._update_general_candidate_stats(
+                await self._update_general_candidate_stats(
                     interaction.guild.id, 
                     target_candidate.get("user_id"), 
                     state_key, 
@@ -390,15 +345,19 @@ class GeneralCampaignActions(commands.Cog):
                     stamina_cost, 
                     0,  # corruption increase
                     target_candidate,
-                    interaction.user.id
+                    interaction.user.id,
+                    batch=batch
                 )
             elif current_phase == "Primary Campaign" and target_candidate:
                 # Add points to target candidate in all_signups for Primary Campaign
-                target_signups_col.update_one(
+                batch.update_one(
+                    target_signups_col,
                     {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                     {"$inc": {"candidates.$.points": total_bonus}}
                 )
 
+            await self._commit_action(interaction, batch)
+
             # Create response embed
             embed = discord.Embed(
                 title=f"🎤 Campaign Speech in {state.title()}",
@@ -453,6 +412,7 @@ class GeneralCampaignActions(commands.Cog):
                 content=f"⏰ **{candidate_name}**, your speech timed out. Please use `/speech` again and reply with your speech within 5 minutes."
             )
         except Exception as e:
+            self._release_uncommitted_cooldown(interaction)
             await interaction.edit_original_response(
                 content=f"❌ An error occurred while processing your speech. Please try again."
             )
@@ -499,7 +459,7 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check if user has a registered candidate (optional)
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Use candidate name if registered, otherwise use display name
         candidate_name = candidate["name"] if candidate else interaction.user.display_name
@@ -516,7 +476,7 @@ class GeneralCampaignActions(commands.Cog):
                 return
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -525,16 +485,15 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "donor", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "donor", 1)
-            if remaining:
-                hours = int(remaining.total_seconds() // 3600)
-                minutes = int((remaining.total_seconds() % 3600) // 60)
-                await interaction.response.send_message(
-                    f"❌ You must wait {hours}h {minutes}m before making another donor appeal.",
-                    ephemeral=True
-                )
-                return
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "donor", 1)
+        if remaining:
+            hours = int(remaining.total_seconds() // 3600)
+            minutes = int((remaining.total_seconds() % 3600) // 60)
+            await interaction.response.send_message(
+                f"❌ You must wait {hours}h {minutes}m before making another donor appeal.",
+                ephemeral=True
+            )
+            return
 
         # Send initial message asking for donor appeal
         await interaction.response.send_message(
@@ -574,13 +533,13 @@ class GeneralCampaignActions(commands.Cog):
 
             # Determine who pays stamina cost
             stamina_cost = 5.0
-            stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+            stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
             # Check if stamina user has enough stamina
             stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else None
             if not stamina_user_candidate and stamina_user_id != target_candidate.get("user_id"):
                 # Get stamina user's candidate data
-                _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+                _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
 
             stamina_amount = stamina_user_candidate.get("stamina", 0) if stamina_user_candidate else 0
             if stamina_amount < stamina_cost:
@@ -588,24 +547,28 @@ class GeneralCampaignActions(commands.Cog):
                 await reply_message.reply(f"❌ {stamina_user_name} doesn't have enough stamina for this donor appeal! They need at least {stamina_cost} stamina (current: {stamina_amount}).")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "donor")
+            # Collect the action's writes and apply them together once its effects are known
+            batch = self.bot.db.batch()
+
+            # Start the cooldown after successful validation, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "donor", 1, batch=batch):
+                return
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost, batch=batch)
 
             # Calculate boost - 1% per 1000 characters  
             boost = (char_count / 1000) * 1.0
             boost = min(boost, 3.0)
 
             # Get current phase
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             # Update candidate stats based on phase
             if current_phase == "General Campaign" and target_candidate:
                 # Update points in winners collection for General Campaign
-                self._update_general_candidate_stats(
+                await self._update_general_candidate_stats(
                     interaction.guild.id, 
                     target_candidate.get("user_id"), 
                     state_upper, 
@@ -613,15 +576,19 @@ class GeneralCampaignActions(commands.Cog):
                     stamina_cost, 
                     0,  # corruption increase
                     target_candidate,
-                    interaction.user.id
+                    interaction.user.id,
+                    batch=batch
                 )
             elif current_phase == "Primary Campaign" and target_candidate:
                 # Add points to target candidate in all_signups for Primary Campaign
-                target_signups_col.update_one(
+                batch.update_one(
+                    target_signups_col,
                     {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                     {"$inc": {"candidates.$.points": boost}}
                 )
 
+            await self._commit_action(interaction, batch)
+
             # Create response embed
             embed = discord.Embed(
                 title="💰 General Campaign Donor Appeal",
@@ -707,7 +674,7 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check if user has a registered candidate (optional)
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Use candidate name if registered, otherwise use display name
         candidate_name = candidate["name"] if candidate else interaction.user.display_name
@@ -724,7 +691,7 @@ class GeneralCampaignActions(commands.Cog):
                 return
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -733,16 +700,15 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "poster", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "poster", 1)
-            if remaining:
-                hours = int(remaining.total_seconds() // 3600)
-                minutes = int((remaining.total_seconds() % 3600) // 60)
-                await interaction.response.send_message(
-                    f"❌ You must wait {hours}h {minutes}m before creating another poster.",
-                    ephemeral=True
-                )
-                return
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "poster", 1)
+        if remaining:
+            hours = int(remaining.total_seconds() // 3600)
+            minutes = int((remaining.total_seconds() % 3600) // 60)
+            await interaction.response.send_message(
+                f"❌ You must wait {hours}h {minutes}m before creating another poster.",
+                ephemeral=True
+            )
+            return
 
         # Defer the response early to prevent timeout
         await interaction.response.defer()
@@ -765,13 +731,13 @@ class GeneralCampaignActions(commands.Cog):
 
         # Determine who pays stamina cost
         stamina_cost = 2.0
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Check if stamina user has enough stamina
         stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else None
         if not stamina_user_candidate and stamina_user_id != target_candidate.get("user_id"):
             # Get stamina user's candidate data
-            _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+            _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
 
         stamina_amount = stamina_user_candidate.get("stamina", 0) if stamina_user_candidate else 0
         if stamina_amount < stamina_cost:
@@ -782,27 +748,31 @@ class GeneralCampaignActions(commands.Cog):
             )
             return
 
-        # Set cooldown after successful validation
-        self._set_cooldown(interaction.guild.id, interaction.user.id, "poster")
+        # Collect the action's writes and apply them together once its effects are known
+        batch = self.bot.db.batch()
+
+        # Start the cooldown after successful validation, unless a concurrent use already did
+        if not await self._claim_cooldown(interaction, "poster", 1, batch=batch):
+            return
 
         # Deduct stamina from the determined user
-        self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+        await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost, batch=batch)
 
         # Random polling boost between 0.25% and 0.5%
         polling_boost = random.uniform(0.25, 0.5)
 
         # Apply buff/debuff multipliers
         user_id = candidate.get("user_id") if candidate else interaction.user.id
-        polling_boost = self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "poster")
+        polling_boost = await self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "poster")
 
         # Get current phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         current_phase = time_config.get("current_phase", "") if time_config else ""
 
         # Update candidate stats based on phase
         if current_phase == "General Campaign" and target_candidate:
             # Update points in winners collection for General Campaign
-            self._update_general_candidate_stats(
+            await self._update_general_candidate_stats(
                 interaction.guild.id, 
                 target_candidate.get("user_id"), 
                 state_upper, 
@@ -810,15 +780,19 @@ class GeneralCampaignActions(commands.Cog):
                 stamina_cost, 
                 0,  # corruption increase
                 target_candidate,
-                interaction.user.id
+                interaction.user.id,
+                batch=batch
             )
         elif current_phase == "Primary Campaign" and target_candidate:
             # Add points to target candidate in all_signups for Primary Campaign
-            target_signups_col.update_one(
+            batch.update_one(
+                target_signups_col,
                 {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                 {"$inc": {"candidates.$.points": polling_boost}}
             )
 
+        await self._commit_action(interaction, batch)
+
         embed = discord.Embed(
             title="🖼️ Campaign Poster",
             description=f"**{candidate_name}** creates campaign materials for **{target}** in {state_upper}!",
@@ -887,7 +861,7 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check if user has a registered candidate (optional)
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Use candidate name if registered, otherwise use display name
         candidate_name = candidate["name"] if candidate else interaction.user.display_name
@@ -904,7 +878,7 @@ class GeneralCampaignActions(commands.Cog):
                 return
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -913,16 +887,15 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "ad", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "ad", 1)
-            if remaining:
-                hours = int(remaining.total_seconds() // 3600)
-                minutes = int((remaining.total_seconds() % 3600) // 60)
-                await interaction.response.send_message(
-                    f"❌ You must wait {hours}h {minutes}m before creating another ad.",
-                    ephemeral=True
-                )
-                return
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "ad", 1)
+        if remaining:
+            hours = int(remaining.total_seconds() // 3600)
+            minutes = int((remaining.total_seconds() % 3600) // 60)
+            await interaction.response.send_message(
+                f"❌ You must wait {hours}h {minutes}m before creating another ad.",
+                ephemeral=True
+            )
+            return
 
         # Send initial message asking for video
         await interaction.response.send_message(
@@ -964,13 +937,13 @@ class GeneralCampaignActions(commands.Cog):
 
             # Determine who pays stamina cost
             stamina_cost = 3.0
-            stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+            stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
             # Check if stamina user has enough stamina
             stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else None
             if not stamina_user_candidate and stamina_user_id != target_candidate.get("user_id"):
                 # Get stamina user's candidate data
-                _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+                _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
 
             stamina_amount = stamina_user_candidate.get("stamina", 0) if stamina_user_candidate else 0
             if stamina_amount < stamina_cost:
@@ -978,27 +951,31 @@ class GeneralCampaignActions(commands.Cog):
                 await reply_message.reply(f"❌ {stamina_user_name} doesn't have enough stamina to create an ad! They need at least {stamina_cost} stamina (current: {stamina_amount}).")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "ad")
+            # Collect the action's writes and apply them together once its effects are known
+            batch = self.bot.db.batch()
+
+            # Start the cooldown after successful validation, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "ad", 1, batch=batch):
+                return
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost, batch=batch)
 
             # Random polling boost between 0.5% and 1%
             polling_boost = random.uniform(0.5, 1.0)
 
             # Apply buff/debuff multipliers
             user_id = candidate.get("user_id") if candidate else interaction.user.id
-            polling_boost = self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "ad")
+            polling_boost = await self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "ad")
 
             # Get current phase
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             # Update candidate stats based on phase
             if current_phase == "General Campaign" and target_candidate:
                 # Update points in winners collection for General Campaign
-                self._update_general_candidate_stats(
+                await self._update_general_candidate_stats(
                     interaction.guild.id, 
                     target_candidate.get("user_id"), 
                     state_upper, 
@@ -1006,15 +983,19 @@ class GeneralCampaignActions(commands.Cog):
                     stamina_cost, 
                     0,  # corruption increase
                     target_candidate,
-                    interaction.user.id
+                    interaction.user.id,
+                    batch=batch
                 )
             elif current_phase == "Primary Campaign" and target_candidate:
                 # Add points to target candidate in all_signups for Primary Campaign
-                target_signups_col.update_one(
+                batch.update_one(
+                    target_signups_col,
                     {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                     {"$inc": {"candidates.$.points": polling_boost}}
                 )
 
+            await self._commit_action(interaction, batch)
+
             embed = discord.Embed(
                 title="📺 Campaign Video Ad",
                 description=f"**{candidate_name}** creates a campaign advertisement for **{target}** in {state_upper}!",
@@ -1094,7 +1075,7 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check if user has a registered candidate (optional)
-        signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
 
         # Use candidate name if registered, otherwise use display name
         candidate_name = candidate["name"] if candidate else interaction.user.display_name
@@ -1111,7 +1092,7 @@ class GeneralCampaignActions(commands.Cog):
                 return
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target candidate '{target}' not found.",
@@ -1120,16 +1101,15 @@ class GeneralCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "canvassing", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "canvassing", 1)
-            if remaining:
-                hours = int(remaining.total_seconds() // 3600)
-                minutes = int((remaining.total_seconds() % 3600) // 60)
-                await interaction.response.send_message(
-                    f"❌ You must wait {hours}h {minutes}m before canvassing again.",
-                    ephemeral=True
-                )
-                return
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "canvassing", 1)
+        if remaining:
+            hours = int(remaining.total_seconds() // 3600)
+            minutes = int((remaining.total_seconds() % 3600) // 60)
+            await interaction.response.send_message(
+                f"❌ You must wait {hours}h {minutes}m before canvassing again.",
+                ephemeral=True
+            )
+            return
 
         # Check character limits for canvassing message
         char_count = len(canvassing_message)
@@ -1142,13 +1122,13 @@ class GeneralCampaignActions(commands.Cog):
 
         # Determine who pays stamina cost
         stamina_cost = 1.0
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Check if stamina user has enough stamina
         stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else None
         if not stamina_user_candidate and stamina_user_id != target_candidate.get("user_id"):
             # Get stamina user's candidate data
-            _, stamina_user_candidate = self._get_user_candidate(interaction.guild.id, stamina_user_id)
+            _, stamina_user_candidate = await self._get_user_candidate(interaction.guild.id, stamina_user_id)
 
         stamina_amount = stamina_user_candidate.get("stamina", 0) if stamina_user_candidate else 0
         if stamina_amount < stamina_cost:
@@ -1159,27 +1139,31 @@ class GeneralCampaignActions(commands.Cog):
             )
             return
 
-        # Set cooldown after successful validation
-        self._set_cooldown(interaction.guild.id, interaction.user.id, "canvassing")
+        # Collect the action's writes and apply them together once its effects are known
+        batch = self.bot.db.batch()
+
+        # Start the cooldown after successful validation, unless a concurrent use already did
+        if not await self._claim_cooldown(interaction, "canvassing", 1, batch=batch):
+            return
 
         # Deduct stamina from the determined user
-        self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+        await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost, batch=batch)
 
         # Fixed polling boost of 0.1%
         polling_boost = 0.1
 
         # Apply buff/debuff multipliers
         user_id = candidate.get("user_id") if candidate else interaction.user.id
-        polling_boost = self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "canvassing")
+        polling_boost = await self._apply_buff_debuff_multiplier_enhanced(polling_boost, user_id, interaction.guild.id, "canvassing")
 
         # Get current phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         current_phase = time_config.get("current_phase", "") if time_config else ""
 
         # Update candidate stats based on phase
         if current_phase == "General Campaign" and target_candidate:
             # Update points in winners collection for General Campaign
-            self._update_general_candidate_stats(
+            await self._update_general_candidate_stats(
                 interaction.guild.id, 
                 target_candidate.get("user_id"), 
                 state_upper, 
@@ -1187,15 +1171,19 @@ class GeneralCampaignActions(commands.Cog):
                 stamina_cost, 
                 0,  # corruption increase
                 target_candidate,
-                interaction.user.id
+                interaction.user.id,
+                batch=batch
             )
         elif current_phase == "Primary Campaign" and target_candidate:
             # Add points to target candidate in all_signups for Primary Campaign
-            target_signups_col.update_one(
+            batch.update_one(
+                target_signups_col,
                 {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate.get("user_id")},
                 {"$inc": {"candidates.$.points": polling_boost}}
             )
 
+        await self._commit_action(interaction, batch)
+
         embed = discord.Embed(
             title="🚪 Door-to-Door Canvassing",
             description=f"**{candidate_name}** goes canvassing for **{target}** in {state_upper}!",
@@ -1252,12 +1240,11 @@ class GeneralCampaignActions(commands.Cog):
 
     async def _get_candidate_choices_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice]:
         """Helper to get candidate choices for autocompletion"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         # Calculate current phase dynamically instead of relying on stored value
-        from cogs.time_manager import TimeManager
         time_manager = self.bot.get_cog('TimeManager')
         if time_manager:
             current_rp_date, current_phase = time_manager._calculate_current_rp_time(time_config)
@@ -1266,380 +1253,129 @@ class GeneralCampaignActions(commands.Cog):
             current_year = time_config["current_rp_date"].year if time_config else 2024
             current_phase = time_config.get("current_phase", "")
 
-        all_candidates = []
-
-        print(f"DEBUG: Autocomplete - Phase: {current_phase}, Year: {current_year}")
-
-        # Phase-specific logic: prioritize different collections based on current phase
-        if current_phase == "Primary Campaign":
-            # During Primary Campaign, prioritize signups collection (used by all_signups.py)
-            print("DEBUG: Primary Campaign phase - checking signups collection")
-            
-            # 1. Check signups collection (primary source for Primary Campaign - used by all_signups.py)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added signup candidate: {candidate_name}")
-
-            # 2. Check all_signups collection (backup)
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if all_signups_config and "candidates" in all_signups_config:
-                for candidate in all_signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added all_signups candidate: {candidate_name}")
-
-        elif current_phase in ["General Campaign", "Primary Election"]:
-            # During General Campaign or Primary Election, prioritize winners collection
-            print(f"DEBUG: {current_phase} phase - checking winners collection")
-            
-            # 1. Check winners collection for primary winners
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if winners_config and "winners" in winners_config:
-                # For General Campaign/Primary Election, look for primary winners from the current election year
-                # Primary winners are stored with the election year (even years), not the signup year
-                print(f"DEBUG: Checking winners for election year: {current_year}")
-                for winner in winners_config["winners"]:
-                    if (winner.get("year") == current_year and 
-                        winner.get("primary_winner", False)):
-                        candidate_name = winner.get("candidate")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-                            print(f"DEBUG: Added primary winner candidate: {candidate_name}")
-
-            # 2. Check presidential winners
-            pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
-
-            if pres_winners_config:
-                election_year = pres_winners_config.get("election_year", current_year)
-                print(f"DEBUG: Presidential winners - election_year: {election_year}, current_year: {current_year}")
-                if election_year == current_year:
-                    winners_data = pres_winners_config.get("winners", {})
-                    if isinstance(winners_data, dict):
-                        for party, winner_name in winners_data.items():
-                            if isinstance(winner_name, str) and winner_name not in all_candidates:
-                                all_candidates.append(winner_name)
-                                print(f"DEBUG: Added presidential winner: {winner_name} ({party})")
-
-        else:
-            # For other phases or unknown phases, check all collections
-            print("DEBUG: Unknown phase - checking all collections")
-            
-            # Check signups collection first (primary source)
-            signups_col = self.bot.db["signups"]
-            signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if signups_config and "candidates" in signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name:
-                            all_candidates.append(candidate_name)
-
-            # Check all_signups collection (backup)
-            all_signups_col = self.bot.db["all_signups"]
-            all_signups_config = all_signups_col.find_one({"guild_id": interaction.guild.id})
-
-            if all_signups_config and "candidates" in all_signups_config:
-                for candidate in all_signups_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-
-            # Check presidential signups
-            pres_col = self.bot.db["presidential_signups"]
-            pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
-
-            if pres_config and "candidates" in pres_config:
-                for candidate in pres_config["candidates"]:
-                    if candidate.get("year") == current_year:
-                        candidate_name = candidate.get("name")
-                        if candidate_name and candidate_name not in all_candidates:
-                            all_candidates.append(candidate_name)
-
-        # Debug: Log candidates found
-        print(f"DEBUG: Found {len(all_candidates)} candidates for autocomplete: {all_candidates[:10]}...")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_candidates = []
-        for name in all_candidates:
-            if name and name not in seen:
-                seen.add(name)
-                unique_candidates.append(name)
-
-        # Filter candidates based on user input
-        if current:
-            filtered_candidates = [name for name in unique_candidates if current.lower() in name.lower()]
-        else:
-            filtered_candidates = unique_candidates
-
-        # Sort alphabetically for better UX
-        filtered_candidates.sort()
-
-        # Debug: Log filtered results
-        print(f"DEBUG: Filtered to {len(filtered_candidates)} candidates matching '{current}': {filtered_candidates[:5]}...")
-
-        # Return up to 25 choices
-        return [app_commands.Choice(name=name, value=name) for name in filtered_candidates[:25]]
+        names = await get_candidate_names(self.bot).matches(
+            interaction.guild.id, CAMPAIGN_TARGETS, current_phase, current_year, current
+        )
+        return [app_commands.Choice(name=name, value=name) for name in names]
 
 
     # --- Buff/Debuff Management Functions ---
 
 
 
-    def _check_cooldown(self, guild_id: int, user_id: int, action_type: str, hours: int):
-        """Check if user is on cooldown for an action"""
-        try:
-            cooldowns_col = self.bot.db["action_cooldowns"]
-            cooldown_record = cooldowns_col.find_one({
-                "guild_id": guild_id,
-                "user_id": user_id,
-                "action_type": action_type
-            })
-
-            if not cooldown_record:
-                return True
-
-            last_used = cooldown_record.get("last_used")
-            if not last_used:
-                return True
-
-            time_since = datetime.utcnow() - last_used
-            return time_since >= timedelta(hours=hours)
-        except Exception as e:
-            print(f"Error in _check_cooldown: {e}")
-            return True  # Allow action if error occurs
-
-    def _get_cooldown_remaining(self, guild_id: int, user_id: int, action_type: str, hours: int):
+    async def _get_cooldown_remaining(self, guild_id: int, user_id: int, action_type: str, hours: int):
         """Get remaining cooldown time"""
         try:
-            cooldowns_col = self.bot.db["action_cooldowns"]
-            cooldown_record = cooldowns_col.find_one({
-                "guild_id": guild_id,
-                "user_id": user_id,
-                "action_type": action_type
-            })
-
-            if not cooldown_record:
-                return timedelta(0)
-
-            last_used = cooldown_record.get("last_used")
-            if not last_used:
-                return timedelta(0)
-
-            time_since = datetime.utcnow() - last_used
-            cooldown_duration = timedelta(hours=hours)
-
-            if time_since >= cooldown_duration:
-                return timedelta(0)
-
-            return cooldown_duration - time_since
+            return await get_cooldowns(self.bot).remaining(GENERAL_COOLDOWNS, guild_id, user_id, action_type, hours)
         except Exception as e:
             print(f"Error in _get_cooldown_remaining: {e}")
             return timedelta(0)  # Return no cooldown if error occurs
 
-    def _set_cooldown(self, guild_id: int, user_id: int, action_type: str):
-        """Set cooldown for an action"""
+    async def _claim_cooldown(self, interaction: discord.Interaction, action_type: str, hours: int, batch=None) -> bool:
+        """Start the user's cooldown for an action, telling them if another use of it got there first"""
         try:
-            cooldowns_col = self.bot.db["action_cooldowns"]
-            cooldowns_col.update_one(
-                {"guild_id": guild_id, "user_id": user_id, "action_type": action_type},
-                {"$set": {"last_used": datetime.utcnow()}},
-                upsert=True
+            remaining = await get_cooldowns(self.bot).check_and_claim(
+                GENERAL_COOLDOWNS, interaction.guild.id, interaction.user.id, action_type, hours, batch=batch
             )
         except Exception as e:
-            print(f"Error in _set_cooldown: {e}")
-
-    def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
+            print(f"Error in _claim_cooldown: {e}")
+            return True  # Allow action if error occurs
+        if not remaining:
+            if batch is not None:
+                self._uncommitted_cooldowns[interaction.id] = (interaction.guild.id, interaction.user.id, action_type)
+            return True
+        hours_left = int(remaining.total_seconds() // 3600)
+        minutes_left = int((remaining.total_seconds() % 3600) // 60)
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(f"❌ You must wait {hours_left}h {minutes_left}m before doing that again.", ephemeral=True)
+        return False
+
+    async def _commit_action(self, interaction: discord.Interaction, batch):
+        """Apply an action's writes, making the cooldown it claimed on `batch` final"""
+        try:
+            await batch.commit()
+        except Exception:
+            if batch.written:
+                # Part of the action was applied, so its cooldown stands
+                self._uncommitted_cooldowns.pop(interaction.id, None)
+            raise
+        self._uncommitted_cooldowns.pop(interaction.id, None)
+
+    def _release_uncommitted_cooldown(self, interaction: discord.Interaction):
+        """Drop the cooldown an interaction claimed if its action failed before writing anything"""
+        claim = self._uncommitted_cooldowns.pop(interaction.id, None)
+        if claim is not None:
+            get_cooldowns(self.bot).release(GENERAL_COOLDOWNS, *claim)
+
+    async def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
         """Calculate zero-sum redistribution percentages for general election candidates"""
         try:
-            # Get general election candidates (primary winners) for this seat
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if not winners_config:
-                return {}
-
             # Get current year
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             current_year = time_config["current_rp_date"].year if time_config else 2024
-            current_phase = time_config.get("current_phase", "") if time_config else ""
 
             # Find all primary winners (general election candidates) for this seat
             # For general campaign, look for primary winners from the previous year if we're in an even year
             # Or current year if odd year
             primary_year = current_year - 1 if current_year % 2 == 0 else current_year
 
-            seat_candidates = [
-                w for w in winners_config["winners"]
-                if w.get("seat_id") == seat_id and w.get("year") == primary_year and w.get("primary_winner", False)
-            ]
+            winners_col = self.bot.db["winners"]
+            seat_candidates = await winners_col.find_candidates(
+                {"guild_id": guild_id, "seat_id": seat_id, "year": primary_year, "primary_winner": True}
+            )
 
             # If no primary winners found, fall back to all candidates for this seat in the current year
             if not seat_candidates:
-                seat_candidates = [
-                    w for w in winners_config["winners"]
-                    if w.get("seat_id") == seat_id and w.get("year") == current_year
-                ]
+                seat_candidates = await winners_col.find_candidates(
+                    {"guild_id": guild_id, "seat_id": seat_id, "year": current_year}
+                )
 
             if not seat_candidates:
                 return {}
 
-            # Calculate baseline percentages based on party alignment
-            baseline_percentages = {}
-            num_candidates = len(seat_candidates)
-
-            # Count major parties
-            major_parties = ["Democratic", "Republican", "Democratic Party", "Republican Party"]
-            parties_present = set(candidate.get("party", "") for candidate in seat_candidates)
-            major_parties_present = [party for party in major_parties if party in parties_present]
-            
-            # Check if we have the standard 3-party setup: Republican + Democratic + Independent
-            has_republican = any("Republican" in party for party in parties_present)
-            has_democratic = any("Democratic" in party for party in parties_present)
-            has_independent = any("Independent" in party for party in parties_present)
-            is_standard_three_way = has_republican and has_democratic and has_independent and len(parties_present) == 3
-
-            if len(major_parties_present) == 2 or is_standard_three_way:
-                # Standard two-party setup or three-party setup
-                num_parties = len(parties_present)
-                if num_parties == 2:
-                    # Pure two-party race
-                    for candidate in seat_candidates:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 50.0
-                else:
-                    # Two major parties + others (40-40-20 for 3 parties)
-                    remaining_percentage = 20.0  # 100 - 40 - 40
-                    other_parties_count = num_parties - 2
-                    other_party_percentage = remaining_percentage / other_parties_count if other_parties_count > 0 else 0
-
-                    for candidate in seat_candidates:
-                        party = candidate.get("party", "")
-                        if (party in major_parties or 
-                            "Republican" in party or 
-                            "Democratic" in party):
-                            baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 40.0
-                        else:
-                            baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = other_party_percentage
-            else:
-                # No standard major party setup, split evenly
-                for candidate in seat_candidates:
-                    baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 100.0 / num_candidates
-
-            # Apply proportional redistribution with minimum floors
-            final_percentages = {}
-
-            # Define minimum percentage floors
-            def get_minimum_floor(candidate):
-                party = candidate.get('party', '').lower()
-                if any(keyword in party for keyword in ['democrat', 'republican']):
-                    return 25.0  # 25% minimum for major parties
-                else:
-                    return 2.0   # 2% minimum for independents/third parties
-
-            # Calculate total campaign points across all candidates in this seat
-            total_campaign_points = sum(candidate.get('points', 0.0) for candidate in seat_candidates)
-
-            # Start with baseline percentages
-            current_percentages = baseline_percentages.copy()
-
-            # Apply campaign effects using proportional redistribution
-            if total_campaign_points > 0:
-                for candidate in seat_candidates:
-                    candidate_name = candidate.get('candidate', candidate.get('name', ''))
-                    candidate_points = candidate.get('points', 0.0)
-
-                    if candidate_points > 0:
-                        # This candidate gains points
-                        points_gained = candidate_points
-
-                        # Calculate total percentage that can be taken from other candidates
-                        total_available_to_take = 0.0
-                        for other_candidate in seat_candidates:
-                            if other_candidate != candidate:
-                                other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                                other_current = current_percentages[other_name]
-                                other_minimum = get_minimum_floor(other_candidate)
-                                available = max(0, other_current - other_minimum)
-                                total_available_to_take += available
-
-                        # Limit gains to what's actually available
-                        actual_gain = min(points_gained, total_available_to_take)
-                        current_percentages[candidate_name] += actual_gain
-
-                        # Distribute losses proportionally among other candidates
-                        if total_available_to_take > 0 and actual_gain > 0:
-                            for other_candidate in seat_candidates:
-                                if other_candidate != candidate:
-                                    other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                                    other_current = current_percentages[other_name]
-                                    other_minimum = get_minimum_floor(other_candidate)
-                                    available = max(0, other_current - other_minimum)
-
-                                    if available > 0:
-                                        loss_proportion = available / total_available_to_take
-                                        loss = actual_gain * loss_proportion
-                                        current_percentages[other_name] -= loss
-
-            # Ensure percentages sum to 100% and respect minimums
-            total_percentage = sum(current_percentages.values())
-            if total_percentage > 0:
-                for candidate_name in current_percentages:
-                    current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-            # Final verification and correction for floating point errors
-            final_total = sum(current_percentages.values())
-            if abs(final_total - 100.0) > 0.001:
-                # Apply micro-adjustment to the largest percentage instead of equal distribution
-                largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-                adjustment = 100.0 - final_total
-                current_percentages[largest_candidate] += adjustment
-
-            final_percentages = current_percentages
-            return final_percentages
+            return floor_redistribution(
+                [seat_candidates], campaign_baselines,
+                name=lambda candidate: candidate.get('candidate', candidate.get('name', '')),
+                points=lambda candidate: candidate.get('points', 0.0),
+                clamp_floors=False
+            )[0]
         except Exception as e:
             print(f"Error in _calculate_zero_sum_percentages: {e}")
             return {}
 
-    def _update_general_candidate_stats(self, guild_id: int, user_id: int, state_name: str, 
+    async def _update_general_candidate_stats(self, guild_id: int, user_id: int, state_name: str, 
                                        points_gained: float, stamina_cost: float = 0, 
                                        corruption_increase: int = 0, candidate_data: dict = None,
-                                       action_user_id: int = None):
-        """Update general candidate's points, stamina, and corruption in winners collection"""
+                                       action_user_id: int = None, batch=None):
+        """Update general candidate's points, stamina, and corruption in winners collection.
+
+        The points, stamina and momentum writes are queued on `batch` if given,
+        otherwise they are applied together before returning.
+        """
         try:
             if not user_id or not state_name:
                 print("Error: Missing required parameters in _update_general_candidate_stats")
                 return
                 
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             if current_phase != "General Campaign":
                 return
 
+            own_batch = batch is None
+            if own_batch:
+                batch = self.bot.db.batch()
+
             # Apply momentum multiplier during General Campaign
             actual_points_gained = points_gained
             momentum_multiplier = 1.0
+            momentum_config = None
 
             # Get momentum multiplier
             momentum_cog = self.bot.get_cog('Momentum')
             if momentum_cog and candidate_data:
-                momentum_col, momentum_config = momentum_cog._get_momentum_config(guild_id)
+                momentum_col, momentum_config = await momentum_cog._get_momentum_config(guild_id)
 
                 # Determine party key
                 party_key = self._normalize_party_key(candidate_data.get("party", ""))
@@ -1651,21 +1387,19 @@ class GeneralCampaignActions(commands.Cog):
 
             # Determine who pays the stamina cost
             stamina_deduction_user_id = user_id  # Default to target candidate
+            winners_col = self.bot.db["winners"]
 
             if action_user_id and action_user_id != user_id:
                 # Check if action user is a candidate with enough stamina
-                winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": guild_id})
-                
-                if winners_config and "winners" in winners_config:
-                    for winner in winners_config["winners"]:
-                        if winner.get("user_id") == action_user_id and winner.get("stamina", 0) >= stamina_cost:
-                            stamina_deduction_user_id = action_user_id
-                            break
+                action_user_winner = await winners_col.find_candidate({
+                    "guild_id": guild_id, "user_id": action_user_id, "stamina": {"$gte": stamina_cost}
+                })
+                if action_user_winner:
+                    stamina_deduction_user_id = action_user_id
 
             # Update candidate points in winners collection
-            winners_col = self.bot.db["winners"]
-            winners_col.update_one(
+            batch.update_one(
+                winners_col,
                 {"guild_id": guild_id, "winners.user_id": user_id},
                 {
                     "$inc": {
@@ -1676,30 +1410,43 @@ class GeneralCampaignActions(commands.Cog):
                 }
             )
 
-            # Deduct stamina from the determined user
-            winners_col.update_one(
+            # Deduct stamina from the determined user (merged with the update above when it is the same candidate)
+            batch.update_one(
+                winners_col,
                 {"guild_id": guild_id, "winners.user_id": stamina_deduction_user_id},
                 {"$inc": {"winners.$.stamina": -stamina_cost}}
             )
 
             # Add momentum effects during General Campaign (use the boosted points)
             print(f"DEBUG: Adding momentum from general campaign stats update: {actual_points_gained} points in {state_name.upper()}")
-            self._add_momentum_from_general_action(guild_id, user_id, state_name.upper(), actual_points_gained, candidate_data)
+            await self._add_momentum_from_general_action(
+                guild_id, user_id, state_name.upper(), actual_points_gained, candidate_data,
+                momentum_config=momentum_config, batch=batch
+            )
+
+            if own_batch:
+                await batch.commit()
 
         except Exception as e:
             print(f"Error in _update_general_candidate_stats: {e}")
             import traceback
             traceback.print_exc()
 
-    def _add_momentum_from_general_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float, candidate_data: dict = None, target_name: str = None):
-        """Adds momentum to a state based on general campaign actions."""
+    async def _add_momentum_from_general_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float,
+                                                candidate_data: dict = None, target_name: str = None,
+                                                momentum_config: dict = None, batch=None):
+        """Adds momentum to a state based on general campaign actions.
+
+        `momentum_config` saves a read when the caller already has it, and the
+        writes are queued on `batch` if given.
+        """
         try:
             if not user_id or not state_name or not points_gained:
                 print("Error: Missing required parameters in _add_momentum_from_general_action")
                 return
                 
             # Check if we're in General Campaign phase
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             if current_phase != "General Campaign":
@@ -1710,54 +1457,22 @@ class GeneralCampaignActions(commands.Cog):
             if not momentum_cog:
                 return
 
+            own_batch = batch is None
+            if own_batch:
+                batch = self.bot.db.batch()
+
             # Get momentum config
-            momentum_col, momentum_config = momentum_cog._get_momentum_config(guild_id)
+            if momentum_config is None:
+                momentum_col, momentum_config = await momentum_cog._get_momentum_config(guild_id)
+            else:
+                momentum_col = self.bot.db["momentum_config"]
 
             # Determine which candidate's party to use for momentum
             target_candidate = candidate_data
             if target_name and (not candidate_data or target_name != candidate_data.get("name")):
-                # Look for the target candidate in signups first (primary source)
-                signups_col = self.bot.db["signups"]
-                signups_config = signups_col.find_one({"guild_id": guild_id})
-
-                if signups_config:
-                    current_year = time_config["current_rp_date"].year if time_config else 2024
-                    for candidate in signups_config.get("candidates", []):
-                        if (candidate.get("name", "").lower() == target_name.lower() and 
-                            candidate["year"] == current_year):
-                            target_candidate = candidate
-                            break
-
-                # If not found, try all_signups collection
-                if not target_candidate:
-                    all_signups_col = self.bot.db["all_signups"]
-                    all_signups_config = all_signups_col.find_one({"guild_id": guild_id})
-
-                    if all_signups_config:
-                        current_year = time_config["current_rp_date"].year if time_config else 2024
-                        for candidate in all_signups_config.get("candidates", []):
-                            if (candidate.get("name", "").lower() == target_name.lower() and 
-                                candidate["year"] == current_year):
-                                target_candidate = candidate
-                                break
-
-            # If we still don't have a target candidate, try to find them in winners (for General Campaign)
-            if not target_candidate and target_name:
-                winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": guild_id})
-
-                if winners_config and "winners" in winners_config:
-                    current_year = time_config["current_rp_date"].year if time_config else 2024
-                    for winner in winners_config["winners"]:
-                        if (winner.get("candidate", "").lower() == target_name.lower() and 
-                            winner.get("year") == current_year and
-                            winner.get("primary_winner", False)):
-                            # Create a temporary candidate dict with party info
-                            target_candidate = {
-                                "name": winner.get("candidate"),
-                                "party": winner.get("party", "Independent")
-                            }
-                            break
+                _, target_candidate = await get_candidate_registry(self.bot).resolve(
+                    guild_id, time_config, name=target_name, sources=("signups", "all_signups", "winners")
+                )
 
             if not target_candidate or not isinstance(target_candidate, dict) or not target_candidate.get("party"):
                 return
@@ -1785,13 +1500,15 @@ class GeneralCampaignActions(commands.Cog):
             new_momentum = current_momentum + momentum_gained
 
             # Check for auto-collapse and apply if needed
-            final_momentum, collapsed = momentum_cog._check_and_apply_auto_collapse(
-                momentum_col, guild_id, state_name, party_key, new_momentum
+            final_momentum, collapsed = await momentum_cog._check_and_apply_auto_collapse(
+                momentum_col, guild_id, state_name, party_key, new_momentum,
+                momentum_config=momentum_config, batch=batch
             )
 
             if not collapsed:
                 # Update momentum in database
-                momentum_col.update_one(
+                batch.update_one(
+                    momentum_col,
                     {"guild_id": guild_id},
                     {
                         "$set": {
@@ -1804,19 +1521,22 @@ class GeneralCampaignActions(commands.Cog):
                 # Log the momentum gain event
                 if momentum_gained > 0.1:
                     action_desc = f"General campaign action for {target_candidate.get('name', 'Unknown')} (+{points_gained:.1f} pts)"
-                    momentum_cog._add_momentum_event(
+                    await momentum_cog._add_momentum_event(
                         momentum_col, guild_id, state_name, party_key,
-                        momentum_gained, action_desc, user_id
+                        momentum_gained, action_desc, user_id, batch=batch
                     )
 
+            if own_batch:
+                await batch.commit()
+
         except Exception as e:
             print(f"Error in _add_momentum_from_general_action: {e}")
 
-    def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
+    async def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
         """Determines whether the user or the target candidate pays the stamina cost."""
         try:
             # Get the user's candidate data
-            _, user_candidate_data = self._get_user_candidate(guild_id, user_id)
+            _, user_candidate_data = await self._get_user_candidate(guild_id, user_id)
 
             # If the user is a candidate and has enough stamina, they pay.
             if user_candidate_data and isinstance(user_candidate_data, dict) and user_candidate_data.get("stamina", 0) >= stamina_cost:
@@ -1832,31 +1552,27 @@ class GeneralCampaignActions(commands.Cog):
             print(f"Error in _determine_stamina_user: {e}")
             return target_candidate_data.get("user_id") if target_candidate_data else user_id
 
-    def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float):
-        """Deducts stamina from a user's candidate profile."""
+    async def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float, batch=None):
+        """Deducts stamina from a user's candidate profile, or queues it on `batch` if given."""
         try:
-            # Try signups collection first (primary source)
-            signups_col = self.bot.db["signups"]
-            result = signups_col.update_one(
-                {"guild_id": guild_id, "candidates.user_id": user_id},
-                {"$inc": {"candidates.$.stamina": -cost}}
+            # Signups are the primary source, winners hold admin-added general campaign candidates
+            registry = get_candidate_registry(self.bot)
+            time_col, time_config = await self._get_time_config(guild_id)
+            col, candidate = await registry.resolve(
+                guild_id, time_config, user_id=user_id, sources=("signups", "all_signups")
             )
-            
-            # If not found in signups, try all_signups collection
-            if result.matched_count == 0:
-                all_signups_col = self.bot.db["all_signups"]
-                result = all_signups_col.update_one(
-                    {"guild_id": guild_id, "candidates.user_id": user_id},
-                    {"$inc": {"candidates.$.stamina": -cost}}
-                )
-                
-                # If still not found, try winners collection (for General Campaign)
-                if result.matched_count == 0:
-                    winners_col = self.bot.db["winners"]
-                    winners_col.update_one(
-                        {"guild_id": guild_id, "winners.user_id": user_id},
-                        {"$inc": {"winners.$.stamina": -cost}}
-                    )
+            if not candidate:
+                col, candidate = await registry.resolve(guild_id, time_config, user_id=user_id, sources=("winners",))
+            if not candidate:
+                return
+
+            field = "winners" if col.name == "winners" else "candidates"
+            filter = {"guild_id": guild_id, field: {"$elemMatch": {"user_id": user_id, "year": candidate.get("year")}}}
+            update = {"$inc": {f"{field}.$.stamina": -cost}}
+            if batch is not None:
+                batch.update_one(col, filter, update)
+            else:
+                await col.update_one(filter, update)
         except Exception as e:
             print(f"Error deducting stamina from user {user_id}: {e}")
 
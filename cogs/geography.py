@@ -0,0 +1,186 @@
+"""States, regions and seats of the election map, indexed once at import.
+
+Every state has an integer ID, its position in STATES (alphabetical, the
+District of Columbia included), and every region an ID, its position in
+REGION_NAMES. Lookups go both ways in constant time: name -> ID through
+STATE_IDS and REGION_IDS, ID -> name by indexing the tuples, postal code
+<-> state and region code <-> region through the code tables, and state
+<-> region through STATE_REGION and REGION_STATES. Per-state tables are
+tuples indexed by state ID; `state_table` builds one from a mapping keyed
+by state name so cogs can keep their own data in this layout.
+
+Everything here is immutable (tuples and read-only mappings) and shared by
+all guilds; guild-specific numbers live with the cogs that own them.
+"""
+
+from types import MappingProxyType
+from typing import Optional
+
+# Postal code of every state, in state ID order
+STATE_POSTAL_CODES = MappingProxyType({
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA",
+    "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC",
+    "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL",
+    "INDIANA": "IN", "IOWA": "IA", "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA",
+    "MAINE": "ME", "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN",
+    "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV",
+    "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY",
+    "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH", "OKLAHOMA": "OK", "OREGON": "OR",
+    "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD",
+    "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA",
+    "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY"
+})
+
+# State names by state ID, and each state's ID
+STATES = tuple(STATE_POSTAL_CODES)
+STATE_IDS = MappingProxyType({state: state_id for state_id, state in enumerate(STATES)})
+
+# Postal codes by state ID, and the state of each postal code
+STATE_CODES = tuple(STATE_POSTAL_CODES.values())
+CODE_TO_STATE = MappingProxyType({code: state for state, code in STATE_POSTAL_CODES.items()})
+
+# States of each region; the District of Columbia belongs to none
+REGIONS = MappingProxyType({
+    "Cambridge": (
+        "NEW YORK", "MASSACHUSETTS", "NEW HAMPSHIRE", "CONNECTICUT",
+        "RHODE ISLAND", "VERMONT", "MAINE", "PENNSYLVANIA",
+        "DELAWARE", "NEW JERSEY", "MARYLAND"
+    ),
+    "Superior": (
+        "OHIO", "ILLINOIS", "MICHIGAN", "WISCONSIN", "INDIANA"
+    ),
+    "Heartland": (
+        "MINNESOTA", "IOWA", "MISSOURI", "NORTH DAKOTA",
+        "SOUTH DAKOTA", "NEBRASKA", "KANSAS"
+    ),
+    "Columbia": (
+        "VIRGINIA", "WEST VIRGINIA", "NORTH CAROLINA", "SOUTH CAROLINA",
+        "KENTUCKY", "TENNESSEE", "GEORGIA", "FLORIDA",
+        "ALABAMA", "MISSISSIPPI"
+    ),
+    "Austin": (
+        "TEXAS", "LOUISIANA", "ARKANSAS", "OKLAHOMA"
+    ),
+    "Yellowstone": (
+        "WYOMING", "MONTANA", "IDAHO", "COLORADO",
+        "NEW MEXICO", "UTAH", "ARIZONA"
+    ),
+    "Phoenix": (
+        "CALIFORNIA", "WASHINGTON", "OREGON", "NEVADA",
+        "HAWAII", "ALASKA"
+    )
+})
+
+# Region names by region ID, and each region's ID
+REGION_NAMES = tuple(REGIONS)
+REGION_IDS = MappingProxyType({region: region_id for region_id, region in enumerate(REGION_NAMES)})
+
+# Region codes used in seat IDs (SEN-CO-1, CO-GOV, REP-CO-1)
+REGION_CODES = MappingProxyType({
+    "CO": "Columbia",
+    "CA": "Cambridge",
+    "AU": "Austin",
+    "SU": "Superior",
+    "HL": "Heartland",
+    "YS": "Yellowstone",
+    "PH": "Phoenix"
+})
+
+# State IDs of each region by region ID, and the region ID of each state (None outside every region)
+REGION_STATES = tuple(tuple(STATE_IDS[state] for state in REGIONS[region]) for region in REGION_NAMES)
+STATE_REGION = tuple(
+    next((region_id for region_id, states in enumerate(REGION_STATES) if state_id in states), None)
+    for state_id in range(len(STATES))
+)
+
+# Representative seat of each state
+STATE_TO_SEAT = MappingProxyType({
+    "ALABAMA": "REP-CO-4",
+    "ALASKA": "REP-PH-3",
+    "ARIZONA": "REP-YS-2",
+    "ARKANSAS": "REP-AU-2",
+    "CALIFORNIA": "REP-PH-1",
+    "COLORADO": "REP-YS-3",
+    "CONNECTICUT": "REP-CA-3",
+    "DELAWARE": "REP-CA-6",
+    "FLORIDA": "REP-CO-6",
+    "GEORGIA": "REP-CO-5",
+    "HAWAII": "REP-PH-3",
+    "IDAHO": "REP-YS-1",
+    "ILLINOIS": "REP-SU-4",
+    "INDIANA": "REP-SU-1",
+    "IOWA": "REP-HL-2",
+    "KANSAS": "REP-HL-3",
+    "KENTUCKY": "REP-CO-7",
+    "LOUISIANA": "REP-AU-2",
+    "MAINE": "REP-CA-4",
+    "MARYLAND": "REP-CA-6",
+    "MASSACHUSETTS": "REP-CA-3",
+    "MICHIGAN": "REP-SU-2",
+    "MINNESOTA": "REP-HL-1",
+    "MISSISSIPPI": "REP-CO-4",
+    "MISSOURI": "REP-HL-2",
+    "MONTANA": "REP-YS-1",
+    "NEBRASKA": "REP-HL-3",
+    "NEVADA": "REP-PH-4",
+    "NEW HAMPSHIRE": "REP-CA-4",
+    "NEW JERSEY": "REP-CA-5",
+    "NEW MEXICO": "REP-YS-3",
+    "NEW YORK": "REP-CA-2",
+    "NORTH CAROLINA": "REP-CO-2",
+    "NORTH DAKOTA": "REP-HL-4",
+    "OHIO": "REP-SU-1",
+    "OKLAHOMA": "REP-AU-1",
+    "OREGON": "REP-PH-2",
+    "PENNSYLVANIA": "REP-CA-1",
+    "RHODE ISLAND": "REP-CA-3",
+    "SOUTH CAROLINA": "REP-CO-2",
+    "SOUTH DAKOTA": "REP-HL-4",
+    "TENNESSEE": "REP-CO-3",
+    "TEXAS": "REP-AU-1",
+    "UTAH": "REP-YS-2",
+    "VERMONT": "REP-CA-4",
+    "VIRGINIA": "REP-CO-1",
+    "WASHINGTON": "REP-PH-2",
+    "WEST VIRGINIA": "REP-CO-1",
+    "WISCONSIN": "REP-SU-3",
+    "WYOMING": "REP-YS-1"
+})
+
+# Representative seat -> state; seats listed for two states belong to the first
+SEAT_TO_STATE = {}
+for _state, _seat_id in STATE_TO_SEAT.items():
+    SEAT_TO_STATE.setdefault(_seat_id, _state)
+SEAT_TO_STATE = MappingProxyType(SEAT_TO_STATE)
+
+# Share of the national population living in each state, in percent, by state ID
+POPULATION_WEIGHTS = (
+    1.55, 0.23, 2.07, 0.95, 12.07, 1.63, 1.16, 0.29, 0.20, 6.09,
+    3.14, 0.44, 0.51, 4.15, 2.10, 0.99, 0.94, 1.41, 1.47, 0.43,
+    1.87, 2.12, 3.19, 1.72, 0.96, 1.94, 0.32, 0.59, 0.87, 0.43,
+    2.85, 0.67, 6.27, 3.10, 0.22, 3.73, 1.22, 1.24, 4.11, 0.34,
+    1.50, 0.26, 2.06, 8.16, 0.90, 0.20, 2.59, 2.18, 0.60, 1.84,
+    0.18
+)
+
+def state_table(values, default=None) -> tuple:
+    """`values` (a mapping keyed by state name) as a tuple indexed by state ID"""
+    return tuple(values.get(state, default) for state in STATES)
+
+def region_code_of_seat(seat_id: str) -> Optional[str]:
+    """Region code of a seat ID: the first part of governor seats (CO-GOV), the second otherwise"""
+    parts = (seat_id or "").split("-")
+    if len(parts) < 2:
+        return None
+    return parts[0] if parts[-1] == "GOV" else parts[1]
+
+def region_of_seat(seat_id: str) -> Optional[str]:
+    """Region name of a seat ID, or None for national and unknown seats"""
+    return REGION_CODES.get(region_code_of_seat(seat_id))
+
+def region_of_state(state: str) -> Optional[str]:
+    """Region name of a state, or None for a state outside every region"""
+    state_id = STATE_IDS.get(state)
+    if state_id is None or STATE_REGION[state_id] is None:
+        return None
+    return REGION_NAMES[STATE_REGION[state_id]]
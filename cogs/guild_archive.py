@@ -0,0 +1,139 @@
+"""Snapshot and restore of everything a guild has stored.
+
+An archive is a gzip-compressed stream of BSON documents: a header naming
+the format, its version and the guild it was taken from, one record per
+stored document (`{"collection": ..., "document": ...}`), grouped by
+collection, and a trailer with the number of documents written for each
+collection. Every document with the guild's `guild_id` is included, in
+every collection except derived caches, so new cogs are covered without
+changes here.
+
+Restoring replaces the target guild's documents in every collection with
+those of the archive, inserting them in batches. Archives can be restored
+into another guild, which makes them usable as fixtures. These functions
+use the blocking pymongo API; the bot runs them on a database worker with
+`bot.db.run`. This module has no database dependency so cogs and scripts
+can import it without connecting.
+"""
+
+import gzip
+from datetime import datetime
+
+import bson
+
+# Identifies archive files, checked before anything is restored
+ARCHIVE_FORMAT = "election-bot-guild-archive"
+
+# Bumped whenever the archive layout changes; older versions are still restored
+ARCHIVE_VERSION = 1
+
+# Caches rebuilt from the other collections, never archived but cleared on restore
+DERIVED_COLLECTIONS = frozenset({"seat_polling"})
+
+# Documents inserted per round trip when restoring
+RESTORE_BATCH_SIZE = 1000
+
+class ArchiveError(ValueError):
+    """The file is not a guild archive this version can restore"""
+
+def guild_collections(database) -> list:
+    """Collections that may hold guild documents, in a stable order"""
+    return sorted(name for name in database.list_collection_names() if not name.startswith("system."))
+
+def dump_guild(database, guild_id: int, fileobj) -> dict:
+    """Write every document of `guild_id` to `fileobj`; returns documents written per collection"""
+    counts = {}
+    with gzip.GzipFile(fileobj=fileobj, mode="wb") as archive:
+        archive.write(bson.encode({
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "guild_id": guild_id,
+            "created_at": datetime.utcnow()
+        }))
+        for name in guild_collections(database):
+            if name in DERIVED_COLLECTIONS:
+                continue
+            for document in database[name].find({"guild_id": guild_id}).sort("_id", 1):
+                archive.write(bson.encode({"collection": name, "document": document}))
+                counts[name] = counts.get(name, 0) + 1
+        archive.write(bson.encode({"end": True, "counts": counts}))
+    return counts
+
+def read_header(fileobj) -> dict:
+    """The header of an archive, leaving `fileobj` where it was"""
+    position = fileobj.tell()
+    try:
+        return next(_records(fileobj))
+    finally:
+        fileobj.seek(position)
+
+def restore_guild(database, fileobj, guild_id: int = None) -> dict:
+    """Replace a guild's documents with those of an archive.
+
+    `guild_id` defaults to the guild the archive was taken from. Returns
+    documents restored per collection. The archive is checked for a valid
+    header and trailer before anything is written.
+    """
+    header = read_header(fileobj)
+    source_guild = header["guild_id"]
+    target_guild = source_guild if guild_id is None else guild_id
+    expected = _verify(fileobj)
+
+    for name in sorted(set(guild_collections(database)) | set(expected) | DERIVED_COLLECTIONS):
+        database[name].delete_many({"guild_id": target_guild})
+
+    counts = {}
+    batch, batch_collection = [], None
+    for record in _records(fileobj):
+        if "collection" not in record:
+            continue
+        if record["collection"] != batch_collection:
+            _insert(database, batch_collection, batch, counts)
+            batch, batch_collection = [], record["collection"]
+        document = record["document"]
+        document["guild_id"] = target_guild
+        if target_guild != source_guild:
+            # A clone next to the source guild needs ids of its own
+            document.pop("_id", None)
+        batch.append(document)
+        if len(batch) >= RESTORE_BATCH_SIZE:
+            _insert(database, batch_collection, batch, counts)
+            batch = []
+    _insert(database, batch_collection, batch, counts)
+    return counts
+
+def _insert(database, name: str, documents: list, counts: dict):
+    if documents:
+        database[name].insert_many(documents, ordered=False)
+        counts[name] = counts.get(name, 0) + len(documents)
+
+def _records(fileobj):
+    """Every BSON document of an archive, header first"""
+    fileobj.seek(0)
+    with gzip.GzipFile(fileobj=fileobj, mode="rb") as archive:
+        try:
+            header = next(bson.decode_file_iter(archive))
+        except (StopIteration, OSError, bson.errors.BSONError) as e:
+            raise ArchiveError("Not a guild archive") from e
+        if header.get("format") != ARCHIVE_FORMAT:
+            raise ArchiveError("Not a guild archive")
+        if header.get("version", 0) > ARCHIVE_VERSION:
+            raise ArchiveError(f"Archive version {header.get('version')} is newer than this bot supports")
+        yield header
+        try:
+            yield from bson.decode_file_iter(archive)
+        except (OSError, EOFError, bson.errors.BSONError) as e:
+            raise ArchiveError(f"Archive is damaged: {e}") from e
+
+def _verify(fileobj) -> dict:
+    """Document counts of a complete archive; raises ArchiveError if it was cut short"""
+    counts = {}
+    trailer = None
+    for record in _records(fileobj):
+        if "collection" in record:
+            counts[record["collection"]] = counts.get(record["collection"], 0) + 1
+        elif record.get("end"):
+            trailer = record
+    if trailer is None or trailer.get("counts") != counts:
+        raise ArchiveError("Archive is incomplete")
+    return counts
@@ -2,8 +2,12 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
+import asyncio
 import statistics
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Dict, List, Tuple
+from cogs.geography import REGIONS, SEAT_TO_STATE, STATE_TO_SEAT, region_of_seat
 
 # State ideological data
 STATE_DATA = {
@@ -60,189 +64,86 @@ STATE_DATA = {
     "WYOMING": {"republican": 66, "democrat": 25, "other": 9, "ideology": "Conservative", "economic": "Capitalist", "social": "Traditionalist", "government": "Small", "axis": "Right"}
 }
 
-# Representative seat mappings (State -> Seat ID)
-STATE_TO_SEAT = {
-    "ALABAMA": "REP-CO-4",
-    "ALASKA": "REP-PH-3",
-    "ARIZONA": "REP-YS-2",
-    "ARKANSAS": "REP-AU-2",
-    "CALIFORNIA": "REP-PH-1",
-    "COLORADO": "REP-YS-3",
-    "CONNECTICUT": "REP-CA-3",
-    "DELAWARE": "REP-CA-6",
-    "FLORIDA": "REP-CO-6",
-    "GEORGIA": "REP-CO-5",
-    "HAWAII": "REP-PH-3",
-    "IDAHO": "REP-YS-1",
-    "ILLINOIS": "REP-SU-4",
-    "INDIANA": "REP-SU-1",
-    "IOWA": "REP-HL-2",
-    "KANSAS": "REP-HL-3",
-    "KENTUCKY": "REP-CO-7",
-    "LOUISIANA": "REP-AU-2",
-    "MAINE": "REP-CA-4",
-    "MARYLAND": "REP-CA-6",
-    "MASSACHUSETTS": "REP-CA-3",
-    "MICHIGAN": "REP-SU-2",
-    "MINNESOTA": "REP-HL-1",
-    "MISSISSIPPI": "REP-CO-4",
-    "MISSOURI": "REP-HL-2",
-    "MONTANA": "REP-YS-1",
-    "NEBRASKA": "REP-HL-3",
-    "NEVADA": "REP-PH-4",
-    "NEW HAMPSHIRE": "REP-CA-4",
-    "NEW JERSEY": "REP-CA-5",
-    "NEW MEXICO": "REP-YS-3",
-    "NEW YORK": "REP-CA-2",
-    "NORTH CAROLINA": "REP-CO-2",
-    "NORTH DAKOTA": "REP-HL-4",
-    "OHIO": "REP-SU-1",
-    "OKLAHOMA": "REP-AU-1",
-    "OREGON": "REP-PH-2",
-    "PENNSYLVANIA": "REP-CA-1",
-    "RHODE ISLAND": "REP-CA-3",
-    "SOUTH CAROLINA": "REP-CO-2",
-    "SOUTH DAKOTA": "REP-HL-4",
-    "TENNESSEE": "REP-CO-3",
-    "TEXAS": "REP-AU-1",
-    "UTAH": "REP-YS-2",
-    "VERMONT": "REP-CA-4",
-    "VIRGINIA": "REP-CO-1",
-    "WASHINGTON": "REP-PH-2",
-    "WEST VIRGINIA": "REP-CO-1",
-    "WISCONSIN": "REP-SU-3",
-    "WYOMING": "REP-YS-1"
-}
+# The base table is shared by every guild; a guild's shifts live in its GuildIdeology
+STATE_DATA = MappingProxyType({state: MappingProxyType(data) for state, data in STATE_DATA.items()})
 
-# Regional mappings
-REGIONS = {
-    "Cambridge": [
-        "NEW YORK", "MASSACHUSETTS", "NEW HAMPSHIRE", "CONNECTICUT",
-        "RHODE ISLAND", "VERMONT", "MAINE", "PENNSYLVANIA",
-        "DELAWARE", "NEW JERSEY", "MARYLAND"
-    ],
-    "Superior": [
-        "OHIO", "ILLINOIS", "MICHIGAN", "WISCONSIN", "INDIANA"
-    ],
-    "Heartland": [
-        "MINNESOTA", "IOWA", "MISSOURI", "NORTH DAKOTA",
-        "SOUTH DAKOTA", "NEBRASKA", "KANSAS"
-    ],
-    "Columbia": [
-        "VIRGINIA", "WEST VIRGINIA", "NORTH CAROLINA", "SOUTH CAROLINA",
-        "KENTUCKY", "TENNESSEE", "GEORGIA", "FLORIDA",
-        "ALABAMA", "MISSISSIPPI"
-    ],
-    "Austin": [
-        "TEXAS", "LOUISIANA", "ARKANSAS", "OKLAHOMA"
-    ],
-    "Yellowstone": [
-        "WYOMING", "MONTANA", "IDAHO", "COLORADO",
-        "NEW MEXICO", "UTAH", "ARIZONA"
-    ],
-    "Phoenix": [
-        "CALIFORNIA", "WASHINGTON", "OREGON", "NEVADA",
-        "HAWAII", "ALASKA"
-    ]
+# Party names -> vote share keys of STATE_DATA
+PARTY_KEYS = {
+    "Republican Party": "republican",
+    "Democratic Party": "democrat",
+    "Independent": "other"
 }
 
-def calculate_region_medians(custom_regions=None) -> Dict[str, Dict[str, float]]:
-    """Calculate summed percentages for each region, normalized to 100%"""
-    region_medians = {}
+# Vote share keys of STATE_DATA
+SHARE_KEYS = ("republican", "democrat", "other")
+
+# Region -> (seat_id, state) of its representative seats, by the seat's region code
+SEAT_REGIONS = {}
+for _state, _seat_id in STATE_TO_SEAT.items():
+    SEAT_REGIONS.setdefault(region_of_seat(_seat_id) or "Unknown", []).append((_seat_id, _state))
+
+def _summed_shares(states, shares) -> Dict[str, float]:
+    """Vote shares of several states summed and normalized to 100%, or None if none have data"""
+    total_republican = 0
+    total_democrat = 0
+    total_other = 0
+    valid_states = 0
+
+    for state in states:
+        if state in shares:
+            total_republican += shares[state]["republican"]
+            total_democrat += shares[state]["democrat"]
+            total_other += shares[state]["other"]
+            valid_states += 1
+
+    if valid_states == 0:
+        return None
+
+    # Normalize to percentages that add up to exactly 100%
+    regional_total = total_republican + total_democrat + total_other
+    return {
+        "republican": (total_republican / regional_total) * 100,
+        "democrat": (total_democrat / regional_total) * 100,
+        "other": (total_other / regional_total) * 100
+    }
 
-    # Use custom regions if provided, otherwise use default REGIONS
-    regions_to_use = custom_regions if custom_regions else REGIONS
-
-    for region, states in regions_to_use.items():
-        total_republican = 0
-        total_democrat = 0
-        total_other = 0
-        valid_states = 0
-
-        for state in states:
-            # Convert to uppercase to match STATE_DATA keys
-            state_key = state.upper()
-            if state_key in STATE_DATA:
-                total_republican += STATE_DATA[state_key]["republican"]
-                total_democrat += STATE_DATA[state_key]["democrat"]
-                total_other += STATE_DATA[state_key]["other"]
-                valid_states += 1
-
-        if valid_states > 0:  # Only calculate if we have data
-            # Calculate the total sum
-            regional_total = total_republican + total_democrat + total_other
-
-            # Normalize to percentages that add up to exactly 100%
-            region_medians[region] = {
-                "republican": (total_republican / regional_total) * 100,
-                "democrat": (total_democrat / regional_total) * 100,
-                "other": (total_other / regional_total) * 100
-            }
+def calculate_region_medians(custom_regions=None, shares=None) -> Dict[str, Dict[str, float]]:
+    """Calculate summed percentages for each region, normalized to 100%.
 
+    `shares` is a guild's `GuildIdeology`; the base STATE_DATA is used without one.
+    """
+    shares = STATE_DATA if shares is None else shares
+    if isinstance(shares, GuildIdeology):
+        return shares.region_medians(custom_regions)
+
+    region_medians = {}
+    # Use custom regions if provided, otherwise use default REGIONS
+    for region, states in (custom_regions if custom_regions else REGIONS).items():
+        median = _summed_shares([state.upper() for state in states], shares)
+        if median is not None:
+            region_medians[region] = median
     return region_medians
 
-def calculate_seat_medians() -> Dict[str, Dict[str, float]]:
+def calculate_seat_medians(shares=None) -> Dict[str, Dict[str, float]]:
     """Calculate median percentages for each representative seat by region"""
+    shares = STATE_DATA if shares is None else shares
+    if isinstance(shares, GuildIdeology):
+        return shares.seat_medians()
+
     seat_medians = {}
+    for region, seats in SEAT_REGIONS.items():
+        region_median = _summed_shares([state for _, state in seats], shares)
+        if region_median is not None:
+            seat_medians.update(_seat_entries(region, seats, shares, region_median))
+    return seat_medians
 
-    # Group seats by region prefix
-    seat_regions = {
-        "CA": "Cambridge",
-        "SU": "Superior",
-        "HL": "Heartland",
-        "CO": "Columbia",
-        "AU": "Austin",
-        "YS": "Yellowstone",
-        "PH": "Phoenix"
+def _seat_entries(region: str, seats, shares, region_median: dict) -> Dict[str, Dict]:
+    """Assign a region's percentage to each of its seats"""
+    return {
+        seat_id: {"state": state, "region": region, **region_median}
+        for seat_id, state in seats if state in shares
     }
 
-    # Group seats by their region
-    region_seats = {}
-    for state, seat_id in STATE_TO_SEAT.items():
-        seat_prefix = seat_id.split("-")[1]
-        region = seat_regions.get(seat_prefix, "Unknown")
-
-        if region not in region_seats:
-            region_seats[region] = []
-
-        if state in STATE_DATA:
-            region_seats[region].append({
-                "seat_id": seat_id,
-                "state": state,
-                "republican": STATE_DATA[state]["republican"],
-                "democrat": STATE_DATA[state]["democrat"],
-                "other": STATE_DATA[state]["other"]
-            })
-
-    # Calculate summed percentages for each seat based on its region, normalized to 100%
-    for region, seats in region_seats.items():
-        if seats:
-            total_republican = sum(seat["republican"] for seat in seats)
-            total_democrat = sum(seat["democrat"] for seat in seats)
-            total_other = sum(seat["other"] for seat in seats)
-
-            # Calculate the total sum
-            regional_total = total_republican + total_democrat + total_other
-
-            # Normalize to percentages that add up to exactly 100%
-            region_median = {
-                "republican": (total_republican / regional_total) * 100,
-                "democrat": (total_democrat / regional_total) * 100,
-                "other": (total_other / regional_total) * 100
-            }
-
-            # Assign the region percentage to each seat
-            for seat in seats:
-                seat_medians[seat["seat_id"]] = {
-                    "state": seat["state"],
-                    "region": region,
-                    "republican": region_median["republican"],
-                    "democrat": region_median["democrat"],
-                    "other": region_median["other"]
-                }
-
-    return seat_medians
-
 def get_dynamic_regions_from_db(client, guild_id: int) -> Dict[str, list]:
     """Get dynamic region mappings from database if available"""
     try:
@@ -254,147 +155,198 @@ def get_dynamic_regions_from_db(client, guild_id: int) -> Dict[str, list]:
         pass
     return None
 
-def shift_state_ideology_for_winner(winner_data: dict, shift_amount: float = 1.0):
-    """Shift state ideology based on election winner's party"""
-    # Determine which state to shift based on seat type
-    state_to_shift = None
-
-    # Map seat types to states
+def winner_shifts(winner_data: dict, shift_amount: float = 1.0) -> List[Tuple[str, float]]:
+    """(state, shift) pairs an election winner moves toward their party"""
     seat_id = winner_data.get("seat_id", "")
-    office = winner_data.get("office", "")
 
     if seat_id.startswith("REP-"):
-        # House representative - find state from STATE_TO_SEAT mapping
-        for state, rep_seat in STATE_TO_SEAT.items():
-            if rep_seat == seat_id:
-                state_to_shift = state
-                break
-    elif seat_id.startswith("SEN-") or seat_id.endswith("-GOV"):
-        # Senate or Governor - extract state from seat_id or use region mapping
-        if seat_id.endswith("-GOV"):
-            # Governor seat format: CO-GOV, CA-GOV, etc.
-            region_code = seat_id.split("-")[0]
-            region_mapping = {
-                "CO": "Columbia",
-                "CA": "Cambridge",
-                "AU": "Austin",
-                "SU": "Superior",
-                "HL": "Heartland",
-                "YS": "Yellowstone",
-                "PH": "Phoenix"
-            }
-            region_name = region_mapping.get(region_code)
-
-            # For governors, shift all states in that region
-            if region_name and region_name in REGIONS:
-                states_to_shift = REGIONS[region_name]
-                party = winner_data.get("party", "")
-
-                # Apply shift to all states in the region
-                for state in states_to_shift:
-                    if state in STATE_DATA:
-                        apply_ideology_shift(state, party, shift_amount / len(states_to_shift))
-                return
-        else:
-            # Senate seat - similar to governor, affect region
-            region_code = seat_id.split("-")[1]
-            region_mapping = {
-                "CO": "Columbia",
-                "CA": "Cambridge",
-                "AU": "Austin",
-                "SU": "Superior",
-                "HL": "Heartland",
-                "YS": "Yellowstone",
-                "PH": "Phoenix"
-            }
-            region_name = region_mapping.get(region_code)
-
-            if region_name and region_name in REGIONS:
-                states_to_shift = REGIONS[region_name]
-                party = winner_data.get("party", "")
-
-                # Apply smaller shift to all states in region for senate
-                for state in states_to_shift:
-                    if state in STATE_DATA:
-                        apply_ideology_shift(state, party, shift_amount / (len(states_to_shift) * 2))
-                return
+        # House representative - shift their own state
+        state = SEAT_TO_STATE.get(seat_id)
+        return [(state, shift_amount)] if state in STATE_DATA else []
+
+    if seat_id.endswith("-GOV"):
+        # Governor seat format: CO-GOV, CA-GOV, etc. - shift every state in the region
+        divisor = 1
+    elif seat_id.startswith("SEN-"):
+        # Senate seat - smaller shift to every state in the region
+        divisor = 2
+    else:
+        return []
+
+    states = REGIONS.get(region_of_seat(seat_id))
+    if not states:
+        return []
+    return [(state, shift_amount / (len(states) * divisor)) for state in states if state in STATE_DATA]
+
+def shift_state_ideology_for_winner(winner_data: dict, shift_amount: float = 1.0, shares=None) -> Dict[str, dict]:
+    """New vote shares of the states an election winner shifts toward their party.
+
+    Computed from `shares` (a guild's `GuildIdeology`, or the base STATE_DATA)
+    without changing it; `IdeologyStore.shift_for_winner` records the result.
+    """
+    shares = STATE_DATA if shares is None else shares
+    shifted = {}
+    for state, amount in winner_shifts(winner_data, shift_amount):
+        new_shares = apply_ideology_shift(state, winner_data.get("party", ""), amount, shares)
+        if new_shares is not None:
+            shifted[state] = new_shares
+    return shifted
+
+def apply_ideology_shift(state: str, party: str, shift_amount: float, shares=None) -> Dict[str, float]:
+    """Vote shares of `state` after a shift toward `party`, or None if the party has no share"""
+    shares = STATE_DATA if shares is None else shares
+    if state not in shares or not party:
+        return None
+
+    winning_party_key = PARTY_KEYS.get(party)
+    if not winning_party_key:
+        return None
 
-    # For house representatives, find the specific state
-    if state_to_shift and state_to_shift in STATE_DATA:
-        party = winner_data.get("party", "")
-        apply_ideology_shift(state_to_shift, party, shift_amount)
-
-def apply_ideology_shift(state: str, party: str, shift_amount: float):
-    """Apply ideology shift to a specific state"""
-    if state not in STATE_DATA or not party:
-        return
-
-    # Map party names to ideology keys
-    party_mapping = {
-        "Republican Party": "republican",
-        "Democratic Party": "democrat",
-        "Independent": "other"
-    }
+    current = {key: shares[state][key] for key in SHARE_KEYS}
+    new_shares = dict(current)
+    losing_keys = [key for key in SHARE_KEYS if key != winning_party_key]
+    losing_total = sum(current[key] for key in losing_keys)
 
-    winning_party_key = party_mapping.get(party)
-    if not winning_party_key:
-        return
-
-    # Get current percentages
-    current_rep = STATE_DATA[state]["republican"]
-    current_dem = STATE_DATA[state]["democrat"]
-    current_other = STATE_DATA[state]["other"]
-
-    # Apply shift toward winning party
-    if winning_party_key == "republican":
-        # Shift toward Republican
-        new_rep = min(100, current_rep + shift_amount)
-        reduction_needed = new_rep - current_rep
-
-        # Reduce from other parties proportionally
-        if current_dem + current_other > 0:
-            dem_reduction = reduction_needed * (current_dem / (current_dem + current_other))
-            other_reduction = reduction_needed * (current_other / (current_dem + current_other))
-
-            STATE_DATA[state]["republican"] = round(new_rep, 1)
-            STATE_DATA[state]["democrat"] = round(max(0, current_dem - dem_reduction), 1)
-            STATE_DATA[state]["other"] = round(max(0, current_other - other_reduction), 1)
-
-    elif winning_party_key == "democrat":
-        # Shift toward Democrat
-        new_dem = min(100, current_dem + shift_amount)
-        reduction_needed = new_dem - current_dem
-
-        # Reduce from other parties proportionally
-        if current_rep + current_other > 0:
-            rep_reduction = reduction_needed * (current_rep / (current_rep + current_other))
-            other_reduction = reduction_needed * (current_other / (current_rep + current_other))
-
-            STATE_DATA[state]["democrat"] = round(new_dem, 1)
-            STATE_DATA[state]["republican"] = round(max(0, current_rep - rep_reduction), 1)
-            STATE_DATA[state]["other"] = round(max(0, current_other - other_reduction), 1)
-
-    elif winning_party_key == "other":
-        # Shift toward Independent/Other
-        new_other = min(100, current_other + shift_amount)
-        reduction_needed = new_other - current_other
-
-        # Reduce from major parties proportionally
-        if current_rep + current_dem > 0:
-            rep_reduction = reduction_needed * (current_rep / (current_rep + current_dem))
-            dem_reduction = reduction_needed * (current_dem / (current_rep + current_dem))
-
-            STATE_DATA[state]["other"] = round(new_other, 1)
-            STATE_DATA[state]["republican"] = round(max(0, current_rep - rep_reduction), 1)
-            STATE_DATA[state]["democrat"] = round(max(0, current_dem - dem_reduction), 1)
+    # Shift toward the winning party, reducing the others proportionally
+    gained = min(100, current[winning_party_key] + shift_amount)
+    reduction_needed = gained - current[winning_party_key]
+    if losing_total > 0:
+        new_shares[winning_party_key] = round(gained, 1)
+        for key in losing_keys:
+            new_shares[key] = round(max(0, current[key] - reduction_needed * (current[key] / losing_total)), 1)
 
     # Ensure totals add up to 100%
-    total = STATE_DATA[state]["republican"] + STATE_DATA[state]["democrat"] + STATE_DATA[state]["other"]
+    total = sum(new_shares.values())
     if abs(total - 100) > 0.1:  # If deviation is significant, normalize
-        STATE_DATA[state]["republican"] = round((STATE_DATA[state]["republican"] / total) * 100, 1)
-        STATE_DATA[state]["democrat"] = round((STATE_DATA[state]["democrat"] / total) * 100, 1)
-        STATE_DATA[state]["other"] = round((STATE_DATA[state]["other"] / total) * 100, 1)
+        new_shares = {key: round((value / total) * 100, 1) for key, value in new_shares.items()}
+    return new_shares
+
+class GuildIdeology(Mapping):
+    """One guild's state data: STATE_DATA with the states its elections shifted laid over it.
+
+    Read it like STATE_DATA (`ideology["OHIO"]["republican"]`). Instances never
+    change; `with_shifts` returns a new one sharing every region median the
+    shift did not touch, so medians are only recomputed for shifted regions.
+    """
+
+    def __init__(self, overrides: dict = None, version: int = 0):
+        self.version = version
+        self._overrides = {
+            state: MappingProxyType({**STATE_DATA[state], **values})
+            for state, values in (overrides or {}).items() if state in STATE_DATA
+        }
+        self._region_medians = {}  # (region, states) -> summed shares or None
+        self._seat_medians = {}  # region -> {seat_id: entry}
+
+    def __getitem__(self, state: str):
+        override = self._overrides.get(state)
+        return override if override is not None else STATE_DATA[state]
+
+    def __iter__(self):
+        return iter(STATE_DATA)
+
+    def __len__(self):
+        return len(STATE_DATA)
+
+    @property
+    def shifted_states(self) -> Dict[str, dict]:
+        """Vote shares of the states this guild has shifted away from STATE_DATA"""
+        return {state: {key: values[key] for key in SHARE_KEYS} for state, values in self._overrides.items()}
+
+    def with_shifts(self, shifted: Dict[str, dict]) -> "GuildIdeology":
+        """A copy with `shifted` states' vote shares replaced"""
+        updated = GuildIdeology(version=self.version + 1)
+        updated._overrides = dict(self._overrides)
+        for state, values in shifted.items():
+            updated._overrides[state] = MappingProxyType({**STATE_DATA[state], **values})
+        updated._region_medians = {
+            key: median for key, median in self._region_medians.items() if shifted.keys().isdisjoint(key[1])
+        }
+        updated._seat_medians = {
+            region: entries for region, entries in self._seat_medians.items()
+            if shifted.keys().isdisjoint(state for _, state in SEAT_REGIONS[region])
+        }
+        return updated
+
+    def region_medians(self, custom_regions=None) -> Dict[str, Dict[str, float]]:
+        """`calculate_region_medians` for this guild, computed once per region and version"""
+        region_medians = {}
+        for region, states in (custom_regions if custom_regions else REGIONS).items():
+            key = (region, tuple(state.upper() for state in states))
+            if key not in self._region_medians:
+                self._region_medians[key] = _summed_shares(key[1], self)
+            if self._region_medians[key] is not None:
+                region_medians[region] = dict(self._region_medians[key])
+        return region_medians
+
+    def seat_medians(self) -> Dict[str, Dict[str, float]]:
+        """`calculate_seat_medians` for this guild, computed once per region and version"""
+        seat_medians = {}
+        for region, seats in SEAT_REGIONS.items():
+            if region not in self._seat_medians:
+                region_median = _summed_shares([state for _, state in seats], self)
+                self._seat_medians[region] = (
+                    _seat_entries(region, seats, self, region_median) if region_median is not None else {}
+                )
+            seat_medians.update((seat_id, dict(entry)) for seat_id, entry in self._seat_medians[region].items())
+        return seat_medians
+
+class IdeologyStore:
+    """Each guild's `GuildIdeology`, kept in memory and persisted in `ideology_config`.
+
+    Only the shifted states are stored (`state_overrides`), so a guild that
+    never shifted reads STATE_DATA itself. Writes made outside this store are
+    not seen until `invalidate`.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._guilds = {}  # guild_id -> GuildIdeology
+        self._lock = asyncio.Lock()
+
+    async def guild(self, guild_id: int) -> GuildIdeology:
+        """The guild's current state data"""
+        ideology = self._guilds.get(guild_id)
+        if ideology is None:
+            config = await self.db["ideology_config"].find_one({"guild_id": guild_id})
+            config = config or {}
+            ideology = GuildIdeology(config.get("state_overrides"), config.get("ideology_version", 0))
+            ideology = self._guilds.setdefault(guild_id, ideology)
+        return ideology
+
+    async def shift_for_winner(self, guild_id: int, winner_data: dict, shift_amount: float = 1.0):
+        """Shift the guild's states toward an election winner's party; returns (before, after)"""
+        async with self._lock:
+            before = await self.guild(guild_id)
+            shifted = shift_state_ideology_for_winner(winner_data, shift_amount, before)
+            if not shifted:
+                return before, before
+            after = before.with_shifts(shifted)
+            await self.db["ideology_config"].update_one(
+                {"guild_id": guild_id},
+                {
+                    "$set": {f"state_overrides.{state}": values for state, values in shifted.items()},
+                    "$inc": {"ideology_version": 1}
+                },
+                upsert=True
+            )
+            self._guilds[guild_id] = after
+            return before, after
+
+    def invalidate(self, guild_id: int = None):
+        """Drop cached state data so it is read again on next use"""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
 
+def get_ideology_store(bot) -> IdeologyStore:
+    """The bot's ideology store, created on first use"""
+    store = getattr(bot, "ideology_store", None)
+    if store is None or store.db is not bot.db:
+        store = IdeologyStore(bot.db)
+        bot.ideology_store = store
+    return store
 
 def get_all_medians(client=None, guild_id=None) -> Dict[str, Dict]:
     """Get all calculated medians in one convenient function"""
@@ -546,7 +498,7 @@ class IdeologyManagement(commands.Cog):
             "user_id": interaction.user.id
         }
 
-        ideology_col.insert_one(modification)
+        await ideology_col.insert_one(modification)
 
         await interaction.response.send_message(
             f"✅ **Note:** This would add '{new_value}' to the {category} category by updating {state_name}.\n\n"
@@ -636,7 +588,7 @@ class IdeologyManagement(commands.Cog):
             "user_id": interaction.user.id
         }
 
-        ideology_col.insert_one(modification)
+        await ideology_col.insert_one(modification)
 
         await interaction.response.send_message(
             f"✅ **Note:** This would change '{old_value}' to '{new_value}' in the {category} category.\n\n"
@@ -727,7 +679,7 @@ class IdeologyManagement(commands.Cog):
             "user_id": interaction.user.id
         }
 
-        ideology_col.insert_one(modification)
+        await ideology_col.insert_one(modification)
 
         await interaction.response.send_message(
             f"✅ **Note:** This would remove '{value_to_remove}' from the {category} category.\n\n"
@@ -790,7 +742,7 @@ class IdeologyManagement(commands.Cog):
                 )
                 return
 
-            data = STATE_DATA[state_name]
+            data = (await get_ideology_store(self.bot).guild(interaction.guild.id))[state_name]
             embed = discord.Embed(
                 title=f"📊 Ideology Data: {state_name}",
                 color=discord.Color.blue(),
@@ -865,9 +817,9 @@ class IdeologyManagement(commands.Cog):
 
         ideology_col = self.bot.db["ideology_modifications"]
 
-        modifications = list(ideology_col.find(
+        modifications = await ideology_col.find(
             {"guild_id": interaction.guild.id}
-        ).sort("timestamp", -1).limit(limit))
+        ).sort("timestamp", -1).limit(limit).to_list(None)
 
         if not modifications:
             await interaction.response.send_message(
@@ -942,23 +894,7 @@ class IdeologyManagement(commands.Cog):
             "office": "Test Office"
         }
 
-        # Get affected states before shift
-        affected_states = []
-        if seat_id.startswith("REP-"):
-            for state, rep_seat in STATE_TO_SEAT.items():
-                if rep_seat == seat_id:
-                    affected_states.append(state)
-                    break
-        elif seat_id.endswith("-GOV") or seat_id.startswith("SEN-"):
-            region_code = seat_id.split("-")[0] if seat_id.endswith("-GOV") else seat_id.split("-")[1]
-            region_mapping = {
-                "CO": "Columbia", "CA": "Cambridge", "AU": "Austin",
-                "SU": "Superior", "HL": "Heartland", "YS": "Yellowstone", "PH": "Phoenix"
-            }
-            region_name = region_mapping.get(region_code)
-            if region_name and region_name in REGIONS:
-                affected_states.extend(REGIONS[region_name])
-
+        affected_states = [state for state, _ in winner_shifts(winner_data, shift_amount)]
         if not affected_states:
             await interaction.response.send_message(
                 f"❌ No states found for seat {seat_id}",
@@ -966,18 +902,10 @@ class IdeologyManagement(commands.Cog):
             )
             return
 
-        # Show before state
-        before_data = {}
-        for state in affected_states:
-            if state in STATE_DATA:
-                before_data[state] = {
-                    "republican": STATE_DATA[state]["republican"],
-                    "democrat": STATE_DATA[state]["democrat"],
-                    "other": STATE_DATA[state]["other"]
-                }
-
-        # Apply shift
-        shift_state_ideology_for_winner(winner_data, shift_amount)
+        # Apply shift to this server's ideology data
+        before_data, after_data = await get_ideology_store(self.bot).shift_for_winner(
+            interaction.guild.id, winner_data, shift_amount
+        )
 
         # Show results
         embed = discord.Embed(
@@ -988,9 +916,9 @@ class IdeologyManagement(commands.Cog):
         )
 
         for state in affected_states:
-            if state in STATE_DATA and state in before_data:
+            if state in before_data:
                 before = before_data[state]
-                after = STATE_DATA[state]
+                after = after_data[state]
 
                 changes = []
                 if abs(before["republican"] - after["republican"]) > 0.05:
@@ -0,0 +1,35 @@
+"""Registry of the indexes each cog needs.
+
+Cogs call `register_index` at import time for every query shape they run, and
+the db cog creates the registered indexes at startup. This module has no
+database dependency so cogs can import it without connecting.
+"""
+
+# Cooldown documents are dropped this long after the action, well past the longest cooldown in the bot
+COOLDOWN_TTL_SECONDS = 24 * 60 * 60
+
+# Indexes declared by the cogs: collection -> {index name: {"keys", "options", "owners"}}
+INDEX_REGISTRY = {}
+
+def index_name(keys) -> str:
+    """Name MongoDB gives an index by default, e.g. guild_id_1_user_id_1"""
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+def register_index(collection: str, keys, owner: str, **options):
+    """Declare a query shape `owner` runs against `collection`.
+
+    `keys` is a list of (field, direction) pairs and `options` are passed to
+    `create_index` (e.g. `expireAfterSeconds` for TTL indexes). Several cogs may
+    declare the same index as long as they agree on its options.
+    """
+    keys = [(field, direction) for field, direction in keys]
+    name = index_name(keys)
+    indexes = INDEX_REGISTRY.setdefault(collection, {})
+    existing = indexes.get(name)
+    if existing is None:
+        indexes[name] = {"keys": keys, "options": options, "owners": [owner]}
+    elif existing["options"] != options:
+        raise ValueError(f"Index {name} on {collection} is declared with different options "
+                         f"by {', '.join(existing['owners'])} and {owner}")
+    elif owner not in existing["owners"]:
+        existing["owners"].append(owner)
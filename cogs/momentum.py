@@ -6,6 +6,26 @@ import random
 import math
 from typing import Optional, Dict, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from cogs.geography import REGION_NAMES, region_of_seat
+from cogs.indexes import COOLDOWN_TTL_SECONDS, register_index
+from cogs.time_manager import get_rp_clock
+
+# Query shapes this cog runs, created at startup by the db cog
+register_index("momentum_cooldowns", [("guild_id", 1), ("user_id", 1), ("action", 1)], owner=__name__)
+register_index("momentum_cooldowns", [("last_action", 1)], owner=__name__, expireAfterSeconds=COOLDOWN_TTL_SECONDS)
+
+# Individual momentum events are kept this long in the append-only momentum_events collection
+MOMENTUM_EVENT_RETENTION_SECONDS = 30 * 24 * 60 * 60
+
+# Daily per-state, per-party rollups of those events are kept for longer summaries
+MOMENTUM_ROLLUP_RETENTION_SECONDS = 365 * 24 * 60 * 60
+
+register_index("momentum_events", [("guild_id", 1), ("state", 1), ("timestamp", -1)], owner=__name__)
+register_index("momentum_events", [("timestamp", 1)], owner=__name__,
+               expireAfterSeconds=MOMENTUM_EVENT_RETENTION_SECONDS)
+register_index("momentum_event_rollups", [("guild_id", 1), ("state", 1), ("day", -1)], owner=__name__)
+register_index("momentum_event_rollups", [("day", 1)], owner=__name__,
+               expireAfterSeconds=MOMENTUM_ROLLUP_RETENTION_SECONDS)
 
 class Momentum(commands.Cog):
     def __init__(self, bot):
@@ -20,16 +40,19 @@ class Momentum(commands.Cog):
     def cog_unload(self):
         self.momentum_decay_loop.cancel()
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_momentum_config(self, guild_id: int):
+    async def _get_momentum_config(self, guild_id: int):
         """Get or create momentum configuration"""
         col = self.bot.db["momentum_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
+
+        if config and "momentum_events" in config:
+            await self._migrate_momentum_events(col, config)
 
         if not config:
             # Initialize momentum system with default settings
@@ -45,8 +68,7 @@ class Momentum(commands.Cog):
                 },
                 "state_leans": {},  # State political leans (hardcoded values)
                 "state_momentum": {},  # Current momentum by state and party
-                "regional_momentum": {},  # Regional momentum for senate/governor races
-                "momentum_events": []  # Log of momentum changes
+                "regional_momentum": {}  # Regional momentum for senate/governor races
             }
 
             # Initialize state leans based on PRESIDENTIAL_STATE_DATA
@@ -87,10 +109,9 @@ class Momentum(commands.Cog):
                     }
 
             # Initialize regional momentum for senate/governor races (only if not already exists)
-            from .ideology import REGIONS
             if "regional_momentum" not in config:
                 config["regional_momentum"] = {}
-            for region_name in REGIONS.keys():
+            for region_name in REGION_NAMES:
                 if region_name not in config["regional_momentum"]:
                     config["regional_momentum"][region_name] = {
                         "Republican": 0.0,
@@ -99,7 +120,7 @@ class Momentum(commands.Cog):
                         "last_updated": datetime.utcnow()
                     }
 
-            col.insert_one(config)
+            await col.insert_one(config)
 
         return col, config
 
@@ -138,35 +159,66 @@ class Momentum(commands.Cog):
         current_momentum = momentum_config["state_momentum"][state][party]
         return current_momentum >= volatility_threshold
 
-    def _add_momentum_event(self, momentum_col, guild_id: int, state: str, party: str, 
-                           change: float, reason: str, user_id: Optional[int] = None):
-        """Log a momentum change event"""
+    def _momentum_event(self, guild_id: int, state: str, party: str, change: float, reason: str,
+                        user_id: Optional[int] = None) -> dict:
+        """Document for the momentum_events collection"""
+        return {
+            "guild_id": guild_id,
+            "timestamp": datetime.utcnow(),
+            "state": state,
+            "party": party,
+            "change": change,
+            "reason": reason,
+            "user_id": user_id
+        }
+
+    def _queue_momentum_event(self, batch, event: dict):
+        """Queue an event insert and the matching daily rollup increment"""
+        batch.insert_one(self.bot.db["momentum_events"], event)
+        day = event["timestamp"].replace(hour=0, minute=0, second=0, microsecond=0)
+        batch.update_one(
+            self.bot.db["momentum_event_rollups"],
+            {"guild_id": event["guild_id"], "state": event["state"], "party": event["party"], "day": day},
+            {"$inc": {"change": event["change"], "events": 1}},
+            upsert=True
+        )
+
+    async def _add_momentum_event(self, momentum_col, guild_id: int, state: str, party: str, 
+                           change: float, reason: str, user_id: Optional[int] = None, batch=None):
+        """Log a momentum change event, or queue it on `batch` if given.
+
+        Events go to the momentum_events collection, not the `momentum_col`
+        config document the callers pass in, so that document stays small.
+        """
+        event = self._momentum_event(guild_id, state, party, change, reason, user_id)
+        if batch is not None:
+            self._queue_momentum_event(batch, event)
+            return
+
         try:
-            result = momentum_col.update_one(
-                {"guild_id": guild_id},
-                {
-                    "$push": {
-                        "momentum_events": {
-                            "timestamp": datetime.utcnow(),
-                            "state": state,
-                            "party": party,
-                            "change": change,
-                            "reason": reason,
-                            "user_id": user_id
-                        }
-                    }
-                }
-            )
-            print(f"DEBUG: Momentum event logged - matched: {result.matched_count}, modified: {result.modified_count}")
+            batch = self.bot.db.batch()
+            self._queue_momentum_event(batch, event)
+            await batch.commit()
         except Exception as e:
             print(f"ERROR: Failed to log momentum event: {e}")
             import traceback
             traceback.print_exc()
 
-    def _check_and_apply_auto_collapse(self, momentum_col, guild_id: int, state: str, party: str, current_momentum: float):
-        """Check if momentum should auto-collapse and apply it"""
+    async def _migrate_momentum_events(self, momentum_col, config: dict):
+        """Move the events embedded in an old momentum_config document to momentum_events"""
+        batch = self.bot.db.batch()
+        for event in config.pop("momentum_events", None) or []:
+            if isinstance(event, dict) and isinstance(event.get("timestamp"), datetime):
+                self._queue_momentum_event(batch, {**event, "guild_id": config["guild_id"]})
+        batch.update_one(momentum_col, {"_id": config["_id"]}, {"$unset": {"momentum_events": ""}})
+        await batch.commit()
+
+    async def _check_and_apply_auto_collapse(self, momentum_col, guild_id: int, state: str, party: str, current_momentum: float,
+                                             momentum_config: Optional[dict] = None, batch=None):
+        """Check if momentum should auto-collapse and apply it (queued on `batch` if given)"""
         # Get the auto-collapse threshold from settings
-        momentum_col_config, momentum_config = self._get_momentum_config(guild_id)
+        if momentum_config is None:
+            momentum_col_config, momentum_config = await self._get_momentum_config(guild_id)
         auto_collapse_threshold = momentum_config["settings"].get("auto_collapse_threshold", 100.0)
 
         if current_momentum >= auto_collapse_threshold:
@@ -176,20 +228,21 @@ class Momentum(commands.Cog):
             new_momentum = current_momentum - momentum_loss
 
             # Update momentum
-            momentum_col.update_one(
-                {"guild_id": guild_id},
-                {
-                    "$set": {
-                        f"state_momentum.{state}.{party}": new_momentum,
-                        f"state_momentum.{state}.last_updated": datetime.utcnow()
-                    }
+            update = {
+                "$set": {
+                    f"state_momentum.{state}.{party}": new_momentum,
+                    f"state_momentum.{state}.last_updated": datetime.utcnow()
                 }
-            )
+            }
+            if batch is not None:
+                batch.update_one(momentum_col, {"guild_id": guild_id}, update)
+            else:
+                await momentum_col.update_one({"guild_id": guild_id}, update)
 
             # Log the auto-collapse event
-            self._add_momentum_event(
+            await self._add_momentum_event(
                 momentum_col, guild_id, state, party, 
-                -momentum_loss, "Automatic collapse (anti-spam)", user_id=None
+                -momentum_loss, "Automatic collapse (anti-spam)", user_id=None, batch=batch
             )
 
             return new_momentum, True
@@ -243,31 +296,20 @@ class Momentum(commands.Cog):
 
     def _get_region_from_seat_id(self, seat_id: str) -> Optional[str]:
         """Extract region from seat ID"""
-        if not seat_id or "-" not in seat_id:
-            return None
-
-        parts = seat_id.split("-")
-        if len(parts) >= 2:
-            region_code = parts[0] if seat_id.endswith("-GOV") else parts[1]
-            region_mapping = {
-                "CO": "Columbia", "CA": "Cambridge", "AU": "Austin",
-                "SU": "Superior", "HL": "Heartland", "YS": "Yellowstone", "PH": "Phoenix"
-            }
-            return region_mapping.get(region_code)
-        return None
+        return region_of_seat(seat_id)
 
     @tasks.loop(hours=12)  # Run decay every 12 hours
     async def momentum_decay_loop(self):
         """Apply momentum decay across all guilds"""
         try:
             col = self.bot.db["momentum_config"]
-            configs = col.find({})
+            configs = await col.find({}, {"momentum_events": 0}).to_list(None)
 
             for config in configs:
                 guild_id = config["guild_id"]
 
                 # Check if we're in General Campaign phase
-                time_col, time_config = self._get_time_config(guild_id)
+                time_col, time_config = await self._get_time_config(guild_id)
                 if not time_config or time_config.get("current_phase", "") != "General Campaign":
                     continue  # Skip decay if not in General Campaign
 
@@ -277,6 +319,7 @@ class Momentum(commands.Cog):
                 # Apply decay to all state momentum
                 updates = {}
                 momentum_changed = False
+                batch = self.bot.db.batch()
 
                 for state_name, momentum_data in config["state_momentum"].items():
                     # Skip non-dictionary entries (like 'last_decay' timestamp)
@@ -302,18 +345,16 @@ class Momentum(commands.Cog):
 
                             # Log decay event if significant change
                             if abs(current_momentum - new_momentum) > 0.5:
-                                self._add_momentum_event(
+                                await self._add_momentum_event(
                                     col, guild_id, state_name, party,
-                                    new_momentum - current_momentum, "Daily decay"
+                                    new_momentum - current_momentum, "Daily decay", batch=batch
                                 )
 
-                # Apply all updates at once
+                # Apply all updates and their events at once
                 if updates:
                     updates[f"state_momentum.last_decay"] = datetime.utcnow()
-                    col.update_one(
-                        {"guild_id": guild_id},
-                        {"$set": updates}
-                    )
+                    batch.update_one(col, {"guild_id": guild_id}, {"$set": updates})
+                    await batch.commit()
 
                     print(f"Applied momentum decay for guild {guild_id}")
 
@@ -333,7 +374,7 @@ class Momentum(commands.Cog):
     )
     async def momentum_status(self, interaction: discord.Interaction, state: str):
         # Check if in General Campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") != "General Campaign":
             await interaction.response.send_message(
                 "❌ Momentum tracking is only active during the General Campaign phase.",
@@ -357,7 +398,7 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         state_lean = momentum_config["state_leans"].get(state_upper, {"party": "Unknown", "intensity": "None"})
         state_momentum = momentum_config["state_momentum"].get(state_upper, {})
@@ -442,10 +483,10 @@ class Momentum(commands.Cog):
             )
 
         # Show recent momentum events for this state
-        recent_events = [
-            event for event in momentum_config.get("momentum_events", [])
-            if event["state"] == state_upper
-        ][-3:]  # Last 3 events
+        recent_events = await self.bot.db["momentum_events"].find(
+            {"guild_id": interaction.guild.id, "state": state_upper}
+        ).sort("timestamp", -1).limit(3).to_list(None)  # Last 3 events
+        recent_events.reverse()
 
         if recent_events:
             events_text = ""
@@ -464,6 +505,31 @@ class Momentum(commands.Cog):
                 inline=True
             )
 
+        # Summarize the past week from the daily rollups
+        week_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=6)
+        rollups = await self.bot.db["momentum_event_rollups"].find(
+            {"guild_id": interaction.guild.id, "state": state_upper, "day": {"$gte": week_start}}
+        ).to_list(None)
+
+        if rollups:
+            weekly = {}
+            for rollup in rollups:
+                totals = weekly.setdefault(rollup["party"], [0.0, 0])
+                totals[0] += rollup.get("change", 0.0)
+                totals[1] += rollup.get("events", 0)
+
+            weekly_text = ""
+            for party in parties:
+                if party in weekly:
+                    change, count = weekly[party]
+                    weekly_text += f"**{party}:** {change:+.1f} ({count} events)\n"
+
+            embed.add_field(
+                name="📈 Last 7 Days",
+                value=weekly_text or "No changes",
+                inline=True
+            )
+
         embed.add_field(
             name="ℹ️ Legend",
             value="⚠️ = Vulnerable to collapse\n█ = Positive momentum\n▓ = Negative momentum",
@@ -482,7 +548,7 @@ class Momentum(commands.Cog):
     )
     async def trigger_collapse(self, interaction: discord.Interaction, state: str, target_party: str):
         # Check if in General Campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") != "General Campaign":
             await interaction.response.send_message(
                 "❌ Momentum collapse can only be triggered during the General Campaign phase.",
@@ -508,7 +574,7 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         # Check if target party is vulnerable
         if not self._check_vulnerability_threshold(interaction.guild.id, state_upper, target_party, momentum_config):
@@ -523,7 +589,7 @@ class Momentum(commands.Cog):
 
         # Check if user has recently triggered a collapse (prevent spam)
         cooldown_col = self.bot.db["momentum_cooldowns"]
-        cooldown_record = cooldown_col.find_one({
+        cooldown_record = await cooldown_col.find_one({
             "guild_id": interaction.guild.id,
             "user_id": interaction.user.id,
             "action": "trigger_collapse"
@@ -552,7 +618,7 @@ class Momentum(commands.Cog):
         new_momentum = current_momentum - momentum_loss
 
         # Update momentum
-        momentum_col.update_one(
+        await momentum_col.update_one(
             {"guild_id": interaction.guild.id},
             {
                 "$set": {
@@ -563,13 +629,13 @@ class Momentum(commands.Cog):
         )
 
         # Log the event
-        self._add_momentum_event(
+        await self._add_momentum_event(
             momentum_col, interaction.guild.id, state_upper, target_party, 
             -momentum_loss, "Opposition-triggered collapse", interaction.user.id
         )
 
         # Set cooldown
-        cooldown_col.update_one(
+        await cooldown_col.update_one(
             {"guild_id": interaction.guild.id, "user_id": interaction.user.id, "action": "trigger_collapse"},
             {
                 "$set": {
@@ -598,7 +664,7 @@ class Momentum(commands.Cog):
                         new_intensity = "None"
                         current_lean["party"] = "Swing"
 
-                    momentum_col.update_one(
+                    await momentum_col.update_one(
                         {"guild_id": interaction.guild.id},
                         {
                             "$set": {
@@ -684,13 +750,13 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         # Update momentum
         current_momentum = momentum_config["state_momentum"][state_upper][party]
         new_momentum = current_momentum + amount
 
-        momentum_col.update_one(
+        await momentum_col.update_one(
             {"guild_id": interaction.guild.id},
             {
                 "$set": {
@@ -701,7 +767,7 @@ class Momentum(commands.Cog):
         )
 
         # Log the event
-        self._add_momentum_event(
+        await self._add_momentum_event(
             momentum_col, interaction.guild.id, state_upper, party, 
             amount, reason, interaction.user.id
         )
@@ -769,7 +835,7 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         # Check if admin can change leans
         settings = momentum_config["settings"]
@@ -785,7 +851,7 @@ class Momentum(commands.Cog):
 
         # Update lean
         new_lean = {"party": party, "intensity": intensity}
-        momentum_col.update_one(
+        await momentum_col.update_one(
             {"guild_id": interaction.guild.id},
             {
                 "$set": {
@@ -835,7 +901,7 @@ class Momentum(commands.Cog):
         volatility_threshold: Optional[float] = None,
         auto_collapse_threshold: Optional[float] = None
     ):
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
         settings = momentum_config["settings"]
 
         # Update settings if provided
@@ -877,13 +943,13 @@ class Momentum(commands.Cog):
             updates["settings.auto_collapse_threshold"] = auto_collapse_threshold
 
         if updates:
-            momentum_col.update_one(
+            await momentum_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": updates}
             )
 
         # Refresh config after updates
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
         settings = momentum_config["settings"]
 
         embed = discord.Embed(
@@ -933,7 +999,7 @@ class Momentum(commands.Cog):
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def reset_momentum(self, interaction: discord.Interaction, state: Optional[str] = None, party: Optional[str] = None):
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         # Validate state if provided
         if state:
@@ -968,7 +1034,7 @@ class Momentum(commands.Cog):
                 reset_summary.append(f"**{state_upper} {party}:** {old_momentum:.1f} → 0.0")
                 
                 # Log reset event
-                self._add_momentum_event(
+                await self._add_momentum_event(
                     momentum_col, interaction.guild.id, state_upper, party,
                     -old_momentum, "Admin momentum reset", interaction.user.id
                 )
@@ -981,7 +1047,7 @@ class Momentum(commands.Cog):
                         reset_summary.append(f"**{state_upper} {party_name}:** {old_momentum:.1f} → 0.0")
                         
                         # Log reset event
-                        self._add_momentum_event(
+                        await self._add_momentum_event(
                             momentum_col, interaction.guild.id, state_upper, party_name,
                             -old_momentum, "Admin momentum reset", interaction.user.id
                         )
@@ -1002,7 +1068,7 @@ class Momentum(commands.Cog):
                             reset_summary.append(f"**{state_name} {party_name}:** {old_momentum:.1f} → 0.0")
                         
                         # Log reset event
-                        self._add_momentum_event(
+                        await self._add_momentum_event(
                             momentum_col, interaction.guild.id, state_name, party_name,
                             -old_momentum, "Admin momentum reset", interaction.user.id
                         )
@@ -1010,7 +1076,7 @@ class Momentum(commands.Cog):
         # Apply all updates
         if updates:
             updates["state_momentum.last_reset"] = datetime.utcnow()
-            momentum_col.update_one(
+            await momentum_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": updates}
             )
@@ -1072,7 +1138,7 @@ class Momentum(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def trigger_decay(self, interaction: discord.Interaction):
         # Check if in General Campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") != "General Campaign":
             await interaction.response.send_message(
                 "❌ Momentum decay can only be triggered during the General Campaign phase.",
@@ -1080,7 +1146,7 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
         settings = momentum_config["settings"]
         decay_rate = settings.get("momentum_decay_rate", 0.95)
 
@@ -1115,7 +1181,7 @@ class Momentum(commands.Cog):
                         decay_summary.append(f"**{state_name} {party}:** {current_momentum:.1f} → {new_momentum:.1f}")
 
                         # Log decay event
-                        self._add_momentum_event(
+                        await self._add_momentum_event(
                             momentum_col, interaction.guild.id, state_name, party,
                             change, "Manual decay trigger", interaction.user.id
                         )
@@ -1123,7 +1189,7 @@ class Momentum(commands.Cog):
         # Apply all updates
         if updates:
             updates["state_momentum.last_decay"] = datetime.utcnow()
-            momentum_col.update_one(
+            await momentum_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": updates}
             )
@@ -1168,7 +1234,7 @@ class Momentum(commands.Cog):
     )
     async def momentum_overview(self, interaction: discord.Interaction):
         # Check if in General Campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") != "General Campaign":
             await interaction.response.send_message(
                 "❌ Momentum tracking is only active during the General Campaign phase.",
@@ -1176,7 +1242,7 @@ class Momentum(commands.Cog):
             )
             return
 
-        momentum_col, momentum_config = self._get_momentum_config(interaction.guild.id)
+        momentum_col, momentum_config = await self._get_momentum_config(interaction.guild.id)
 
         embed = discord.Embed(
             title="🌊 National Momentum Overview",
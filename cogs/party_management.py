@@ -3,6 +3,10 @@ import discord
 from discord import app_commands
 from datetime import datetime
 from typing import List, Optional
+from cogs.exports import build_export, send_export
+
+# Columns of the party CSV and JSON Lines exports
+PARTY_EXPORT_COLUMNS = ["name", "abbreviation", "color", "is_default", "created_at"]
 
 class PartyManagement(commands.Cog):
     def __init__(self, bot):
@@ -16,10 +20,10 @@ class PartyManagement(commands.Cog):
     party_manage_group = app_commands.Group(name="manage", description="Party management commands", parent=party_group, default_permissions=discord.Permissions(administrator=True))
     party_info_group = app_commands.Group(name="info", description="Party information commands", parent=party_group)
 
-    def _get_parties_config(self, guild_id: int):
+    async def _get_parties_config(self, guild_id: int):
         """Get or create parties configuration for a guild"""
         col = self.bot.db["parties_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             # Initialize with default parties
             config = {
@@ -48,7 +52,7 @@ class PartyManagement(commands.Cog):
                     }
                 ]
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
     @party_manage_group.command(
@@ -68,7 +72,7 @@ class PartyManagement(commands.Cog):
         abbreviation: str,
         color: str = None
     ):
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Validate inputs
         if len(name) < 2 or len(name) > 50:
@@ -128,7 +132,7 @@ class PartyManagement(commands.Cog):
 
         config["parties"].append(new_party)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": config["parties"]}}
         )
@@ -151,7 +155,7 @@ class PartyManagement(commands.Cog):
         description="List all available political parties"
     )
     async def list_parties(self, interaction: discord.Interaction):
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         embed = discord.Embed(
             title="🏛️ Political Parties",
@@ -185,7 +189,7 @@ class PartyManagement(commands.Cog):
         interaction: discord.Interaction,
         party_name: str
     ):
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Find the party
         party_found = None
@@ -214,7 +218,7 @@ class PartyManagement(commands.Cog):
         # Remove the party
         removed_party = config["parties"].pop(party_found)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": config["parties"]}}
         )
@@ -243,7 +247,7 @@ class PartyManagement(commands.Cog):
         new_abbreviation: str = None,
         new_color: str = None
     ):
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Find the party
         party_found = None
@@ -330,7 +334,7 @@ class PartyManagement(commands.Cog):
             )
             return
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": config["parties"]}}
         )
@@ -349,9 +353,9 @@ class PartyManagement(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    def get_party_choices(self, guild_id: int) -> list:
+    async def get_party_choices(self, guild_id: int) -> list:
         """Get list of party choices for autocomplete"""
-        col, config = self._get_parties_config(guild_id)
+        col, config = await self._get_parties_config(guild_id)
         return [
             app_commands.Choice(name=party["name"], value=party["name"])
             for party in config["parties"]
@@ -409,7 +413,7 @@ class PartyManagement(commands.Cog):
             ]
         }
 
-        col.replace_one(
+        await col.replace_one(
             {"guild_id": interaction.guild.id},
             default_config,
             upsert=True
@@ -434,7 +438,7 @@ class PartyManagement(commands.Cog):
         party_data: str
     ):
         """Create multiple parties from formatted text: Name:Abbr:Color,Name:Abbr:Color"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Parse format: "Green Party:G:00FF00,Libertarian Party:L:FFFF00"
         party_entries = party_data.split(",")
@@ -503,7 +507,7 @@ class PartyManagement(commands.Cog):
                 errors.append(f"Error with {entry}: {str(e)}")
 
         if created_parties:
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"parties": config["parties"]}}
             )
@@ -530,7 +534,7 @@ class PartyManagement(commands.Cog):
         confirm: bool = False
     ):
         """Remove all non-default parties"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         custom_parties = [p for p in config["parties"] if not p.get("is_default", False)]
 
@@ -555,7 +559,7 @@ class PartyManagement(commands.Cog):
         # Keep only default parties
         config["parties"] = [p for p in config["parties"] if p.get("is_default", False)]
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": config["parties"]}}
         )
@@ -567,16 +571,17 @@ class PartyManagement(commands.Cog):
 
     @party_manage_group.command(
         name="export",
-        description="Export party configuration as text (Admin only)"
+        description="Export party configuration as a CSV, JSON Lines or text file (Admin only)"
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_export_parties(
         self,
         interaction: discord.Interaction,
-        format_type: str = "csv"
+        format_type: str = "csv",
+        compress: bool = False
     ):
         """Export party data"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         if not config["parties"]:
             await interaction.response.send_message(
@@ -585,35 +590,32 @@ class PartyManagement(commands.Cog):
             )
             return
 
-        if format_type.lower() == "csv":
-            lines = ["name,abbreviation,color,is_default,created_at"]
-            for party in config["parties"]:
-                created_date = party["created_at"].strftime("%Y-%m-%d") if party.get("created_at") else ""
-                lines.append(
-                    f"{party['name']},{party['abbreviation']},{party['color']:06X},"
-                    f"{party.get('is_default', False)},{created_date}"
-                )
-            export_text = "\n".join(lines)
-        elif format_type.lower() == "bulk":
+        if format_type.lower() == "bulk":
             # Format for bulk_create_parties command
-            lines = []
-            for party in config["parties"]:
-                lines.append(f"{party['name']}:{party['abbreviation']}:{party['color']:06X}")
-            export_text = ",".join(lines)
+            line = lambda party: f"{party['name']}:{party['abbreviation']}:{party['color']:06X}"
+            separator = ","
         else:
             # Text format
-            lines = []
-            for party in config["parties"]:
-                party_type = "Default" if party.get("is_default", False) else "Custom"
-                lines.append(
-                    f"{party['name']} ({party['abbreviation']}) - "
-                    f"#{party['color']:06X} - {party_type}"
-                )
-            export_text = "\n".join(lines)
-
-        await interaction.response.send_message(
-            f"📊 Party Export ({format_type.upper()}):\n```\n{export_text}\n```",
-            ephemeral=True
+            line = lambda party: (
+                f"{party['name']} ({party['abbreviation']}) - "
+                f"#{party['color']:06X} - {'Default' if party.get('is_default', False) else 'Custom'}"
+            )
+            separator = "\n"
+
+        export = await build_export(
+            config["parties"], "parties", format_type, PARTY_EXPORT_COLUMNS,
+            row=lambda party: [
+                party["name"], party["abbreviation"], f"{party['color']:06X}",
+                party.get("is_default", False),
+                party["created_at"].strftime("%Y-%m-%d") if party.get("created_at") else ""
+            ],
+            line=line,
+            separator=separator,
+            compress=compress
+        )
+        await send_export(
+            interaction, export,
+            f"📊 Party Export ({format_type.upper()}) - {export.rows} parties"
         )
 
     @party_manage_group.command(
@@ -628,7 +630,7 @@ class PartyManagement(commands.Cog):
         new_color: str
     ):
         """Change a party's color"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Find the party
         party_found = None
@@ -661,7 +663,7 @@ class PartyManagement(commands.Cog):
         old_color = config["parties"][party_found]["color"]
         config["parties"][party_found]["color"] = party_color
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"parties": config["parties"]}}
         )
@@ -689,7 +691,7 @@ class PartyManagement(commands.Cog):
         independent_role: discord.Role = None
     ):
         """Set Discord role IDs for party validation"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         # Set role IDs in configuration
         if "role_validation" not in config:
@@ -701,7 +703,7 @@ class PartyManagement(commands.Cog):
         if independent_role:
             config["role_validation"]["Independent"] = independent_role.id
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"role_validation": config["role_validation"]}}
         )
@@ -746,7 +748,7 @@ class PartyManagement(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def view_party_role_config(self, interaction: discord.Interaction):
         """View current party role ID configuration"""
-        col, config = self._get_parties_config(interaction.guild.id)
+        col, config = await self._get_parties_config(interaction.guild.id)
 
         role_validation = config.get("role_validation", {})
 
@@ -780,9 +782,9 @@ class PartyManagement(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    def validate_user_party_role(self, user: discord.Member, party_name: str, guild_id: int) -> tuple[bool, str]:
+    async def validate_user_party_role(self, user: discord.Member, party_name: str, guild_id: int) -> tuple[bool, str]:
         """Validate if user has the correct role for the specified party"""
-        col, config = self._get_parties_config(guild_id)
+        col, config = await self._get_parties_config(guild_id)
         role_validation = config.get("role_validation", {})
 
         # If no role validation configured, allow all
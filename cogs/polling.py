@@ -4,7 +4,12 @@ from discord import app_commands
 from datetime import datetime
 import random
 from typing import Optional, List
-from .ideology import STATE_DATA
+from .ideology import get_ideology_store
+from cogs.candidates import get_candidate_registry
+from cogs.geography import CODE_TO_STATE
+from cogs.polling_engine import floor_redistribution, seat_baselines
+from cogs.seat_polling import get_seat_polling
+from cogs.time_manager import get_rp_clock
 
 class Polling(commands.Cog):
     def __init__(self, bot):
@@ -18,327 +23,98 @@ class Polling(commands.Cog):
     poll_manage_group = app_commands.Group(name="manage", description="Poll management commands", parent=poll_group, default_permissions=discord.Permissions(administrator=True))
 
 
-    def _get_signups_config(self, guild_id: int):
+    async def _get_signups_config(self, guild_id: int):
         """Get signups configuration"""
         col = self.bot.db["signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_winners_config(self, guild_id: int):
+    async def _get_winners_config(self, guild_id: int):
         """Get winners configuration"""
         col = self.bot.db["winners"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_user_candidate(self, guild_id: int, user_id: int):
+    async def _get_user_candidate(self, guild_id: int, user_id: int):
         """Get user's candidate information based on current phase"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
-        if current_phase == "General Campaign":
-            # Look in winners collection for general campaign
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if not winners_config:
-                return None, None
-
-            # For general campaign, look for primary winners from the current election year
-            for winner in winners_config["winners"]:
-                if (winner["user_id"] == user_id and
-                    winner.get("primary_winner", False) and
-                    winner["year"] == current_year):
-                    return winners_col, winner
-
-            return winners_col, None
-
-        else:
-            # Look in signups collection for primary campaign
-            signups_col, signups_config = self._get_signups_config(guild_id)
-
-            if not signups_config:
-                return None, None
-
-            for candidate in signups_config["candidates"]:
-                if candidate["user_id"] == user_id and candidate["year"] == current_year:
-                    return signups_col, candidate
-
-            return signups_col, None
+        time_col, time_config = await self._get_time_config(guild_id)
+        col, candidate = await get_candidate_registry(self.bot).resolve(
+            guild_id, time_config, user_id=user_id, sources=("winners", "signups")
+        )
+        return col or self.bot.db["signups"], candidate
 
-    def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
+    async def _get_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get candidate by name based on current phase"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
-        if current_phase == "General Campaign":
-            # First check presidential signups directly for presidential candidates
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-
-            if pres_signups_config:
-                # Try multiple signup years to be safe
-                possible_years = [current_year, current_year - 1, current_year - 2]
-
-                for signup_year in possible_years:
-                    for candidate in pres_signups_config.get("candidates", []):
-                        if (candidate["name"].lower() == candidate_name.lower() and 
-                            candidate["year"] == signup_year and
-                            candidate["office"] == "President"):
-                            return pres_signups_col, candidate
-
-            # Also check presidential winners collection
-            pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": guild_id})
-
-            if pres_winners_config:
-                winners_data = pres_winners_config.get("winners", {})
-                if isinstance(winners_data, dict):
-                    # Check if this candidate is a primary winner
-                    for party, winner_name in winners_data.items():
-                        if isinstance(winner_name, str) and winner_name.lower() == candidate_name.lower():
-                            # Get full candidate data from presidential signups
-                            if pres_signups_config:
-                                election_year = pres_winners_config.get("election_year", current_year)
-                                signup_year = election_year - 1 if election_year % 2 == 0 else election_year
-
-                                for candidate in pres_signups_config.get("candidates", []):
-                                    if (candidate["name"].lower() == candidate_name.lower() and 
-                                        candidate["year"] == signup_year and
-                                        candidate["office"] == "President"):
-                                        return pres_signups_col, candidate
-
-            # If not presidential, look in regular winners collection
-            winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": guild_id})
-
-            if winners_config:
-                # Primary winners are stored with the election year (current year during General Campaign)
-                for winner in winners_config["winners"]:
-                    if (winner.get("candidate", "").lower() == candidate_name.lower() and
-                        winner.get("primary_winner", False) and
-                        winner["year"] == current_year):
-                        return winners_col, winner
-
-            return None, None
-        else:
-            # Look in signups collection for primary campaign (including presidential)
-            signups_col, signups_config = self._get_signups_config(guild_id)
-            if signups_config:
-                for candidate in signups_config["candidates"]:
-                    if candidate["name"].lower() == candidate_name.lower() and candidate["year"] == current_year:
-                        return signups_col, candidate
-
-            # Also check presidential signups
-            pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
-            if pres_signups_config:
-                for candidate in pres_signups_config.get("candidates", []):
-                    if (candidate["name"].lower() == candidate_name.lower() and 
-                        candidate["year"] == current_year):
-                        return pres_signups_col, candidate
-
-            return None, None
+        time_col, time_config = await self._get_time_config(guild_id)
+        return await get_candidate_registry(self.bot).resolve(
+            guild_id, time_config, name=candidate_name,
+            sources=("winners", "presidential_winners", "signups", "presidential_signups")
+        )
 
-    def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
+    async def _calculate_zero_sum_percentages(self, guild_id: int, seat_id: str):
         """Calculate zero-sum redistribution percentages for general election candidates"""
-        # Get general election candidates (primary winners) for this seat
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
-
-        if not winners_config:
-            return {}
+        percentages = await self._calculate_all_zero_sum_percentages(guild_id, [seat_id])
+        return percentages.get(seat_id, {})
+
+    async def _calculate_all_zero_sum_percentages(self, guild_id: int, seat_ids: list) -> dict:
+        """Zero-sum percentages of several seats at once, as {seat_id: {candidate: percentage}}"""
+        time_col, time_config = await self._get_time_config(guild_id)
+        return await get_seat_polling(self.bot).percentages(
+            guild_id, seat_ids, time_config, self._compute_zero_sum_percentages
+        )
 
-        # Get current year
-        time_col, time_config = self._get_time_config(guild_id)
+    async def _compute_zero_sum_percentages(self, guild_id: int, seat_ids: list, time_config) -> dict:
+        """Recompute seats for the seat polling view, as {seat_id: (percentages, uses_momentum)}"""
         current_year = time_config["current_rp_date"].year if time_config else 2024
         current_phase = time_config.get("current_phase", "") if time_config else ""
 
-        # Find all primary winners (general election candidates) for this seat
-        # For general campaign, look for primary winners from the current election year
-        seat_candidates = [
-            w for w in winners_config["winners"]
-            if w["seat_id"] == seat_id and w["year"] == current_year and w.get("primary_winner", False)
-        ]
-
-        # If no primary winners found, fall back to all candidates for this seat in the current year
-        if not seat_candidates:
-            seat_candidates = [
-                w for w in winners_config["winners"]
-                if w["seat_id"] == seat_id and w["year"] == current_year
-            ]
-
-        if not seat_candidates:
+        # General election candidates are this year's primary winners of each seat,
+        # or every candidate of the seat this year if none has won a primary yet
+        winners_col = self.bot.db["winners"]
+        year_candidates = await winners_col.find_candidates(
+            {"guild_id": guild_id, "year": current_year, "seat_id": {"$in": list(seat_ids)}}
+        )
+        seats = {}
+        for seat_id in seat_ids:
+            seat_candidates = [w for w in year_candidates if w["seat_id"] == seat_id]
+            primary_winners = [w for w in seat_candidates if w.get("primary_winner", False)]
+            if primary_winners or seat_candidates:
+                seats[seat_id] = primary_winners or seat_candidates
+
+        if not seats:
             return {}
 
-        # Get momentum effects if in General Campaign phase and this is a presidential race
-        momentum_effects = {}
-        if (current_phase == "General Campaign" and
-            any(c.get("office") in ["President", "Vice President"] for c in seat_candidates)):
-            momentum_effects = self._get_momentum_effects_for_candidates(guild_id, seat_candidates)
-
-        # Get state name from seat_id for momentum calculation
-        state_name = self._extract_state_from_seat_id(seat_id)
-
-        # Determine baseline percentages based on number of candidates and parties
-        num_candidates = len(seat_candidates)
-        parties = set(candidate["party"] for candidate in seat_candidates)
-        num_parties = len(parties)
-
-        # Count major parties (Democrat and Republican)
-        major_parties = {"Democrat", "Republican", "Democratic Party", "Republican Party"}
-        major_parties_present = len([p for p in parties if p in major_parties])
-        
-        # Check if we have the standard 3-party setup: Republican + Democratic + Independent
-        has_republican = any("Republican" in party for party in parties)
-        has_democratic = any("Democratic" in party for party in parties)
-        has_independent = any("Independent" in party for party in parties)
-        is_standard_three_way = has_republican and has_democratic and has_independent and num_parties == 3
-
-        # Set baseline percentages based on number of parties
-        baseline_percentages = {}
-
-        if num_parties == 2:
-            # Two parties: 50-50 split
-            for candidate in seat_candidates:
-                baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 50.0
-        elif num_parties == 3:
-            # Three parties: 40-40-20 (if Dem+Rep+other) or equal split
-            if major_parties_present == 2 or is_standard_three_way:
-                for candidate in seat_candidates:
-                    if candidate["party"] in major_parties or "Republican" in candidate["party"] or "Democratic" in candidate["party"]:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 40.0
-                    else:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 20.0
-            else:
-                # Equal split if not standard Dem-Rep-other
-                for candidate in seat_candidates:
-                    baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 100.0 / 3
-        elif num_parties == 4:
-            # Four parties: 40-40-10-10 (if Dem+Rep+two others) or equal split
-            if major_parties_present == 2:
-                for candidate in seat_candidates:
-                    if candidate["party"] in major_parties:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 40.0
-                    else:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 10.0
-            else:
-                # Equal split if not standard setup
-                for candidate in seat_candidates:
-                    baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 25.0
-        else:
-            # 5+ parties: prioritize taking from other/independents
-            if major_parties_present == 2:
-                # Democrat + Republican + multiple others: 40-40 for major, split remainder among others
-                remaining_percentage = 20.0  # 100 - 40 - 40
-                other_parties_count = num_parties - 2
-                other_party_percentage = remaining_percentage / other_parties_count if other_parties_count > 0 else 0
-
-                for candidate in seat_candidates:
-                    if candidate["party"] in major_parties:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 40.0
-                    else:
-                        baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = other_party_percentage
-            else:
-                # No standard major party setup, split evenly
-                for candidate in seat_candidates:
-                    baseline_percentages[candidate.get('candidate', candidate.get('name', ''))] = 100.0 / num_candidates
-
-        # Apply proportional redistribution with minimum floors
-        final_percentages = {}
-
-        # Define minimum percentage floors
-        def get_minimum_floor(candidate):
-            party = candidate.get('party', '').lower()
-            if any(keyword in party for keyword in ['democrat', 'republican']):
-                return 25.0  # 25% minimum for major parties
-            else:
-                return 2.0   # 2% minimum for independents/third parties
-
-        # Calculate total campaign points across all candidates in this seat
-        total_campaign_points = sum(candidate.get('points', 0.0) for candidate in seat_candidates)
-
-        # Start with baseline percentages
-        current_percentages = baseline_percentages.copy()
+        # Momentum moves presidential races during the General Campaign
+        momentum = []
+        uses_momentum = []
+        for seat_candidates in seats.values():
+            momentum_effects = {}
+            presidential = (current_phase == "General Campaign" and
+                            any(c.get("office") in ["President", "Vice President"] for c in seat_candidates))
+            if presidential:
+                momentum_effects = await self._get_momentum_effects_for_candidates(guild_id, seat_candidates)
+            momentum.append(momentum_effects)
+            uses_momentum.append(presidential)
+
+        percentages = floor_redistribution(
+            list(seats.values()), seat_baselines,
+            name=lambda candidate: candidate.get('candidate', candidate.get('name', '')),
+            points=lambda candidate: candidate.get('points', 0.0),
+            momentum=momentum
+        )
+        return dict(zip(seats, zip(percentages, uses_momentum)))
 
-        # Apply campaign effects using proportional redistribution
-        if total_campaign_points > 0:
-            for candidate in seat_candidates:
-                candidate_name = candidate.get('candidate', candidate.get('name', ''))
-                candidate_points = candidate.get('points', 0.0)
-
-                if candidate_points > 0:
-                    # This candidate gains points
-                    points_gained = candidate_points
-
-                    # Calculate total percentage that can be taken from other candidates
-                    total_available_to_take = 0.0
-                    for other_candidate in seat_candidates:
-                        if other_candidate != candidate:
-                            other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                            other_current = current_percentages[other_name]
-                            other_minimum = get_minimum_floor(other_candidate)
-                            available = max(0, other_current - other_minimum)
-                            total_available_to_take += available
-
-                    # Limit gains to what's actually available
-                    actual_gain = min(points_gained, total_available_to_take)
-                    current_percentages[candidate_name] += actual_gain
-
-                    # Distribute losses proportionally among other candidates
-                    if total_available_to_take > 0:
-                        for other_candidate in seat_candidates:
-                            if other_candidate != candidate:
-                                other_name = other_candidate.get('candidate', other_candidate.get('name', ''))
-                                other_current = current_percentages[other_name]
-                                other_minimum = get_minimum_floor(other_candidate)
-                                available = max(0, other_current - other_minimum)
-
-                                if available > 0:
-                                    proportional_loss = (available / total_available_to_take) * actual_gain
-                                    current_percentages[other_name] -= proportional_loss
-
-        # Apply momentum effects if available
-        for candidate in seat_candidates:
-            candidate_name = candidate.get('candidate', candidate.get('name', ''))
-            momentum_effect = momentum_effects.get(candidate_name, 0.0)
-            current_percentages[candidate_name] += momentum_effect
-
-        # Ensure minimum floors are respected
-        for candidate in seat_candidates:
-            candidate_name = candidate.get('candidate', candidate.get('name', ''))
-            minimum_floor = get_minimum_floor(candidate)
-            current_percentages[candidate_name] = max(current_percentages[candidate_name], minimum_floor)
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(current_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in current_percentages:
-                current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(current_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage instead of equal distribution
-            largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-            adjustment = 100.0 - final_total
-            current_percentages[largest_candidate] += adjustment
-
-        final_percentages = current_percentages
-        return final_percentages
-
-    def _get_momentum_effects_for_candidates(self, guild_id: int, candidates: list) -> dict:
+    async def _get_momentum_effects_for_candidates(self, guild_id: int, candidates: list) -> dict:
         """Get momentum effects for presidential candidates"""
         try:
             momentum_col = self.bot.db["momentum_config"]
-            momentum_config = momentum_col.find_one({"guild_id": guild_id})
+            momentum_config = await momentum_col.find_one({"guild_id": guild_id}, {"momentum_events": 0})
 
             if not momentum_config:
                 return {}
@@ -395,26 +171,7 @@ class Polling(commands.Cog):
         if len(parts) >= 2:
             state_code = parts[1]
             # Map state codes to full names if needed
-            state_code_to_name = {
-                "CA": "CALIFORNIA", "TX": "TEXAS", "NY": "NEW YORK",
-                "FL": "FLORIDA", "PA": "PENNSYLVANIA", "IL": "ILLINOIS",
-                "OH": "OHIO", "GA": "GEORGIA", "NC": "NORTH CAROLINA",
-                "MI": "MICHIGAN", "NJ": "NEW JERSEY", "VA": "VIRGINIA",
-                "WA": "WASHINGTON", "AZ": "ARIZONA", "MA": "MASSACHUSETTS",
-                "TN": "TENNESSEE", "IN": "INDIANA", "MO": "MISSOURI",
-                "MD": "MARYLAND", "WI": "WISCONSIN", "CO": "COLORADO",
-                "MN": "MINNESOTA", "SC": "SOUTH CAROLINA", "AL": "ALABAMA",
-                "LA": "LOUISIANA", "KY": "KENTUCKY", "OR": "OREGON",
-                "OK": "OKLAHOMA", "CT": "CONNECTICUT", "IA": "IOWA",
-                "MS": "MISSISSIPPI", "AR": "ARKANSAS", "KS": "KANSAS",
-                "UT": "UTAH", "NV": "NEVADA", "NM": "NEW MEXICO",
-                "WV": "WEST VIRGINIA", "NE": "NEBRASKA", "ID": "IDAHO",
-                "HI": "HAWAII", "ME": "MAINE", "NH": "NEW HAMPSHIRE",
-                "RI": "RHODE ISLAND", "MT": "MONTANA", "DE": "DELAWARE",
-                "SD": "SOUTH DAKOTA", "ND": "NORTH DAKOTA", "AK": "ALASKA",
-                "VT": "VERMONT", "WY": "WYOMING"
-            }
-            return state_code_to_name.get(state_code, state_code)
+            return CODE_TO_STATE.get(state_code, state_code)
 
         return "UNKNOWN"
 
@@ -450,7 +207,7 @@ class Polling(commands.Cog):
     @app_commands.describe(candidate_name="The candidate to poll (leave blank to poll yourself)")
     async def poll(self, interaction: discord.Interaction, candidate_name: Optional[str] = None):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -462,7 +219,7 @@ class Polling(commands.Cog):
 
         # If no candidate specified, check if user is a candidate
         if not candidate_name:
-            signups_col, candidate = self._get_user_candidate(interaction.guild.id, interaction.user.id)
+            signups_col, candidate = await self._get_user_candidate(interaction.guild.id, interaction.user.id)
             if not candidate:
                 await interaction.response.send_message(
                     "❌ You must specify a candidate name or be a registered candidate yourself.",
@@ -472,7 +229,7 @@ class Polling(commands.Cog):
             candidate_name = candidate.get('candidate') or candidate.get('name')
 
         # Get the candidate
-        signups_col, candidate = self._get_candidate_by_name(interaction.guild.id, candidate_name)
+        signups_col, candidate = await self._get_candidate_by_name(interaction.guild.id, candidate_name)
         if not candidate:
             await interaction.response.send_message(
                 f"❌ Candidate '{candidate_name}' not found.",
@@ -485,13 +242,13 @@ class Polling(commands.Cog):
 
         if current_phase == "General Campaign":
             # For general campaign, use zero-sum percentages
-            zero_sum_percentages = self._calculate_zero_sum_percentages(interaction.guild.id, candidate["seat_id"])
+            zero_sum_percentages = await self._calculate_zero_sum_percentages(interaction.guild.id, candidate["seat_id"])
             actual_percentage = zero_sum_percentages.get(candidate_display_name, 50.0)
         else:
             # For primary campaign, calculate based on points relative to competition
             # Get all candidates for same seat and party
             if current_phase == "Primary Campaign":
-                signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+                signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
                 if signups_config:
                     current_year = time_config["current_rp_date"].year
                     seat_party_candidates = [
@@ -583,7 +340,7 @@ class Polling(commands.Cog):
         # Add context based on phase
         if current_phase == "Primary Campaign":
             # Show primary competition context
-            signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
             if signups_config:
                 current_year = time_config["current_rp_date"].year
                 primary_competitors = [
@@ -601,7 +358,7 @@ class Polling(commands.Cog):
                     )
         else:
             # Show general election context
-            zero_sum_percentages = self._calculate_zero_sum_percentages(interaction.guild.id, candidate["seat_id"])
+            zero_sum_percentages = await self._calculate_zero_sum_percentages(interaction.guild.id, candidate["seat_id"])
             if len(zero_sum_percentages) > 1:
                 embed.add_field(
                     name="🔍 General Election Context",
@@ -626,7 +383,7 @@ class Polling(commands.Cog):
     @app_commands.describe(state="The state to poll (e.g., 'California', 'NY')")
     async def state_poll(self, interaction: discord.Interaction, state: str):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -637,8 +394,9 @@ class Polling(commands.Cog):
         current_phase = time_config.get("current_phase", "")
         current_year = time_config["current_rp_date"].year
 
-        # Use STATE_DATA to get base percentages for Republican, Democrat, and Independent
-        state_info = STATE_DATA.get(state.upper())  # STATE_DATA uses uppercase keys
+        # Use this server's STATE_DATA (with its election shifts) for Republican, Democrat, and Independent
+        state_data = await get_ideology_store(self.bot).guild(interaction.guild.id)
+        state_info = state_data.get(state.upper())  # STATE_DATA uses uppercase keys
 
         if not state_info:
             await interaction.response.send_message(
@@ -728,7 +486,7 @@ class Polling(commands.Cog):
     )
     async def private_seat_poll(self, interaction: discord.Interaction, seat_id: str, candidate_name: Optional[str] = None):
         # Check if user is a candidate
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -743,7 +501,7 @@ class Polling(commands.Cog):
         user_candidate = None
 
         # Check in signups
-        signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+        signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
         if signups_config:
             for candidate in signups_config["candidates"]:
                 if candidate["user_id"] == interaction.user.id and candidate["year"] == current_year:
@@ -753,7 +511,7 @@ class Polling(commands.Cog):
         # Check in winners if general campaign
         if not user_candidate and current_phase == "General Campaign":
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if winners_config:
                 # Primary winners are stored with the election year (current year during General Campaign)
                 for winner in winners_config["winners"]:
@@ -766,7 +524,7 @@ class Polling(commands.Cog):
         # Check in presidential signups
         if not user_candidate:
             pres_col = self.bot.db["presidential_signups"]
-            pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+            pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
             if pres_config:
                 for candidate in pres_config.get("candidates", []):
                     if (candidate["user_id"] == interaction.user.id and
@@ -795,18 +553,18 @@ class Polling(commands.Cog):
             for i, candidate in enumerate(signups_config["candidates"]):
                 if candidate["user_id"] == interaction.user.id and candidate["year"] == current_year:
                     signups_config["candidates"][i]["stamina"] = max(0, current_stamina - 1)
-                    signups_col.update_one(
+                    await signups_col.update_one(
                         {"guild_id": interaction.guild.id},
                         {"$set": {"candidates": signups_config["candidates"]}}
                     )
                     break
         elif current_phase == "General Campaign" and "winners" in locals():
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": interaction.user.id},
                 {"$inc": {"winners.$.stamina": -1}}
             )
         elif "pres_config" in locals():
-            pres_col.update_one(
+            await pres_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": interaction.user.id},
                 {"$inc": {"candidates.$.stamina": -1}}
             )
@@ -823,7 +581,7 @@ class Polling(commands.Cog):
 
         if current_phase == "General Campaign":
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if winners_config:
                 # Primary winners are stored with the election year (current year during General Campaign)
                 seat_candidates = [
@@ -859,7 +617,7 @@ class Polling(commands.Cog):
         poll_results = []
 
         if current_phase == "General Campaign":
-            zero_sum_percentages = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
+            zero_sum_percentages = await self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
             for candidate in seat_candidates:
                 candidate_name = candidate.get('candidate') or candidate.get('name')
                 actual_percentage = zero_sum_percentages.get(candidate_name, 50.0)
@@ -1026,7 +784,7 @@ class Polling(commands.Cog):
     )
     async def media_seat_poll(self, interaction: discord.Interaction, seat_id: str, candidate_name: Optional[str] = None):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -1043,7 +801,7 @@ class Polling(commands.Cog):
 
         if current_phase == "General Campaign":
             winners_col = self.bot.db["winners"]
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if winners_config:
                 # Primary winners are stored with the election year (current year during General Campaign)
                 seat_candidates = [
@@ -1053,7 +811,7 @@ class Polling(commands.Cog):
                         w["year"] == current_year)
                 ]
         else:
-            signups_col, signups_config = self._get_signups_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_signups_config(interaction.guild.id)
             if signups_config:
                 seat_candidates = [
                     c for c in signups_config["candidates"]
@@ -1080,7 +838,7 @@ class Polling(commands.Cog):
         poll_results = []
 
         if current_phase == "General Campaign":
-            zero_sum_percentages = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
+            zero_sum_percentages = await self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
             for candidate in seat_candidates:
                 candidate_name = candidate.get('candidate') or candidate.get('name')
                 actual_percentage = zero_sum_percentages.get(candidate_name, 50.0)
@@ -1197,10 +955,6 @@ class Polling(commands.Cog):
                 party_abbrev = result['candidate']['party'][0] if result['candidate']['party'] else "I"
                 progress_bar = create_progress_bar(result['poll'])
 
-                # Lookup actual percentage from zero-sum calculation for consistency with admin view
-                zero_sum_percentages = self._calculate_zero_sum_percentages(interaction.guild.id, seat_id)
-                actual_percentage = zero_sum_percentages.get(result['name'], 50.0)
-
                 results_text += f"**{i}. {highlight}{result['name']}**\n"
                 results_text += f"**{party_abbrev} - {result['candidate']['party']}**\n"
                 results_text += f"{progress_bar} **{result['poll']:.1f}%**\n\n"
@@ -1283,7 +1037,7 @@ class Polling(commands.Cog):
             return
 
         # Check if user is a candidate
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -1299,7 +1053,7 @@ class Polling(commands.Cog):
 
         # Check in presidential signups
         pres_col = self.bot.db["presidential_signups"]
-        pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+        pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
         if pres_config:
             for candidate in pres_config.get("candidates", []):
                 if (candidate["user_id"] == interaction.user.id and
@@ -1314,7 +1068,7 @@ class Polling(commands.Cog):
 
         # Check in winners if general campaign
         if not user_candidate and current_phase == "General Campaign":
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if winners_config:
                 # Primary winners are stored with the election year (current year during General Campaign)
                 for winner in winners_config["winners"]:
@@ -1343,12 +1097,12 @@ class Polling(commands.Cog):
 
         # Deduct stamina
         if current_phase == "General Campaign" and winners_config:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": interaction.user.id},
                 {"$inc": {"winners.$.stamina": -1}}
             )
         else:
-            pres_col.update_one(
+            await pres_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": interaction.user.id},
                 {"$inc": {"candidates.$.stamina": -1}}
             )
@@ -1360,7 +1114,7 @@ class Polling(commands.Cog):
         if current_phase == "General Campaign":
             # Get presidential winners from presidential_winners collection
             pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
+            pres_winners_config = await pres_winners_col.find_one({"guild_id": interaction.guild.id})
 
             if pres_winners_config and pres_winners_config.get("winners"):
                 party_winners = pres_winners_config.get("winners", [])
@@ -1445,7 +1199,7 @@ class Polling(commands.Cog):
 
             # Get momentum config
             momentum_col = self.bot.db["momentum_config"]
-            momentum_config = momentum_col.find_one({"guild_id": interaction.guild.id})
+            momentum_config = await momentum_col.find_one({"guild_id": interaction.guild.id}, {"momentum_events": 0})
             if not momentum_config:
                 momentum_config = {}
 
@@ -1657,7 +1411,7 @@ class Polling(commands.Cog):
             return
 
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -1675,7 +1429,7 @@ class Polling(commands.Cog):
         if current_phase == "General Campaign":
             # Check if presidential_winners collection has an election_year that matches target_year
             pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
+            pres_winners_config = await pres_winners_col.find_one({"guild_id": interaction.guild.id})
 
             if pres_winners_config and pres_winners_config.get("winners"):
                 party_winners = pres_winners_config.get("winners", [])
@@ -1689,7 +1443,7 @@ class Polling(commands.Cog):
                     signup_year = current_year - 1 if current_year % 2 == 0 else current_year
 
                 pres_col = self.bot.db["presidential_signups"]
-                pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
 
                 if pres_config:
                     for party, winner_name in party_winners.items():
@@ -1707,7 +1461,7 @@ class Polling(commands.Cog):
             # If no winners from presidential_winners, check all_winners system as fallback
             if not pres_candidates:
                 winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+                winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
                 if winners_config and winners_config.get("winners"):
                     # Find presidential primary winners in all_winners system
@@ -1721,7 +1475,7 @@ class Polling(commands.Cog):
 
                     # Get full candidate data from presidential signups
                     pres_col = self.bot.db["presidential_signups"]
-                    pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                    pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
 
                     if pres_config and presidential_winners:
                         for winner in presidential_winners:
@@ -1741,7 +1495,7 @@ class Polling(commands.Cog):
                 fallback_signup_year = signup_year if 'signup_year' in locals() else (current_year - 1 if current_year % 2 == 0 else current_year)
 
                 pres_col = self.bot.db["presidential_signups"]
-                pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
 
                 if pres_config:
                     pres_candidates = [
@@ -1751,7 +1505,7 @@ class Polling(commands.Cog):
         else:
             # Look in presidential signups for primary campaign
             pres_col = self.bot.db["presidential_signups"]
-            pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+            pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
             if pres_config:
                 pres_candidates = [
                     c for c in pres_config.get("candidates", [])
@@ -1785,7 +1539,7 @@ class Polling(commands.Cog):
 
             # Get momentum config
             momentum_col = self.bot.db["momentum_config"]
-            momentum_config = momentum_col.find_one({"guild_id": interaction.guild.id})
+            momentum_config = await momentum_col.find_one({"guild_id": interaction.guild.id}, {"momentum_events": 0})
             if not momentum_config:
                 momentum_config = {}
 
@@ -1991,7 +1745,7 @@ class Polling(commands.Cog):
             return
 
         # Check if user is a candidate
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -2007,7 +1761,7 @@ class Polling(commands.Cog):
 
         # Check in presidential signups
         pres_col = self.bot.db["presidential_signups"]
-        pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+        pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
         if pres_config:
             for candidate in pres_config.get("candidates", []):
                 if (candidate["user_id"] == interaction.user.id and
@@ -2022,7 +1776,7 @@ class Polling(commands.Cog):
 
         # Check in winners if general campaign
         if not user_candidate and current_phase == "General Campaign":
-            winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+            winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
             if winners_config:
                 # Primary winners are stored with the election year (current year during General Campaign)
                 for winner in winners_config["winners"]:
@@ -2051,12 +1805,12 @@ class Polling(commands.Cog):
 
         # Deduct stamina
         if current_phase == "General Campaign" and winners_config:
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": interaction.user.id},
                 {"$inc": {"winners.$.stamina": -1}}
             )
         else:
-            pres_col.update_one(
+            await pres_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": interaction.user.id},
                 {"$inc": {"candidates.$.stamina": -1}}
             )
@@ -2068,7 +1822,7 @@ class Polling(commands.Cog):
         if current_phase == "General Campaign":
             # Get presidential winners from presidential_winners collection
             pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
+            pres_winners_config = await pres_winners_col.find_one({"guild_id": interaction.guild.id})
 
             if pres_winners_config and pres_winners_config.get("winners"):
                 party_winners = pres_winners_config.get("winners", [])
@@ -2153,7 +1907,7 @@ class Polling(commands.Cog):
 
             # Get momentum config
             momentum_col = self.bot.db["momentum_config"]
-            momentum_config = momentum_col.find_one({"guild_id": interaction.guild.id})
+            momentum_config = await momentum_col.find_one({"guild_id": interaction.guild.id}, {"momentum_events": 0})
             if not momentum_config:
                 momentum_config = {}
 
@@ -2355,7 +2109,7 @@ class Polling(commands.Cog):
         """Get presidential candidate choices for autocomplete"""
         try:
             # Get time config for current year/phase context
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
 
             if not time_config:
                 return []
@@ -2367,7 +2121,7 @@ class Polling(commands.Cog):
             if current_phase == "General Campaign":
                 # Check presidential_winners collection first
                 pres_col = self.bot.db["presidential_winners"]
-                pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
 
                 if pres_config:
                     winners_data = pres_config.get("winners", [])
@@ -2386,7 +2140,7 @@ class Polling(commands.Cog):
                 # Fallback to all_winners if no candidates found
                 if not candidate_names:
                     winners_col = self.bot.db["winners"]
-                    winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+                    winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
                     if winners_config:
                         # Primary winners are stored with the election year (current year during General Campaign)
                         for winner in winners_config.get("winners", []):
@@ -2397,7 +2151,7 @@ class Polling(commands.Cog):
             else:
                 # For primary campaign, show all registered candidates
                 pres_col = self.bot.db["presidential_signups"]
-                pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
                 if pres_config:
                     for candidate in pres_config.get("candidates", []):
                         if (candidate.get("year") == current_year and
@@ -2432,7 +2186,7 @@ class Polling(commands.Cog):
         """Get presidential candidate choices for autocomplete"""
         try:
             # Get time config for current year/phase context
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
 
             if not time_config:
                 return []
@@ -2444,7 +2198,7 @@ class Polling(commands.Cog):
             if current_phase == "General Campaign":
                 # First check winners collection for primary winners
                 winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+                winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
                 if winners_config:
                     # Primary winners are stored with the election year (current year during General Campaign)
                     for winner in winners_config.get("winners", []):
@@ -2456,7 +2210,7 @@ class Polling(commands.Cog):
                 # If no candidates found, try presidential_winners collection
                 if not candidate_names:
                     pres_col = self.bot.db["presidential_winners"]
-                    pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                    pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
                     if pres_config:
                         winners_data = pres_config.get("winners", [])
 
@@ -2472,7 +2226,7 @@ class Polling(commands.Cog):
             else:
                 # For primary campaign, show all registered candidates
                 pres_col = self.bot.db["presidential_signups"]
-                pres_config = pres_col.find_one({"guild_id": interaction.guild.id})
+                pres_config = await pres_col.find_one({"guild_id": interaction.guild.id})
                 if pres_config:
                     for candidate in pres_config.get("candidates", []):
                         if (candidate.get("year") == current_year and
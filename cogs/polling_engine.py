@@ -0,0 +1,324 @@
+"""Zero-sum polling engine shared by the polling, campaign and winners cogs.
+
+A seat's poll starts from party baselines and moves with campaign points so
+that the candidates always add up to 100%. Two models are in use:
+
+- floor redistribution (general polls, campaign actions, presidential
+  tickets): each candidate with points takes them from the others in
+  proportion to how far each one sits above its floor (25% for the major
+  parties, 2% otherwise)
+- baseline redistribution (winners tables): Final_i = b_i + a_i - (b_i / 100) * s,
+  where a_i is a candidate's points less a corruption penalty and s the sum
+  of every a_i
+
+Every seat of a guild is handled at once: candidates are packed into
+(seats x candidates) arrays padded to the largest seat, and each step is a
+NumPy operation over all seats. Redistribution still visits the candidate
+slots in order, as the effect of one candidate's gains feeds the next.
+Baseline rules differ between the cogs and are kept here side by side so
+each cog keeps its numbers.
+
+National presidential polling averages each candidate's state-by-state
+support by population. The state weights are a fixed vector and the party
+baselines of every state a matrix built once from the state data, both in
+the state ID order of the geography module, so the
+national numbers of all candidates come from one clipped matrix-vector
+product.
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+
+from cogs.geography import POPULATION_WEIGHTS, STATE_IDS, STATES
+
+# Minimum share a candidate keeps while others gain on them
+MAJOR_PARTY_FLOOR = 25.0
+MINOR_PARTY_FLOOR = 2.0
+
+# Share no candidate drops below under baseline redistribution
+BASELINE_MINIMUM = 0.1
+
+# Total a seat's percentages must be within before the largest one absorbs the rounding error
+NORMALIZATION_TOLERANCE = 0.001
+
+def party_floor(party: str) -> float:
+    """Floor of a candidate's share under floor redistribution"""
+    party = (party or "").lower()
+    if "democrat" in party or "republican" in party:
+        return MAJOR_PARTY_FLOOR
+    return MINOR_PARTY_FLOOR
+
+# ---- Baseline rules ------------------------------------------------------
+
+def _is_standard_three_way(parties) -> bool:
+    return (len(parties) == 3
+            and any("Republican" in party for party in parties)
+            and any("Democratic" in party for party in parties)
+            and any("Independent" in party for party in parties))
+
+def seat_baselines(candidates: list) -> list:
+    """Baselines of a general election seat by number of parties (40-40-20, 40-40-10-10, ...)"""
+    parties = set(candidate["party"] for candidate in candidates)
+    num_parties = len(parties)
+    major_parties = {"Democrat", "Republican", "Democratic Party", "Republican Party"}
+    major_parties_present = len([party for party in parties if party in major_parties])
+
+    def is_major(party):
+        return party in major_parties or "Republican" in party or "Democratic" in party
+
+    if num_parties == 2:
+        return [50.0 for _ in candidates]
+    if num_parties == 3:
+        if major_parties_present == 2 or _is_standard_three_way(parties):
+            return [40.0 if is_major(candidate["party"]) else 20.0 for candidate in candidates]
+        return [100.0 / 3 for _ in candidates]
+    if num_parties == 4:
+        if major_parties_present == 2:
+            return [40.0 if candidate["party"] in major_parties else 10.0 for candidate in candidates]
+        return [25.0 for _ in candidates]
+    if major_parties_present == 2:
+        other_party_percentage = 20.0 / (num_parties - 2)
+        return [40.0 if candidate["party"] in major_parties else other_party_percentage for candidate in candidates]
+    return [100.0 / len(candidates) for _ in candidates]
+
+def campaign_baselines(candidates: list) -> list:
+    """Baselines used by general campaign actions: 50-50, or 40-40 with the rest split"""
+    major_parties = ["Democratic", "Republican", "Democratic Party", "Republican Party"]
+    parties = set(candidate.get("party", "") for candidate in candidates)
+    major_parties_present = [party for party in major_parties if party in parties]
+
+    if len(major_parties_present) == 2 or _is_standard_three_way(parties):
+        if len(parties) == 2:
+            return [50.0 for _ in candidates]
+        other_parties_count = len(parties) - 2
+        other_party_percentage = 20.0 / other_parties_count if other_parties_count > 0 else 0
+        baselines = []
+        for candidate in candidates:
+            party = candidate.get("party", "")
+            is_major = party in major_parties or "Republican" in party or "Democratic" in party
+            baselines.append(40.0 if is_major else other_party_percentage)
+        return baselines
+    return [100.0 / len(candidates) for _ in candidates]
+
+def presidential_baselines(candidates: list) -> list:
+    """Baselines of a presidential ticket race, recognising the major parties by keyword"""
+    def is_major(candidate):
+        party = candidate["party"].lower()
+        return "democrat" in party or "republican" in party
+
+    major_parties = set()
+    for candidate in candidates:
+        party = candidate["party"].lower()
+        if "democrat" in party:
+            major_parties.add("Democrat")
+        elif "republican" in party:
+            major_parties.add("Republican")
+
+    if len(major_parties) == 2 and len(candidates) == 2:
+        return [50.0 for _ in candidates]
+    if len(major_parties) == 2 and len(candidates) > 2:
+        other_party_percentage = 20.0 / (len(candidates) - 2)
+        return [40.0 if is_major(candidate) else other_party_percentage for candidate in candidates]
+    return [100.0 / len(candidates) for _ in candidates]
+
+def party_baselines(candidates: list) -> list:
+    """Baselines shared by every candidate of a party, as used by the winners tables"""
+    parties = list(dict.fromkeys(candidate["party"] for candidate in candidates))
+    num_parties = len(parties)
+    major_parties = ["Republican Party", "Democratic Party"]
+    major_parties_present = sum(1 for party in parties if party in major_parties)
+
+    if num_parties == 2:
+        by_party = {party: 50.0 for party in parties}
+    elif num_parties == 3:
+        if major_parties_present == 2 or _is_standard_three_way(parties):
+            by_party = {
+                party: 40.0 if party in major_parties or "Republican" in party or "Democratic" in party else 20.0
+                for party in parties
+            }
+        else:
+            by_party = {party: 100.0 / 3 for party in parties}
+    elif num_parties == 4:
+        if major_parties_present == 2:
+            by_party = {party: 40.0 if party in major_parties else 10.0 for party in parties}
+        else:
+            by_party = {party: 25.0 for party in parties}
+    else:
+        by_party = {party: 100.0 / num_parties for party in parties}
+    return [by_party[candidate["party"]] for candidate in candidates]
+
+# ---- Array steps ---------------------------------------------------------
+
+def pack(rows: list):
+    """(seats x candidates) array of per-seat value lists, padded with 0, and its presence mask"""
+    width = max((len(row) for row in rows), default=0)
+    values = np.zeros((len(rows), width))
+    present = np.zeros((len(rows), width), dtype=bool)
+    for seat, row in enumerate(rows):
+        values[seat, :len(row)] = row
+        present[seat, :len(row)] = True
+    return values, present
+
+def redistribute(baselines, points, floors, present, require_positive_total: bool = True):
+    """Floor-respecting proportional redistribution of campaign points, every seat at once.
+
+    Candidate slots are visited in order; each candidate with points gains
+    up to what the others hold above their floors, taken from them in
+    proportion to that margin. With `require_positive_total`, seats whose
+    points sum to zero or less keep their baselines.
+    """
+    current = np.where(present, baselines, 0.0)
+    active = present & (points > 0)
+    if require_positive_total:
+        active &= (np.where(present, points, 0.0).sum(axis=1) > 0)[:, None]
+
+    for slot in np.flatnonzero(active.any(axis=0)):
+        gaining = active[:, slot]
+        margins = np.where(present, np.maximum(0.0, current - floors), 0.0)
+        margins[:, slot] = 0.0
+        available = margins.sum(axis=1)
+        gains = np.where(gaining, np.minimum(points[:, slot], available), 0.0)
+        current[:, slot] += gains
+
+        shares = np.divide(margins, available[:, None], out=np.zeros_like(margins), where=available[:, None] > 0)
+        current -= shares * gains[:, None]
+    return current
+
+def normalize(percentages, present):
+    """Scale every seat to 100%, then give any leftover rounding error to its largest share"""
+    values = np.where(present, percentages, 0.0)
+    totals = values.sum(axis=1)
+    positive = totals > 0
+    values[positive] = values[positive] / totals[positive, None] * 100.0
+
+    final_totals = values.sum(axis=1)
+    off = present.any(axis=1) & (np.abs(final_totals - 100.0) > NORMALIZATION_TOLERANCE)
+    if off.any():
+        largest = np.argmax(np.where(present, values, -np.inf), axis=1)
+        rows = np.flatnonzero(off)
+        values[rows, largest[rows]] += 100.0 - final_totals[rows]
+    return values
+
+def _seat_results(seats: list, names: list, values) -> list:
+    return [
+        {name: float(values[seat, slot]) for slot, name in enumerate(names[seat])}
+        for seat in range(len(seats))
+    ]
+
+# ---- Models ---------------------------------------------------------------
+
+def floor_redistribution(seats: list, baseline_rule, *, name, points, momentum: list = None,
+                         clamp_floors: bool = True, require_positive_total: bool = True) -> list:
+    """Percentages of every seat under floor redistribution.
+
+    `seats` holds each seat's candidate documents, `baseline_rule` turns one
+    seat's candidates into baselines, and `name` / `points` read a
+    candidate's display name and campaign points. `momentum` optionally
+    gives each seat's {name: effect} added after redistribution. With
+    `clamp_floors`, shares are raised back to their floors before
+    normalization. Returns one {name: percentage} dict per seat.
+    """
+    seats = [list(candidates) for candidates in seats]
+    names = [[name(candidate) for candidate in candidates] for candidates in seats]
+    baselines, present = pack([baseline_rule(candidates) if candidates else [] for candidates in seats])
+    campaign_points, _ = pack([[points(candidate) for candidate in candidates] for candidates in seats])
+    floors, _ = pack([[party_floor(candidate.get("party", "")) for candidate in candidates] for candidates in seats])
+
+    current = redistribute(baselines, campaign_points, floors, present, require_positive_total)
+    if momentum is not None:
+        effects, _ = pack([
+            [(seat_momentum or {}).get(candidate_name, 0.0) for candidate_name in seat_names]
+            for seat_names, seat_momentum in zip(names, momentum)
+        ])
+        current += effects
+    if clamp_floors:
+        current = np.maximum(current, floors)
+    return _seat_results(seats, names, normalize(current, present))
+
+def baseline_redistribution(seats: list, baseline_rule, *, name, raw_change) -> list:
+    """Percentages of every seat under Final_i = b_i + a_i - (b_i / 100) * s"""
+    seats = [list(candidates) for candidates in seats]
+    names = [[name(candidate) for candidate in candidates] for candidates in seats]
+    baselines, present = pack([baseline_rule(candidates) if candidates else [] for candidates in seats])
+    changes, _ = pack([[raw_change(candidate) for candidate in candidates] for candidates in seats])
+
+    net_changes = np.where(present, changes, 0.0).sum(axis=1)
+    final = baselines + changes - (baselines / 100.0) * net_changes[:, None]
+    final = np.maximum(BASELINE_MINIMUM, final)
+    return _seat_results(seats, names, normalize(final, present))
+
+# ---- National presidential polling ----------------------------------------
+
+# Share of the national population living in each state, in percent
+STATE_POPULATION_WEIGHTS = MappingProxyType(dict(zip(STATES, POPULATION_WEIGHTS)))
+
+# Column order of the state arrays is the state ID order, so each state's column is its ID
+STATE_COLUMNS = STATE_IDS
+
+# Population weights as a fraction of the weighted total, so a product with them is a national average
+STATE_WEIGHT_VECTOR = np.array(POPULATION_WEIGHTS)
+STATE_WEIGHT_VECTOR = STATE_WEIGHT_VECTOR / STATE_WEIGHT_VECTOR.sum()
+
+# Rows of the state baseline matrix
+PARTY_ALIGNMENTS = ("republican", "democrat", "other")
+
+# Support a state poll stays within after campaign points, and the national poll after weighting
+STATE_POLLING_BOUNDS = (15.0, 85.0)
+NATIONAL_POLLING_BOUNDS = (20.0, 80.0)
+
+# Support assumed for a state missing from the state data, and for an alignment missing from a state
+MISSING_STATE_BASELINES = {"republican": 33.0, "democrat": 33.0, "other": 34.0}
+DEFAULT_STATE_BASELINE = 33.0
+
+_state_baselines = {}
+
+def party_alignment(party: str) -> int:
+    """Row of the state baseline matrix a candidate's party reads from"""
+    party = (party or "").lower()
+    if "republican" in party:
+        return 0
+    if "democrat" in party:
+        return 1
+    return 2
+
+def state_baseline_matrix(state_data: dict):
+    """(alignments x states) baseline support, built once per state data until invalidated"""
+    key = id(state_data)
+    matrix = _state_baselines.get(key)
+    if matrix is None:
+        matrix = np.array([
+            [state_data.get(state, MISSING_STATE_BASELINES).get(alignment, DEFAULT_STATE_BASELINE) for state in STATES]
+            for alignment in PARTY_ALIGNMENTS
+        ], dtype=float)
+        _state_baselines[key] = matrix
+    return matrix
+
+def invalidate_state_baselines():
+    """Drop the cached baseline matrices after the state data was edited in place"""
+    _state_baselines.clear()
+
+def stack_state_points(candidates: list):
+    """(candidates x states) campaign points; states outside the weight table are ignored"""
+    points = np.zeros((len(candidates), len(STATES)))
+    for row, candidate in enumerate(candidates):
+        for state, value in (candidate.get("state_points") or {}).items():
+            column = STATE_COLUMNS.get(state)
+            if column is not None:
+                points[row, column] = value
+    return points
+
+def national_polling(candidates: list, state_data: dict):
+    """Population-weighted national support of each candidate, in percent.
+
+    Every state starts from the baseline of the candidate's party alignment
+    plus the candidate's points there, clipped to STATE_POLLING_BOUNDS; the
+    national number is the population-weighted mean, clipped to
+    NATIONAL_POLLING_BOUNDS. Returns one value per candidate, in order.
+    """
+    if not candidates:
+        return np.zeros(0)
+    rows = [party_alignment(candidate.get("party", "")) for candidate in candidates]
+    support = state_baseline_matrix(state_data)[rows] + stack_state_points(candidates)
+    support = np.clip(support, *STATE_POLLING_BOUNDS)
+    return np.clip(support @ STATE_WEIGHT_VECTOR, *NATIONAL_POLLING_BOUNDS)
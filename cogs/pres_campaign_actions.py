@@ -6,234 +6,87 @@ import random
 import asyncio
 from typing import Optional, List
 from .presidential_winners import PRESIDENTIAL_STATE_DATA
+from cogs.candidate_names import PRESIDENTIAL_TARGETS, get_candidate_names
+from cogs.candidates import get_candidate_registry
+from cogs.cooldowns import PRESIDENTIAL_COOLDOWNS, get_cooldowns
+from cogs.polling_engine import (
+    floor_redistribution, invalidate_state_baselines, national_polling, presidential_baselines,
+)
+from cogs.time_manager import get_rp_clock
 
 class PresCampaignActions(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         print("Presidential Campaign Actions cog loaded successfully")
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration to check current phase"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_presidential_config(self, guild_id: int):
+    async def _get_presidential_config(self, guild_id: int):
         """Get presidential signups configuration"""
         col = self.bot.db["presidential_signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_presidential_winners_config(self, guild_id: int):
+    async def _get_presidential_winners_config(self, guild_id: int):
         """Get presidential winners configuration"""
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
-    def _get_user_presidential_candidate(self, guild_id: int, user_id: int):
+    async def _get_user_presidential_candidate(self, guild_id: int, user_id: int):
         """Get user's presidential candidate information"""
-        time_col, time_config = self._get_time_config(guild_id)
-        current_phase = time_config.get("current_phase", "") if time_config else ""
-        current_year = time_config["current_rp_date"].year if time_config else 2024
-
-        if current_phase == "General Campaign":
-            # Look in presidential winners collection for general campaign
-            winners_col, winners_config = self._get_presidential_winners_config(guild_id)
-
-            if not winners_config:
-                return None, None
-
-            # For general campaign, look for primary winners from the previous year if we're in an even year
-            # Or current year if odd year
-            primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-            winners_data = winners_config.get("winners", [])
-
-            # Handle both list and dict formats for winners
-            if isinstance(winners_data, list):
-                # New list format
-                for winner in winners_data:
-                    if (isinstance(winner, dict) and
-                        winner.get("user_id") == user_id and
-                        winner.get("primary_winner", False) and
-                        winner.get("year") == primary_year and
-                        winner.get("office") in ["President", "Vice President"]):
-                        return winners_col, winner
-            elif isinstance(winners_data, dict):
-                # Old dict format: {party: candidate_name}
-                # We need to get user_id from presidential signups
-                signups_col, signups_config = self._get_presidential_config(guild_id)
-                if signups_config:
-                    election_year = winners_config.get("election_year", current_year)
-                    signup_year = election_year - 1 if election_year % 2 == 0 else election_year
-
-                    candidates_list = signups_config.get("candidates", [])
-                    if isinstance(candidates_list, list):
-                        for candidate in candidates_list:
-                            if (isinstance(candidate, dict) and
-                                candidate.get("user_id") == user_id and
-                                candidate.get("year") == signup_year and
-                                candidate.get("office") in ["President", "Vice President"]):
-                                # Check if this candidate won their primary
-                                candidate_name = candidate.get("name")
-                                if candidate_name:
-                                    for party, winner_name in winners_data.items():
-                                        if isinstance(winner_name, str) and winner_name.lower() == candidate_name.lower():
-                                            # Create a general campaign candidate object
-                                            general_candidate = candidate.copy()
-                                            general_candidate["primary_winner"] = True
-                                            general_candidate["total_points"] = general_candidate.get("points", 0.0)
-                                            general_candidate["state_points"] = general_candidate.get("state_points", {})
-                                            return signups_col, general_candidate
-
-            return winners_col, None
-        else:
-            # Look in presidential signups collection for primary campaign
-            signups_col, signups_config = self._get_presidential_config(guild_id)
-
-            if not signups_config:
-                return None, None
-
-            for candidate in signups_config.get("candidates", []):
-                if (candidate["user_id"] == user_id and
-                    candidate["year"] == current_year and
-                    candidate["office"] in ["President", "Vice President"]):
-                    return signups_col, candidate
-
-            return signups_col, None
+        time_col, time_config = await self._get_time_config(guild_id)
+        col, candidate = await get_candidate_registry(self.bot).resolve(
+            guild_id, time_config, user_id=user_id, sources=("presidential_winners", "presidential_signups")
+        )
+        return col or self.bot.db["presidential_signups"], candidate
 
-    def _get_presidential_candidate_by_name(self, guild_id: int, candidate_name: str):
+    async def _get_presidential_candidate_by_name(self, guild_id: int, candidate_name: str):
         """Get presidential candidate by name"""
         try:
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
             current_year = time_config["current_rp_date"].year if time_config else 2024
 
-            if current_phase == "General Campaign":
-                # For general campaign, check presidential winners collection first
-                winners_col, winners_config = self._get_presidential_winners_config(guild_id)
-                if winners_config:
-                    winners_data = winners_config.get("winners", [])
-
-                    # Handle both list and dict formats for winners
-                    if isinstance(winners_data, list):
-                        # New list format
-                        primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                        for winner in winners_data:
-                            if (isinstance(winner, dict) and
-                                winner.get("name", "").lower() == candidate_name.lower() and
-                                winner.get("primary_winner", False) and
-                                winner.get("year") == primary_year and
-                                winner.get("office") in ["President", "Vice President"]):
-                                return winners_col, winner
-
-                    elif isinstance(winners_data, dict):
-                        # Old dict format: {party: candidate_name}
-                        for party, winner_name in winners_data.items():
-                            if isinstance(winner_name, str) and winner_name.lower() == candidate_name.lower():
-                                # Get full candidate data from presidential signups
-                                signups_col, signups_config = self._get_presidential_config(guild_id)
-                                if signups_config:
-                                    election_year = winners_config.get("election_year", current_year)
-                                    # For general campaign, signup year is typically election_year - 1
-                                    # But check both years to be safe
-                                    possible_signup_years = [election_year - 1, election_year]
-
-                                    candidates_list = signups_config.get("candidates", [])
-                                    if isinstance(candidates_list, list):
-                                        for signup_year in possible_signup_years:
-                                            for candidate in candidates_list:
-                                                if (isinstance(candidate, dict) and
-                                                    candidate.get("name", "").lower() == candidate_name.lower() and
-                                                    candidate.get("year") == signup_year and
-                                                    candidate.get("office") in ["President", "Vice President"]):
-                                                    # Create a copy and add general campaign specific fields
-                                                    general_candidate = candidate.copy()
-                                                    general_candidate["primary_winner"] = True
-                                                    general_candidate["total_points"] = general_candidate.get("points", 0.0)
-                                                    general_candidate["state_points"] = general_candidate.get("state_points", {})
-                                                    return signups_col, general_candidate
-
-                                # If not found in signups, create a basic candidate object with reasonable defaults
-                                # Try to find user_id from all_winners system
-                                all_winners_col = self.bot.db["winners"]
-                                all_winners_config = all_winners_col.find_one({"guild_id": guild_id})
-                                found_user_id = 0
-
-                                if all_winners_config:
-                                    for winner in all_winners_config.get("winners", []):
-                                        if (isinstance(winner, dict) and
-                                            winner.get("candidate", "").lower() == candidate_name.lower() and
-                                            winner.get("office") in ["President", "Vice President"]):
-                                            found_user_id = winner.get("user_id", 0)
-                                            break
-
-                                election_year = winners_config.get("election_year", current_year)
-                                basic_candidate = {
-                                    "name": winner_name,
-                                    "user_id": found_user_id,
-                                    "party": party,
-                                    "office": "President",
-                                    "year": election_year - 1,  # Use election_year - 1 as signup year
-                                    "stamina": 200,
-                                    "corruption": 0,
-                                    "total_points": 0.0,
-                                    "state_points": {},
-                                    "primary_winner": True
-                                }
-                                return winners_col, basic_candidate
-
-                return winners_col, None
-
-                # Fallback to all_winners system
-                all_winners_col = self.bot.db["winners"]
-                all_winners_config = all_winners_col.find_one({"guild_id": guild_id})
+            col, candidate = await get_candidate_registry(self.bot).resolve(
+                guild_id, time_config, name=candidate_name, sources=("presidential_winners", "presidential_signups")
+            )
+            if candidate or current_phase != "General Campaign":
+                return col, candidate
+
+            # Old {party: name} winners without a presidential signup: build a basic candidate object
+            winners_col, winners_config = await self._get_presidential_winners_config(guild_id)
+            winners_data = winners_config.get("winners", []) if winners_config else []
+            if isinstance(winners_data, dict):
+                for party, winner_name in winners_data.items():
+                    if isinstance(winner_name, str) and winner_name.lower() == candidate_name.lower():
+                        # Try to find user_id from all_winners system
+                        winner = await self.bot.db["winners"].find_candidate({
+                            "guild_id": guild_id, "name_lower": candidate_name.lower(),
+                            "office": {"$in": ["President", "Vice President"]}
+                        })
+                        found_user_id = winner.get("user_id", 0) if winner else 0
 
-                if all_winners_config:
-                    primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-                    winners_list = all_winners_config.get("winners", [])
-
-                    if isinstance(winners_list, list):
-                        for winner in winners_list:
-                            if (isinstance(winner, dict) and
-                                winner.get("candidate", "").lower() == candidate_name.lower() and
-                                winner.get("primary_winner", False) and
-                                winner.get("year") == primary_year and
-                                winner.get("office") in ["President", "Vice President"]):
-                                # Convert all_winners format to expected format
-                                candidate_dict = {
-                                    "name": winner.get("candidate"),
-                                    "user_id": winner.get("user_id"),
-                                    "party": winner.get("party"),
-                                    "office": winner.get("office"),
-                                    "year": winner.get("year"),
-                                    "stamina": winner.get("stamina", 200),
-                                    "corruption": winner.get("corruption", 0),
-                                    "total_points": winner.get("points", 0.0),
-                                    "state_points": winner.get("state_points", {}),
-                                    "primary_winner": True
-                                }
-                                return all_winners_col, candidate_dict
-
-                return None, None
-            else:
-                # Look in presidential signups collection for primary campaign
-                signups_col, signups_config = self._get_presidential_config(guild_id)
-
-                if not signups_config:
-                    return None, None
-
-                candidates_list = signups_config.get("candidates", [])
-                if isinstance(candidates_list, list):
-                    for candidate in candidates_list:
-                        if (isinstance(candidate, dict) and
-                            candidate.get("name", "").lower() == candidate_name.lower() and
-                            candidate.get("year") == current_year and
-                            candidate.get("office") in ["President", "Vice President"]):
-                            return signups_col, candidate
+                        election_year = winners_config.get("election_year", current_year)
+                        basic_candidate = {
+                            "name": winner_name,
+                            "user_id": found_user_id,
+                            "party": party,
+                            "office": "President",
+                            "year": election_year - 1,  # Use election_year - 1 as signup year
+                            "stamina": 200,
+                            "corruption": 0,
+                            "total_points": 0.0,
+                            "state_points": {},
+                            "primary_winner": True
+                        }
+                        return winners_col, basic_candidate
 
-                return signups_col, None
+            return winners_col, None
 
         except Exception as e:
             print(f"Error in _get_presidential_candidate_by_name: {e}")
@@ -241,12 +94,12 @@ class PresCampaignActions(commands.Cog):
             traceback.print_exc()
             return None, None
 
-    def _update_presidential_candidate_stats(self, collection, guild_id: int, user_id: int,
+    async def _update_presidential_candidate_stats(self, collection, guild_id: int, user_id: int,
                                            state_name: str, polling_boost: float = 0,
                                            stamina_cost: int = 0, corruption_increase: int = 0, candidate_data: Optional[dict] = None,
                                            action_user_id: Optional[int] = None):
         """Update presidential candidate's polling, stamina, and corruption"""
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_phase = time_config.get("current_phase", "")
 
         # Apply momentum multiplier during General Campaign
@@ -257,7 +110,7 @@ class PresCampaignActions(commands.Cog):
             # Get momentum multiplier
             momentum_cog = self.bot.get_cog('Momentum')
             if momentum_cog and candidate_data:
-                momentum_col, momentum_config = momentum_cog._get_momentum_config(guild_id)
+                momentum_col, momentum_config = await momentum_cog._get_momentum_config(guild_id)
 
                 # Determine party key
                 party = candidate_data.get("party", "").lower()
@@ -282,7 +135,7 @@ class PresCampaignActions(commands.Cog):
 
             if current_phase == "General Campaign":
                 # Check in presidential winners
-                winners_config = collection.find_one({"guild_id": guild_id})
+                winners_config = await collection.find_one({"guild_id": guild_id})
                 if winners_config and "winners" in winners_config:
                     winners_data = winners_config.get("winners", [])
                     if isinstance(winners_data, list):
@@ -292,7 +145,7 @@ class PresCampaignActions(commands.Cog):
                                 break
             else:
                 # Check in presidential signups
-                signups_config = collection.find_one({"guild_id": guild_id})
+                signups_config = await collection.find_one({"guild_id": guild_id})
                 if signups_config and "candidates" in signups_config:
                     for candidate in signups_config.get("candidates", []):
                         if isinstance(candidate, dict) and candidate.get("user_id") == action_user_id:
@@ -307,7 +160,7 @@ class PresCampaignActions(commands.Cog):
 
         if current_phase == "General Campaign":
             # For general campaign, update in presidential winners collection
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "winners.user_id": user_id},
                 {
                     "$inc": {
@@ -319,17 +172,17 @@ class PresCampaignActions(commands.Cog):
             )
 
             # Deduct stamina from the determined user
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "winners.user_id": stamina_deduction_user_id},
                 {"$inc": {"winners.$.stamina": -stamina_cost}}
             )
 
             # Add momentum effects during General Campaign (use the boosted points)
             print(f"DEBUG: Adding momentum from stats update: {actual_polling_boost} points in {state_name.upper()}")
-            self._add_momentum_from_campaign_action(guild_id, user_id, state_name.upper(), actual_polling_boost, candidate_data)
+            await self._add_momentum_from_campaign_action(guild_id, user_id, state_name.upper(), actual_polling_boost, candidate_data)
         else:
             # For primary campaign, update in presidential signups collection (no momentum multiplier)
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "candidates.user_id": user_id},
                 {
                     "$inc": {
@@ -340,7 +193,7 @@ class PresCampaignActions(commands.Cog):
             )
 
             # Deduct stamina from the determined user
-            collection.update_one(
+            await collection.update_one(
                 {"guild_id": guild_id, "candidates.user_id": stamina_deduction_user_id},
                 {"$inc": {"candidates.$.stamina": -stamina_cost}}
             )
@@ -353,8 +206,9 @@ class PresCampaignActions(commands.Cog):
             PRESIDENTIAL_STATE_DATA[state_name]["republican"] = round(data["republican"], 1)
             PRESIDENTIAL_STATE_DATA[state_name]["democrat"] = round(data["democrat"], 1)
             PRESIDENTIAL_STATE_DATA[state_name]["other"] = round(data["other"], 1)
+        invalidate_state_baselines()
 
-    def _transfer_pres_points_to_winners(self, guild_id: int, candidate_data: dict, state_name: str, points_gained: float):
+    async def _transfer_pres_points_to_winners(self, guild_id: int, candidate_data: dict, state_name: str, points_gained: float):
         """Transfer points to the all_winners system, mapping to political parties."""
         all_winners_col = self.bot.db["winners"]
         user_id = candidate_data.get("user_id")
@@ -376,7 +230,7 @@ class PresCampaignActions(commands.Cog):
             political_party = "Independents"
 
         # Update or insert the winner data
-        all_winners_col.update_one(
+        await all_winners_col.update_one(
             {
                 "guild_id": guild_id,
                 "user_id": user_id,
@@ -464,69 +318,26 @@ class PresCampaignActions(commands.Cog):
         PRESIDENTIAL_STATE_DATA[state_name_upper]["republican"] = round(PRESIDENTIAL_STATE_DATA[state_name_upper]["republican"], 1)
         PRESIDENTIAL_STATE_DATA[state_name_upper]["democrat"] = round(PRESIDENTIAL_STATE_DATA[state_name_upper]["democrat"], 1)
         PRESIDENTIAL_STATE_DATA[state_name_upper]["other"] = round(PRESIDENTIAL_STATE_DATA[state_name_upper]["other"], 1)
+        invalidate_state_baselines()
 
         print(f"Updated {state_name_upper} baseline: R:{PRESIDENTIAL_STATE_DATA[state_name_upper]['republican']:.1f}% D:{PRESIDENTIAL_STATE_DATA[state_name_upper]['democrat']:.1f}% O:{PRESIDENTIAL_STATE_DATA[state_name_upper]['other']:.1f}%")
 
-    def _check_cooldown(self, guild_id: int, user_id: int, action: str, hours: int) -> bool:
-        """Check if user is on cooldown for a specific action"""
-        cooldowns_col = self.bot.db["action_cooldowns"]
-
-        cooldown_record = cooldowns_col.find_one({
-            "guild_id": guild_id,
-            "user_id": user_id,
-            "action": action
-        })
-
-        if not cooldown_record:
-            return True
-
-        from datetime import datetime, timedelta
-        last_used = cooldown_record["last_used"]
-        cooldown_duration = timedelta(hours=hours)
-
-        return datetime.utcnow() > last_used + cooldown_duration
-
-    def _get_cooldown_remaining(self, guild_id: int, user_id: int, action: str, hours: int):
+    async def _get_cooldown_remaining(self, guild_id: int, user_id: int, action: str, hours: int):
         """Get remaining cooldown time"""
-        cooldowns_col = self.bot.db["action_cooldowns"]
-
-        cooldown_record = cooldowns_col.find_one({
-            "guild_id": guild_id,
-            "user_id": user_id,
-            "action": action
-        })
+        return await get_cooldowns(self.bot).remaining(PRESIDENTIAL_COOLDOWNS, guild_id, user_id, action, hours)
 
-        if not cooldown_record:
-            from datetime import timedelta
-            return timedelta(0)
-
-        from datetime import datetime, timedelta
-        last_used = cooldown_record["last_used"]
-        cooldown_duration = timedelta(hours=hours)
-        next_available = last_used + cooldown_duration
-
-        if datetime.utcnow() >= next_available:
-            return timedelta(0)
-
-        return next_available - datetime.utcnow()
-
-    def _set_cooldown(self, guild_id: int, user_id: int, action: str):
-        """Set cooldown for a user action"""
-        cooldowns_col = self.bot.db["action_cooldowns"]
-
-        cooldowns_col.update_one(
-            {
-                "guild_id": guild_id,
-                "user_id": user_id,
-                "action": action
-            },
-            {
-                "$set": {
-                    "last_used": datetime.utcnow()
-                }
-            },
-            upsert=True
+    async def _claim_cooldown(self, interaction: discord.Interaction, action: str, hours: int) -> bool:
+        """Start the user's cooldown for an action, telling them if another use of it got there first"""
+        remaining = await get_cooldowns(self.bot).check_and_claim(
+            PRESIDENTIAL_COOLDOWNS, interaction.guild.id, interaction.user.id, action, hours
         )
+        if not remaining:
+            return True
+        hours_left = int(remaining.total_seconds() // 3600)
+        minutes_left = int((remaining.total_seconds() % 3600) // 60)
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(f"❌ You must wait {hours_left}h {minutes_left}m before doing that again.", ephemeral=True)
+        return False
 
     def _apply_buff_debuff_multiplier(self, base_points: float, user_id: int, guild_id: int, action_type: str) -> float:
         """Apply any active buffs or debuffs to the points gained"""
@@ -534,11 +345,11 @@ class PresCampaignActions(commands.Cog):
         # This can be expanded later to include buff/debuff system
         return base_points
 
-    def _add_momentum_from_campaign_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float, candidate_data: Optional[dict] = None):
+    async def _add_momentum_from_campaign_action(self, guild_id: int, user_id: int, state_name: str, points_gained: float, candidate_data: Optional[dict] = None):
         """Adds momentum to a state based on campaign actions."""
         try:
             # Check if we're in General Campaign phase
-            time_col, time_config = self._get_time_config(guild_id)
+            time_col, time_config = await self._get_time_config(guild_id)
             current_phase = time_config.get("current_phase", "") if time_config else ""
 
             if current_phase != "General Campaign":
@@ -553,19 +364,19 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Get momentum config
-            momentum_col, momentum_config = momentum_cog._get_momentum_config(guild_id)
+            momentum_col, momentum_config = await momentum_cog._get_momentum_config(guild_id)
 
             # Get candidate data - either from parameter or lookup
             candidate = candidate_data
             if not candidate:
-                signups_col, candidate = self._get_user_presidential_candidate(guild_id, user_id)
+                signups_col, candidate = await self._get_user_presidential_candidate(guild_id, user_id)
 
             if not candidate or not isinstance(candidate, dict) or not candidate.get("party"):
                 print(f"DEBUG: No valid candidate data found for user {user_id}, attempting to find by name from all_winners")
 
                 # Try to find candidate in all_winners system as fallback
                 all_winners_col = self.bot.db["winners"]
-                all_winners_config = all_winners_col.find_one({"guild_id": guild_id})
+                all_winners_config = await all_winners_col.find_one({"guild_id": guild_id})
 
                 if all_winners_config:
                     current_year = time_config["current_rp_date"].year if time_config else 2024
@@ -666,7 +477,7 @@ class PresCampaignActions(commands.Cog):
             print(f"DEBUG: Current momentum: {current_momentum}, adding: {momentum_gained}, new total: {new_momentum}")
 
             # Check for auto-collapse and apply if needed
-            final_momentum, collapsed = momentum_cog._check_and_apply_auto_collapse(
+            final_momentum, collapsed = await momentum_cog._check_and_apply_auto_collapse(
                 momentum_col, guild_id, state_name, party_key, new_momentum
             )
 
@@ -674,7 +485,7 @@ class PresCampaignActions(commands.Cog):
                 print(f"DEBUG: Momentum auto-collapsed to {final_momentum}")
             else:
                 # Update momentum in database
-                result = momentum_col.update_one(
+                result = await momentum_col.update_one(
                     {"guild_id": guild_id},
                     {
                         "$set": {
@@ -687,7 +498,7 @@ class PresCampaignActions(commands.Cog):
 
                 # Log the momentum gain event
                 if momentum_gained > 0.1:  # Only log significant gains
-                    momentum_cog._add_momentum_event(
+                    await momentum_cog._add_momentum_event(
                         momentum_col, guild_id, state_name, party_key,
                         momentum_gained, f"Presidential campaign action (+{points_gained:.1f} pts)", user_id
                     )
@@ -700,7 +511,7 @@ class PresCampaignActions(commands.Cog):
             import traceback
             traceback.print_exc()
 
-    def _get_state_lean_and_momentum(self, guild_id: int, state_name: str):
+    async def _get_state_lean_and_momentum(self, guild_id: int, state_name: str):
         """Retrieves the lean and current momentum for a given state."""
         state_data = PRESIDENTIAL_STATE_DATA.get(state_name.upper())
         if not state_data:
@@ -715,18 +526,18 @@ class PresCampaignActions(commands.Cog):
 
         # Get momentum from database
         momentum_col = self.bot.db["presidential_momentum"]
-        momentum_record = momentum_col.find_one({"guild_id": guild_id, "state": state_name.upper()})
+        momentum_record = await momentum_col.find_one({"guild_id": guild_id, "state": state_name.upper()})
         current_momentum = momentum_record.get("momentum", 0.0) if momentum_record else 0.0
 
         return lean_percentage, current_momentum, state_data
 
-    def _calculate_general_election_percentages(self, guild_id: int, office: str):
+    async def _calculate_general_election_percentages(self, guild_id: int, office: str):
         """Calculate general election percentages using complete proportional redistribution with 100% normalization"""
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # Get presidential winners (general election candidates)
-        winners_col, winners_config = self._get_presidential_winners_config(guild_id)
+        winners_col, winners_config = await self._get_presidential_winners_config(guild_id)
 
         if not winners_config:
             return {}
@@ -751,7 +562,7 @@ class PresCampaignActions(commands.Cog):
         elif isinstance(winners_data, dict):
             # Old dict format: {party: candidate_name}
             # Need to get full candidate data from presidential signups
-            signups_col, signups_config = self._get_presidential_config(guild_id)
+            signups_col, signups_config = await self._get_presidential_config(guild_id)
             if signups_config:
                 election_year = winners_config.get("election_year", primary_year + 1)
                 signup_year = election_year - 1 if election_year % 2 == 0 else election_year
@@ -777,113 +588,13 @@ class PresCampaignActions(commands.Cog):
         if not candidates:
             return {}
 
-        # Define minimum percentage floors for presidential races
-        def get_presidential_minimum_floor(candidate):
-            party = candidate.get("party", "").lower()
-            if any(keyword in party for keyword in ['democrat', 'republican']):
-                return 25.0  # 25% minimum for major parties
-            else:
-                return 2.0   # 2% minimum for independents/third parties
-
-        # Calculate baseline percentages based on party alignment
-        baseline_percentages = {}
-        num_candidates = len(candidates)
-
-        # Count major parties
-        major_parties = []
-        for candidate in candidates:
-            party = candidate["party"].lower()
-            if "democrat" in party or "democratic" in party:
-                if "Democrat" not in major_parties:
-                    major_parties.append("Democrat")
-            elif "republican" in party:
-                if "Republican" not in major_parties:
-                    major_parties.append("Republican")
-
-        major_parties_present = len(major_parties)
-
-        if major_parties_present == 2 and num_candidates == 2:
-            # Two-way race between major parties: 50-50
-            for candidate in candidates:
-                baseline_percentages[candidate["name"]] = 50.0
-        elif major_parties_present == 2 and num_candidates > 2:
-            # Democrat + Republican + others: 40-40 for major, split remainder among others
-            remaining_percentage = 20.0
-            other_parties_count = num_candidates - 2
-            other_party_percentage = remaining_percentage / other_parties_count if other_parties_count > 0 else 0
-
-            for candidate in candidates:
-                party = candidate["party"].lower()
-                if "democrat" in party or "democratic" in party or "republican" in party:
-                    baseline_percentages[candidate["name"]] = 40.0
-                else:
-                    baseline_percentages[candidate["name"]] = other_party_percentage
-        else:
-            # No standard major party setup, split evenly
-            for candidate in candidates:
-                baseline_percentages[candidate["name"]] = 100.0 / num_candidates
-
-        # Start with baseline percentages
-        current_percentages = baseline_percentages.copy()
-
-        # Apply campaign effects using COMPLETE proportional redistribution
-        for candidate in candidates:
-            candidate_name = candidate["name"]
-            total_campaign_points = candidate.get("total_points", 0.0)
-
-            if total_campaign_points > 0:
-                # Points gained equals the campaign points directly
-                points_gained = total_campaign_points
-
-                # Calculate total percentage that can be taken from other candidates
-                total_available_to_take = 0.0
-                for other_candidate in candidates:
-                    if other_candidate != candidate:
-                        other_name = other_candidate["name"]
-                        other_current = current_percentages[other_name]
-                        other_minimum = get_presidential_minimum_floor(other_candidate)
-                        available = max(0, other_current - other_minimum)
-                        total_available_to_take += available
-
-                # Limit gains to what's actually available
-                actual_gain = min(points_gained, total_available_to_take)
-                current_percentages[candidate_name] += actual_gain
-
-                # Distribute losses proportionally among other candidates
-                if total_available_to_take > 0:
-                    for other_candidate in candidates:
-                        if other_candidate != candidate:
-                            other_name = other_candidate["name"]
-                            other_current = current_percentages[other_name]
-                            other_minimum = get_presidential_minimum_floor(other_candidate)
-                            available = max(0, other_current - other_minimum)
-
-                            if available > 0:
-                                proportional_loss = (available / total_available_to_take) * actual_gain
-                                current_percentages[other_name] -= proportional_loss
-
-        # Ensure minimum floors are respected
-        for candidate in candidates:
-            candidate_name = candidate["name"]
-            minimum_floor = get_presidential_minimum_floor(candidate)
-            current_percentages[candidate_name] = max(current_percentages[candidate_name], minimum_floor)
-
-        # COMPLETE 100% NORMALIZATION - Force total to exactly 100%
-        total_percentage = sum(current_percentages.values())
-        if total_percentage > 0:
-            for candidate_name in current_percentages:
-                current_percentages[candidate_name] = (current_percentages[candidate_name] / total_percentage) * 100.0
-
-        # Final verification and correction for floating point errors
-        final_total = sum(current_percentages.values())
-        if abs(final_total - 100.0) > 0.001:
-            # Apply micro-adjustment to the largest percentage
-            largest_candidate = max(current_percentages.keys(), key=lambda x: current_percentages[x])
-            adjustment = 100.0 - final_total
-            current_percentages[largest_candidate] += adjustment
-
-        final_percentages = current_percentages
-        return final_percentages
+        # Campaign points move the ticket with floor redistribution (25% major parties, 2% others)
+        return floor_redistribution(
+            [candidates], presidential_baselines,
+            name=lambda candidate: candidate["name"],
+            points=lambda candidate: candidate.get("total_points", 0.0),
+            require_positive_total=False
+        )[0]
 
     # State autocomplete for all commands
     @app_commands.command(
@@ -912,7 +623,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if user is a presidential candidate
-        signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
 
         if not candidate:
             await interaction.response.send_message(
@@ -922,7 +633,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if in campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Signups", "Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Presidential canvassing can only be done during signups and campaign phases.",
@@ -937,7 +648,7 @@ class PresCampaignActions(commands.Cog):
         # Get target candidate
         if not target:
             target = candidate["name"]
-        target_signups_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target presidential candidate '{target}' not found.",
@@ -966,12 +677,12 @@ class PresCampaignActions(commands.Cog):
         polling_boost = self._apply_buff_debuff_multiplier(0.1, target_candidate["user_id"], interaction.guild.id, "pres_canvassing")
 
         # Update target candidate stats
-        self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
+        await self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
                                                  state_upper, polling_boost=polling_boost, stamina_cost=1,
                                                  candidate_data=target_candidate, action_user_id=interaction.user.id)
 
         # Transfer points to all_winners system for proper tracking
-        self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
+        await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
 
         embed = discord.Embed(
             title="🚪 Presidential Door-to-Door Canvassing",
@@ -1021,7 +732,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if user is either a presidential candidate OR has party role validation
-        signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
         user_is_candidate = candidate and isinstance(candidate, dict)
 
         # If not a candidate, check if they have party role validation
@@ -1035,7 +746,7 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Check if any party role validation is configured
-            parties_col, parties_config = party_cog._get_parties_config(interaction.guild.id)
+            parties_col, parties_config = await party_cog._get_parties_config(interaction.guild.id)
             role_validation = parties_config.get("role_validation", {})
 
             if not role_validation:
@@ -1068,7 +779,7 @@ class PresCampaignActions(commands.Cog):
             }
 
         # Check if in campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config["current_phase"] not in ["Signups", "Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Presidential donor appeals can only be made during signups and campaign phases.",
@@ -1081,7 +792,7 @@ class PresCampaignActions(commands.Cog):
             target = candidate["name"]
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target presidential candidate '{target}' not found.",
@@ -1090,8 +801,8 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_donor", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_donor", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_donor", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             await interaction.response.send_message(
@@ -1145,20 +856,21 @@ class PresCampaignActions(commands.Cog):
                 await reply_message.reply(f"❌ Donor appeal must be no more than 3000 characters. You wrote {char_count} characters.")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "pres_donor")
+            # Start the cooldown after successful validation, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "pres_donor", 1):
+                return
 
             # Calculate polling boost - 1% per 1000 characters
             polling_boost = (char_count / 1000) * 1.0
             polling_boost = min(polling_boost, 3.0)
 
             # Update target candidate stats
-            self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate.get("user_id"),
+            await self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate.get("user_id"),
                                                      state_upper, polling_boost=polling_boost, corruption_increase=5, stamina_cost=5,
                                                      candidate_data=target_candidate, action_user_id=interaction.user.id)
 
             # Transfer points to all_winners system for proper tracking
-            self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
+            await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
 
             embed = discord.Embed(
                 title="💰 Presidential Donor Fundraising",
@@ -1218,7 +930,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if user is a presidential candidate
-        signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
 
         if not candidate:
             await interaction.response.send_message(
@@ -1228,7 +940,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if in campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Signups", "Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Presidential campaign ads can only be created during signups and campaign phases.",
@@ -1243,7 +955,7 @@ class PresCampaignActions(commands.Cog):
         # Get target candidate
         if not target:
             target = candidate["name"]
-        target_signups_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target presidential candidate '{target}' not found.",
@@ -1260,8 +972,8 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_ad", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_ad", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_ad", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             await interaction.response.send_message(
@@ -1308,19 +1020,20 @@ class PresCampaignActions(commands.Cog):
                 await reply_message.reply("❌ Video file too large! Maximum size is 25MB.")
                 return
 
+            # Start the cooldown before applying the ad, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "pres_ad", 1):
+                return
+
             # Random polling boost between 0.2% and 0.3%
             polling_boost = random.uniform(0.2, 0.3)
 
             # Update target candidate stats
-            self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
+            await self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
                                                      state_upper, polling_boost=polling_boost, stamina_cost=5,
                                                      candidate_data=target_candidate, action_user_id=interaction.user.id)
 
             # Transfer points to all_winners system for proper tracking
-            self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
-
-            # Set cooldown
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "pres_ad")
+            await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
 
             embed = discord.Embed(
                 title="📺 Presidential Campaign Video Ad",
@@ -1388,7 +1101,7 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Check if user is either a presidential candidate OR has party role validation
-            signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+            signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
             user_is_candidate = candidate and isinstance(candidate, dict)
 
             # If not a candidate, check if they have party role validation
@@ -1402,7 +1115,7 @@ class PresCampaignActions(commands.Cog):
                     return
 
                 # Check if any party role validation is configured
-                parties_col, parties_config = party_cog._get_parties_config(interaction.guild.id)
+                parties_col, parties_config = await party_cog._get_parties_config(interaction.guild.id)
                 role_validation = parties_config.get("role_validation", {})
 
                 if not role_validation:
@@ -1443,7 +1156,7 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Check if in campaign phase
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
             if not time_config or time_config.get("current_phase", "") not in ["Signups", "Primary Campaign", "General Campaign"]:
                 await interaction.followup.send(
                     "❌ Presidential campaign posters can only be created during signups and campaign phases.",
@@ -1456,7 +1169,7 @@ class PresCampaignActions(commands.Cog):
                 target = candidate.get("name", "Unknown")
 
             # Get target candidate with extensive validation
-            target_signups_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, target)
+            target_signups_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, target)
 
             # Comprehensive validation of target candidate
             if (not target_candidate or
@@ -1479,8 +1192,8 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Check cooldown (1 hour)
-            if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_poster", 1):
-                remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_poster", 1)
+            remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_poster", 1)
+            if remaining:
                 hours = int(remaining.total_seconds() // 3600)
                 minutes = int((remaining.total_seconds() % 3600) // 60)
                 await interaction.followup.send(
@@ -1517,18 +1230,19 @@ class PresCampaignActions(commands.Cog):
                 )
                 return
 
+            # Start the cooldown before applying the poster, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "pres_poster", 1):
+                return
+
             # Update target candidate stats
-            self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_user_id,
+            await self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_user_id,
                                                      state_upper, polling_boost=polling_boost, stamina_cost=4,
                                                      candidate_data=target_candidate, action_user_id=interaction.user.id)
 
             # For general campaign only, transfer points to all_winners system
             current_phase = time_config.get("current_phase", "")
             if current_phase == "General Campaign":
-                self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
-
-            # Set cooldown
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "pres_poster")
+                await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
 
             # Create embed with safe string access
             candidate_name = candidate.get("name", "Unknown Candidate")
@@ -1602,7 +1316,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if user is either a presidential candidate OR has party role validation
-        signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
         user_is_candidate = candidate and isinstance(candidate, dict)
 
         # If not a candidate, check if they have party role validation
@@ -1616,7 +1330,7 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Check if any party role validation is configured
-            parties_col, parties_config = party_cog._get_parties_config(interaction.guild.id)
+            parties_col, parties_config = await party_cog._get_parties_config(interaction.guild.id)
             role_validation = parties_config.get("role_validation", {})
 
             if not role_validation:
@@ -1657,7 +1371,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check if in campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config["current_phase"] not in ["Signups", "Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Presidential speeches can only be given during signups and campaign phases.",
@@ -1670,7 +1384,7 @@ class PresCampaignActions(commands.Cog):
             target = candidate["name"]
 
         # Verify target candidate exists
-        target_signups_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, target)
+        target_signups_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, target)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Target presidential candidate '{target}' not found.",
@@ -1679,8 +1393,8 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_speech", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_speech", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_speech", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             await interaction.response.send_message(
@@ -1697,9 +1411,10 @@ class PresCampaignActions(commands.Cog):
             )
             return
 
-        # Get state ideology data for bonus calculation
-        from .ideology import STATE_DATA
-        state_data = STATE_DATA.get(state_upper, {})
+        # Get this guild's state ideology data for bonus calculation
+        from .ideology import get_ideology_store
+        guild_ideology = await get_ideology_store(self.bot).guild(interaction.guild.id)
+        state_data = guild_ideology.get(state_upper, {})
         state_ideology = state_data.get('ideology', 'Unknown')
 
         # Check for ideology match
@@ -1740,15 +1455,16 @@ class PresCampaignActions(commands.Cog):
                 await reply_message.reply(f"❌ Presidential speech must be 600-3000 characters. You wrote {char_count} characters.")
                 return
 
-            # Set cooldown after successful validation
-            self._set_cooldown(interaction.guild.id, interaction.user.id, "pres_speech")
+            # Start the cooldown after successful validation, unless a concurrent use already did
+            if not await self._claim_cooldown(interaction, "pres_speech", 1):
+                return
 
             # Calculate base polling boost - 1% per 2000 characters
             base_polling_boost = (char_count / 2000) * 1.0
             base_polling_boost = min(base_polling_boost, 1.5)
 
             # Check for ideology match bonus
-            state_data = STATE_DATA.get(state_upper, {})
+            state_data = guild_ideology.get(state_upper, {})
             state_ideology = state_data.get('ideology', '')
             ideology_bonus = 0.5 if state_ideology.lower() == ideology.lower() else 0.0
 
@@ -1756,12 +1472,12 @@ class PresCampaignActions(commands.Cog):
             polling_boost = base_polling_boost + ideology_bonus
 
             # Update target candidate stats
-            self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
+            await self._update_presidential_candidate_stats(target_signups_col, interaction.guild.id, target_candidate["user_id"],
                                                      state_upper, polling_boost=polling_boost, stamina_cost=6,
                                                      candidate_data=target_candidate, action_user_id=interaction.user.id)
 
             # Transfer points to all_winners system for proper tracking
-            self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
+            await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, polling_boost)
 
             # Create public speech announcement
             embed = discord.Embed(
@@ -1887,83 +1603,17 @@ class PresCampaignActions(commands.Cog):
         """Get presidential candidate choices for autocomplete"""
         try:
             # Get time config for current year/phase context
-            time_col, time_config = self._get_time_config(interaction.guild.id)
+            time_col, time_config = await self._get_time_config(interaction.guild.id)
 
             if not time_config:
                 return []
 
             current_year = time_config["current_rp_date"].year
             current_phase = time_config.get("current_phase", "")
-            candidate_names = []
-
-            if current_phase == "General Campaign":
-                # For general campaign, get primary winners
-                primary_year = current_year - 1 if current_year % 2 == 0 else current_year
-
-                # Check presidential winners collection
-                winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
-                if winners_config and winners_config.get("winners"):
-                    winners_data = winners_config.get("winners", {})
-
-                    if isinstance(winners_data, dict):
-                        # Old format: {party: candidate_name}
-                        for party, winner_name in winners_data.items():
-                            if isinstance(winner_name, str):
-                                candidate_names.append(winner_name)
-                    elif isinstance(winners_data, list):
-                        # New format: list of winner objects
-                        for winner in winners_data:
-                            if (isinstance(winner, dict) and
-                                winner.get("primary_winner", False) and
-                                winner.get("year") == primary_year and
-                                winner.get("office") in ["President", "Vice President"]):
-                                name = winner.get("name")
-                                if name:
-                                    candidate_names.append(name)
-
-                # Fallback to all_winners system
-                if not candidate_names:
-                    all_winners_col = self.bot.db["winners"]
-                    all_winners_config = all_winners_col.find_one({"guild_id": interaction.guild.id})
-
-                    if all_winners_config:
-                        winners_list = all_winners_config.get("winners", [])
-                        for winner in winners_list:
-                            if (isinstance(winner, dict) and
-                                winner.get("office") in ["President", "Vice President"] and
-                                winner.get("primary_winner", False) and
-                                winner.get("year") == primary_year):
-                                name = winner.get("candidate")
-                                if name:
-                                    candidate_names.append(name)
-
-            else:
-                # For primary campaign, show all registered candidates
-                signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
-
-                if signups_config:
-                    candidates_list = signups_config.get("candidates", [])
-                    for candidate in candidates_list:
-                        if (isinstance(candidate, dict) and
-                            candidate.get("year") == current_year and
-                            candidate.get("office") in ["President", "Vice President"]):
-                            name = candidate.get("name")
-                            if name:
-                                candidate_names.append(name)
-
-            # Remove duplicates and filter by current input
-            candidate_names = list(set(candidate_names))
-
-            # Filter by what the user has typed
-            if current:
-                filtered_names = [name for name in candidate_names if current.lower() in name.lower()]
-            else:
-                filtered_names = candidate_names
-
-            # Sort for better user experience
-            filtered_names.sort()
-
-            return [app_commands.Choice(name=name, value=name) for name in filtered_names[:25]]
+            names = await get_candidate_names(self.bot).matches(
+                interaction.guild.id, PRESIDENTIAL_TARGETS, current_phase, current_year, current
+            )
+            return [app_commands.Choice(name=name, value=name) for name in names]
 
         except Exception as e:
             print(f"Error in _get_presidential_candidate_choices: {e}")
@@ -1975,7 +1625,7 @@ class PresCampaignActions(commands.Cog):
     )
     async def pres_campaign_status(self, interaction: discord.Interaction):
         # Check if user is a presidential candidate
-        signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+        signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
 
         if not candidate:
             await interaction.response.send_message(
@@ -1985,7 +1635,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check current phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         current_phase = time_config.get("current_phase", "") if time_config else ""
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
@@ -2013,7 +1663,7 @@ class PresCampaignActions(commands.Cog):
             total_points = candidate.get("total_points", 0)
 
             # Calculate national polling percentage
-            general_percentages = self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
+            general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
             national_polling = general_percentages.get(candidate_name, 50.0)
 
             embed.add_field(
@@ -2058,8 +1708,8 @@ class PresCampaignActions(commands.Cog):
         cooldown_info = ""
 
         # Check speech cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_speech", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_speech", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_speech", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             cooldown_info += f"🎤 **Speech:** {hours}h {minutes}m remaining\n"
@@ -2067,8 +1717,8 @@ class PresCampaignActions(commands.Cog):
             cooldown_info += "✅ **Speech:** Available\n"
 
         # Check donor cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_donor", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_donor", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_donor", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             cooldown_info += f"💰 **Donor Appeal:** {hours}h {minutes}m remaining\n"
@@ -2076,8 +1726,8 @@ class PresCampaignActions(commands.Cog):
             cooldown_info += "✅ **Donor Appeal:** Available\n"
 
         # Check ad cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_ad", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_ad", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_ad", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             cooldown_info += f"📺 **Video Ad:** {hours}h {minutes}m remaining\n"
@@ -2085,8 +1735,8 @@ class PresCampaignActions(commands.Cog):
             cooldown_info += "✅ **Video Ad:** Available\n"
 
         # Check poster cooldown (1 hour)
-        if not self._check_cooldown(interaction.guild.id, interaction.user.id, "pres_poster", 1):
-            remaining = self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_poster", 1)
+        remaining = await self._get_cooldown_remaining(interaction.guild.id, interaction.user.id, "pres_poster", 1)
+        if remaining:
             hours = int(remaining.total_seconds() // 3600)
             minutes = int((remaining.total_seconds() % 3600) // 60)
             cooldown_info += f"🖼️ **Poster:** {hours}h {minutes}m remaining\n"
@@ -2137,7 +1787,7 @@ class PresCampaignActions(commands.Cog):
         filter_party: str = None,
         filter_office: str = None
     ):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -2157,7 +1807,7 @@ class PresCampaignActions(commands.Cog):
 
         if current_phase == "General Campaign":
             # Get from presidential winners
-            winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
+            winners_col, winners_config = await self._get_presidential_winners_config(interaction.guild.id)
             if winners_config:
                 primary_year = current_year - 1 if current_year % 2 == 0 else current_year
                 winners_data = winners_config.get("winners", [])
@@ -2176,7 +1826,7 @@ class PresCampaignActions(commands.Cog):
                 elif isinstance(winners_data, dict):
                     # Old dict format: {party: candidate_name}
                     # Need to get full candidate data from presidential signups
-                    signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+                    signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
                     if signups_config:
                         election_year = winners_config.get("election_year", current_year)
                         signup_year = election_year - 1 if election_year % 2 == 0 else election_year
@@ -2199,7 +1849,7 @@ class PresCampaignActions(commands.Cog):
                                             candidates.append(general_candidate)
         else:
             # Get from presidential signups
-            signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
             if signups_config:
                 candidates = [
                     c for c in signups_config.get("candidates", [])
@@ -2237,7 +1887,7 @@ class PresCampaignActions(commands.Cog):
                 user_mention = user.mention if user else candidate_name
 
                 if current_phase == "General Campaign":
-                    general_percentages = self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
+                    general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
                     polling = general_percentages.get(candidate_name, 50.0)
                     total_points = candidate.get("total_points", 0)
                     pres_text += (
@@ -2273,7 +1923,7 @@ class PresCampaignActions(commands.Cog):
                 user_mention = user.mention if user else candidate_name
 
                 if current_phase == "General Campaign":
-                    general_percentages = self._calculate_general_election_percentages(interaction.guild.id, "Vice President")
+                    general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, "Vice President")
                     polling = general_percentages.get(candidate_name, 50.0)
                     total_points = candidate.get("total_points", 0)
                     vp_text += (
@@ -2343,7 +1993,7 @@ class PresCampaignActions(commands.Cog):
         reason: str = "Admin adjustment"
     ):
         # Get target candidate
-        target_col, target_candidate = self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
+        target_col, target_candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
         if not target_candidate or not isinstance(target_candidate, dict):
             await interaction.response.send_message(
                 f"❌ Presidential candidate '{candidate_name}' not found.",
@@ -2352,7 +2002,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Check current phase to determine how to add points
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         current_phase = time_config.get("current_phase", "")
 
         if current_phase == "General Campaign":
@@ -2373,7 +2023,7 @@ class PresCampaignActions(commands.Cog):
                 return
 
             # Update state points and total points for general campaign
-            target_col.update_one(
+            await target_col.update_one(
                 {"guild_id": interaction.guild.id, "winners.user_id": target_candidate["user_id"]},
                 {
                     "$inc": {
@@ -2384,10 +2034,10 @@ class PresCampaignActions(commands.Cog):
             )
 
             # Transfer points to all_winners system for proper tracking
-            self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, points)
+            await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, state_upper, points)
 
             # Calculate new percentages
-            general_percentages = self._calculate_general_election_percentages(interaction.guild.id, target_candidate["office"])
+            general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, target_candidate["office"])
             updated_percentage = general_percentages.get(target_candidate["name"], 50.0)
 
             embed = discord.Embed(
@@ -2409,7 +2059,7 @@ class PresCampaignActions(commands.Cog):
 
         else:
             # For primary campaign, add to general points
-            target_col.update_one(
+            await target_col.update_one(
                 {"guild_id": interaction.guild.id, "candidates.user_id": target_candidate["user_id"]},
                 {
                     "$inc": {
@@ -2420,10 +2070,10 @@ class PresCampaignActions(commands.Cog):
 
             # Transfer points to all_winners system for proper tracking
             # For primary, we're adding to their general 'total_points' in all_winners
-            self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, "N/A", points) # State is not applicable for primary point transfer
+            await self._transfer_pres_points_to_winners(interaction.guild.id, target_candidate, "N/A", points) # State is not applicable for primary point transfer
 
             # Get updated points
-            updated_candidate_data = target_col.find_one({"guild_id": interaction.guild.id})
+            updated_candidate_data = await target_col.find_one({"guild_id": interaction.guild.id})
             updated_points = 0
             if updated_candidate_data and "candidates" in updated_candidate_data:
                 for candidate_data in updated_candidate_data.get("candidates", []):
@@ -2469,7 +2119,7 @@ class PresCampaignActions(commands.Cog):
     @app_commands.describe(candidate_name="The presidential candidate to poll (leave blank to poll yourself)")
     async def pres_poll(self, interaction: discord.Interaction, candidate_name: Optional[str] = None):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Presidential polls can only be conducted during campaign phases.",
@@ -2482,7 +2132,7 @@ class PresCampaignActions(commands.Cog):
 
         # If no candidate specified, check if user is a presidential candidate
         if not candidate_name:
-            signups_col, candidate = self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
+            signups_col, candidate = await self._get_user_presidential_candidate(interaction.guild.id, interaction.user.id)
             if not candidate:
                 await interaction.response.send_message(
                     "❌ You must specify a presidential candidate name or be a registered presidential candidate yourself.",
@@ -2492,7 +2142,7 @@ class PresCampaignActions(commands.Cog):
             candidate_name = candidate.get('name')
 
         # Get the presidential candidate
-        signups_col, candidate = self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
+        signups_col, candidate = await self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
         if not candidate or not isinstance(candidate, dict):
             await interaction.response.send_message(
                 f"❌ Presidential candidate '{candidate_name}' not found.",
@@ -2505,10 +2155,10 @@ class PresCampaignActions(commands.Cog):
 
         if current_phase == "General Campaign":
             # For general campaign, use population-weighted national polling
-            actual_percentage = self._calculate_national_polling_by_population(interaction.guild.id, candidate_display_name)
+            actual_percentage = await self._calculate_national_polling_by_population(interaction.guild.id, candidate_display_name)
         else:
             # For primary campaign, calculate based on points relative to competition
-            signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
             actual_percentage = 50.0  # Default fallback
             if signups_config:
                 current_year = time_config["current_rp_date"].year
@@ -2599,7 +2249,7 @@ class PresCampaignActions(commands.Cog):
         # Add context based on phase
         if current_phase == "Primary Campaign":
             # Show primary competition context
-            signups_col, signups_config = self._get_presidential_config(interaction.guild.id)
+            signups_col, signups_config = await self._get_presidential_config(interaction.guild.id)
             if signups_config:
                 primary_competitors = [
                     c for c in signups_config.get("candidates", [])
@@ -2616,7 +2266,7 @@ class PresCampaignActions(commands.Cog):
                     )
         else:
             # Show general election context
-            general_percentages = self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
+            general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, candidate["office"])
             if len(general_percentages) > 1:
                 embed.add_field(
                     name="🔍 General Election Context",
@@ -2645,79 +2295,13 @@ class PresCampaignActions(commands.Cog):
 
         return poll_result
 
-    def _calculate_national_polling_by_population(self, guild_id: int, candidate_name: str) -> float:
+    async def _calculate_national_polling_by_population(self, guild_id: int, candidate_name: str) -> float:
         """Calculate national polling using population-weighted state percentages"""
-        # State population data with percentages of national population
-        STATE_POPULATION_WEIGHTS = {
-            "CALIFORNIA": 12.07, "TEXAS": 8.16, "NEW YORK": 6.27, "FLORIDA": 6.09,
-            "PENNSYLVANIA": 4.11, "ILLINOIS": 4.15, "OHIO": 3.73, "MICHIGAN": 3.19,
-            "GEORGIA": 3.14, "NORTH CAROLINA": 3.10, "NEW JERSEY": 2.85, "VIRGINIA": 2.59,
-            "WASHINGTON": 2.18, "MASSACHUSETTS": 2.12, "INDIANA": 2.10, "ARIZONA": 2.07,
-            "TENNESSEE": 2.06, "MISSOURI": 1.94, "MARYLAND": 1.87, "WISCONSIN": 1.84,
-            "MINNESOTA": 1.72, "COLORADO": 1.63, "ALABAMA": 1.55, "SOUTH CAROLINA": 1.50,
-            "LOUISIANA": 1.47, "KENTUCKY": 1.41, "OREGON": 1.24, "OKLAHOMA": 1.22,
-            "CONNECTICUT": 1.16, "IOWA": 0.99, "ARKANSAS": 0.95, "UTAH": 0.90,
-            "NEVADA": 0.87, "NEW MEXICO": 0.67, "NEBRASKA": 0.59, "WEST VIRGINIA": 0.60,
-            "NEW HAMPSHIRE": 0.43, "MAINE": 0.43, "HAWAII": 0.44, "IDAHO": 0.51,
-            "MONTANA": 0.32, "RHODE ISLAND": 0.34, "DELAWARE": 0.29, "SOUTH DAKOTA": 0.26,
-            "NORTH DAKOTA": 0.22, "ALASKA": 0.23, "DISTRICT OF COLUMBIA": 0.20,
-            "VERMONT": 0.20, "WYOMING": 0.18, "KANSAS": 0.94, "MISSISSIPPI": 0.96
-        }
-
-        # Get candidate data
-        signups_col, candidate = self._get_presidential_candidate_by_name(guild_id, candidate_name)
+        signups_col, candidate = await self._get_presidential_candidate_by_name(guild_id, candidate_name)
         if not candidate:
             return 50.0
 
-        # Get candidate's party for baseline calculations
-        candidate_party = candidate.get("party", "").lower()
-
-        # Determine party alignment for baseline calculations
-        if "republican" in candidate_party:
-            party_alignment = "republican"
-        elif "democrat" in candidate_party:
-            party_alignment = "democrat"
-        else:
-            party_alignment = "other"
-
-        # Get state points for this candidate
-        state_points = candidate.get("state_points", {})
-
-        total_weighted_percentage = 0.0
-        total_population_weight = 0.0
-
-        # Calculate weighted polling across all states
-        for state_name, population_weight in STATE_POPULATION_WEIGHTS.items():
-            # Get base party support for this state
-            state_data = PRESIDENTIAL_STATE_DATA.get(state_name, {
-                "republican": 33.0, "democrat": 33.0, "other": 34.0
-            })
-
-            # Start with party baseline
-            base_support = state_data.get(party_alignment, 33.0)
-
-            # Add campaign points gained in this state
-            campaign_boost = state_points.get(state_name, 0.0)
-
-            # Calculate state polling (base + campaign effects)
-            state_polling = base_support + campaign_boost
-
-            # Apply realistic bounds (15% minimum, 85% maximum per state)
-            state_polling = max(15.0, min(85.0, state_polling))
-
-            # Weight by population
-            weighted_contribution = (state_polling / 100.0) * population_weight
-            total_weighted_percentage += weighted_contribution
-            total_population_weight += population_weight
-
-        # Calculate final national percentage
-        if total_population_weight > 0:
-            national_percentage = (total_weighted_percentage / total_population_weight) * 100.0
-        else:
-            national_percentage = 50.0
-
-        # Ensure reasonable bounds for national polling
-        return max(20.0, min(80.0, national_percentage))
+        return float(national_polling([candidate], PRESIDENTIAL_STATE_DATA)[0])
 
     @app_commands.command(
         name="pres_media_poll",
@@ -2726,7 +2310,7 @@ class PresCampaignActions(commands.Cog):
     @app_commands.describe(candidate_name="The presidential candidate to poll")
     async def pres_media_poll(self, interaction: discord.Interaction, candidate_name: str):
         # Check if we're in a campaign phase
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config or time_config.get("current_phase", "") not in ["Primary Campaign", "General Campaign"]:
             await interaction.response.send_message(
                 "❌ Polls can only be conducted during campaign phases.",
@@ -2738,7 +2322,7 @@ class PresCampaignActions(commands.Cog):
         current_year = time_config["current_rp_date"].year
 
         # Get the candidate
-        pres_col, candidate_data = self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
+        pres_col, candidate_data = await self._get_presidential_candidate_by_name(interaction.guild.id, candidate_name)
         if not candidate_data:
             await interaction.response.send_message(
                 f"❌ Presidential candidate '{candidate_name}' not found.",
@@ -2747,7 +2331,7 @@ class PresCampaignActions(commands.Cog):
             return
 
         # Calculate national polling percentage with 10% margin of error
-        actual_percentage = self._calculate_presidential_polling_percentage(interaction.guild.id, candidate_data)
+        actual_percentage = await self._calculate_presidential_polling_percentage(interaction.guild.id, candidate_data)
         poll_result = self._calculate_poll_result(actual_percentage, margin_of_error=10.0)
 
         # Generate media polling details
@@ -2812,18 +2396,18 @@ class PresCampaignActions(commands.Cog):
 
 
 
-    def _calculate_presidential_polling_percentage(self, guild_id: int, candidate_data: dict) -> float:
+    async def _calculate_presidential_polling_percentage(self, guild_id: int, candidate_data: dict) -> float:
         """Calculate presidential polling percentage based on candidate data"""
         # If in general campaign, use national polling
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_phase = time_config.get("current_phase", "") if time_config else ""
         candidate_name = candidate_data.get("name")
 
         if current_phase == "General Campaign":
-            return self._calculate_national_polling_by_population(guild_id, candidate_name)
+            return await self._calculate_national_polling_by_population(guild_id, candidate_name)
         else:
             # If in primary campaign, calculate based on points relative to competition
-            signups_col, signups_config = self._get_presidential_config(guild_id)
+            signups_col, signups_config = await self._get_presidential_config(guild_id)
             if signups_config:
                 current_year = time_config["current_rp_date"].year
                 primary_competitors = [
@@ -3,30 +3,31 @@ from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
 from typing import Optional
-from .ideology import STATE_DATA
+from .ideology import STATE_DATA, get_ideology_store
+from cogs.time_manager import get_rp_clock
 
 class PresidentialSignups(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         print("Presidential Signups cog loaded successfully")
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration for a guild"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
-    def _get_presidential_config(self, guild_id: int):
+    async def _get_presidential_config(self, guild_id: int):
         """Get or create presidential signups configuration for a guild"""
         col = self.bot.db["presidential_signups"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "candidates": [],  # Presidential and VP candidates
                 "pending_vp_requests": []  # VP requests pending acceptance
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
     def _get_available_choices(self):
@@ -83,7 +84,7 @@ class PresidentialSignups(commands.Cog):
         government: str,
         axis: str
     ):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -169,8 +170,9 @@ class PresidentialSignups(commands.Cog):
             )
             return
 
-        # Calculate ideology bonus based on state alignment
-        state_data = STATE_DATA[state_upper]
+        # Calculate ideology bonus based on this guild's (possibly shifted) state data
+        guild_ideology = await get_ideology_store(self.bot).guild(interaction.guild.id)
+        state_data = guild_ideology[state_upper]
         ideology_bonus = 0.0
 
         # Check alignment with state ideology
@@ -189,12 +191,12 @@ class PresidentialSignups(commands.Cog):
                 state_data[field] == candidate_ideology[field]):
                 ideology_bonus += 0.5  # 0.5 points per matching field
 
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Validate party role if configured
         party_cog = self.bot.get_cog("PartyManagement")
         if party_cog:
-            is_valid, error_msg = party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
+            is_valid, error_msg = await party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
             if not is_valid:
                 await interaction.response.send_message(f"❌ {error_msg}", ephemeral=True)
                 return
@@ -210,7 +212,7 @@ class PresidentialSignups(commands.Cog):
 
         # Check if user has a regular election signup
         signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+        signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
         if signups_config:
             for candidate in signups_config.get("candidates", []):
                 if (candidate["user_id"] == interaction.user.id and
@@ -258,7 +260,7 @@ class PresidentialSignups(commands.Cog):
 
         pres_config["candidates"].append(new_candidate)
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"candidates": pres_config["candidates"]}}
         )
@@ -336,7 +338,7 @@ class PresidentialSignups(commands.Cog):
         axis: str,
         presidential_candidate: str
     ):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -404,8 +406,9 @@ class PresidentialSignups(commands.Cog):
             )
             return
 
-        # Calculate ideology bonus based on state alignment
-        state_data = STATE_DATA[state_upper]
+        # Calculate ideology bonus based on this guild's (possibly shifted) state data
+        guild_ideology = await get_ideology_store(self.bot).guild(interaction.guild.id)
+        state_data = guild_ideology[state_upper]
         ideology_bonus = 0.0
 
         # Check alignment with state ideology
@@ -424,12 +427,12 @@ class PresidentialSignups(commands.Cog):
                 state_data[field] == candidate_ideology[field]):
                 ideology_bonus += 0.5  # 0.5 points per matching field
 
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Validate party role if configured
         party_cog = self.bot.get_cog("PartyManagement")
         if party_cog:
-            is_valid, error_msg = party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
+            is_valid, error_msg = await party_cog.validate_user_party_role(interaction.user, party, interaction.guild.id)
             if not is_valid:
                 await interaction.response.send_message(f"❌ {error_msg}", ephemeral=True)
                 return
@@ -488,7 +491,7 @@ class PresidentialSignups(commands.Cog):
 
         # Check if user has a regular election signup
         signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": interaction.guild.id})
+        signups_config = await signups_col.find_one({"guild_id": interaction.guild.id})
         if signups_config:
             for candidate in signups_config.get("candidates", []):
                 if (candidate["user_id"] == interaction.user.id and
@@ -534,7 +537,7 @@ class PresidentialSignups(commands.Cog):
 
         pres_config["pending_vp_requests"].append(vp_request)
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"pending_vp_requests": pres_config["pending_vp_requests"]}}
         )
@@ -589,14 +592,14 @@ class PresidentialSignups(commands.Cog):
         description="Accept a VP candidate for your presidential campaign"
     )
     async def accept_vp(self, interaction: discord.Interaction, vp_candidate_name: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
             return
 
         current_year = time_config["current_rp_date"].year
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Find user's presidential campaign
         user_pres_campaign = None
@@ -681,7 +684,7 @@ class PresidentialSignups(commands.Cog):
         # Remove the request
         pres_config["pending_vp_requests"][request_index]["status"] = "accepted"
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {
                 "candidates": pres_config["candidates"],
@@ -715,14 +718,14 @@ class PresidentialSignups(commands.Cog):
         description="Decline a VP candidate for your presidential campaign"
     )
     async def decline_vp(self, interaction: discord.Interaction, vp_candidate_name: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
             return
 
         current_year = time_config["current_rp_date"].year
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Find the VP request
         vp_request = None
@@ -746,7 +749,7 @@ class PresidentialSignups(commands.Cog):
         # Mark request as declined
         pres_config["pending_vp_requests"][request_index]["status"] = "declined"
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"pending_vp_requests": pres_config["pending_vp_requests"]}}
         )
@@ -761,7 +764,7 @@ class PresidentialSignups(commands.Cog):
         description="Withdraw from your presidential or VP campaign"
     )
     async def pres_withdraw(self, interaction: discord.Interaction):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message(
@@ -780,7 +783,7 @@ class PresidentialSignups(commands.Cog):
             )
             return
 
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Find user's campaign
         user_campaign = None
@@ -841,7 +844,7 @@ class PresidentialSignups(commands.Cog):
             if not (req["user_id"] == interaction.user.id or req["presidential_candidate_id"] == interaction.user.id)
         ]
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {
                 "candidates": pres_config["candidates"],
@@ -880,7 +883,7 @@ class PresidentialSignups(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def admin_cleanup_duplicates(self, interaction: discord.Interaction):
         """Remove duplicate presidential campaign entries"""
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Track users we've seen
         seen_users = {}
@@ -906,7 +909,7 @@ class PresidentialSignups(commands.Cog):
 
         if duplicates_removed > 0:
             # Update the database
-            pres_col.update_one(
+            await pres_col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"candidates": cleaned_candidates}}
             )
@@ -930,7 +933,7 @@ class PresidentialSignups(commands.Cog):
         interaction: discord.Interaction,
         year: int = None
     ):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -946,7 +949,7 @@ class PresidentialSignups(commands.Cog):
 
             # Check if presidential_winners collection has an election_year that matches target_year
             pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_config = pres_winners_col.find_one({"guild_id": interaction.guild.id})
+            pres_winners_config = await pres_winners_col.find_one({"guild_id": interaction.guild.id})
             
             general_candidates = []
 
@@ -964,7 +967,7 @@ class PresidentialSignups(commands.Cog):
                     # Fallback to old logic
                     signup_year = target_year - 1 if target_year % 2 == 0 else target_year
 
-                pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+                pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
                 
                 if pres_config:
                     for party, winner_name in party_winners.items():
@@ -983,7 +986,7 @@ class PresidentialSignups(commands.Cog):
             # If no winners from presidential_winners, check all_winners system as fallback
             if not general_candidates:
                 winners_col = self.bot.db["winners"]
-                winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+                winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
                 if winners_config and winners_config.get("winners"):
                     # Find presidential primary winners in all_winners system
@@ -997,7 +1000,7 @@ class PresidentialSignups(commands.Cog):
                     print(f"Debug: Found {len(presidential_winners)} presidential primary winners in all_winners system")
 
                     # Get full candidate data from presidential signups
-                    pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+                    pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
                     
                     if pres_config and presidential_winners:
                         for winner in presidential_winners:
@@ -1017,7 +1020,7 @@ class PresidentialSignups(commands.Cog):
                 # For fallback, use the stored election year if available, otherwise use target_year
                 fallback_signup_year = signup_year if 'signup_year' in locals() else (target_year - 1 if target_year % 2 == 0 else target_year)
                 
-                pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+                pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
                 
                 if pres_config:
                     all_presidential_candidates = [
@@ -1122,7 +1125,7 @@ class PresidentialSignups(commands.Cog):
 
         else:
             # During primary phases, show all registered candidates
-            pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+            pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
             # Get candidates for target year
             candidates = [c for c in pres_config["candidates"] if c["year"] == target_year]
@@ -1183,13 +1186,13 @@ class PresidentialSignups(commands.Cog):
         reason: Optional[str] = None
     ):
         """Force withdraw a presidential or VP candidate"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
             return
 
         current_year = time_config["current_rp_date"].year
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         user_campaign = None
         campaign_index = -1
@@ -1245,7 +1248,7 @@ class PresidentialSignups(commands.Cog):
                 if not (req["presidential_candidate_id"] == withdrawn_candidate["user_id"] and req["year"] == current_year)
             ]
 
-        pres_col.update_one(
+        await pres_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {
                 "candidates": pres_config["candidates"],
@@ -1339,12 +1342,12 @@ class PresidentialSignups(commands.Cog):
 
     @vp_signup.autocomplete("presidential_candidate")
     async def vp_presidential_candidate_autocomplete(self, interaction: discord.Interaction, current: str):
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
         if not time_config:
             return []
 
         current_year = time_config["current_rp_date"].year
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         available_presidents = [c["name"] for c in pres_config["candidates"] 
                               if c["year"] == current_year and c["office"] == "President"]
@@ -1366,7 +1369,7 @@ class PresidentialSignups(commands.Cog):
             party_cog = self.bot.get_cog("PartyManagement")
             if party_cog:
                 parties_col = self.bot.db["parties_config"]
-                config = parties_col.find_one({"guild_id": interaction.guild.id})
+                config = await parties_col.find_one({"guild_id": interaction.guild.id})
                 if config and "parties" in config:
                     party_names = [party["name"] for party in config["parties"]]
                     return [app_commands.Choice(name=name, value=name) 
@@ -1393,7 +1396,7 @@ class PresidentialSignups(commands.Cog):
             party_cog = self.bot.get_cog("PartyManagement")
             if party_cog:
                 parties_col = self.bot.db["parties_config"]
-                config = parties_col.find_one({"guild_id": interaction.guild.id})
+                config = await parties_col.find_one({"guild_id": interaction.guild.id})
                 if config and "parties" in config:
                     party_names = [party["name"] for party in config["parties"]]
                     return [app_commands.Choice(name=name, value=name) 
@@ -1503,9 +1506,9 @@ class PresidentialSignups(commands.Cog):
 
         ideology_col = self.bot.db["ideology_modifications"]
 
-        modifications = list(ideology_col.find(
+        modifications = await ideology_col.find(
             {"guild_id": interaction.guild.id}
-        ).sort("timestamp", -1).limit(limit))
+        ).sort("timestamp", -1).limit(limit).to_list(None)
 
         if not modifications:
             await interaction.response.send_message(
@@ -1566,7 +1569,7 @@ class PresidentialSignups(commands.Cog):
         year: int = None
     ):
         """View all presidential candidate points during primaries"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -1575,7 +1578,7 @@ class PresidentialSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Get candidates for target year
         candidates = [c for c in pres_config["candidates"] if c["year"] == target_year]
@@ -1704,9 +1707,9 @@ class PresidentialSignups(commands.Cog):
 
         ideology_col = self.bot.db["ideology_modifications"]
 
-        modifications = list(ideology_col.find(
+        modifications = await ideology_col.find(
             {"guild_id": interaction.guild.id}
-        ).sort("timestamp", -1).limit(limit))
+        ).sort("timestamp", -1).limit(limit).to_list(None)
 
         if not modifications:
             await interaction.response.send_message(
@@ -1767,9 +1770,9 @@ class PresidentialSignups(commands.Cog):
 
         ideology_col = self.bot.db["ideology_modifications"]
 
-        modifications = list(ideology_col.find(
+        modifications = await ideology_col.find(
             {"guild_id": interaction.guild.id}
-        ).sort("timestamp", -1).limit(limit))
+        ).sort("timestamp", -1).limit(limit).to_list(None)
 
         if not modifications:
             await interaction.response.send_message(
@@ -1830,7 +1833,7 @@ class PresidentialSignups(commands.Cog):
         year: int = None
     ):
         """View all presidential candidate points during primaries"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -1839,7 +1842,7 @@ class PresidentialSignups(commands.Cog):
         current_year = time_config["current_rp_date"].year
         target_year = year if year else current_year
 
-        pres_col, pres_config = self._get_presidential_config(interaction.guild.id)
+        pres_col, pres_config = await self._get_presidential_config(interaction.guild.id)
 
         # Get candidates for target year
         candidates = [c for c in pres_config["candidates"] if c["year"] == target_year]
@@ -1961,7 +1964,7 @@ class PresidentialSignups(commands.Cog):
             party_cog = self.bot.get_cog("PartyManagement")
             if party_cog:
                 parties_col = self.bot.db["parties_config"]
-                config = parties_col.find_one({"guild_id": interaction.guild.id})
+                config = await parties_col.find_one({"guild_id": interaction.guild.id})
                 if config and "parties" in config:
                     party_names = [party["name"] for party in config["parties"]]
                     return [app_commands.Choice(name=name, value=name) 
@@ -2,6 +2,8 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
+from cogs.time_manager import get_rp_clock
+from cogs.polling_engine import invalidate_state_baselines, national_polling
 
 # Presidential election state data
 # Data shows Republican/Democrat/Other percentages for each state
@@ -84,8 +86,12 @@ def _calculate_ideology_bonus_standalone(candidate_ideology: dict, state_ideolog
     # Return full calculated bonus (candidate alignment halving handled elsewhere when needed)
     return bonus
 
-def get_state_percentages(state_name: str, candidate_ideologies=None) -> dict:
-        """Get the Republican/Democrat/Other percentages for a specific state with ideology bonuses"""
+def get_state_percentages(state_name: str, candidate_ideologies=None, state_data=None) -> dict:
+        """Get the Republican/Democrat/Other percentages for a specific state with ideology bonuses.
+
+        `state_data` is the guild's state data (`await get_ideology_store(bot).guild(guild_id)`);
+        without it the unshifted STATE_DATA is used.
+        """
         state_key = state_name.upper()
         base_data = PRESIDENTIAL_STATE_DATA.get(state_key, {"republican": 0, "democrat": 0, "other": 0})
 
@@ -94,8 +100,9 @@ def get_state_percentages(state_name: str, candidate_ideologies=None) -> dict:
 
         # Import ideology data
         try:
-            from cogs.ideology import STATE_DATA
-            state_ideology_data = STATE_DATA.get(state_key, {})
+            if state_data is None:
+                from cogs.ideology import STATE_DATA as state_data
+            state_ideology_data = state_data.get(state_key, {})
         except ImportError:
             return base_data
 
@@ -141,22 +148,22 @@ class PresidentialWinners(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    def _get_presidential_winners_config(self, guild_id: int):
+    async def _get_presidential_winners_config(self, guild_id: int):
         """Get or create presidential winners configuration for a guild"""
         col = self.bot.db["presidential_winners"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "winners": {}
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get time configuration for a guild"""
         col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await get_rp_clock(self.bot).get_config(guild_id)
         return col, config
 
     @commands.Cog.listener()
@@ -180,7 +187,7 @@ class PresidentialWinners(commands.Cog):
         """Process presidential primary winners from signups to winners"""
         # Get presidential signups
         pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
+        pres_signups_config = await pres_signups_col.find_one({"guild_id": guild_id})
 
         if not pres_signups_config:
             return
@@ -192,7 +199,7 @@ class PresidentialWinners(commands.Cog):
             return
 
         # Get or create presidential winners config
-        pres_winners_col, pres_winners_config = self._get_presidential_winners_config(guild_id)
+        pres_winners_col, pres_winners_config = await self._get_presidential_winners_config(guild_id)
 
         # Group candidates by party for primary winners
         party_candidates = {}
@@ -218,7 +225,7 @@ class PresidentialWinners(commands.Cog):
         pres_winners_config["winners"] = winners
         pres_winners_config["election_year"] = election_year
 
-        pres_winners_col.update_one(
+        await pres_winners_col.update_one(
             {"guild_id": guild_id},
             {"$set": {"winners": winners, "election_year": election_year}}
         )
@@ -238,7 +245,7 @@ class PresidentialWinners(commands.Cog):
         year: int = None
     ):
         """Show the current primary winners"""
-        winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_presidential_winners_config(interaction.guild.id)
 
         winners = winners_config.get("winners", {})
 
@@ -289,7 +296,7 @@ class PresidentialWinners(commands.Cog):
         year: int = None
     ):
         """Show candidates in the general election"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -307,7 +314,7 @@ class PresidentialWinners(commands.Cog):
             return
 
         # Get primary winners who advanced to general election
-        winners_col, winners_config = self._get_presidential_winners_config(interaction.guild.id)
+        winners_col, winners_config = await self._get_presidential_winners_config(interaction.guild.id)
         
         if not winners_config:
             await interaction.response.send_message("❌ No presidential winners data found.", ephemeral=True)
@@ -323,7 +330,7 @@ class PresidentialWinners(commands.Cog):
         if party_winners:
             # Find full candidate data
             pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_config = pres_signups_col.find_one({"guild_id": interaction.guild.id})
+            pres_signups_config = await pres_signups_col.find_one({"guild_id": interaction.guild.id})
             
             if pres_signups_config:
                 for party, winner_name in party_winners.items():
@@ -336,7 +343,7 @@ class PresidentialWinners(commands.Cog):
 
         # Also check for independents who qualified through delegates
         delegates_col = self.bot.db["delegates_config"]
-        delegates_config = delegates_col.find_one({"guild_id": interaction.guild.id})
+        delegates_config = await delegates_col.find_one({"guild_id": interaction.guild.id})
         
         if delegates_config:
             delegate_threshold = delegates_config.get("delegate_threshold", 100)
@@ -371,7 +378,7 @@ class PresidentialWinners(commands.Cog):
         )
 
         # Calculate general election percentages
-        general_percentages = self._calculate_general_election_percentages(interaction.guild.id, "President")
+        general_percentages = await self._calculate_general_election_percentages(interaction.guild.id, "President")
 
         for candidate in general_candidates:
             vp_name = candidate.get("vp_candidate", "No VP selected")
@@ -403,13 +410,13 @@ class PresidentialWinners(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 
-    def _calculate_general_election_percentages(self, guild_id: int, office: str):
+    async def _calculate_general_election_percentages(self, guild_id: int, office: str):
         """Calculate general election percentages using state-by-state analysis with complete proportional redistribution"""
-        time_col, time_config = self._get_time_config(guild_id)
+        time_col, time_config = await self._get_time_config(guild_id)
         current_year = time_config["current_rp_date"].year if time_config else 2024
 
         # Get presidential winners (general election candidates)
-        winners_col, winners_config = self._get_presidential_winners_config(guild_id)
+        winners_col, winners_config = await self._get_presidential_winners_config(guild_id)
 
         if not winners_config:
             return {}
@@ -435,7 +442,7 @@ class PresidentialWinners(commands.Cog):
             # Old dict format: {party: candidate_name}
             # Need to get full candidate data from presidential signups
             signups_col = self.bot.db["presidential_signups"]
-            signups_config = signups_col.find_one({"guild_id": guild_id})
+            signups_config = await signups_col.find_one({"guild_id": guild_id})
             if signups_config:
                 election_year = winners_config.get("election_year", primary_year + 1)
                 signup_year = election_year - 1 if election_year % 2 == 0 else election_year
@@ -460,75 +467,13 @@ class PresidentialWinners(commands.Cog):
         if not candidates:
             return {}
 
-        # State population weights for national polling calculation
-        STATE_POPULATION_WEIGHTS = {
-            "CALIFORNIA": 12.07, "TEXAS": 8.16, "NEW YORK": 6.27, "FLORIDA": 6.09,
-            "PENNSYLVANIA": 4.11, "ILLINOIS": 4.15, "OHIO": 3.73, "MICHIGAN": 3.19,
-            "GEORGIA": 3.14, "NORTH CAROLINA": 3.10, "NEW JERSEY": 2.85, "VIRGINIA": 2.59,
-            "WASHINGTON": 2.18, "MASSACHUSETTS": 2.12, "INDIANA": 2.10, "ARIZONA": 2.07,
-            "TENNESSEE": 2.06, "MISSOURI": 1.94, "MARYLAND": 1.87, "WISCONSIN": 1.84,
-            "MINNESOTA": 1.72, "COLORADO": 1.63, "ALABAMA": 1.55, "SOUTH CAROLINA": 1.50,
-            "LOUISIANA": 1.47, "KENTUCKY": 1.41, "OREGON": 1.24, "OKLAHOMA": 1.22,
-            "CONNECTICUT": 1.16, "IOWA": 0.99, "ARKANSAS": 0.95, "UTAH": 0.90,
-            "NEVADA": 0.87, "NEW MEXICO": 0.67, "NEBRASKA": 0.59, "WEST VIRGINIA": 0.60,
-            "NEW HAMPSHIRE": 0.43, "MAINE": 0.43, "HAWAII": 0.44, "IDAHO": 0.51,
-            "MONTANA": 0.32, "RHODE ISLAND": 0.34, "DELAWARE": 0.29, "SOUTH DAKOTA": 0.26,
-            "NORTH DAKOTA": 0.22, "ALASKA": 0.23, "DISTRICT OF COLUMBIA": 0.20,
-            "VERMONT": 0.20, "WYOMING": 0.18, "KANSAS": 0.94, "MISSISSIPPI": 0.96
+        # National polling of every candidate from the state baseline matrix
+        national = national_polling(candidates, PRESIDENTIAL_STATE_DATA)
+        candidate_percentages = {
+            candidate.get("name"): float(percentage)
+            for candidate, percentage in zip(candidates, national)
         }
 
-        # Calculate state-by-state percentages for each candidate
-        candidate_percentages = {}
-
-        for candidate in candidates:
-            candidate_name = candidate.get("name")
-            candidate_party = candidate.get("party", "").lower()
-            state_points = candidate.get("state_points", {})
-
-            # Determine party alignment for baseline calculations
-            if "republican" in candidate_party:
-                party_alignment = "republican"
-            elif "democrat" in candidate_party:
-                party_alignment = "democrat"
-            else:
-                party_alignment = "other"
-
-            total_weighted_percentage = 0.0
-            total_population_weight = 0.0
-
-            # Calculate weighted polling across all states
-            for state_name, population_weight in STATE_POPULATION_WEIGHTS.items():
-                # Get base party support for this state
-                state_data = PRESIDENTIAL_STATE_DATA.get(state_name, {
-                    "republican": 33.0, "democrat": 33.0, "other": 34.0
-                })
-
-                # Start with party baseline
-                base_support = state_data.get(party_alignment, 33.0)
-
-                # Add campaign points gained in this state
-                campaign_boost = state_points.get(state_name, 0.0)
-
-                # Calculate state polling (base + campaign effects)
-                state_polling = base_support + campaign_boost
-
-                # Apply realistic bounds (15% minimum, 85% maximum per state)
-                state_polling = max(15.0, min(85.0, state_polling))
-
-                # Weight by population
-                weighted_contribution = (state_polling / 100.0) * population_weight
-                total_weighted_percentage += weighted_contribution
-                total_population_weight += population_weight
-
-            # Calculate final national percentage for this candidate
-            if total_population_weight > 0:
-                national_percentage = (total_weighted_percentage / total_population_weight) * 100.0
-            else:
-                national_percentage = 50.0
-
-            # Ensure reasonable bounds for national polling
-            candidate_percentages[candidate_name] = max(20.0, min(80.0, national_percentage))
-
         # Normalize percentages to sum to 100%
         total_percentage = sum(candidate_percentages.values())
         if total_percentage > 0:
@@ -537,35 +482,27 @@ class PresidentialWinners(commands.Cog):
 
         return candidate_percentages
 
-    def _get_presidential_candidates(self, guild_id: int, party: str, year: int):
+    async def _get_presidential_candidates(self, guild_id: int, party: str, year: int):
         """Get presidential candidates for a specific party and year"""
         col = self.bot.db["presidential_signups"]
-        config = col.find_one({"guild_id": guild_id})
+        candidates = await col.find_candidates({"guild_id": guild_id, "year": year})
+        return [candidate for candidate in candidates
+                if candidate.get("party", "").lower() == party.lower()]
 
-        if not config:
-            return []
-
-        candidates = []
-        for candidate in config.get("candidates", []):
-            if (candidate.get("party", "").lower() == party.lower() and 
-                candidate.get("year", 0) == year):
-                candidates.append(candidate)
-
-        return candidates
-
-    def _apply_post_election_ideology_shift(self, guild_id: int):
+    async def _apply_post_election_ideology_shift(self, guild_id: int):
         """Apply permanent ideology shift after presidential election ends"""
         global PRESIDENTIAL_STATE_DATA
 
         try:
-            # Import STATE_DATA from ideology module
-            from cogs.ideology import STATE_DATA
+            # This guild's state data, with the shifts its elections made
+            from cogs.ideology import get_ideology_store
+            guild_ideology = await get_ideology_store(self.bot).guild(guild_id)
 
             # Track changes for logging
             changes_made = []
 
-            # Update PRESIDENTIAL_STATE_DATA with values from STATE_DATA
-            for state_name, state_ideology_data in STATE_DATA.items():
+            # Update PRESIDENTIAL_STATE_DATA with the guild's shifted values
+            for state_name, state_ideology_data in guild_ideology.items():
                 if state_name in PRESIDENTIAL_STATE_DATA:
                     old_data = PRESIDENTIAL_STATE_DATA[state_name].copy()
 
@@ -587,6 +524,8 @@ class PresidentialWinners(commands.Cog):
                             "new": new_data
                         })
 
+            invalidate_state_baselines()
+
             # Log the ideology shift in database for tracking
             ideology_shift_col = self.bot.db["ideology_shifts"]
             shift_record = {
@@ -596,37 +535,37 @@ class PresidentialWinners(commands.Cog):
                 "changes": changes_made,
                 "total_states_affected": len(changes_made)
             }
-            ideology_shift_col.insert_one(shift_record)
+            await ideology_shift_col.insert_one(shift_record)
 
             return changes_made
 
         except ImportError:
-            print("Warning: Could not import STATE_DATA from ideology module")
+            print("Warning: Could not import the ideology module")
             return []
         except Exception as e:
             print(f"Error applying post-election ideology shift: {e}")
             return []
 
-    def _reset_all_candidate_points(self, guild_id: int):
+    async def _reset_all_candidate_points(self, guild_id: int):
         """Reset all presidential candidate points to 0 for new election cycle"""
         try:
             # Reset presidential signups points
             pres_signups_col = self.bot.db["presidential_signups"]
-            pres_signups_col.update_one(
+            await pres_signups_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"candidates.$[].points": 0, "candidates.$[].total_points": 0}}
             )
 
             # Reset presidential winners points
             pres_winners_col = self.bot.db["presidential_winners"]
-            pres_winners_col.update_one(
+            await pres_winners_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"winners.$[].total_points": 0, "winners.$[].state_points": {}}}
             )
 
             # Reset delegates points if they exist
             delegates_col = self.bot.db["delegates_config"]
-            delegates_col.update_one(
+            await delegates_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"candidates.$[].points": 0}}
             )
@@ -637,10 +576,10 @@ class PresidentialWinners(commands.Cog):
             print(f"Error resetting candidate points: {e}")
             return False
 
-    def _reset_presidential_candidates_for_general_campaign(self, guild_id: int, current_year: int):
+    async def _reset_presidential_candidates_for_general_campaign(self, guild_id: int, current_year: int):
         """Reset presidential candidates for the general campaign phase."""
         pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": guild_id})
+        pres_signups_config = await pres_signups_col.find_one({"guild_id": guild_id})
 
         if pres_signups_config:
             # Filter out candidates from the previous election year and reset points
@@ -651,14 +590,14 @@ class PresidentialWinners(commands.Cog):
                     candidate["total_points"] = 0
                 updated_candidates.append(candidate)
 
-            pres_signups_col.update_one(
+            await pres_signups_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"candidates": updated_candidates}}
             )
 
         # Also reset presidential candidates in all_winners system
         winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
+        winners_config = await winners_col.find_one({"guild_id": guild_id})
 
         if winners_config:
             updated_count = 0
@@ -674,7 +613,7 @@ class PresidentialWinners(commands.Cog):
                     updated_count += 1
 
             if updated_count > 0:
-                winners_col.update_one(
+                await winners_col.update_one(
                     {"guild_id": guild_id},
                     {"$set": {"winners": winners_config["winners"]}}
                 )
@@ -694,7 +633,7 @@ class PresidentialWinners(commands.Cog):
         confirm: bool = False
     ):
         """Manually process presidential primary winners from signups"""
-        time_col, time_config = self._get_time_config(interaction.guild.id)
+        time_col, time_config = await self._get_time_config(interaction.guild.id)
 
         if not time_config:
             await interaction.response.send_message("❌ Election system not configured.", ephemeral=True)
@@ -745,7 +684,7 @@ class PresidentialWinners(commands.Cog):
 
         # Get presidential signups from from_year
         pres_signups_col = self.bot.db["presidential_signups"]
-        pres_signups_config = pres_signups_col.find_one({"guild_id": interaction.guild.id})
+        pres_signups_config = await pres_signups_col.find_one({"guild_id": interaction.guild.id})
 
         if not pres_signups_config:
             await interaction.response.send_message("❌ No presidential signups found.", ephemeral=True)
@@ -772,13 +711,13 @@ class PresidentialWinners(commands.Cog):
         """Transfer presidential primary winners to the all_winners system"""
         # Get or create all_winners configuration
         winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
+        winners_config = await winners_col.find_one({"guild_id": guild_id})
         if not winners_config:
             winners_config = {
                 "guild_id": guild_id,
                 "winners": []
             }
-            winners_col.insert_one(winners_config)
+            await winners_col.insert_one(winners_config)
 
         # Create winner entries for all_winners system
         all_winners_entries = []
@@ -834,7 +773,7 @@ class PresidentialWinners(commands.Cog):
                 winners_config["winners"] = []
             winners_config["winners"].extend(all_winners_entries)
 
-            winners_col.update_one(
+            await winners_col.update_one(
                 {"guild_id": guild_id},
                 {"$set": {"winners": winners_config["winners"]}}
             )
@@ -856,7 +795,7 @@ class PresidentialWinners(commands.Cog):
     ):
         """Admin command to view all winners"""
         winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": interaction.guild.id})
+        winners_config = await winners_col.find_one({"guild_id": interaction.guild.id})
 
         if not winners_config or not winners_config.get("winners"):
             await interaction.response.send_message("No winners found in the system.", ephemeral=True)
@@ -952,6 +891,7 @@ class PresidentialWinners(commands.Cog):
         PRESIDENTIAL_STATE_DATA[state_upper]["republican"] = round(republican, 1)
         PRESIDENTIAL_STATE_DATA[state_upper]["democrat"] = round(democrat, 1)
         PRESIDENTIAL_STATE_DATA[state_upper]["other"] = round(other, 1)
+        invalidate_state_baselines()
 
         # Create response embed
         embed = discord.Embed(
@@ -0,0 +1,166 @@
+"""Materialized seat polling shared by the poll commands.
+
+A seat's general election percentages only change when one of its
+candidates gains points, picks up corruption, changes party or seat, or -
+for presidential tickets during the General Campaign - when momentum moves.
+`SeatPollingView` keeps the last computed percentages of every seat polled
+so far, in memory and in the `seat_polling` collection so they survive a
+restart, and polls read them back instead of recomputing.
+
+The view listens to writes on `winners` and `momentum_config` and drops only
+the snapshots those writes can affect: a points update on one candidate
+drops that candidate's seat, a momentum update drops the guild's
+presidential seats. Stamina and other bookkeeping updates are ignored. A
+snapshot also records the RP year and phase it was computed for and is not
+used once either has moved on. Writes made outside this process are not
+seen until `invalidate`.
+"""
+
+import threading
+from datetime import datetime
+
+from cogs.indexes import register_index
+
+# Candidate fields that feed a seat's percentages; writes touching none of them keep the snapshot
+POLLING_INPUT_FIELDS = frozenset({
+    "candidate", "name", "party", "points", "corruption", "primary_winner",
+    "seat_id", "year", "office", "state_points",
+})
+
+register_index("seat_polling", [("guild_id", 1), ("seat_id", 1)], owner=__name__)
+
+class SeatPollingView:
+    """Per-seat general election percentages, recomputed only after a relevant write.
+
+    `percentages` takes a `compute(guild_id, seat_ids, time_config)`
+    coroutine returning `{seat_id: (percentages, uses_momentum)}` for the
+    seats that have candidates, and only calls it for seats without a
+    current snapshot.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._snapshots = {}  # (guild_id, seat_id) -> snapshot
+        self._loaded_guilds = set()
+        # Bumped by every invalidation of a guild (or of all guilds), so a computation that raced a write is not stored
+        self._generation = 0
+        self._guild_generations = {}
+        self._lock = threading.Lock()
+        db["winners"].add_listener(self._on_candidates_change)
+        db["momentum_config"].add_listener(self._on_momentum_change)
+
+    def close(self):
+        """Stop listening to the database"""
+        self.db["winners"].remove_listener(self._on_candidates_change)
+        self.db["momentum_config"].remove_listener(self._on_momentum_change)
+
+    async def percentages(self, guild_id: int, seat_ids: list, time_config, compute) -> dict:
+        """Percentages of the given seats that have candidates, as {seat_id: {candidate: percentage}}"""
+        year = time_config["current_rp_date"].year if time_config else 2024
+        phase = time_config.get("current_phase", "") if time_config else ""
+        if guild_id not in self._loaded_guilds:
+            await self._load_guild(guild_id)
+
+        results = {}
+        missing = []
+        for seat_id in dict.fromkeys(seat_ids):
+            snapshot = self._snapshots.get((guild_id, seat_id))
+            if snapshot is not None and snapshot["year"] == year and snapshot["phase"] == phase:
+                if snapshot["percentages"]:
+                    results[seat_id] = snapshot["percentages"]
+            else:
+                missing.append(seat_id)
+        if not missing:
+            return results
+
+        generation = self._generation_of(guild_id)
+        computed = await compute(guild_id, missing, time_config)
+        stored = []
+        with self._lock:
+            current = generation == self._generation_of(guild_id)
+            for seat_id in missing:
+                percentages, uses_momentum = computed.get(seat_id, ({}, False))
+                if percentages:
+                    results[seat_id] = percentages
+                if current:
+                    snapshot = {"guild_id": guild_id, "seat_id": seat_id, "year": year, "phase": phase,
+                                "percentages": percentages, "uses_momentum": uses_momentum}
+                    self._snapshots[(guild_id, seat_id)] = snapshot
+                    if percentages:
+                        stored.append(snapshot)
+        if stored:
+            await self.db.run(self._persist, stored, generation)
+        return results
+
+    async def invalidate(self, guild_id: int = None):
+        """Drop snapshots so they are recomputed on next use"""
+        await self.db.run(self._drop, guild_id, None, False)
+
+    def _generation_of(self, guild_id: int) -> tuple:
+        return self._generation, self._guild_generations.get(guild_id, 0)
+
+    async def _load_guild(self, guild_id: int):
+        generation = self._generation_of(guild_id)
+        documents = await self.db["seat_polling"].find({"guild_id": guild_id}, {"_id": 0}).to_list(None)
+        with self._lock:
+            if generation != self._generation_of(guild_id):
+                return
+            for document in documents:
+                document["percentages"] = dict(document["percentages"])
+                self._snapshots.setdefault((guild_id, document["seat_id"]), document)
+            self._loaded_guilds.add(guild_id)
+
+    def _persist(self, snapshots: list, generation: tuple):
+        collection = self.db["seat_polling"].sync
+        for snapshot in snapshots:
+            # Candidate names may contain dots, so percentages are stored as [name, percentage] pairs
+            document = {**snapshot, "percentages": [[name, value] for name, value in snapshot["percentages"].items()],
+                        "updated_at": datetime.utcnow()}
+            collection.replace_one({"guild_id": snapshot["guild_id"], "seat_id": snapshot["seat_id"]},
+                                   document, upsert=True)
+        # A write that landed meanwhile already deleted what it invalidated; delete what was re-added
+        if generation != self._generation_of(snapshots[0]["guild_id"]):
+            for snapshot in snapshots:
+                if (snapshot["guild_id"], snapshot["seat_id"]) not in self._snapshots:
+                    collection.delete_one({"guild_id": snapshot["guild_id"], "seat_id": snapshot["seat_id"]})
+
+    def _drop(self, guild_id, seat_ids, momentum_only: bool):
+        with self._lock:
+            if guild_id is None:
+                self._generation += 1
+                self._loaded_guilds.clear()
+            else:
+                self._guild_generations[guild_id] = self._guild_generations.get(guild_id, 0) + 1
+            for key, snapshot in list(self._snapshots.items()):
+                if guild_id is not None and key[0] != guild_id:
+                    continue
+                if seat_ids is not None and key[1] not in seat_ids:
+                    continue
+                if momentum_only and not snapshot.get("uses_momentum"):
+                    continue
+                del self._snapshots[key]
+
+        query = {} if guild_id is None else {"guild_id": guild_id}
+        if seat_ids is not None:
+            query["seat_id"] = {"$in": list(seat_ids)}
+        if momentum_only:
+            query["uses_momentum"] = True
+        self.db["seat_polling"].sync.delete_many(query)
+
+    def _on_candidates_change(self, guild_id, seat_ids, fields):
+        if fields is not None and not POLLING_INPUT_FIELDS.intersection(fields):
+            return
+        self._drop(guild_id, seat_ids, momentum_only=False)
+
+    def _on_momentum_change(self, guild_id, seat_ids, fields):
+        self._drop(guild_id, None, momentum_only=True)
+
+def get_seat_polling(bot) -> SeatPollingView:
+    """The bot's seat polling view, created on first use"""
+    view = getattr(bot, "seat_polling", None)
+    if view is None or view.db is not bot.db:
+        if view is not None:
+            view.close()
+        view = SeatPollingView(bot.db)
+        bot.seat_polling = view
+    return view
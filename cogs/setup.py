@@ -8,12 +8,12 @@ class Setup(commands.Cog):
         self.bot = bot
         print("Setup cog loaded successfully")
 
-    def _get_config(self, guild_id: int):
+    async def _get_config(self, guild_id: int):
         """
         Returns (or creates) the config document for this guild.
         """
         col = self.bot.db["guild_configs"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
@@ -21,7 +21,7 @@ class Setup(commands.Cog):
                 "start_datetime": None,
                 "announcement_channel_id": None
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
     # Create a command group
@@ -39,13 +39,13 @@ class Setup(commands.Cog):
         interaction: discord.Interaction,
         state: str  # e.g. "NY" or "California"
     ):
-        col, config = self._get_config(interaction.guild.id)
+        col, config = await self._get_config(interaction.guild.id)
         state = state.upper()
         if state in config["regions"]:
             await interaction.response.send_message(f"🔸 `{state}` is already a region.", ephemeral=True)
             return
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$push": {"regions": state}}
         )
@@ -60,13 +60,13 @@ class Setup(commands.Cog):
         interaction: discord.Interaction,
         state: str
     ):
-        col, config = self._get_config(interaction.guild.id)
+        col, config = await self._get_config(interaction.guild.id)
         state = state.upper()
         if state not in config["regions"]:
             await interaction.response.send_message(f"🔸 `{state}` isn't in the regions list.", ephemeral=True)
             return
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$pull": {"regions": state}}
         )
@@ -77,7 +77,7 @@ class Setup(commands.Cog):
         description="Show current election configuration"
     )
     async def show_config(self, interaction: discord.Interaction):
-        _, config = self._get_config(interaction.guild.id)
+        _, config = await self._get_config(interaction.guild.id)
         
         embed = discord.Embed(
             title="🗳️ Election Configuration",
@@ -106,7 +106,7 @@ class Setup(commands.Cog):
         description="List all the US states you've added as regions"
     )
     async def list_regions(self, interaction: discord.Interaction):
-        _, config = self._get_config(interaction.guild.id)
+        _, config = await self._get_config(interaction.guild.id)
         regions = config["regions"]
         if not regions:
             await interaction.response.send_message("⚠️ No regions set yet.", ephemeral=True)
@@ -135,8 +135,8 @@ class Setup(commands.Cog):
             )
             return
 
-        col, config = self._get_config(interaction.guild.id)
-        col.update_one(
+        col, config = await self._get_config(interaction.guild.id)
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"start_datetime": start_dt.isoformat()}}
         )
@@ -162,8 +162,8 @@ class Setup(commands.Cog):
             )
             return
             
-        col, config = self._get_config(interaction.guild.id)
-        col.update_one(
+        col, config = await self._get_config(interaction.guild.id)
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"announcement_channel_id": channel.id}}
         )
@@ -180,8 +180,8 @@ class Setup(commands.Cog):
         self,
         interaction: discord.Interaction
     ):
-        col, config = self._get_config(interaction.guild.id)
-        col.update_one(
+        col, config = await self._get_config(interaction.guild.id)
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$unset": {"announcement_channel_id": ""}}
         )
@@ -226,8 +226,8 @@ class Setup(commands.Cog):
                 )
                 return
 
-            col, config = self._get_config(interaction.guild.id)
-            col.update_one(
+            col, config = await self._get_config(interaction.guild.id)
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"announcement_channel_id": channel_id_int}}
             )
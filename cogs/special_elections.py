@@ -5,6 +5,11 @@ from datetime import datetime, timedelta
 import random
 import asyncio
 from typing import Optional
+from cogs.indexes import COOLDOWN_TTL_SECONDS, register_index
+
+# Query shapes this cog runs, created at startup by the db cog
+register_index("special_election_cooldowns", [("guild_id", 1), ("user_id", 1), ("action", 1)], owner=__name__)
+register_index("special_election_cooldowns", [("timestamp", 1)], owner=__name__, expireAfterSeconds=COOLDOWN_TTL_SECONDS)
 
 class SpecialElections(commands.Cog):
     def __init__(self, bot):
@@ -22,32 +27,32 @@ class SpecialElections(commands.Cog):
         default_permissions=discord.Permissions(administrator=True)
     )
 
-    def _get_special_config(self, guild_id: int):
+    async def _get_special_config(self, guild_id: int):
         """Get or create special elections configuration"""
         col = self.bot.db["special_elections"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         if not config:
             config = {
                 "guild_id": guild_id,
                 "active_elections": [],
                 "completed_elections": []
             }
-            col.insert_one(config)
+            await col.insert_one(config)
         return col, config
 
-    def _get_elections_config(self, guild_id: int):
+    async def _get_elections_config(self, guild_id: int):
         """Get elections configuration to access seats"""
         col = self.bot.db["elections_config"]
-        config = col.find_one({"guild_id": guild_id})
+        config = await col.find_one({"guild_id": guild_id})
         return col, config
 
     def _is_house_seat(self, seat_id: str) -> bool:
         """Check if seat is a House seat (eligible for special elections)"""
         return seat_id.startswith("REP-") or "District" in seat_id
 
-    def _get_active_special_election(self, guild_id: int, seat_id: Optional[str] = None):
+    async def _get_active_special_election(self, guild_id: int, seat_id: Optional[str] = None):
         """Get active special election for a seat or any active election"""
-        col, config = self._get_special_config(guild_id)
+        col, config = await self._get_special_config(guild_id)
 
         for election in config.get("active_elections", []):
             if seat_id is None or election["seat_id"] == seat_id:
@@ -60,10 +65,10 @@ class SpecialElections(commands.Cog):
         poll_result = actual_percentage + variation
         return max(0.1, min(99.9, poll_result))
 
-    def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
+    async def _determine_stamina_user(self, guild_id: int, user_id: int, target_candidate_data: dict, stamina_cost: float):
         """Determines whether the user or the target candidate pays the stamina cost."""
         # Get the user's candidate data from active special election
-        active_election = self._get_active_special_election(guild_id)
+        active_election = await self._get_active_special_election(guild_id)
         user_candidate_data = None
 
         if active_election:
@@ -83,9 +88,9 @@ class SpecialElections(commands.Cog):
         # If neither can pay, return the target's user ID as a fallback (though the action will likely fail).
         return target_candidate_data.get("user_id") if target_candidate_data else user_id
 
-    def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float):
+    async def _deduct_stamina_from_user(self, guild_id: int, user_id: int, cost: float):
         """Deducts stamina from a user's candidate profile in the active special election."""
-        col, config = self._get_special_config(guild_id)
+        col, config = await self._get_special_config(guild_id)
 
         for i, election in enumerate(config["active_elections"]):
             for j, candidate in enumerate(election["candidates"]):
@@ -93,7 +98,7 @@ class SpecialElections(commands.Cog):
                     election["candidates"][j]["stamina"] = max(0, candidate.get("stamina", 100) - cost)
                     config["active_elections"][i] = election
 
-                    col.update_one(
+                    await col.update_one(
                         {"guild_id": guild_id},
                         {"$set": {"active_elections": config["active_elections"]}}
                     )
@@ -102,7 +107,7 @@ class SpecialElections(commands.Cog):
     # Autocomplete methods for admin commands
     async def _get_house_seats_autocomplete(self, interaction: discord.Interaction, current: str):
         """Get House seats for autocomplete"""
-        elections_col, elections_config = self._get_elections_config(interaction.guild.id)
+        elections_col, elections_config = await self._get_elections_config(interaction.guild.id)
         if not elections_config:
             return []
         
@@ -114,7 +119,7 @@ class SpecialElections(commands.Cog):
 
     async def _get_active_special_elections_autocomplete(self, interaction: discord.Interaction, current: str):
         """Get active special elections for autocomplete"""
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
         
         choices = []
         for election in config.get("active_elections", []):
@@ -137,7 +142,7 @@ class SpecialElections(commands.Cog):
         party: str
     ):
         # Check if there's an active special election
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently taking signups.",
@@ -166,7 +171,7 @@ class SpecialElections(commands.Cog):
                 return
 
         # Get seat information
-        elections_col, elections_config = self._get_elections_config(interaction.guild.id)
+        elections_col, elections_config = await self._get_elections_config(interaction.guild.id)
         seat_info = None
         for seat in elections_config.get("seats", []):
             if seat["seat_id"] == active_election["seat_id"]:
@@ -194,7 +199,7 @@ class SpecialElections(commands.Cog):
         }
 
         # Add candidate to election
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
 
         for i, election in enumerate(config["active_elections"]):
             if election["seat_id"] == active_election["seat_id"]:
@@ -204,7 +209,7 @@ class SpecialElections(commands.Cog):
                 config["active_elections"][i] = election
                 break
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"active_elections": config["active_elections"]}}
         )
@@ -255,7 +260,7 @@ class SpecialElections(commands.Cog):
 
     # Helper function to get candidate autocomplete choices
     async def _get_special_candidate_choices(self, interaction: discord.Interaction, current: str):
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             return []
         
@@ -277,7 +282,7 @@ class SpecialElections(commands.Cog):
         target: Optional[str] = None
     ):
         # Check if user is in an active special election
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently running.",
@@ -331,7 +336,7 @@ class SpecialElections(commands.Cog):
         
         # Determine who pays stamina cost
         stamina_cost = 6
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Check if stamina user has enough stamina
         stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else user_candidate
@@ -346,7 +351,7 @@ class SpecialElections(commands.Cog):
 
         # Check cooldown
         cooldowns_col = self.bot.db["special_election_cooldowns"]
-        last_action = cooldowns_col.find_one({
+        last_action = await cooldowns_col.find_one({
             "guild_id": interaction.guild.id,
             "user_id": interaction.user.id,
             "action": "speech"
@@ -395,7 +400,7 @@ class SpecialElections(commands.Cog):
                 return
 
             # Set cooldown after successful validation
-            cooldowns_col.update_one(
+            await cooldowns_col.update_one(
                 {
                     "guild_id": interaction.guild.id,
                     "user_id": interaction.user.id,
@@ -414,7 +419,7 @@ class SpecialElections(commands.Cog):
             points_gained = random.uniform(2.0, 4.0)
 
             # Update candidate points
-            col, config = self._get_special_config(interaction.guild.id)
+            col, config = await self._get_special_config(interaction.guild.id)
 
             for i, election in enumerate(config["active_elections"]):
                 if election["seat_id"] == active_election["seat_id"]:
@@ -425,13 +430,13 @@ class SpecialElections(commands.Cog):
                             break
                     break
 
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"active_elections": config["active_elections"]}}
             )
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
             embed = discord.Embed(
                 title="🎤 Special Election Campaign Speech",
@@ -488,7 +493,7 @@ class SpecialElections(commands.Cog):
         target: Optional[str] = None
     ):
         # Check if user is in an active special election
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently running.",
@@ -542,7 +547,7 @@ class SpecialElections(commands.Cog):
 
         # Determine who pays stamina cost
         stamina_cost = 4
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Check if stamina user has enough stamina
         stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else user_candidate
@@ -557,7 +562,7 @@ class SpecialElections(commands.Cog):
 
         # Check cooldown
         cooldowns_col = self.bot.db["special_election_cooldowns"]
-        last_action = cooldowns_col.find_one({
+        last_action = await cooldowns_col.find_one({
             "guild_id": interaction.guild.id,
             "user_id": interaction.user.id,
             "action": "poster"
@@ -590,7 +595,7 @@ class SpecialElections(commands.Cog):
             return
 
         # Set cooldown after successful validation
-        cooldowns_col.update_one(
+        await cooldowns_col.update_one(
             {
                 "guild_id": interaction.guild.id,
                 "user_id": interaction.user.id,
@@ -609,7 +614,7 @@ class SpecialElections(commands.Cog):
         points_gained = random.uniform(1.0, 3.0)
 
         # Update candidate points
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
 
         for i, election in enumerate(config["active_elections"]):
             if election["seat_id"] == active_election["seat_id"]:
@@ -620,13 +625,13 @@ class SpecialElections(commands.Cog):
                         break
                 break
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"active_elections": config["active_elections"]}}
         )
 
         # Deduct stamina from the determined user
-        self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+        await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
         embed = discord.Embed(
             title="📋 Special Election Campaign Posters",
@@ -672,7 +677,7 @@ class SpecialElections(commands.Cog):
         target: Optional[str] = None
     ):
         # Check if user is in an active special election
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently running.",
@@ -726,7 +731,7 @@ class SpecialElections(commands.Cog):
 
         # Determine who pays stamina cost
         stamina_cost = 5
-        stamina_user_id = self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
+        stamina_user_id = await self._determine_stamina_user(interaction.guild.id, interaction.user.id, target_candidate, stamina_cost)
 
         # Check if stamina user has enough stamina
         stamina_user_candidate = target_candidate if stamina_user_id == target_candidate.get("user_id") else user_candidate
@@ -741,7 +746,7 @@ class SpecialElections(commands.Cog):
 
         # Check cooldown
         cooldowns_col = self.bot.db["special_election_cooldowns"]
-        last_action = cooldowns_col.find_one({
+        last_action = await cooldowns_col.find_one({
             "guild_id": interaction.guild.id,
             "user_id": interaction.user.id,
             "action": "ad"
@@ -796,7 +801,7 @@ class SpecialElections(commands.Cog):
                 return
 
             # Set cooldown after successful validation
-            cooldowns_col.update_one(
+            await cooldowns_col.update_one(
                 {
                     "guild_id": interaction.guild.id,
                     "user_id": interaction.user.id,
@@ -815,7 +820,7 @@ class SpecialElections(commands.Cog):
             points_gained = random.uniform(3.0, 6.0)
 
             # Update candidate points
-            col, config = self._get_special_config(interaction.guild.id)
+            col, config = await self._get_special_config(interaction.guild.id)
 
             for i, election in enumerate(config["active_elections"]):
                 if election["seat_id"] == active_election["seat_id"]:
@@ -826,13 +831,13 @@ class SpecialElections(commands.Cog):
                             break
                     break
 
-            col.update_one(
+            await col.update_one(
                 {"guild_id": interaction.guild.id},
                 {"$set": {"active_elections": config["active_elections"]}}
             )
 
             # Deduct stamina from the determined user
-            self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
+            await self._deduct_stamina_from_user(interaction.guild.id, stamina_user_id, stamina_cost)
 
             embed = discord.Embed(
                 title="📺 Special Election Campaign Advertisement",
@@ -875,7 +880,7 @@ class SpecialElections(commands.Cog):
         description="View the current special election timeline and status"
     )
     async def special_calendar(self, interaction: discord.Interaction):
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently running.",
@@ -967,7 +972,7 @@ class SpecialElections(commands.Cog):
         interaction: discord.Interaction,
         candidate_name: Optional[str] = None
     ):
-        active_election = self._get_active_special_election(interaction.guild.id)
+        active_election = await self._get_active_special_election(interaction.guild.id)
         if not active_election:
             await interaction.response.send_message(
                 "❌ No active special elections are currently running.",
@@ -1120,7 +1125,7 @@ class SpecialElections(commands.Cog):
         reason: str = "Seat became vacant"
     ):
         # Check if seat exists and is a House seat
-        elections_col, elections_config = self._get_elections_config(interaction.guild.id)
+        elections_col, elections_config = await self._get_elections_config(interaction.guild.id)
         if not elections_config:
             await interaction.response.send_message(
                 "❌ Elections system not configured.",
@@ -1149,7 +1154,7 @@ class SpecialElections(commands.Cog):
             return
 
         # Check if there's already an active special election for this seat
-        active_election = self._get_active_special_election(interaction.guild.id, seat_id)
+        active_election = await self._get_active_special_election(interaction.guild.id, seat_id)
         if active_election:
             await interaction.response.send_message(
                 f"❌ There is already an active special election for seat '{seat_id}'.",
@@ -1173,12 +1178,12 @@ class SpecialElections(commands.Cog):
         }
 
         # Add to database
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
         if "active_elections" not in config:
             config["active_elections"] = []
         config["active_elections"].append(new_election)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"active_elections": config["active_elections"]}}
         )
@@ -1194,7 +1199,7 @@ class SpecialElections(commands.Cog):
                 })
                 break
 
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": elections_config["seats"]}}
         )
@@ -1251,7 +1256,7 @@ class SpecialElections(commands.Cog):
         seat_id: str
     ):
         # Find the active special election
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
 
         active_election = None
         election_index = None
@@ -1280,7 +1285,7 @@ class SpecialElections(commands.Cog):
         winner = max(candidates, key=lambda x: x.get("points", 0))
 
         # Update seat with winner
-        elections_col, elections_config = self._get_elections_config(interaction.guild.id)
+        elections_col, elections_config = await self._get_elections_config(interaction.guild.id)
 
         for i, seat in enumerate(elections_config["seats"]):
             if seat["seat_id"].upper() == seat_id.upper():
@@ -1294,7 +1299,7 @@ class SpecialElections(commands.Cog):
                 })
                 break
 
-        elections_col.update_one(
+        await elections_col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {"seats": elections_config["seats"]}}
         )
@@ -1311,7 +1316,7 @@ class SpecialElections(commands.Cog):
         # Remove from active elections
         config["active_elections"].pop(election_index)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {
                 "active_elections": config["active_elections"],
@@ -1371,7 +1376,7 @@ class SpecialElections(commands.Cog):
         interaction: discord.Interaction,
         seat_id: Optional[str] = None
     ):
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
 
         if seat_id:
             # View specific election
@@ -1500,7 +1505,7 @@ class SpecialElections(commands.Cog):
         seat_id: str,
         reason: str = "Administrative decision"
     ):
-        col, config = self._get_special_config(interaction.guild.id)
+        col, config = await self._get_special_config(interaction.guild.id)
 
         # Find and remove the election
         election_index = None
@@ -1530,7 +1535,7 @@ class SpecialElections(commands.Cog):
             config["completed_elections"] = []
         config["completed_elections"].append(cancelled_election)
 
-        col.update_one(
+        await col.update_one(
             {"guild_id": interaction.guild.id},
             {"$set": {
                 "active_elections": config["active_elections"],
@@ -0,0 +1,137 @@
+"""Extension loading for `main.py`, with a timing breakdown of startup.
+
+Extensions load in three steps: the database cog, which every other cog
+reads `bot.db` from; the core cogs, loaded together; and the deferred cogs
+(help text, special elections), loaded in the background from
+`connecting()` while the bot logs in and connects to the gateway.
+`ready()`, called from `on_ready`, waits for the deferred cogs so the
+command tree is complete before it is synced, then dispatches
+`on_extensions_loaded` for cogs that act once everything is registered.
+
+Module code runs under the GIL, so loading "together" overlaps the
+awaitable parts of each cog's setup, not the imports themselves; the
+deferred cogs are where the real saving is, as their imports run while
+the bot waits on the network.
+"""
+
+import asyncio
+import contextlib
+import time
+
+# Loaded first; sets `bot.db`
+DATABASE_EXTENSION = "cogs.db"
+
+# Loaded before the bot connects
+CORE_EXTENSIONS = (
+    "cogs.setup",
+    "cogs.time_manager",
+    "cogs.elections",
+    "cogs.polling",
+    "cogs.all_signups",
+    "cogs.all_winners",
+    "cogs.party_management",
+    "cogs.presidential_signups",
+    "cogs.ideology",
+    "cogs.general_campaign_actions",
+    "cogs.presidential_winners",
+    "cogs.endorsements",
+    "cogs.delegates",
+    "cogs.demographics",
+    "cogs.admin_central",
+    "cogs.pres_campaign_actions",
+    "cogs.momentum"
+)
+
+# Rarely used cogs, loaded while the bot connects
+DEFERRED_EXTENSIONS = (
+    "cogs.basics",
+    "cogs.special_elections"
+)
+
+# Extensions listed by name in the timing report, slowest first
+SLOWEST_REPORTED = 5
+
+class StartupError(Exception):
+    """One or more extensions needed before connecting failed to load"""
+
+class Startup:
+    """Loads a bot's extensions and records how long each phase of startup took"""
+
+    def __init__(self, bot, core=CORE_EXTENSIONS, deferred=DEFERRED_EXTENSIONS):
+        self.bot = bot
+        self.core = tuple(core)
+        self.deferred = tuple(deferred)
+        self.phases = []  # (name, seconds) in the order they finished
+        self.extension_times = {}
+        self.failed = {}
+        self._started = time.perf_counter()
+        self._connect_started = None
+        self._deferred_task = None
+        self._ready = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Time a phase of startup"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - started))
+
+    async def _load(self, name: str):
+        started = time.perf_counter()
+        try:
+            await self.bot.load_extension(name)
+        except Exception as e:
+            self.failed[name] = e
+            print(f"❌ Failed to load {name}: {e}")
+        finally:
+            self.extension_times[name] = time.perf_counter() - started
+
+    async def load_all(self, names):
+        """Load several extensions concurrently; failures are recorded in `failed`"""
+        await asyncio.gather(*(self._load(name) for name in names))
+
+    async def load_core(self):
+        """Load the database and core cogs; raises StartupError if any failed"""
+        with self.phase("database"):
+            await self.load_all([DATABASE_EXTENSION])
+        with self.phase("core cogs"):
+            await self.load_all(self.core)
+        print(f"✓ Loaded {len(self.core) + 1 - len(self.failed)} cogs, {len(self.deferred)} deferred")
+        if self.failed:
+            raise StartupError(", ".join(self.failed))
+
+    def connecting(self):
+        """Mark the start of the gateway connection and start loading the deferred cogs"""
+        if self._deferred_task is None:
+            self._connect_started = time.perf_counter()
+            self._deferred_task = asyncio.create_task(self._load_deferred())
+
+    async def _load_deferred(self):
+        with self.phase("deferred cogs"):
+            await self.load_all(self.deferred)
+
+    async def ready(self) -> bool:
+        """Wait for the deferred cogs; True the first time, when the caller should finish startup"""
+        if self._ready:
+            return False
+        self._ready = True
+        self.connecting()
+        await self._deferred_task
+        self.phases.append(("connect", time.perf_counter() - self._connect_started))
+        self.bot.dispatch("extensions_loaded")
+        return True
+
+    def report(self) -> str:
+        """Startup timing breakdown, one line per phase plus the slowest extensions"""
+        lines = ["Startup timing:"]
+        for name, seconds in self.phases:
+            lines.append(f"  {name:<16}{seconds * 1000:8.0f} ms")
+        slowest = sorted(self.extension_times.items(), key=lambda item: item[1], reverse=True)[:SLOWEST_REPORTED]
+        if slowest:
+            lines.append("  slowest: " + ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in slowest))
+        if self.failed:
+            lines.append("  failed: " + ", ".join(self.failed))
+        lines.append(f"  {'total':<16}{(time.perf_counter() - self._started) * 1000:8.0f} ms")
+        return "\n".join(lines)
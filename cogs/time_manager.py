@@ -2,12 +2,242 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 import asyncio
+import copy
+import heapq
 from datetime import datetime, timedelta
 import pytz
 
+# Daily stamina regeneration as (amount per day, cap)
+GENERAL_STAMINA_REGEN = (30, 100)
+PRESIDENTIAL_STAMINA_REGEN = (100, 300)
+
+# Real time between two daily stamina regenerations of a guild
+STAMINA_REGEN_INTERVAL = timedelta(hours=24)
+
+# Delay before retrying a guild whose time update failed
+TIME_UPDATE_RETRY = timedelta(minutes=1)
+
+# Margin added to timers computed from the RP clock so they fire just after the boundary
+RP_TIMER_MARGIN = timedelta(seconds=1)
+
+def _stamina_regen_pipeline(amount: int, cap: int) -> list:
+    """Update pipeline raising a candidate's stamina by `amount`, capped at `cap`"""
+    return [{"$set": {"stamina": {"$min": [cap, {"$add": [{"$ifNull": ["$stamina", cap]}, amount]}]}}}]
+
+class RPClock:
+    """In-memory RP clock for every guild, owned by the TimeManager cog.
+
+    Each guild's time_configs document is loaded once and kept as an anchor:
+    the RP date (`current_rp_date`) at a real moment (`last_real_update`), the
+    scale (`minutes_per_rp_day`) and `time_paused`. The current RP date is
+    computed from the anchor on demand, so reading the clock costs no database
+    round trip and nothing is written while time simply passes. Changes go
+    through `update`, which persists them and moves the anchor when needed.
+    """
+
+    # Changing any of these moves the anchor to the current moment first
+    ANCHOR_FIELDS = ("current_rp_date", "last_real_update", "minutes_per_rp_day", "time_paused")
+
+    def __init__(self, db, listeners=None):
+        self.db = db
+        self._configs = {}  # guild_id -> stored document, or None if the guild has none
+        self._loaded_all = False
+        self._lock = asyncio.Lock()
+        self._listeners = [] if listeners is None else listeners
+
+    def add_listener(self, callback):
+        """Call `callback(guild_id)` after a guild's configuration changes (None: every guild)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, guild_id):
+        for callback in self._listeners:
+            callback(guild_id)
+
+    @staticmethod
+    def current_date(config) -> datetime:
+        """RP date right now according to a stored anchor"""
+        if config.get("time_paused", False) or not config.get("last_real_update") or not config.get("minutes_per_rp_day"):
+            return config["current_rp_date"]
+        real_minutes_elapsed = (datetime.utcnow() - config["last_real_update"]).total_seconds() / 60
+        return config["current_rp_date"] + timedelta(days=real_minutes_elapsed / config["minutes_per_rp_day"])
+
+    @staticmethod
+    def real_time_at(config, rp_date: datetime):
+        """Real moment at which a running clock reaches `rp_date`, or None if it never will"""
+        if config.get("time_paused", False) or not config.get("last_real_update") or not config.get("minutes_per_rp_day"):
+            return None
+        rp_days_ahead = (rp_date - config["current_rp_date"]).total_seconds() / 86400
+        return config["last_real_update"] + timedelta(minutes=rp_days_ahead * config["minutes_per_rp_day"])
+
+    @classmethod
+    def view(cls, config):
+        """Copy of a stored document with the anchor moved to now.
+
+        This is what the document used to look like when the time loop rewrote
+        it every minute, so callers can keep reading `current_rp_date` directly.
+        """
+        if config is None or "current_rp_date" not in config:
+            return copy.deepcopy(config)
+        view = copy.deepcopy(config)
+        view["current_rp_date"] = cls.current_date(config)
+        view["last_real_update"] = datetime.utcnow()
+        return view
+
+    def _default_config(self, guild_id: int):
+        return {
+            "guild_id": guild_id,
+            "minutes_per_rp_day": 28,  # Default: 28 minutes = 1 RP day
+            "current_rp_date": datetime(1999, 2, 1),  # Start at signups phase
+            "current_phase": "Signups",
+            "cycle_year": 1999,
+            "last_real_update": datetime.utcnow(),
+            "last_stamina_regen": datetime(1999, 1, 1),  # Track last stamina regeneration
+            "voice_channel_id": None,  # Specific voice channel to update
+            "update_voice_channels": True,  # Enable voice updates by default
+            "time_paused": False,  # Whether time progression is paused
+            "phases": [
+                {"name": "Signups", "start_month": 2, "end_month": 8},
+                {"name": "Primary Campaign", "start_month": 9, "end_month": 12},
+                {"name": "Primary Election", "start_month": 1, "end_month": 2},
+                {"name": "General Campaign", "start_month": 3, "end_month": 10},
+                {"name": "General Election", "start_month": 11, "end_month": 12}
+            ],
+            "regions": [
+                "Columbia", "Cambridge", "Superior", "Austin", 
+                "Heartland", "Yellowstone", "Phoenix"
+            ]
+        }
+
+    async def _stored(self, guild_id: int, create: bool = False):
+        if guild_id not in self._configs:
+            self._configs[guild_id] = await self.db["time_configs"].find_one({"guild_id": guild_id})
+        if self._configs[guild_id] is None and create:
+            async with self._lock:
+                if self._configs.get(guild_id) is None:
+                    config = self._default_config(guild_id)
+                    await self.db["time_configs"].insert_one(config)
+                    self._configs[guild_id] = config
+                    self._notify(guild_id)
+        return self._configs[guild_id]
+
+    async def get_config(self, guild_id: int, create: bool = False):
+        """Current time configuration of a guild, or None if it has none (unless `create`)"""
+        return self.view(await self._stored(guild_id, create))
+
+    async def get_all_configs(self) -> list:
+        """Current time configuration of every guild, loaded from the database once"""
+        if not self._loaded_all:
+            configs = await self.db["time_configs"].find({}).to_list(None)
+            for config in configs:
+                self._configs.setdefault(config["guild_id"], config)
+            self._loaded_all = True
+        return [self.view(config) for config in list(self._configs.values()) if config is not None]
+
+    async def update(self, guild_id: int, fields: dict):
+        """Persist changes to a guild's time configuration, creating it if needed"""
+        config = await self._stored(guild_id, create=True)
+        fields = dict(fields)
+        if any(field in fields for field in self.ANCHOR_FIELDS) and "current_rp_date" not in fields:
+            # Freeze the RP date reached so far before the scale or pause state changes
+            fields["current_rp_date"] = self.current_date(config)
+        if "current_rp_date" in fields:
+            fields.setdefault("last_real_update", datetime.utcnow())
+
+        await self.db["time_configs"].update_one({"guild_id": guild_id}, {"$set": fields})
+        config.update(copy.deepcopy(fields))
+        self._notify(guild_id)
+
+    def invalidate(self, guild_id: int = None):
+        """Drop cached documents so they are read again on next use"""
+        if guild_id is None:
+            self._configs.clear()
+            self._loaded_all = False
+        else:
+            self._configs.pop(guild_id, None)
+        self._notify(guild_id)
+
+class GuildTimers:
+    """Next due moment of every guild, in a heap the time loop sleeps on.
+
+    `set` arms (or re-arms) a guild's timer and wakes `wait_due`, which
+    returns the guilds whose time has come. Replaced entries stay in the heap
+    and are skipped when they reach the top.
+    """
+
+    def __init__(self):
+        self._heap = []  # (due, guild_id)
+        self._due = {}  # guild_id -> due of its live entry
+        self._wake = asyncio.Event()
+
+    def __len__(self):
+        return len(self._due)
+
+    def set(self, guild_id: int, due: datetime):
+        """Arm a guild's timer for `due`, or disarm it if `due` is None"""
+        if due is None:
+            self._due.pop(guild_id, None)
+            return
+        self._due[guild_id] = due
+        heapq.heappush(self._heap, (due, guild_id))
+        self._wake.set()
+
+    def clear(self):
+        self._heap.clear()
+        self._due.clear()
+        self._wake.set()
+
+    def next_due(self):
+        """Earliest armed moment, or None if no timer is armed"""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list:
+        """Disarm and return the guilds due at `now`"""
+        guild_ids = []
+        while self.next_due() is not None and self._heap[0][0] <= now:
+            _, guild_id = heapq.heappop(self._heap)
+            del self._due[guild_id]
+            guild_ids.append(guild_id)
+        return guild_ids
+
+    async def wait_due(self) -> list:
+        """Sleep until the earliest timer or until timers change, then return the due guilds"""
+        due = self.next_due()
+        now = datetime.utcnow()
+        if due is None or due > now:
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), (due - now).total_seconds() if due else None)
+            except asyncio.TimeoutError:
+                pass
+        return self.pop_due(datetime.utcnow())
+
+def _clock_listeners(bot) -> list:
+    """Listeners shared by every RP clock of the bot, so they survive the TimeManager loading or reloading"""
+    listeners = getattr(bot, "rp_clock_listeners", None)
+    if listeners is None:
+        listeners = bot.rp_clock_listeners = []
+    return listeners
+
+def get_rp_clock(bot) -> RPClock:
+    """The TimeManager's RP clock, or an uncached one if the cog is not loaded"""
+    time_manager = bot.get_cog("TimeManager")
+    if time_manager:
+        return time_manager.clock
+    return RPClock(bot.db, _clock_listeners(bot))
+
 class TimeManager(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.clock = RPClock(bot.db, _clock_listeners(bot))
+        self.timers = GuildTimers()
+        self._timers_loaded = False
+        self.clock.add_listener(self._on_clock_change)
         self.time_loop.start()  # Start the time loop
         print("Time Manager cog loaded successfully")
 
@@ -19,54 +249,80 @@ class TimeManager(commands.Cog):
 
     def cog_unload(self):
         self.time_loop.cancel()
+        self.timers.clear()
+        self.clock.remove_listener(self._on_clock_change)
 
-    def _get_time_config(self, guild_id: int):
+    async def _get_time_config(self, guild_id: int):
         """Get or create time configuration for a guild"""
-        col = self.bot.db["time_configs"]
-        config = col.find_one({"guild_id": guild_id})
-        if not config:
-            config = {
-                "guild_id": guild_id,
-                "minutes_per_rp_day": 28,  # Default: 28 minutes = 1 RP day
-                "current_rp_date": datetime(1999, 2, 1),  # Start at signups phase
-                "current_phase": "Signups",
-                "cycle_year": 1999,
-                "last_real_update": datetime.utcnow(),
-                "last_stamina_regen": datetime(1999, 1, 1),  # Track last stamina regeneration
-                "voice_channel_id": None,  # Specific voice channel to update
-                "update_voice_channels": True,  # Enable voice updates by default
-                "time_paused": False,  # Whether time progression is paused
-                "phases": [
-                    {"name": "Signups", "start_month": 2, "end_month": 8},
-                    {"name": "Primary Campaign", "start_month": 9, "end_month": 12},
-                    {"name": "Primary Election", "start_month": 1, "end_month": 2},
-                    {"name": "General Campaign", "start_month": 3, "end_month": 10},
-                    {"name": "General Election", "start_month": 11, "end_month": 12}
-                ],
-                "regions": [
-                    "Columbia", "Cambridge", "Superior", "Austin", 
-                    "Heartland", "Yellowstone", "Phoenix"
-                ]
-            }
-            col.insert_one(config)
-        return config
+        return await self.clock.get_config(guild_id, create=True)
 
     def _calculate_current_rp_time(self, config):
         """Calculate current RP time based on real time elapsed"""
-        last_update = config["last_real_update"]
-        current_real_time = datetime.utcnow()
-        real_minutes_elapsed = (current_real_time - last_update).total_seconds() / 60
-
-        minutes_per_rp_day = config["minutes_per_rp_day"]
-        rp_days_elapsed = real_minutes_elapsed / minutes_per_rp_day
-
-        current_rp_date = config["current_rp_date"] + timedelta(days=rp_days_elapsed)
+        current_rp_date = self.clock.current_date(config)
 
         # Determine current phase
         current_phase = self._get_current_phase(current_rp_date, config)
 
         return current_rp_date, current_phase
 
+    def _next_phase_boundary(self, rp_date, phase, config):
+        """First month start after `rp_date` at which the phase is no longer `phase`"""
+        year, month = rp_date.year, rp_date.month
+        for _ in range(24):
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            boundary = datetime(year, month, 1)
+            if self._get_current_phase(boundary, config) != phase:
+                return boundary
+        return None
+
+    def _next_due(self, config):
+        """Real moment at which the time loop next has work for a guild, or None.
+
+        That is the earliest of the next stamina regeneration, phase boundary,
+        end-of-cycle reset and (with voice updates on) RP day change, worked out
+        from the clock anchor so nothing has to poll in between.
+        """
+        if not config or config.get("time_paused", False):
+            return None
+        now = datetime.utcnow()
+        current_rp_date, current_phase = self._calculate_current_rp_time(config)
+        if current_phase != config["current_phase"] or (
+                current_phase == "General Election" and current_rp_date.month == 12 and current_rp_date.day >= 31):
+            return now
+
+        rp_moments = [self._next_phase_boundary(current_rp_date, current_phase, config)]
+        if current_phase == "General Election":
+            rp_moments.append(datetime(current_rp_date.year, 12, 31))
+        if config.get("update_voice_channels", True) and config.get("voice_channel_id"):
+            rp_moments.append(datetime(current_rp_date.year, current_rp_date.month, current_rp_date.day) + timedelta(days=1))
+
+        due = [config.get("last_stamina_regen", datetime(1999, 1, 1)) + STAMINA_REGEN_INTERVAL]
+        for rp_moment in rp_moments:
+            real_moment = self.clock.real_time_at(config, rp_moment) if rp_moment else None
+            if real_moment:
+                due.append(real_moment + RP_TIMER_MARGIN)
+        return max(now, min(due))
+
+    def _arm(self, guild_id: int, config):
+        self.timers.set(guild_id, self._next_due(config))
+
+    def _on_clock_change(self, guild_id):
+        """Re-arm timers after an admin or phase change to a guild's clock"""
+        if guild_id is None:
+            self._timers_loaded = False
+            self.timers.clear()
+        else:
+            # Due now: the loop reads the new configuration and arms the real timer
+            self.timers.set(guild_id, datetime.utcnow())
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild):
+        self._arm(guild.id, await self.clock.get_config(guild.id))
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild):
+        self._arm(guild.id, await self.clock.get_config(guild.id))
+
     def _get_current_phase(self, rp_date, config):
         """Determine which phase we're currently in"""
         month = rp_date.month
@@ -92,21 +348,21 @@ class TimeManager(commands.Cog):
         """Resets stamina for all players in the general campaign phase."""
         # Reset general election candidates to 100 stamina
         signups_col = self.bot.db["all_signups"]
-        signups_result = signups_col.update_many(
+        signups_result = await signups_col.update_many(
             {"guild_id": guild_id, "candidates.year": year},
             {"$set": {"candidates.$.stamina": 100}}
         )
 
         # Reset presidential candidates to 300 stamina
         pres_col = self.bot.db["presidential_signups"]
-        pres_result = pres_col.update_many(
+        pres_result = await pres_col.update_many(
             {"guild_id": guild_id, "candidates.year": year},
             {"$set": {"candidates.$.stamina": 300}}
         )
 
         # Reset presidential winners to 300 stamina
         winners_col = self.bot.db["presidential_winners"]
-        winners_result = winners_col.update_many(
+        winners_result = await winners_col.update_many(
             {"guild_id": guild_id, "winners.year": year},
             {"$set": {"winners.$.stamina": 300}}
         )
@@ -114,335 +370,286 @@ class TimeManager(commands.Cog):
         print(f"Reset stamina for guild {guild_id} in year {year}: {signups_result.modified_count} general candidates, {pres_result.modified_count} presidential candidates, {winners_result.modified_count} presidential winners.")
 
     async def _regenerate_daily_stamina(self, guild_id: int):
-        """Regenerate stamina for all candidates daily"""
-        # Regenerate stamina for general election candidates in signups (30 per day, max 100)
-        signups_col = self.bot.db["signups"]
-        signups_config = signups_col.find_one({"guild_id": guild_id})
-
-        if signups_config:
-            for i, candidate in enumerate(signups_config.get("candidates", [])):
-                current_stamina = candidate.get("stamina", 100)
-                new_stamina = min(100, current_stamina + 30)  # Add 30, cap at 100
-
-                signups_col.update_one(
-                    {"guild_id": guild_id, f"candidates.{i}.user_id": candidate["user_id"]},
-                    {"$set": {f"candidates.{i}.stamina": new_stamina}}
-                )
-
-        # Regenerate stamina for general winners (30 per day, max 100)
-        winners_col = self.bot.db["winners"]
-        winners_config = winners_col.find_one({"guild_id": guild_id})
+        """Regenerate stamina for all candidates daily.
+
+        Each candidate collection takes a single server-side update computing
+        min(cap, stamina + amount), so the cost does not grow with the number
+        of candidates. Candidates already at the cap are not rewritten.
+        """
+        # General election candidates in signups and general winners (30 per day, max 100)
+        amount, cap = GENERAL_STAMINA_REGEN
+        for collection_name in ("signups", "winners"):
+            await self.bot.db[collection_name].update_candidates(
+                {"guild_id": guild_id, "stamina": {"$ne": cap}},
+                _stamina_regen_pipeline(amount, cap)
+            )
 
-        if winners_config:
-            for i, winner in enumerate(winners_config.get("winners", [])):
-                current_stamina = winner.get("stamina", 100)
-                new_stamina = min(100, current_stamina + 30)  # Add 30, cap at 100
+        # Presidential candidates (100 per day, max 300). Winners kept in the old
+        # {party: name} presidential_winners format are these same signups.
+        amount, cap = PRESIDENTIAL_STAMINA_REGEN
+        await self.bot.db["presidential_signups"].update_candidates(
+            {"guild_id": guild_id, "stamina": {"$ne": cap}},
+            _stamina_regen_pipeline(amount, cap)
+        )
 
-                winners_col.update_one(
-                    {"guild_id": guild_id, f"winners.{i}.user_id": winner["user_id"]},
-                    {"$set": {f"winners.{i}.stamina": new_stamina}}
+        # Presidential winners stored as a list: the handful of tickets are rewritten in one update
+        pres_winners_col = self.bot.db["presidential_winners"]
+        pres_winners_config = await pres_winners_col.find_one({"guild_id": guild_id}, {"winners": 1})
+        winners = pres_winners_config.get("winners") if pres_winners_config else None
+        if isinstance(winners, list):
+            regenerated = [
+                {**winner, "stamina": min(cap, winner.get("stamina", cap) + amount)}
+                if winner.get("office") in ["President", "Vice President"] else winner
+                for winner in winners
+            ]
+            if regenerated != winners:
+                await pres_winners_col.update_one(
+                    {"_id": pres_winners_config["_id"]},
+                    {"$set": {"winners": regenerated}}
                 )
 
-        # Regenerate stamina for presidential candidates (100 per day, max 300)
-        pres_col = self.bot.db["presidential_signups"]
-        pres_config = pres_col.find_one({"guild_id": guild_id})
+    @tasks.loop(seconds=0)
+    async def time_loop(self):
+        """Sleep until a guild's timer is due, then advance every guild that is due"""
+        try:
+            if not self._timers_loaded:
+                self._timers_loaded = True
+                for config in await self.clock.get_all_configs():
+                    self._arm(config["guild_id"], config)
 
-        if pres_config:
-            for i, candidate in enumerate(pres_config.get("candidates", [])):
-                current_stamina = candidate.get("stamina", 300)
-                new_stamina = min(300, current_stamina + 100)  # Add 100, cap at 300
+            guild_ids = await self.timers.wait_due()
+            await asyncio.gather(*(self._run_guild(guild_id) for guild_id in guild_ids))
+        except Exception as e:
+            print(f"Error in time loop: {e}")
 
-                pres_col.update_one(
-                    {"guild_id": guild_id, f"candidates.{i}.user_id": candidate["user_id"]},
-                    {"$set": {f"candidates.{i}.stamina": new_stamina}}
-                )
+    async def _run_guild(self, guild_id: int):
+        """Advance one guild's RP clock and arm its next timer"""
+        try:
+            config = await self.clock.get_config(guild_id)
+            if not config or config.get("time_paused", False):
+                return
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                # Armed again when the guild becomes available
+                return
+            await self._advance_guild(guild, config)
+        except Exception as e:
+            print(f"Error in time loop for guild {guild_id}: {e}")
+            self.timers.set(guild_id, datetime.utcnow() + TIME_UPDATE_RETRY)
+            return
+        self._arm(guild_id, await self.clock.get_config(guild_id))
 
-        # Regenerate stamina for presidential winners (100 per day, max 300)
-        pres_winners_col = self.bot.db["presidential_winners"]
-        pres_winners_config = pres_winners_col.find_one({"guild_id": guild_id})
-
-        if pres_winners_config:
-            # Handle winners stored as dictionary (party -> candidate name)
-            winners_dict = pres_winners_config.get("winners", {})
-            if isinstance(winners_dict, dict):
-                # For dictionary format, we need to find candidates in presidential_signups
-                for party, winner_name in winners_dict.items():
-                    # Find the candidate in presidential signups to get their user_id
-                    if pres_config:
-                        for i, candidate in enumerate(pres_config.get("candidates", [])):
-                            if (candidate.get("name") == winner_name and 
-                                candidate.get("office") == "President"):
-                                current_stamina = candidate.get("stamina", 300)
-                                new_stamina = min(300, current_stamina + 100)
-
-                                pres_col.update_one(
-                                    {"guild_id": guild_id, f"candidates.{i}.user_id": candidate["user_id"]},
-                                    {"$set": {f"candidates.{i}.stamina": new_stamina}}
-                                )
-            else:
-                # Handle array format if exists
-                for i, winner in enumerate(winners_dict):
-                    if winner.get("office") in ["President", "Vice President"]:
-                        current_stamina = winner.get("stamina", 300)
-                        new_stamina = min(300, current_stamina + 100)
+    async def _advance_guild(self, guild, config):
+        """Handle phase changes, stamina regeneration, cycle reset and voice updates for a guild"""
+        current_rp_date, current_phase = self._calculate_current_rp_time(config)
 
-                        pres_winners_col.update_one(
-                            {"guild_id": guild_id, f"winners.{i}.user_id": winner["user_id"]},
-                            {"$set": {f"winners.{i}.stamina": new_stamina}}
-                        )
+        # Check if phase changed
+        if current_phase != config["current_phase"]:
+            # Phase transition occurred
+            old_phase = config["current_phase"]
+            print(f"DEBUG: ACTUAL phase change detected for guild {guild.id}: {old_phase} -> {current_phase}")
+
+            # Update the phase in the database immediately to prevent duplicate events
+            await self.clock.update(config["guild_id"], {"current_phase": current_phase})
+
+            # Reset stamina when transitioning to General Campaign
+            if current_phase == "General Campaign":
+                await self._reset_stamina_for_general_campaign(config["guild_id"], current_rp_date.year)
+
+            # Dispatch event to elections cog for automatic handling
+            elections_cog = self.bot.get_cog("Elections")
+            if elections_cog:
+                await elections_cog.on_phase_change(
+                    config["guild_id"], 
+                    old_phase, 
+                    current_phase, 
+                    current_rp_date.year
+                )
 
+            # Dispatch event to all_winners cog for automatic handling
+            all_winners_cog = self.bot.get_cog("AllWinners")
+            if all_winners_cog:
+                await all_winners_cog.on_phase_change(
+                    config["guild_id"], 
+                    old_phase, 
+                    current_phase, 
+                    current_rp_date.year
+                )
 
-    @tasks.loop(minutes=1)
-    async def time_loop(self):
-        """Update RP time every minute"""
-        try:
-            col = self.bot.db["time_configs"]
-            configs = col.find({})
+            # Dispatch event to presidential_winners cog for automatic handling
+            pres_winners_cog = self.bot.get_cog("PresidentialWinners")
+            if pres_winners_cog:
+                await pres_winners_cog.on_phase_change(
+                    config["guild_id"], 
+                    old_phase, 
+                    current_phase, 
+                    current_rp_date.year
+                )
 
-            for config in configs:
-                # Skip time progression if paused
-                if config.get("time_paused", False):
-                    continue
-
-                current_rp_date, current_phase = self._calculate_current_rp_time(config)
-                guild = self.bot.get_guild(config["guild_id"])
-
-                if not guild:
-                    continue
-
-                # Check if phase changed
-                if current_phase != config["current_phase"]:
-                    # Phase transition occurred
-                    old_phase = config["current_phase"]
-                    print(f"DEBUG: ACTUAL phase change detected for guild {guild.id}: {old_phase} -> {current_phase}")
-
-                    # Update the phase in the database immediately to prevent duplicate events
-                    col.update_one(
-                        {"guild_id": config["guild_id"]},
-                        {"$set": {"current_phase": current_phase}}
-                    )
-
-                    # Reset stamina when transitioning to General Campaign
-                    if current_phase == "General Campaign":
-                        await self._reset_stamina_for_general_campaign(config["guild_id"], current_rp_date.year)
-
-                    # Dispatch event to elections cog for automatic handling
-                    elections_cog = self.bot.get_cog("Elections")
-                    if elections_cog:
-                        await elections_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # Dispatch event to all_winners cog for automatic handling
-                    all_winners_cog = self.bot.get_cog("AllWinners")
-                    if all_winners_cog:
-                        await all_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # Dispatch event to presidential_winners cog for automatic handling
-                    pres_winners_cog = self.bot.get_cog("PresidentialWinners")
-                    if pres_winners_cog:
-                        await pres_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            old_phase, 
-                            current_phase, 
-                            current_rp_date.year
-                        )
-
-                    # DEBUG: Only allow the specific channel ID for phase change announcements
-                    REQUIRED_CHANNEL_ID = 1380498828121346210
-                    print(f"DEBUG: Phase change announcement for guild {guild.id}, phase: {current_phase}")
-                    
-                    # Find announcement channel - only use the specific channel ID
-                    channel = None
-                    
-                    # Check guild_configs for announcement channel
-                    setup_col = self.bot.db["guild_configs"]
-                    setup_config = setup_col.find_one({"guild_id": guild.id})
-                    
-                    # Check announcement_channel_id first
-                    if setup_config and setup_config.get("announcement_channel_id"):
-                        configured_channel_id = setup_config["announcement_channel_id"]
-                        print(f"DEBUG: Found configured announcement_channel_id: {configured_channel_id}")
-                        
-                        # Only use the specific channel ID
-                        if configured_channel_id == REQUIRED_CHANNEL_ID:
-                            channel = guild.get_channel(configured_channel_id)
-                            print(f"DEBUG: Using configured channel {channel} (ID: {configured_channel_id})")
-                        else:
-                            print(f"DEBUG: WARNING - Configured channel ID {configured_channel_id} is not the required channel {REQUIRED_CHANNEL_ID}")
-                            print(f"DEBUG: Falling back to required channel {REQUIRED_CHANNEL_ID}")
-                    
-                    # Check announcement_channel (legacy support)
-                    if not channel and setup_config and setup_config.get("announcement_channel"):
-                        legacy_channel_id = setup_config["announcement_channel"]
-                        print(f"DEBUG: Found legacy announcement_channel: {legacy_channel_id}")
-                        
-                        # Only use the specific channel ID
-                        if legacy_channel_id == REQUIRED_CHANNEL_ID:
-                            channel = guild.get_channel(legacy_channel_id)
-                            print(f"DEBUG: Using legacy channel {channel} (ID: {legacy_channel_id})")
-                        else:
-                            print(f"DEBUG: WARNING - Legacy channel ID {legacy_channel_id} is not the required channel {REQUIRED_CHANNEL_ID}")
-
-                    # Always try to use the required channel ID as fallback
-                    if not channel:
-                        channel = guild.get_channel(REQUIRED_CHANNEL_ID)
-                        if channel:
-                            print(f"DEBUG: Using fallback required channel {channel} (ID: {REQUIRED_CHANNEL_ID})")
-                        else:
-                            print(f"DEBUG: ERROR - Required channel {REQUIRED_CHANNEL_ID} not found in guild {guild.id}")
-                            print(f"DEBUG: Setup config: {setup_config}")
-                            return
-                    
-                    if channel:
-                        embed = discord.Embed(
-                            title="🗳️ Election Phase Change",
-                            description=f"We have entered the **{current_phase}** phase!",
-                            color=discord.Color.green(),
-                            timestamp=datetime.utcnow()
-                        )
-                        embed.add_field(
-                            name="Current RP Date", 
-                            value=current_rp_date.strftime("%B %d, %Y"), 
-                            inline=True
-                        )
-                        try:
-                            await channel.send(embed=embed)
-                            print(f"DEBUG: Phase change announcement sent to channel {channel.name} (ID: {channel.id})")
-                        except Exception as e:
-                            print(f"DEBUG: Failed to send phase change announcement: {e}")
-                            pass  # Ignore if can't send message
+            # DEBUG: Only allow the specific channel ID for phase change announcements
+            REQUIRED_CHANNEL_ID = 1380498828121346210
+            print(f"DEBUG: Phase change announcement for guild {guild.id}, phase: {current_phase}")
+            
+            # Find announcement channel - only use the specific channel ID
+            channel = None
+            
+            # Check guild_configs for announcement channel
+            setup_col = self.bot.db["guild_configs"]
+            setup_config = await setup_col.find_one({"guild_id": guild.id})
+            
+            # Check announcement_channel_id first
+            if setup_config and setup_config.get("announcement_channel_id"):
+                configured_channel_id = setup_config["announcement_channel_id"]
+                print(f"DEBUG: Found configured announcement_channel_id: {configured_channel_id}")
+                
+                # Only use the specific channel ID
+                if configured_channel_id == REQUIRED_CHANNEL_ID:
+                    channel = guild.get_channel(configured_channel_id)
+                    print(f"DEBUG: Using configured channel {channel} (ID: {configured_channel_id})")
+                else:
+                    print(f"DEBUG: WARNING - Configured channel ID {configured_channel_id} is not the required channel {REQUIRED_CHANNEL_ID}")
+                    print(f"DEBUG: Falling back to required channel {REQUIRED_CHANNEL_ID}")
+            
+            # Check announcement_channel (legacy support)
+            if not channel and setup_config and setup_config.get("announcement_channel"):
+                legacy_channel_id = setup_config["announcement_channel"]
+                print(f"DEBUG: Found legacy announcement_channel: {legacy_channel_id}")
+                
+                # Only use the specific channel ID
+                if legacy_channel_id == REQUIRED_CHANNEL_ID:
+                    channel = guild.get_channel(legacy_channel_id)
+                    print(f"DEBUG: Using legacy channel {channel} (ID: {legacy_channel_id})")
                 else:
-                    # No phase change - just log for debugging
-                    print(f"DEBUG: No phase change for guild {guild.id}, current phase: {current_phase}")
-
-                # Check if 24 hours have passed for stamina regeneration
-                last_stamina_regen = config.get("last_stamina_regen", datetime(1999, 1, 1))
-                current_time = datetime.utcnow()
-                hours_since_last_regen = (current_time - last_stamina_regen).total_seconds() / 3600
-
-                if hours_since_last_regen >= 24:
-                    # 24 hours have passed - regenerate stamina
-                    await self._regenerate_daily_stamina(config["guild_id"])
-
-                    # Update last regeneration time
-                    col.update_one(
-                        {"guild_id": config["guild_id"]},
-                        {"$set": {"last_stamina_regen": current_time}}
-                    )
-
-                    print(f"Regenerated daily stamina for guild {config['guild_id']} after {hours_since_last_regen:.1f} hours")
-
-                # Update database (phase already updated if it changed)
-                col.update_one(
-                    {"guild_id": config["guild_id"]},
-                    {
-                        "$set": {
-                            "current_rp_date": current_rp_date,
-                            "last_real_update": datetime.utcnow()
-                        }
-                    }
+                    print(f"DEBUG: WARNING - Legacy channel ID {legacy_channel_id} is not the required channel {REQUIRED_CHANNEL_ID}")
+
+            # Always try to use the required channel ID as fallback
+            if not channel:
+                channel = guild.get_channel(REQUIRED_CHANNEL_ID)
+                if channel:
+                    print(f"DEBUG: Using fallback required channel {channel} (ID: {REQUIRED_CHANNEL_ID})")
+                else:
+                    print(f"DEBUG: ERROR - Required channel {REQUIRED_CHANNEL_ID} not found in guild {guild.id}")
+                    print(f"DEBUG: Setup config: {setup_config}")
+                    return
+            
+            if channel:
+                embed = discord.Embed(
+                    title="🗳️ Election Phase Change",
+                    description=f"We have entered the **{current_phase}** phase!",
+                    color=discord.Color.green(),
+                    timestamp=datetime.utcnow()
+                )
+                embed.add_field(
+                    name="Current RP Date", 
+                    value=current_rp_date.strftime("%B %d, %Y"), 
+                    inline=True
+                )
+                try:
+                    await channel.send(embed=embed)
+                    print(f"DEBUG: Phase change announcement sent to channel {channel.name} (ID: {channel.id})")
+                except Exception as e:
+                    print(f"DEBUG: Failed to send phase change announcement: {e}")
+                    pass  # Ignore if can't send message
+        else:
+            # No phase change - just log for debugging
+            print(f"DEBUG: No phase change for guild {guild.id}, current phase: {current_phase}")
+
+        # Check if 24 hours have passed for stamina regeneration
+        last_stamina_regen = config.get("last_stamina_regen", datetime(1999, 1, 1))
+        current_time = datetime.utcnow()
+        hours_since_last_regen = (current_time - last_stamina_regen).total_seconds() / 3600
+
+        if hours_since_last_regen >= 24:
+            # 24 hours have passed - regenerate stamina
+            await self._regenerate_daily_stamina(config["guild_id"])
+
+            # Update last regeneration time
+            await self.clock.update(config["guild_id"], {"last_stamina_regen": current_time})
+
+            print(f"Regenerated daily stamina for guild {config['guild_id']} after {hours_since_last_regen:.1f} hours")
+
+        # Check if we need to auto-reset cycle (after General Election ends)
+        if (current_phase == "General Election" and 
+            current_rp_date.month == 12 and current_rp_date.day >= 31):
+            # Auto-reset to next cycle (next odd year for signups)
+            next_year = current_rp_date.year + 1
+            new_rp_date = datetime(next_year, 2, 1)
+
+            await self.clock.update(config["guild_id"], {
+                "current_rp_date": new_rp_date,
+                "current_phase": "Signups"
+            })
+
+            # Dispatch event to elections cog for new cycle automation
+            elections_cog = self.bot.get_cog("Elections")
+            if elections_cog:
+                await elections_cog.on_phase_change(
+                    config["guild_id"], 
+                    "General Election", 
+                    "Signups", 
+                    next_year
                 )
 
-                # Check if we need to auto-reset cycle (after General Election ends)
-                if (current_phase == "General Election" and 
-                    current_rp_date.month == 12 and current_rp_date.day >= 31):
-                    # Auto-reset to next cycle (next odd year for signups)
-                    next_year = current_rp_date.year + 1
-                    new_rp_date = datetime(next_year, 2, 1)
-
-                    col.update_one(
-                        {"guild_id": config["guild_id"]},
-                        {
-                            "$set": {
-                                "current_rp_date": new_rp_date,
-                                "current_phase": "Signups",
-                                "last_real_update": datetime.utcnow()
-                            }
-                        }
-                    )
-
-                    # Dispatch event to elections cog for new cycle automation
-                    elections_cog = self.bot.get_cog("Elections")
-                    if elections_cog:
-                        await elections_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Dispatch event to all_winners cog for new cycle automation
-                    all_winners_cog = self.bot.get_cog("AllWinners")
-                    if all_winners_cog:
-                        await all_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Dispatch event to presidential_winners cog for new cycle automation
-                    pres_winners_cog = self.bot.get_cog("PresidentialWinners")
-                    if pres_winners_cog:
-                        await pres_winners_cog.on_phase_change(
-                            config["guild_id"], 
-                            "General Election", 
-                            "Signups", 
-                            next_year
-                        )
-
-                    # Announce new cycle
-                    channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
-                    if channel:
-                        embed = discord.Embed(
-                            title="🔄 New Election Cycle Started!",
-                            description=f"The {next_year} election cycle has begun! We are now in the **Signups** phase.",
-                            color=discord.Color.gold(),
-                            timestamp=datetime.utcnow()
-                        )
-                        embed.add_field(
-                            name="New RP Date", 
-                            value=new_rp_date.strftime("%B %d, %Y"), 
-                            inline=True
-                        )
-                        try:
-                            await channel.send(embed=embed)
-                        except:
-                            pass
-
-                # Update voice channel if enabled and configured
-                if (config.get("update_voice_channels", True) and 
-                    config.get("voice_channel_id")):
-                    date_string = current_rp_date.strftime("%B %d, %Y")
-                    channel = guild.get_channel(config["voice_channel_id"])
-                    if channel and hasattr(channel, 'edit'):  # Check if it's a voice channel
-                        try:
-                            new_name = f"📅 {date_string}"
-                            # Force update if names don't match or if there's a significant time difference
-                            current_name = channel.name
-                            should_update = (current_name != new_name or 
-                                           not current_name.startswith("📅") or
-                                           "1999" not in current_name)
-
-                            if should_update:
-                                await channel.edit(name=new_name)
-                                print(f"Updated voice channel from '{current_name}' to: {new_name}")
-                        except Exception as e:
-                            print(f"Failed to update voice channel: {e}")
-                            # Try again in next loop iteration
-                            pass
+            # Dispatch event to all_winners cog for new cycle automation
+            all_winners_cog = self.bot.get_cog("AllWinners")
+            if all_winners_cog:
+                await all_winners_cog.on_phase_change(
+                    config["guild_id"], 
+                    "General Election", 
+                    "Signups", 
+                    next_year
+                )
 
-        except Exception as e:
-            print(f"Error in time loop: {e}")
+            # Dispatch event to presidential_winners cog for new cycle automation
+            pres_winners_cog = self.bot.get_cog("PresidentialWinners")
+            if pres_winners_cog:
+                await pres_winners_cog.on_phase_change(
+                    config["guild_id"], 
+                    "General Election", 
+                    "Signups", 
+                    next_year
+                )
+
+            # Announce new cycle
+            channel = discord.utils.get(guild.channels, name="general") or guild.system_channel
+            if channel:
+                embed = discord.Embed(
+                    title="🔄 New Election Cycle Started!",
+                    description=f"The {next_year} election cycle has begun! We are now in the **Signups** phase.",
+                    color=discord.Color.gold(),
+                    timestamp=datetime.utcnow()
+                )
+                embed.add_field(
+                    name="New RP Date", 
+                    value=new_rp_date.strftime("%B %d, %Y"), 
+                    inline=True
+                )
+                try:
+                    await channel.send(embed=embed)
+                except:
+                    pass
+
+        # Update voice channel if enabled and configured
+        if (config.get("update_voice_channels", True) and 
+            config.get("voice_channel_id")):
+            date_string = current_rp_date.strftime("%B %d, %Y")
+            channel = guild.get_channel(config["voice_channel_id"])
+            if channel and hasattr(channel, 'edit'):  # Check if it's a voice channel
+                try:
+                    new_name = f"📅 {date_string}"
+                    # Force update if names don't match or if there's a significant time difference
+                    current_name = channel.name
+                    should_update = (current_name != new_name or 
+                                   not current_name.startswith("📅") or
+                                   "1999" not in current_name)
+
+                    if should_update:
+                        await channel.edit(name=new_name)
+                        print(f"Updated voice channel from '{current_name}' to: {new_name}")
+                except Exception as e:
+                    print(f"Failed to update voice channel: {e}")
+                    # Try again on the next RP day
+                    pass
 
     @time_loop.before_loop
     async def before_time_loop(self):
@@ -485,23 +692,16 @@ class TimeManager(commands.Cog):
             )
             return
 
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         # Determine the new phase
         new_phase = self._get_current_phase(new_date, config)
 
-        # Update the configuration
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {
-                "$set": {
-                    "current_rp_date": new_date,
-                    "current_phase": new_phase,
-                    "last_real_update": datetime.utcnow()
-                }
-            }
-        )
+        # Move the clock's anchor to the new date
+        await self.clock.update(interaction.guild.id, {
+            "current_rp_date": new_date,
+            "current_phase": new_phase
+        })
 
         embed = discord.Embed(
             title="🕒 RP Time Updated",
@@ -534,23 +734,16 @@ class TimeManager(commands.Cog):
             )
             return
 
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         # Update current time before changing scale
         current_rp_date, current_phase = self._calculate_current_rp_time(config)
 
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {
-                "$set": {
-                    "minutes_per_rp_day": minutes_per_day,
-                    "current_rp_date": current_rp_date,
-                    "current_phase": current_phase,
-                    "last_real_update": datetime.utcnow()
-                }
-            }
-        )
+        await self.clock.update(interaction.guild.id, {
+            "minutes_per_rp_day": minutes_per_day,
+            "current_rp_date": current_rp_date,
+            "current_phase": current_phase
+        })
 
         await interaction.response.send_message(
             f"✅ Time scale updated: {minutes_per_day} real minutes = 1 RP day",
@@ -563,24 +756,17 @@ class TimeManager(commands.Cog):
         description="Reset the election cycle to the beginning (Signups phase)"
     )
     async def reset_cycle(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         current_year = config["current_rp_date"].year
         # Find next odd year for signups
         next_signup_year = current_year + 1 if current_year % 2 == 0 else current_year + 2
 
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {
-                "$set": {
-                    "current_rp_date": datetime(next_signup_year, 2, 1),
-                    "current_phase": "Signups",
-                    "cycle_year": next_signup_year,
-                    "last_real_update": datetime.utcnow()
-                }
-            }
-        )
+        await self.clock.update(interaction.guild.id, {
+            "current_rp_date": datetime(next_signup_year, 2, 1),
+            "current_phase": "Signups",
+            "cycle_year": next_signup_year
+        })
 
         await interaction.response.send_message(
             f"✅ Election cycle reset! Now in Signups phase for {next_signup_year} cycle.",
@@ -594,7 +780,7 @@ class TimeManager(commands.Cog):
     async def show_regions(self, interaction: discord.Interaction):
         # Get regions from election configuration
         elections_col = self.bot.db["elections_config"]
-        elections_config = elections_col.find_one({"guild_id": interaction.guild.id})
+        elections_config = await elections_col.find_one({"guild_id": interaction.guild.id})
 
         if not elections_config:
             await interaction.response.send_message("❌ Election system not initialized. Use `/election info show_seats` to initialize.", ephemeral=True)
@@ -641,13 +827,7 @@ class TimeManager(commands.Cog):
         description="Show all election phases and their timing"
     )
     async def show_phases(self, interaction: discord.Interaction):
-        col = self.bot.db["time_configs"]
-
-        # Always get the latest config from database to ensure we show updated phases
-        config = col.find_one({"guild_id": interaction.guild.id})
-        if not config:
-            # If no config exists, create one using _get_time_config
-            config = self._get_time_config(interaction.guild.id)
+        config = await self._get_time_config(interaction.guild.id)
 
         # Debug: Print what phases are actually in the config
         print(f"DEBUG - Guild ID: {interaction.guild.id}")
@@ -672,12 +852,9 @@ class TimeManager(commands.Cog):
                 {"name": "General Campaign", "start_month": 3, "end_month": 10},
                 {"name": "General Election", "start_month": 11, "end_month": 12}
             ]
-            col.update_one(
-                {"guild_id": interaction.guild.id},
-                {"$set": {"phases": new_phases}}
-            )
+            await self.clock.update(interaction.guild.id, {"phases": new_phases})
             # Fetch the updated config
-            config = col.find_one({"guild_id": interaction.guild.id})
+            config = await self._get_time_config(interaction.guild.id)
             print(f"DEBUG - After force update, Signups phase: {[p for p in config['phases'] if p['name'] == 'Signups'][0]}")
 
         current_rp_date, current_phase = self._calculate_current_rp_time(config)
@@ -748,13 +925,7 @@ class TimeManager(commands.Cog):
         interaction: discord.Interaction, 
         channel: discord.VoiceChannel
     ):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
-
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"voice_channel_id": channel.id}}
-        )
+        await self.clock.update(interaction.guild.id, {"voice_channel_id": channel.id})
 
         await interaction.response.send_message(
             f"✅ Voice channel set to {channel.mention}. It will be updated with the current RP date.",
@@ -767,16 +938,12 @@ class TimeManager(commands.Cog):
         description="Toggle automatic voice channel name updates with current RP date"
     )
     async def toggle_voice_updates(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         current_setting = config.get("update_voice_channels", True)
         new_setting = not current_setting
 
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"update_voice_channels": new_setting}}
-        )
+        await self.clock.update(interaction.guild.id, {"update_voice_channels": new_setting})
 
         status = "enabled" if new_setting else "disabled"
         await interaction.response.send_message(
@@ -790,8 +957,7 @@ class TimeManager(commands.Cog):
         description="Manually update the configured voice channel with current RP date"
     )
     async def update_voice_channel(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         if not config.get("voice_channel_id"):
             await interaction.response.send_message(
@@ -830,21 +996,13 @@ class TimeManager(commands.Cog):
         description="Pause or unpause RP time progression (Admin only)"
     )
     async def pause_time(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
+        config = await self._get_time_config(interaction.guild.id)
 
         current_paused = config.get("time_paused", False)
         new_paused = not current_paused
 
-        # If unpausing, update the last_real_update to now to prevent time jumps
-        update_data = {"time_paused": new_paused}
-        if not new_paused:
-            update_data["last_real_update"] = datetime.utcnow()
-
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": update_data}
-        )
+        # The clock freezes the RP date when pausing and restarts from it when unpausing
+        await self.clock.update(interaction.guild.id, {"time_paused": new_paused})
 
         status = "paused" if new_paused else "resumed"
         embed = discord.Embed(
@@ -878,12 +1036,7 @@ class TimeManager(commands.Cog):
         await self._regenerate_daily_stamina(interaction.guild.id)
 
         # Update last regeneration date with current real time
-        col = self.bot.db["time_configs"]
-
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"last_stamina_regen": datetime.utcnow()}}
-        )
+        await self.clock.update(interaction.guild.id, {"last_stamina_regen": datetime.utcnow()})
 
         embed = discord.Embed(
             title="⚡ Stamina Regenerated",
@@ -906,7 +1059,7 @@ class TimeManager(commands.Cog):
         description="Force sync the voice channel name with current RP date (Admin only)"
     )
     async def force_sync_voice(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
+        config = await self._get_time_config(interaction.guild.id)
 
         if not config.get("voice_channel_id"):
             await interaction.response.send_message(
@@ -983,9 +1136,6 @@ class TimeManager(commands.Cog):
         description="Update the phase configuration with new month ranges (Admin only)"
     )
     async def update_phases(self, interaction: discord.Interaction):
-        config = self._get_time_config(interaction.guild.id)
-        col = self.bot.db["time_configs"]
-
         # Update phases to your new configuration
         new_phases = [
             {"name": "Signups", "start_month": 2, "end_month": 8},
@@ -996,20 +1146,14 @@ class TimeManager(commands.Cog):
         ]
 
         # Update database with new phases
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"phases": new_phases}}
-        )
+        await self.clock.update(interaction.guild.id, {"phases": new_phases})
 
-        # Get the updated config from database to calculate current phase correctly
-        updated_config = col.find_one({"guild_id": interaction.guild.id})
+        # Get the updated config to calculate current phase correctly
+        updated_config = await self._get_time_config(interaction.guild.id)
         current_rp_date, current_phase = self._calculate_current_rp_time(updated_config)
 
         # Update current phase in database
-        col.update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"current_phase": current_phase}}
-        )
+        await self.clock.update(interaction.guild.id, {"current_phase": current_phase})
 
         embed = discord.Embed(
             title="✅ Phase Configuration Updated",
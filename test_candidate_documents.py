@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Check that per-candidate documents behave like the old embedded arrays.
+
+Every operation is applied to a plain mongomock collection holding the old
+single-document layout and to bot.db's candidate collection, and the guild
+document each one returns must match. Requires mongomock.
+"""
+
+import asyncio
+import copy
+import sys
+
+import mongomock
+import pymongo.mongo_client
+
+# cogs.db connects at import time, so point it at mongomock first
+pymongo.mongo_client.MongoClient = lambda *args, **kwargs: mongomock.MongoClient()
+
+from cogs.db import AsyncDatabase
+
+def strip_id(document):
+    if document is None:
+        return None
+    return {key: value for key, value in document.items() if key != "_id"}
+
+async def run_checks():
+    legacy_db = mongomock.MongoClient()["legacy"]
+    raw_db = mongomock.MongoClient()["election_bot"]
+
+    guild_doc = {
+        "guild_id": 1,
+        "candidates": [
+            {"user_id": i, "name": f"Candidate {i}", "year": 1999 + i % 2, "points": float(i), "stamina": 50}
+            for i in range(6)
+        ],
+        "pending_vp_requests": []
+    }
+    legacy_db["signups"].insert_one(copy.deepcopy(guild_doc))
+    raw_db["signups"].insert_one(copy.deepcopy(guild_doc))
+
+    db = AsyncDatabase(raw_db)
+    await db.ensure_indexes()
+    legacy, signups = legacy_db["signups"], db["signups"]
+    failures = []
+
+    async def both(method, *args, **kwargs):
+        getattr(legacy, method)(*copy.deepcopy(args), **kwargs)
+        await getattr(signups, method)(*copy.deepcopy(args), **kwargs)
+
+    async def check(label, query=None):
+        query = query or {"guild_id": 1}
+        expected = strip_id(legacy.find_one(query))
+        actual = strip_id(await signups.find_one(query))
+        if expected == actual:
+            print(f"✅ {label}")
+        else:
+            print(f"❌ {label}\n   expected: {expected}\n   actual:   {actual}")
+            failures.append(label)
+
+    await check("existing guild document is migrated on first use")
+    if raw_db["signups"].find_one({"guild_id": 1}).get("candidates") is not None:
+        failures.append("embedded array left behind")
+    print(f"📋 {raw_db['signup_candidates'].count_documents({})} candidate documents stored")
+
+    await both("update_one", {"guild_id": 1, "candidates.user_id": 3}, {"$inc": {"candidates.$.points": 5}})
+    await check("positional $inc")
+
+    await both("update_one", {"guild_id": 1, "candidates.2.user_id": 2}, {"$set": {"candidates.2.stamina": 7}})
+    await check("index-based $set")
+
+    await both("update_many", {"guild_id": 1, "candidates.year": 2000}, {"$set": {"candidates.$.stamina": 100}})
+    await check("update_many only touches the first match per guild")
+
+    await both("update_one", {"guild_id": 1}, {"$push": {"candidates": {"user_id": 50, "name": "Late Entry", "year": 2001}}})
+    await check("$push appends a candidate")
+
+    candidates = legacy.find_one({"guild_id": 1})["candidates"]
+    candidates[1]["points"] = 99.0
+    del candidates[3]
+    candidates.insert(2, {"user_id": 77, "name": "Inserted", "year": 1999})
+    await both("update_one", {"guild_id": 1}, {"$set": {"candidates": candidates, "pending_vp_requests": [1]}})
+    await check("rewriting the whole list keeps order")
+
+    await both("update_one", {"guild_id": 1}, {"$pull": {"candidates": {"user_id": 77}}})
+    await check("$pull removes a candidate")
+
+    await both("insert_one", {"guild_id": 2, "candidates": [{"user_id": 500, "name": "Other Guild", "year": 1999}]})
+    await check("new guild document", {"guild_id": 2})
+    await check("lookup without guild_id", {"candidates.user_id": 500})
+
+    found = await signups.find_candidate({"guild_id": 1, "name_lower": "candidate 4"})
+    if not found or found.get("user_id") != 4 or "position" in found:
+        print(f"❌ find_candidate returned {found}")
+        failures.append("find_candidate")
+    else:
+        print("✅ find_candidate point lookup")
+
+    report = await db.migrate_candidate_documents()
+    if any(result["guilds"] for result in report.values()):
+        print(f"❌ migration ran twice: {report}")
+        failures.append("migration is not one-shot")
+    else:
+        print("✅ migration command is a no-op once migrated")
+
+    db.close()
+    return failures
+
+if __name__ == "__main__":
+    failures = asyncio.run(run_checks())
+    if failures:
+        print(f"\n❌ {len(failures)} check(s) failed")
+        sys.exit(1)
+    print("\n🎉 SUCCESS: Candidate documents match the embedded array behaviour")
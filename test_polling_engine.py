@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Check the polling engine against the per-seat loops it replaced.
+
+The reference functions below are the redistribution loops that used to
+live in the polling, general campaign, presidential campaign and winners
+cogs, reduced to their seat-level arithmetic, plus the per-state loop of
+national presidential polling. Random seats and tickets are run through
+both and every percentage must match. Requires numpy.
+"""
+
+import random
+import sys
+
+from cogs.polling_engine import (
+    STATE_POPULATION_WEIGHTS, baseline_redistribution, campaign_baselines, floor_redistribution,
+    invalidate_state_baselines, national_polling, party_baselines, presidential_baselines, seat_baselines,
+)
+
+PARTIES = [
+    "Democratic Party", "Republican Party", "Independent", "Green Party",
+    "Libertarian Party", "Democrat", "Republican", "Independent Party",
+]
+
+def legacy_floor(candidate):
+    party = candidate.get('party', '').lower()
+    if any(keyword in party for keyword in ['democrat', 'republican']):
+        return 25.0
+    return 2.0
+
+def legacy_redistribution(candidates, baselines, name, points, require_positive_total):
+    current = dict(zip([name(c) for c in candidates], baselines))
+    if require_positive_total and sum(points(c) for c in candidates) <= 0:
+        return current
+    for candidate in candidates:
+        gained = points(candidate)
+        if gained > 0:
+            available_total = 0.0
+            for other in candidates:
+                if other != candidate:
+                    available_total += max(0, current[name(other)] - legacy_floor(other))
+            actual_gain = min(gained, available_total)
+            current[name(candidate)] += actual_gain
+            if available_total > 0:
+                for other in candidates:
+                    if other != candidate:
+                        available = max(0, current[name(other)] - legacy_floor(other))
+                        if available > 0:
+                            current[name(other)] -= (available / available_total) * actual_gain
+    return current
+
+def legacy_normalize(current):
+    total = sum(current.values())
+    if total > 0:
+        for key in current:
+            current[key] = (current[key] / total) * 100.0
+    final_total = sum(current.values())
+    if abs(final_total - 100.0) > 0.001:
+        largest = max(current.keys(), key=lambda key: current[key])
+        current[largest] += 100.0 - final_total
+    return current
+
+def legacy_polling(candidates, momentum):
+    """Polling._calculate_zero_sum_percentages"""
+    name = lambda c: c.get('candidate', c.get('name', ''))
+    parties = set(c["party"] for c in candidates)
+    num_parties = len(parties)
+    major = {"Democrat", "Republican", "Democratic Party", "Republican Party"}
+    major_present = len([p for p in parties if p in major])
+    standard = (any("Republican" in p for p in parties) and any("Democratic" in p for p in parties)
+                and any("Independent" in p for p in parties) and num_parties == 3)
+    baselines = []
+    for c in candidates:
+        if num_parties == 2:
+            baselines.append(50.0)
+        elif num_parties == 3:
+            if major_present == 2 or standard:
+                is_major = c["party"] in major or "Republican" in c["party"] or "Democratic" in c["party"]
+                baselines.append(40.0 if is_major else 20.0)
+            else:
+                baselines.append(100.0 / 3)
+        elif num_parties == 4:
+            baselines.append((40.0 if c["party"] in major else 10.0) if major_present == 2 else 25.0)
+        elif major_present == 2:
+            baselines.append(40.0 if c["party"] in major else 20.0 / (num_parties - 2))
+        else:
+            baselines.append(100.0 / len(candidates))
+    current = legacy_redistribution(candidates, baselines, name, lambda c: c.get('points', 0.0), True)
+    for c in candidates:
+        current[name(c)] += momentum.get(name(c), 0.0)
+    for c in candidates:
+        current[name(c)] = max(current[name(c)], legacy_floor(c))
+    return legacy_normalize(current)
+
+def legacy_campaign(candidates):
+    """GeneralCampaignActions._calculate_zero_sum_percentages"""
+    name = lambda c: c.get('candidate', c.get('name', ''))
+    major = ["Democratic", "Republican", "Democratic Party", "Republican Party"]
+    parties = set(c.get("party", "") for c in candidates)
+    major_present = [p for p in major if p in parties]
+    standard = (any("Republican" in p for p in parties) and any("Democratic" in p for p in parties)
+                and any("Independent" in p for p in parties) and len(parties) == 3)
+    if len(major_present) == 2 or standard:
+        if len(parties) == 2:
+            baselines = [50.0 for _ in candidates]
+        else:
+            other = 20.0 / (len(parties) - 2)
+            baselines = [40.0 if (c["party"] in major or "Republican" in c["party"] or "Democratic" in c["party"])
+                         else other for c in candidates]
+    else:
+        baselines = [100.0 / len(candidates) for _ in candidates]
+    current = legacy_redistribution(candidates, baselines, name, lambda c: c.get('points', 0.0), True)
+    return legacy_normalize(current)
+
+def legacy_presidential(candidates):
+    """PresCampaignActions._calculate_general_election_percentages"""
+    name = lambda c: c["name"]
+    majors = []
+    for c in candidates:
+        party = c["party"].lower()
+        if "democrat" in party or "democratic" in party:
+            if "Democrat" not in majors:
+                majors.append("Democrat")
+        elif "republican" in party:
+            if "Republican" not in majors:
+                majors.append("Republican")
+    if len(majors) == 2 and len(candidates) == 2:
+        baselines = [50.0 for _ in candidates]
+    elif len(majors) == 2 and len(candidates) > 2:
+        other = 20.0 / (len(candidates) - 2)
+        baselines = [40.0 if any(k in c["party"].lower() for k in ("democrat", "democratic", "republican"))
+                     else other for c in candidates]
+    else:
+        baselines = [100.0 / len(candidates) for _ in candidates]
+    current = legacy_redistribution(candidates, baselines, name, lambda c: c.get("total_points", 0.0), False)
+    for c in candidates:
+        current[name(c)] = max(current[name(c)], legacy_floor(c))
+    return legacy_normalize(current)
+
+def legacy_winners(candidates):
+    """AllWinners._calculate_zero_sum_percentages"""
+    parties = list(dict.fromkeys(c["party"] for c in candidates))
+    num_parties = len(parties)
+    major = ["Republican Party", "Democratic Party"]
+    major_present = sum(1 for p in parties if p in major)
+    standard = (any("Republican" in p for p in parties) and any("Democratic" in p for p in parties)
+                and any("Independent" in p for p in parties) and num_parties == 3)
+    baseline = {}
+    for party in parties:
+        if num_parties == 2:
+            baseline[party] = 50.0
+        elif num_parties == 3:
+            if major_present == 2 or standard:
+                baseline[party] = 40.0 if (party in major or "Republican" in party or "Democratic" in party) else 20.0
+            else:
+                baseline[party] = 100.0 / 3
+        elif num_parties == 4:
+            baseline[party] = (40.0 if party in major else 10.0) if major_present == 2 else 25.0
+        else:
+            baseline[party] = 100.0 / num_parties
+    raw = {c["candidate"]: float(c.get("total_points", c.get("points", 0.0))) - c.get("corruption", 0) * 0.1
+           for c in candidates}
+    net = sum(raw.values())
+    final = {}
+    for c in candidates:
+        b = baseline[c["party"]]
+        final[c["candidate"]] = max(0.1, b + raw[c["candidate"]] - (b / 100.0) * net)
+    return legacy_normalize(final)
+
+def legacy_national(candidate, state_data):
+    """PresCampaignActions._calculate_national_polling_by_population"""
+    party = candidate.get("party", "").lower()
+    alignment = "republican" if "republican" in party else "democrat" if "democrat" in party else "other"
+    state_points = candidate.get("state_points", {})
+    total_weighted = 0.0
+    total_weight = 0.0
+    for state, weight in STATE_POPULATION_WEIGHTS.items():
+        base = state_data.get(state, {"republican": 33.0, "democrat": 33.0, "other": 34.0}).get(alignment, 33.0)
+        polling = max(15.0, min(85.0, base + state_points.get(state, 0.0)))
+        total_weighted += (polling / 100.0) * weight
+        total_weight += weight
+    return max(20.0, min(80.0, (total_weighted / total_weight) * 100.0))
+
+def random_state_data(rng):
+    data = {}
+    for state in STATE_POPULATION_WEIGHTS:
+        if rng.random() < 0.05:
+            continue
+        republican = rng.uniform(20, 70)
+        democrat = rng.uniform(20, 90 - republican)
+        data[state] = {"republican": republican, "democrat": democrat, "other": 100 - republican - democrat}
+    return data
+
+def random_ticket(rng, index):
+    states = list(STATE_POPULATION_WEIGHTS) + ["PUERTO RICO"]
+    return {
+        "name": f"Ticket {index}",
+        "party": rng.choice(PARTIES),
+        "state_points": {state: rng.uniform(-40, 60) for state in rng.sample(states, rng.randint(0, 20))},
+    }
+
+def check_national(rng, candidate_count=300):
+    state_data = random_state_data(rng)
+    candidates = [random_ticket(rng, index) for index in range(candidate_count)]
+    expected = [legacy_national(c, state_data) for c in candidates]
+    actual = list(national_polling(candidates, state_data))
+
+    # Editing the state data in place only shows after invalidation
+    state = next(iter(state_data))
+    state_data[state]["republican"] += 30.0
+    invalidate_state_baselines()
+    expected += [legacy_national(c, state_data) for c in candidates]
+    actual += list(national_polling(candidates, state_data))
+    return [i for i, (e, a) in enumerate(zip(expected, actual)) if abs(e - a) > 1e-9]
+
+def random_seat(rng, index):
+    size = rng.randint(1, 6)
+    seat = []
+    for slot in range(size):
+        name = f"Seat {index} Candidate {slot}"
+        seat.append({
+            "candidate": name,
+            "name": name,
+            "party": rng.choice(PARTIES[:rng.randint(2, len(PARTIES))]),
+            "points": rng.choice([0.0, 0.0, rng.uniform(-5, 30)]),
+            "total_points": rng.choice([0.0, rng.uniform(0, 40)]),
+            "corruption": rng.randint(0, 20),
+            "office": rng.choice(["President", "Vice President"]),
+        })
+    return seat
+
+def matches(expected, actual):
+    return list(expected) == list(actual) and all(abs(expected[k] - actual[k]) < 1e-9 for k in expected)
+
+def run_checks(seat_count=400):
+    rng = random.Random(2024)
+    seats = [random_seat(rng, index) for index in range(seat_count)]
+    momentum = [{seat[0]["candidate"]: rng.uniform(-3, 3)} if rng.random() < 0.3 else {} for seat in seats]
+    failures = []
+
+    models = [
+        ("polling", [legacy_polling(s, m) for s, m in zip(seats, momentum)],
+         floor_redistribution(seats, seat_baselines, name=lambda c: c.get('candidate', c.get('name', '')),
+                              points=lambda c: c.get('points', 0.0), momentum=momentum)),
+        ("general campaign", [legacy_campaign(s) for s in seats],
+         floor_redistribution(seats, campaign_baselines, name=lambda c: c.get('candidate', c.get('name', '')),
+                              points=lambda c: c.get('points', 0.0), clamp_floors=False)),
+        ("presidential", [legacy_presidential(s) for s in seats],
+         floor_redistribution(seats, presidential_baselines, name=lambda c: c["name"],
+                              points=lambda c: c.get("total_points", 0.0), require_positive_total=False)),
+        ("winners", [legacy_winners(s) for s in seats],
+         baseline_redistribution(seats, party_baselines, name=lambda c: c["candidate"],
+                                 raw_change=lambda c: float(c.get("total_points", c.get("points", 0.0)))
+                                 - c.get("corruption", 0) * 0.1)),
+    ]
+    for label, expected, actual in models:
+        mismatches = [i for i, (e, a) in enumerate(zip(expected, actual)) if not matches(e, a)]
+        if mismatches or len(expected) != len(actual):
+            first = mismatches[0] if mismatches else None
+            print(f"❌ {label}: {len(mismatches)} seat(s) differ"
+                  + (f"\n   expected: {expected[first]}\n   actual:   {actual[first]}" if first is not None else ""))
+            failures.append(label)
+        else:
+            print(f"✅ {label}: {len(seats)} seats match")
+
+    mismatches = check_national(rng)
+    if mismatches:
+        print(f"❌ national: {len(mismatches)} candidate(s) differ")
+        failures.append("national")
+    else:
+        print("✅ national: 600 candidates match")
+    return failures
+
+if __name__ == "__main__":
+    failures = run_checks()
+    if failures:
+        print(f"\n❌ {len(failures)} model(s) differ from the per-seat loops")
+        sys.exit(1)
+    print("\n🎉 SUCCESS: Polling engine matches the per-seat loops")